@@ -29,6 +29,7 @@ from app.models import (
     RateLimitWindow,
     ErrorGroup,
     LogEvent,
+    ScheduledJob,
 )
 
 config = context.config
@@ -0,0 +1,48 @@
+"""scheduled_jobs — leader-elected job runner 의 스케줄 + 마지막 실행 기록
+
+Revision ID: 3f1a9c2d7b64
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-19 10:00:00.000000
+
+job_runner 가 주기 작업 (주간 리포트 / 파티션 유지 / reaper / GC) 을
+pg_try_advisory_lock 리스 하에 1개 프로세스만 실행. 운영자는 이 테이블로 scheduler health 확인.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '3f1a9c2d7b64'
+down_revision: Union[str, None] = 'e1f2a3b4c5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    job_outcome = postgresql.ENUM(
+        "RUNNING", "SUCCESS", "FAILED", name="joboutcome", create_type=False,
+    )
+    job_outcome.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "scheduled_jobs",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("next_run_at", sa.DateTime(), nullable=False),
+        sa.Column("last_started_at", sa.DateTime(), nullable=True),
+        sa.Column("last_finished_at", sa.DateTime(), nullable=True),
+        sa.Column("last_duration_ms", sa.Integer(), nullable=True),
+        sa.Column("last_outcome", job_outcome, nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("last_processed", sa.Integer(), nullable=True),
+        sa.Column("run_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("holder", sa.String(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduled_jobs")
+    op.execute("DROP TYPE IF EXISTS joboutcome")
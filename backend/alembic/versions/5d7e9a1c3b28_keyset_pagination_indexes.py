@@ -0,0 +1,45 @@
+"""keyset pagination 인덱스 — /logs (received_at, id), /errors sort mode 별 (sort key, id)
+
+Revision ID: 5d7e9a1c3b28
+Revises: 8b2d4e6f1a93
+Create Date: 2026-10-19 14:00:00.000000
+
+OFFSET/LIMIT → cursor 전환. 각 정렬은 (project_id, <key> DESC, id DESC) 인덱스 1개씩 —
+row 비교 `(key, id) < (:v, :id)` + ORDER BY 가 index scan 으로 끝남 (정렬 / skip 없음).
+log_events 는 partitioned parent 에 생성 → 기존 / 이후 파티션 모두 전파.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5d7e9a1c3b28'
+down_revision: Union[str, None] = '8b2d4e6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_GROUP_SORT_INDEXES = {
+    "idx_error_group_last_seen": "last_seen_at",
+    "idx_error_group_first_seen": "first_seen_at",
+    "idx_error_group_event_count": "event_count",
+}
+
+
+def upgrade() -> None:
+    for name, column in _GROUP_SORT_INDEXES.items():
+        op.create_index(
+            name, "error_groups",
+            ["project_id", sa.text(f"{column} DESC"), sa.text("id DESC")],
+        )
+    op.create_index(
+        "idx_log_project_received_id", "log_events",
+        ["project_id", sa.text("received_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_log_project_received_id", table_name="log_events")
+    for name in _GROUP_SORT_INDEXES:
+        op.drop_index(name, table_name="error_groups")
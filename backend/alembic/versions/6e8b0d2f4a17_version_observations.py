@@ -0,0 +1,46 @@
+"""version_observations — (project, environment, version_sha) 관측 구간 + fingerprint 집합
+
+Revision ID: 6e8b0d2f4a17
+Revises: a7c3e5f9b214
+Create Date: 2026-10-19 20:00:00.000000
+
+직전 정상 SHA (log_query_service._find_previous_good_sha) 를 log_events 전 파티션 anti-join 대신
+idx_version_obs_env_first_seen 인덱스 lookup 으로. 기존 데이터는 version_observation_backfill 작업이 채움.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '6e8b0d2f4a17'
+down_revision: Union[str, None] = 'a7c3e5f9b214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "version_observations",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("environment", sa.String(), nullable=False),
+        sa.Column("version_sha", sa.String(), nullable=False),
+        sa.Column("first_seen_at", sa.DateTime(), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "fingerprints", postgresql.ARRAY(sa.Text()), nullable=False, server_default="{}",
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "environment", "version_sha"),
+    )
+    op.create_index(
+        "idx_version_obs_env_first_seen",
+        "version_observations",
+        ["project_id", "environment", sa.text("first_seen_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_version_obs_env_first_seen", table_name="version_observations")
+    op.drop_table("version_observations")
@@ -0,0 +1,51 @@
+"""handoff content delta — 같은 branch 이전 버전 대비 delta 저장 + snapshot
+
+Revision ID: 8b2d4e6f1a93
+Revises: 3f1a9c2d7b64
+Create Date: 2026-10-19 12:00:00.000000
+
+handoff 본문을 매 push 전체 저장 → history 가 제곱으로 증가. content_base_id / content_delta 로
+직전 버전 대비 line delta 저장, content_depth 로 snapshot 주기 관리.
+기존 행은 raw_content 전체 = snapshot (depth 0) — backfill 불필요.
+idx_handoff_project_branch_pushed: 직전 버전 조회 + GET /handoffs?branch= 목록.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8b2d4e6f1a93'
+down_revision: Union[str, None] = '3f1a9c2d7b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("handoffs", sa.Column("content_base_id", sa.UUID(), nullable=True))
+    op.add_column("handoffs", sa.Column("content_delta", sa.LargeBinary(), nullable=True))
+    op.add_column(
+        "handoffs",
+        sa.Column("content_depth", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_foreign_key(
+        "fk_handoff_content_base", "handoffs", "handoffs",
+        ["content_base_id"], ["id"], ondelete="SET NULL",
+    )
+    op.create_index(
+        "idx_handoff_content_base", "handoffs", ["content_base_id"],
+        postgresql_where=sa.text("content_base_id IS NOT NULL"),
+    )
+    op.create_index(
+        "idx_handoff_project_branch_pushed", "handoffs",
+        ["project_id", "branch", sa.text("pushed_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_handoff_project_branch_pushed", table_name="handoffs")
+    op.drop_index("idx_handoff_content_base", table_name="handoffs")
+    op.drop_constraint("fk_handoff_content_base", "handoffs", type_="foreignkey")
+    op.drop_column("handoffs", "content_depth")
+    op.drop_column("handoffs", "content_delta")
+    op.drop_column("handoffs", "content_base_id")
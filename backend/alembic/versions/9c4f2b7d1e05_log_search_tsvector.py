@@ -0,0 +1,49 @@
+"""log_events 풀텍스트 — generated search_tsv + GIN, 전 level trigram
+
+Revision ID: 9c4f2b7d1e05
+Revises: 5d7e9a1c3b28
+Create Date: 2026-10-19 16:00:00.000000
+
+- search_tsv: message (A) / exception_message (B) / logger_name (C), 'simple' config, STORED generated.
+  partitioned parent 에 ADD COLUMN → 모든 파티션 rewrite (대용량이면 유지보수 창에서 실행).
+- idx_log_search_tsv: parent 에 GIN → 파티션별 GIN 자동 생성 (이후 ensure_partitions 파티션 포함).
+- idx_log_message_trgm: WARNING↑ partial → 전 level. 부분 문자열 (`*substr*`) fallback 전용.
+식은 app.models.log_event.SEARCH_TSV_EXPRESSION 과 동일해야 함 (여기선 마이그레이션 시점 값 고정).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '9c4f2b7d1e05'
+down_revision: Union[str, None] = '5d7e9a1c3b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_SEARCH_TSV_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(message, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(exception_message, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(logger_name, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE log_events ADD COLUMN search_tsv tsvector "
+        f"GENERATED ALWAYS AS ({_SEARCH_TSV_EXPRESSION}) STORED"
+    )
+    op.execute("CREATE INDEX idx_log_search_tsv ON log_events USING gin (search_tsv)")
+    op.execute("DROP INDEX IF EXISTS idx_log_message_trgm")
+    op.execute("CREATE INDEX idx_log_message_trgm ON log_events USING gin (message gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_log_message_trgm")
+    op.execute("""
+        CREATE INDEX idx_log_message_trgm
+          ON log_events USING gin (message gin_trgm_ops)
+          WHERE level IN ('WARNING','ERROR','CRITICAL')
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_log_search_tsv")
+    op.execute("ALTER TABLE log_events DROP COLUMN search_tsv")
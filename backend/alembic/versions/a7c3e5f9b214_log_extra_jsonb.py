@@ -0,0 +1,70 @@
+"""log_events extra / stack_frames JSON → JSONB + request_id / user_id_external / extra 인덱스
+
+Revision ID: a7c3e5f9b214
+Revises: 9c4f2b7d1e05
+Create Date: 2026-10-19 18:00:00.000000
+
+- extra, stack_frames: JSONB (ALTER TYPE — 모든 파티션 rewrite, 유지보수 창에서 실행).
+- idx_log_project_request / idx_log_project_user_external: parent partial btree → 파티션 전파.
+  GET /projects/{id}/requests/{request_id} trace 와 /logs 필터용.
+- extra GIN (jsonb_path_ops — @> / @? / @@ jsonpath): 최근 EXTRA_INDEX_DAYS 일 이후 파티션에만.
+  parent 인덱스가 아니라서 새 파티션엔 자동 생성 안 됨 — log_partition_service.maintain_extra_indexes 가 유지.
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = 'a7c3e5f9b214'
+down_revision: Union[str, None] = '9c4f2b7d1e05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_EXTRA_INDEX_DAYS = 7  # log_partition_service.EXTRA_INDEX_DAYS 와 동일 (마이그레이션 시점 값 고정)
+
+
+def _partitions() -> list[str]:
+    return list(op.get_bind().execute(sa.text("""
+        SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'log_events'::regclass
+    """)).scalars())
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE log_events ALTER COLUMN extra TYPE jsonb USING extra::jsonb")
+    op.execute("ALTER TABLE log_events ALTER COLUMN stack_frames TYPE jsonb USING stack_frames::jsonb")
+
+    op.create_index(
+        "idx_log_project_request",
+        "log_events",
+        ["project_id", "request_id"],
+        postgresql_where=sa.text("request_id IS NOT NULL"),
+    )
+    op.create_index(
+        "idx_log_project_user_external",
+        "log_events",
+        ["project_id", "user_id_external"],
+        postgresql_where=sa.text("user_id_external IS NOT NULL"),
+    )
+
+    cutoff = datetime.utcnow().date() - timedelta(days=_EXTRA_INDEX_DAYS)
+    for name in _partitions():
+        try:
+            day = datetime.strptime(name.removeprefix("log_events_"), "%Y%m%d").date()
+        except ValueError:
+            continue
+        if day >= cutoff:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS {name}_extra_gin ON {name} USING gin (extra jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    for name in _partitions():
+        op.execute(f"DROP INDEX IF EXISTS {name}_extra_gin")
+    op.drop_index("idx_log_project_user_external", table_name="log_events")
+    op.drop_index("idx_log_project_request", table_name="log_events")
+    op.execute("ALTER TABLE log_events ALTER COLUMN stack_frames TYPE json USING stack_frames::json")
+    op.execute("ALTER TABLE log_events ALTER COLUMN extra TYPE json USING extra::json")
@@ -0,0 +1,60 @@
+"""project_task_stats — 프로젝트별 status / archived / overdue task 카운터
+
+Revision ID: b5e1d7c3a926
+Revises: 6e8b0d2f4a17
+Create Date: 2026-10-19 22:00:00.000000
+
+프로젝트 목록 task_count / 주간 리포트가 tasks 를 매번 세는 대신 카운터를 읽음.
+기존 데이터는 여기서 한 번 집계 (overdue 기준일 = 오늘, UTC). 이후 task_stats_service 가 유지.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b5e1d7c3a926'
+down_revision: Union[str, None] = '6e8b0d2f4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_task_stats",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("todo_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("doing_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("done_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("blocked_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("archived_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("overdue_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("overdue_as_of", sa.Date(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+    op.execute("""
+        INSERT INTO project_task_stats
+            (project_id, todo_count, doing_count, done_count, blocked_count,
+             archived_count, overdue_count, overdue_as_of, updated_at)
+        SELECT p.id,
+               count(t.id) FILTER (WHERE t.archived_at IS NULL AND t.status = 'TODO'),
+               count(t.id) FILTER (WHERE t.archived_at IS NULL AND t.status = 'DOING'),
+               count(t.id) FILTER (WHERE t.archived_at IS NULL AND t.status = 'DONE'),
+               count(t.id) FILTER (WHERE t.archived_at IS NULL AND t.status = 'BLOCKED'),
+               count(t.id) FILTER (WHERE t.archived_at IS NOT NULL),
+               count(t.id) FILTER (
+                   WHERE t.archived_at IS NULL AND t.status IN ('TODO', 'DOING')
+                     AND t.due_date < (now() AT TIME ZONE 'utc')::date
+               ),
+               (now() AT TIME ZONE 'utc')::date,
+               now() AT TIME ZONE 'utc'
+        FROM projects p
+        LEFT JOIN tasks t ON t.project_id = p.id
+        GROUP BY p.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("project_task_stats")
@@ -0,0 +1,49 @@
+"""version_fingerprint_counts + version_coverage — 버전별 fingerprint 발생 수 요약
+
+Revision ID: c8a4f2e6d913
+Revises: b5e1d7c3a926
+Create Date: 2026-10-20 10:00:00.000000
+
+release 비교 발생률이 log_events 원본 GROUP BY 대신 이 요약을 합산. 기존 데이터는
+version_observation_backfill 작업이 파티션 단위로 채움 (fingerprinted_at < version_coverage.live_since 만,
+이미 관측 backfill 을 마친 배포도 backfilled_from 기준으로 전 파티션 다시 훑음).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c8a4f2e6d913'
+down_revision: Union[str, None] = 'b5e1d7c3a926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "version_coverage",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("environment", sa.String(), nullable=False),
+        sa.Column("live_since", sa.DateTime(), nullable=False),
+        sa.Column("backfilled_from", sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "environment"),
+    )
+    op.create_table(
+        "version_fingerprint_counts",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("environment", sa.String(), nullable=False),
+        sa.Column("version_sha", sa.String(), nullable=False),
+        sa.Column("fingerprint", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("live_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("backfill_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "environment", "version_sha", "fingerprint", "day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("version_fingerprint_counts")
+    op.drop_table("version_coverage")
@@ -0,0 +1,31 @@
+"""version_coverage.history_complete — pair 별 version_observations backfill 완료 표시
+
+Revision ID: d1f7b3a9c254
+Revises: c8a4f2e6d913
+Create Date: 2026-10-20 12:00:00.000000
+
+직전 정상 SHA lookup 이 "관측 row 있음" 대신 이 표시로 version_observations 사용 여부를 판단.
+live ingest 가 배포 직후부터 관측을 만들기 때문에 backfill 이 끝나기 전에도 관측은 존재함.
+기존 row 는 false — 다음 version_observation_backfill 실행이 끝까지 돌면 true.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd1f7b3a9c254'
+down_revision: Union[str, None] = 'c8a4f2e6d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "version_coverage",
+        sa.Column("history_complete", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("version_coverage", "history_complete")
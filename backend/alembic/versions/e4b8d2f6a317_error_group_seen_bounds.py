@@ -0,0 +1,53 @@
+"""error_groups first_seen / last_seen 을 처리된 event 의 received_at min / max 로 보정
+
+Revision ID: e4b8d2f6a317
+Revises: d1f7b3a9c254
+Create Date: 2026-10-20 14:00:00.000000
+
+이전 upsert 는 처리 순서대로 last_seen 을 덮어써서, reaper 가 늦게 처리한 과거 event 가
+last_seen_at 을 되돌리거나 first_seen_at 보다 이른 event 를 남길 수 있었음. 상세 조회가 이제
+이 구간으로 recent events 를 정확히 bound 하므로 기존 row 를 한 번 맞춰 둠 (벗어난 group 만 UPDATE).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'e4b8d2f6a317'
+down_revision: Union[str, None] = 'd1f7b3a9c254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        WITH firsts AS (
+            SELECT DISTINCT ON (project_id, fingerprint) project_id, fingerprint, received_at, version_sha
+            FROM log_events
+            WHERE fingerprint IS NOT NULL
+            ORDER BY project_id, fingerprint, received_at ASC
+        )
+        UPDATE error_groups g
+        SET first_seen_at = f.received_at, first_seen_version_sha = f.version_sha
+        FROM firsts f
+        WHERE g.project_id = f.project_id AND g.fingerprint = f.fingerprint
+          AND f.received_at < g.first_seen_at
+    """)
+    op.execute("""
+        WITH lasts AS (
+            SELECT DISTINCT ON (project_id, fingerprint) project_id, fingerprint, received_at, version_sha
+            FROM log_events
+            WHERE fingerprint IS NOT NULL
+            ORDER BY project_id, fingerprint, received_at DESC
+        )
+        UPDATE error_groups g
+        SET last_seen_at = l.received_at, last_seen_version_sha = l.version_sha
+        FROM lasts l
+        WHERE g.project_id = l.project_id AND g.fingerprint = l.fingerprint
+          AND l.received_at > g.last_seen_at
+    """)
+
+
+def downgrade() -> None:
+    # 데이터 보정만 — 되돌릴 스키마 없음
+    pass
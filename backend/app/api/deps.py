@@ -5,11 +5,11 @@ FastAPI Depends 한 줄로 대체.
 """
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import CurrentUser
+from app.dependencies import AuthContext, CurrentUser, get_auth_context
 from app.models.workspace import WorkspaceRole
 from app.services.permission_service import get_effective_role
 
@@ -33,6 +33,7 @@ async def check_project_member(
     min_role: WorkspaceRole = WorkspaceRole.VIEWER,
     hide_existence: bool = False,
     denied_detail: str = "Permission denied",
+    auth: AuthContext | None = None,
 ) -> WorkspaceRole:
     """프로젝트 멤버 + 최소 role 확인.
 
@@ -43,8 +44,19 @@ async def check_project_member(
         ① 멤버 아닌 경우 — hide_existence=True 면 404 'Project not found'
            (리소스 존재 자체를 숨김, Phase 4+ 신규 endpoint), 아니면 403.
         ② 멤버지만 min_role 미달 — 항상 403 (이미 멤버라 존재는 알려져 있음).
+
+    auth — get_current_user 가 같은 요청에서 이미 role 을 조회했으면 재조회 안 함.
+    role cache 는 읽기 요청의 VIEWER 확인에만 — min_role 이 EDITOR 이상이거나 쓰기 요청이면
+    cache 에서 온 role 을 버리고 DB 에서 다시 읽음 (강등 / 제거가 다른 워커 cache 에 남아 있어도 거부).
     """
-    role = await get_effective_role(db, user_id, project_id)
+    use_cache = min_role == WorkspaceRole.VIEWER and (auth is None or auth.use_role_cache)
+    if (
+        auth is not None and auth.user.id == user_id and project_id in auth.project_roles
+        and (use_cache or project_id not in auth.cached_roles)
+    ):
+        role = auth.project_roles[project_id]
+    else:
+        role = await get_effective_role(db, user_id, project_id, use_cache=use_cache)
     if role is None:
         if hide_existence:
             raise HTTPException(
@@ -79,10 +91,12 @@ def require_project_member(
         ))
     """
     async def dep(
+        request: Request,
         project_id: UUID,
         user: CurrentUser,
         db: AsyncSession = Depends(get_db),
     ) -> WorkspaceRole:
+        # get_current_user 가 user 와 role 을 한 쿼리로 가져와 request.state 에 실어 둠
         return await check_project_member(
             db,
             user.id,
@@ -90,6 +104,7 @@ def require_project_member(
             min_role=min_role,
             hide_existence=hide_existence,
             denied_detail=denied_detail,
+            auth=get_auth_context(request),
         )
 
     return dep
@@ -12,12 +12,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_project_member
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.dependencies import CurrentUser
 from app.models.error_group import ErrorGroup, ErrorGroupStatus
 from app.models.workspace import WorkspaceRole
 from app.schemas.log_query import (
     ErrorGroupDetail,
+    ErrorGroupListItem,
     ErrorGroupListResponse,
     ErrorGroupStatusUpdate,
     ErrorGroupSummary,
@@ -26,6 +27,7 @@ from app.schemas.log_query import (
     GitPushEventRef,
     HandoffRef,
     LogEventSummary,
+    SparklineWindow,
     TaskRef,
 )
 from app.services import error_group_service, log_query_service
@@ -36,24 +38,57 @@ router = APIRouter(prefix="/projects", tags=["log-errors"])
 @router.get(
     "/{project_id}/errors",
     response_model=ErrorGroupListResponse,
+    response_model_exclude_unset=True,
 )
 async def list_errors(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     status: ErrorGroupStatus | None = None,
     since: datetime | None = None,
+    sort: log_query_service.GroupSort = "last_seen",
+    cursor: str | None = None,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=200),
+    total_mode: log_query_service.TotalMode = Query(default="estimate", alias="total"),
+    sparkline: log_query_service.SparklineRange | None = None,
+    fields: str | None = Query(default=None, max_length=500),
     _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
 ):
-    """ErrorGroup 목록. 멤버 누구나 (VIEWER 포함)."""
-    rows, total = await log_query_service.list_groups(
-        db, project_id=project_id,
-        status=status, since=since, offset=offset, limit=limit,
-    )
+    """ErrorGroup 목록. 멤버 누구나 (VIEWER 포함).
+
+    다음 페이지는 응답의 next_cursor 를 `cursor=` 로 전달 (offset 은 구 클라이언트 호환).
+    sparkline=24h (1시간 × 24) | 7d (6시간 × 28) — 페이지 전체 추세를 쿼리 1개로 추가.
+    fields=id,exception_class,... 로 응답 필드 (= SELECT 컬럼) 를 고름 (기본 전체).
+    """
+    requested = log_query_service.split_fields(fields)
+    if requested is not None and sparkline is not None:
+        requested.append("fingerprint")  # sparkline 집계 키
+    try:
+        rows, total = await log_query_service.list_groups(
+            db, project_id=project_id,
+            status=status, since=since, sort=sort, cursor=cursor,
+            offset=offset, limit=limit, total_mode=total_mode, fields=requested,
+        )
+    except (log_query_service.InvalidCursorError, log_query_service.InvalidFieldsError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    items = [ErrorGroupListItem.model_validate(dict(r._mapping)) for r in rows]
+    window = None
+    if sparkline is not None:
+        start, step, counts = await log_query_service.group_sparklines(
+            db, project_id=project_id, fingerprints=[r.fingerprint for r in rows], range_=sparkline,
+        )
+        buckets = log_query_service.SPARKLINE_RANGES[sparkline][0]
+        for item, row in zip(items, rows):
+            item.sparkline = counts.get(row.fingerprint, [0] * buckets)
+        window = SparklineWindow(
+            start=start, bucket_seconds=int(step.total_seconds()), buckets=buckets,
+        )
     return ErrorGroupListResponse(
-        items=[ErrorGroupSummary.model_validate(r) for r in rows],
+        items=items,
         total=total,
+        total_is_estimate=log_query_service.is_estimated_total(total_mode, total),
+        next_cursor=log_query_service.group_cursor(rows[-1], sort) if len(rows) == limit else None,
+        sparkline_window=window,
     )
 
 
@@ -64,7 +99,7 @@ async def list_errors(
 async def get_error_detail(
     project_id: UUID,
     group_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
 ):
     """ErrorGroup 상세 + recent events + git 컨텍스트 + 직전 정상 SHA."""
@@ -10,7 +10,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_project_member
-from app.database import get_db
+from app.database import get_read_db
 from app.models.workspace import WorkspaceRole
 from app.schemas.log_health import LogHealthResponse
 from app.services import log_health_service
@@ -24,7 +24,7 @@ router = APIRouter(prefix="/projects", tags=["log-health"])
 )
 async def get_log_health(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
 ):
     """24h 윈도우 LogEvent 헬스 메트릭. 멤버 누구나."""
@@ -12,6 +12,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import tracing
 from app.database import AsyncSessionLocal, get_db
 from app.models.log_event import LogEvent, LogLevel
 from app.services import log_ingest_service
@@ -36,6 +37,7 @@ async def _process_log_event_in_new_session(event_id) -> None:
 
 
 @router.post("/log-ingest")
+@tracing.traced(log_ingest_service.INGEST_REQUEST_SPAN, kind="server")
 async def ingest_logs(
     request: Request,
     background_tasks: BackgroundTasks,
@@ -52,26 +54,36 @@ async def ingest_logs(
     - 401: 인증 실패 (사유 구분 안 함, timing attack 회피)
     - 429: rate limit 초과 (Retry-After 헤더)
     - 500: DB 쓰기 실패
+    - 503: 토큰 verify pool 포화 (Retry-After 헤더) — 재시도
     """
     body = await request.body()
+    invalid_payload = log_ingest_service.INGEST_BATCHES.labels(outcome="invalid_payload")
 
     if content_encoding == "gzip":
         try:
             body = gzip.decompress(body)
         except Exception:
+            invalid_payload.inc()
             raise HTTPException(status_code=400, detail="gzip decode failed")
 
     try:
         payload = json.loads(body)
     except Exception:
+        invalid_payload.inc()
         raise HTTPException(status_code=400, detail="invalid JSON body")
 
     if not isinstance(payload, dict):
+        invalid_payload.inc()
         raise HTTPException(status_code=400, detail="payload must be a JSON object")
 
-    # 토큰 검증 (HTTPException 401 raise 시 그대로 propagate)
-    key_id, secret = await log_ingest_service.parse_token(authorization)
-    token = await log_ingest_service.verify_token(db, key_id, secret)
+    # 토큰 검증 (HTTPException 401 / 503 raise 시 그대로 propagate)
+    try:
+        key_id, secret = await log_ingest_service.parse_token(authorization)
+        token = await log_ingest_service.verify_token(db, key_id, secret)
+    except HTTPException as exc:
+        outcome = "shed" if exc.status_code == 503 else "unauthorized"
+        log_ingest_service.INGEST_BATCHES.labels(outcome=outcome).inc()
+        raise
 
     # ingest_batch 가 rate limit + validate + insert + commit 처리
     try:
@@ -95,8 +107,9 @@ async def ingest_logs(
             .where(LogEvent.level.in_([LogLevel.ERROR, LogLevel.CRITICAL]))
         )
         error_ids = (await db.execute(error_stmt)).scalars().all()
+        # trace context 를 묶어 큐 — fingerprint → upsert → 알림이 이 요청의 trace 로 이어짐
         for eid in error_ids:
-            background_tasks.add_task(_process_log_event_in_new_session, eid)
+            background_tasks.add_task(tracing.bind(_process_log_event_in_new_session), eid)
 
     # 모두 invalid → 400
     if accepted == 0 and rejected:
@@ -1,4 +1,7 @@
-"""GET /logs — LogEvent raw 조회 + pg_trgm 풀텍스트.
+"""GET /logs — LogEvent raw 조회 + tsvector 풀텍스트 (log_search_service 문법).
+GET /logs/stream — live tail (SSE, log_stream_service fan-out).
+GET /logs/export — NDJSON / CSV 스트리밍 export (log_export_service).
+GET /requests/{request_id} — 한 request 의 이벤트 타임라인.
 
 설계서: 2026-05-01-error-log-phase4-query-design.md §3.3
 """
@@ -6,39 +9,222 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_project_member
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.log_event import LogLevel
 from app.models.workspace import WorkspaceRole
-from app.schemas.log_query import LogEventListResponse, LogEventSummary
-from app.services import log_query_service
+from app.schemas.log_query import (
+    LogEventListItem,
+    LogEventListResponse,
+    LogEventSummary,
+    RequestTraceEvent,
+    RequestTraceResponse,
+)
+from app.services import (
+    log_export_service,
+    log_query_service,
+    log_search_service,
+    log_stream_service,
+)
 
 router = APIRouter(prefix="/projects", tags=["log-logs"])
 
+_EXTRA_PARAM_PREFIX = "extra."
+
+
+def _extra_filters(request: Request) -> dict[str, str]:
+    """`?extra.tenant_id=acme&extra.user.plan=pro` → {"tenant_id": "acme", "user.plan": "pro"}."""
+    filters = {
+        key.removeprefix(_EXTRA_PARAM_PREFIX): value
+        for key, value in request.query_params.items()
+        if key.startswith(_EXTRA_PARAM_PREFIX)
+    }
+    if len(filters) > log_search_service.MAX_EXTRA_FILTERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"too many extra filters (max {log_search_service.MAX_EXTRA_FILTERS})",
+        )
+    return filters
+
 
 @router.get(
     "/{project_id}/logs",
     response_model=LogEventListResponse,
+    response_model_exclude_unset=True,
 )
 async def list_logs(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     level: LogLevel | None = None,
     since: datetime | None = None,
     q: str | None = Query(default=None, min_length=2, max_length=200),
+    request_id: str | None = Query(default=None, max_length=200),
+    user_id: str | None = Query(default=None, max_length=200),
+    sort: log_query_service.LogSort | None = None,
+    cursor: str | None = None,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
+    total_mode: log_query_service.TotalMode = Query(default="estimate", alias="total"),
+    fields: str | None = Query(default=None, max_length=500),
     _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
 ):
-    """LogEvent 목록. q (풀텍스트) 사용 시 자동 level >= WARNING 필터."""
-    rows, total = await log_query_service.list_logs(
-        db, project_id=project_id,
-        level=level, since=since, q=q, offset=offset, limit=limit,
-    )
+    """LogEvent 목록. q 는 풀텍스트 검색 (모든 level, level 필터와 AND).
+
+    sort 미지정 시 q 의 텍스트 항이 있으면 relevance, 아니면 recent.
+    extra 필터는 `extra.<key>=<value>` 쿼리 파라미터 (중첩 키는 `.` 경로, 여러 개면 AND).
+
+    fields=level,message,... 로 응답 필드 (= SELECT 컬럼) 를 고름. 기본은 목록용 요약 필드,
+    extra / stack_trace / stack_frames / request_id / user_id_external 은 지정 시에만.
+    다음 페이지는 응답의 next_cursor 를 `cursor=` 로 전달 (offset 은 구 클라이언트 호환).
+    """
+    try:
+        rows, total = await log_query_service.list_logs(
+            db, project_id=project_id,
+            level=level, since=since, q=q,
+            request_id=request_id, user_id_external=user_id, extra=_extra_filters(request),
+            sort=sort, cursor=cursor,
+            offset=offset, limit=limit, total_mode=total_mode,
+            fields=log_query_service.split_fields(fields),
+        )
+    except (
+        log_query_service.InvalidCursorError,
+        log_query_service.InvalidFieldsError,
+        log_search_service.InvalidSearchQueryError,
+    ) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     return LogEventListResponse(
-        items=[LogEventSummary.model_validate(r) for r in rows],
+        # Core Row → dict (ORM hydration 없음). 선택된 컬럼만 set → exclude_unset 으로 그 키만 응답
+        items=[LogEventListItem.model_validate(dict(r._mapping)) for r in rows],
         total=total,
+        total_is_estimate=log_query_service.is_estimated_total(total_mode, total),
+        next_cursor=_next_cursor(rows, limit),
+    )
+
+
+def _next_cursor(rows: list, limit: int) -> str | None:
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    # relevance 로 조회된 row 에만 search_rank 컬럼이 있음
+    sort = "relevance" if "search_rank" in last._mapping else "recent"
+    return log_query_service.log_cursor(last, sort)
+
+
+@router.get("/{project_id}/logs/stream")
+async def stream_logs(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    level: LogLevel | None = None,
+    logger: str | None = Query(default=None, max_length=200),
+    q: str | None = Query(default=None, min_length=2, max_length=200),
+    _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
+):
+    """새로 ingest 되는 LogEvent 를 SSE 로 push (`log` / `dropped` / `resync` 이벤트).
+
+    /logs 폴링 대체 — 필터는 서버 측 (level 정확히 일치, logger 는 하위 logger 포함,
+    q 는 단어 AND 부분 문자열). 과거 구간은 /logs 로 조회.
+    """
+    # 권한 확인 끝 — 스트림 수명 동안 DB 연결을 붙잡지 않도록 세션 즉시 반납
+    await db.close()
+    hub = log_stream_service.hub
+    if not hub.has_capacity():
+        raise HTTPException(status_code=503, detail="Live tail is at capacity, retry later")
+    stream_filter = log_stream_service.StreamFilter(level=level, logger=logger, q=q)
+    return StreamingResponse(
+        log_stream_service.sse_stream(hub, project_id, stream_filter),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+@router.get("/{project_id}/logs/export")
+async def export_logs(
+    project_id: UUID,
+    request: Request,
+    fmt: log_export_service.ExportFormat = Query(default="ndjson", alias="format"),
+    gzip: bool = False,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    level: LogLevel | None = None,
+    q: str | None = Query(default=None, min_length=2, max_length=200),
+    request_id: str | None = Query(default=None, max_length=200),
+    user_id: str | None = Query(default=None, max_length=200),
+    cursor: str | None = None,
+    _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
+):
+    """[since, until) 구간 LogEvent 전체를 received_at 오름차순으로 스트리밍 (기본 최근 1일, 최대 31일).
+
+    필터는 /logs 와 동일 (extra.<key>=<value> 포함). 각 row 의 cursor 를 같은 필터와 함께
+    `cursor=` 로 넘기면 그 row 다음부터 재개. 프로젝트당 동시 export 상한 초과 시 429.
+    """
+    try:
+        export = await log_export_service.open_export(
+            project_id=project_id, fmt=fmt, gzip=gzip,
+            since=since, until=until, level=level, q=q,
+            request_id=request_id, user_id_external=user_id, extra=_extra_filters(request),
+            cursor=cursor,
+        )
+    except (
+        log_export_service.InvalidExportRangeError,
+        log_query_service.InvalidCursorError,
+        log_search_service.InvalidSearchQueryError,
+    ) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except log_export_service.ExportBusyError as exc:
+        raise HTTPException(status_code=429, detail=str(exc))
+
+    filename = f"logs-{project_id}.{fmt}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        export.body(),
+        media_type="application/gzip" if gzip else _EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        background=BackgroundTask(export.close),  # 본문이 시작되지 못한 경우에도 세션 반납
+    )
+
+
+@router.get(
+    "/{project_id}/requests/{request_id}",
+    response_model=RequestTraceResponse,
+)
+async def get_request_trace(
+    project_id: UUID,
+    request_id: str,
+    db: AsyncSession = Depends(get_read_db),
+    since: datetime | None = None,
+    _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
+):
+    """request_id 한 건의 모든 이벤트를 emitted_at 순으로. offset / duration 은 ms."""
+    rows, truncated = await log_query_service.get_request_trace(
+        db, project_id=project_id, request_id=request_id, since=since,
+    )
+    if not rows:
+        raise HTTPException(status_code=404, detail="Request not found")
+    started_at = rows[0].emitted_at
+
+    def offset_ms(at: datetime) -> float:
+        return round((at - started_at).total_seconds() * 1000, 3)
+
+    return RequestTraceResponse(
+        request_id=request_id,
+        started_at=started_at,
+        duration_ms=offset_ms(rows[-1].emitted_at),
+        events=[
+            RequestTraceEvent(
+                **LogEventSummary.model_validate(r).model_dump(),
+                user_id_external=r.user_id_external,
+                extra=r.extra,
+                offset_ms=offset_ms(r.emitted_at),
+            )
+            for r in rows
+        ],
+        truncated=truncated,
     )
@@ -13,6 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_project_member
+from app.core.security import hash_executor
 from app.database import get_db
 from app.models.log_ingest_token import LogIngestToken
 from app.models.workspace import WorkspaceRole
@@ -46,9 +47,9 @@ async def create_log_token(
     """토큰 발급 — 응답에 평문 token 1회만, DB 에는 bcrypt(secret) 만."""
     # 256-bit secret + bcrypt cost 12
     secret = secrets.token_urlsafe(32)
-    secret_hash = bcrypt.hashpw(
-        secret.encode("utf-8"), bcrypt.gensalt(rounds=12),
-    ).decode("utf-8")
+    secret_hash = (await hash_executor.run(
+        "token_hash", bcrypt.hashpw, secret.encode("utf-8"), bcrypt.gensalt(rounds=12),
+    )).decode("utf-8")
 
     token = LogIngestToken(
         project_id=project_id,
@@ -0,0 +1,27 @@
+"""GET /profiles/{profile_id} — on-demand profiling 결과 다운로드 (app/core/profiling.py).
+
+X-Forps-Profile 서명 헤더 (mode 무관, 미만료) 필요. profiling 꺼져 있으면 404.
+"""
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from app.config import settings
+from app.core import profiling
+
+router = APIRouter(prefix="/profiles", tags=["profiling"])
+
+
+@router.get("/{profile_id}", include_in_schema=False)
+async def download_profile(
+    profile_id: str,
+    x_forps_profile: str | None = Header(default=None, alias=profiling.PROFILE_HEADER),
+):
+    if not settings.profiling_secret:
+        raise HTTPException(status_code=404, detail="Profiling disabled")
+    if x_forps_profile is None or profiling.verify(settings.profiling_secret, x_forps_profile) is None:
+        raise HTTPException(status_code=401, detail="Invalid profile signature")
+    path = profiling.profile_path(settings.profiling_dir, profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
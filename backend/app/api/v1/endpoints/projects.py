@@ -15,7 +15,7 @@ from app.schemas.project import (
     UpdateProjectMemberRequest,
 )
 from app.services import project_service, workspace_service
-from app.services.permission_service import can_edit
+from app.services.permission_service import can_edit, invalidate_project, invalidate_role
 
 router = APIRouter(tags=["projects"])
 
@@ -149,6 +149,7 @@ async def delete_project(
     await check_project_member(db, user.id, project_id, min_role=WorkspaceRole.OWNER)
 
     await project_service.delete_project(db, project)
+    invalidate_project(project_id)
 
 
 @router.get(
@@ -180,9 +181,12 @@ async def add_project_member(
     if not target_user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return await project_service.upsert_project_member(
+    member = await project_service.upsert_project_member(
         db, project_id, target_user.id, data.role
     )
+    # 기존 멤버 재추가 = role 변경 — cache 된 이전 role 제거
+    invalidate_role(target_user.id, project_id)
+    return member
 
 
 @router.patch(
@@ -203,9 +207,11 @@ async def update_project_member_role(
     if not member:
         raise HTTPException(status_code=404, detail="Project member not found")
 
-    return await project_service.upsert_project_member(
+    updated = await project_service.upsert_project_member(
         db, project_id, member_user_id, data.role
     )
+    invalidate_role(member_user_id, project_id)
+    return updated
 
 
 @router.delete(
@@ -230,3 +236,4 @@ async def remove_project_member(
     )
     if not success:
         raise HTTPException(status_code=404, detail="Project member not found")
+    invalidate_role(member_user_id, project_id)
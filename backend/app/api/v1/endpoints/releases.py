@@ -0,0 +1,77 @@
+"""GET /releases/compare — 두 배포 버전 간 새 에러 / 사라진 에러 / 발생률 증가.
+
+설계서: 2026-05-01-error-log-phase4-query-design.md §2.2
+멤버 누구나 (VIEWER 포함).
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_project_member
+from app.database import get_read_db
+from app.models.workspace import WorkspaceRole
+from app.schemas.log_query import ErrorGroupSummary
+from app.schemas.release import ReleaseCompareResponse, ReleaseGroupDelta, ReleaseVersion
+from app.services import release_compare_service
+from app.services.release_compare_service import GroupDelta, VersionSummary
+
+router = APIRouter(prefix="/projects", tags=["releases"])
+
+_SHA_PATTERN = release_compare_service.SHA_PREFIX_RE.pattern
+
+
+def _version(summary: VersionSummary) -> ReleaseVersion:
+    return ReleaseVersion(
+        version_sha=summary.version_sha,
+        first_seen_at=summary.observation.first_seen_at,
+        last_seen_at=summary.observation.last_seen_at,
+        observed_hours=round(summary.observed_hours, 3),
+        error_events=sum(summary.counts.values()),
+    )
+
+
+def _delta(d: GroupDelta) -> ReleaseGroupDelta:
+    return ReleaseGroupDelta(
+        fingerprint=d.fingerprint,
+        group=ErrorGroupSummary.model_validate(d.group) if d.group is not None else None,
+        base_count=d.base_count,
+        head_count=d.head_count,
+        base_rate_per_hour=round(d.base_rate, 4),
+        head_rate_per_hour=round(d.head_rate, 4),
+    )
+
+
+@router.get(
+    "/{project_id}/releases/compare",
+    response_model=ReleaseCompareResponse,
+)
+async def compare_releases(
+    project_id: UUID,
+    base: str = Query(pattern=_SHA_PATTERN),
+    head: str = Query(pattern=_SHA_PATTERN),
+    environment: str = Query(default="production", max_length=100),
+    rate_factor: float = Query(default=release_compare_service.DEFAULT_RATE_FACTOR, gt=1.0),
+    min_events: int = Query(default=release_compare_service.DEFAULT_MIN_EVENTS, ge=1),
+    db: AsyncSession = Depends(get_read_db),
+    _role: WorkspaceRole = Depends(require_project_member(hide_existence=True)),
+):
+    """base / head 는 전체 SHA 또는 7자 이상 prefix. 관측 기록 없는 버전이면 404."""
+    try:
+        result = await release_compare_service.compare_versions(
+            db, project_id=project_id, environment=environment,
+            base_sha=base, head_sha=head, rate_factor=rate_factor, min_events=min_events,
+        )
+    except release_compare_service.AmbiguousVersionError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Version not observed")
+    return ReleaseCompareResponse(
+        environment=result.environment,
+        base=_version(result.base),
+        head=_version(result.head),
+        new=[_delta(d) for d in result.new],
+        disappeared=[_delta(d) for d in result.disappeared],
+        increased=[_delta(d) for d in result.increased],
+    )
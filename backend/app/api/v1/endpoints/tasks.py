@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import check_project_member, require_project_member
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.dependencies import CurrentUser
 from app.models.task import TaskStatus
 from app.models.workspace import WorkspaceRole
@@ -29,7 +29,7 @@ async def list_project_tasks(
     status: TaskStatus | None = None,
     assignee_id: UUID | None = None,
     mine_only: bool = False,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     _role: WorkspaceRole = Depends(require_project_member()),
 ):
     """프로젝트의 태스크 목록 (Board용)"""
@@ -55,7 +55,7 @@ async def create_task(
 async def get_week_tasks(
     user: CurrentUser,
     week_start: date = Query(...),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """주간 태스크 조회"""
     return await task_service.get_week_tasks(db, user.id, week_start)
@@ -65,7 +65,7 @@ async def get_week_tasks(
 async def get_task(
     task_id: UUID,
     user: CurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """태스크 상세"""
     task = await task_service.get_task(db, task_id)
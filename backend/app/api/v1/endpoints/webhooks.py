@@ -18,7 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.crypto import decrypt_secret
 from app.database import AsyncSessionLocal, get_db
 from app.schemas.webhook import GitHubPushPayload
-from app.services.git_repo_service import fetch_compare_files, fetch_file
+from app.services.git_repo_service import get_fetchers
 from app.services.github_webhook_service import (
     find_project_by_repo_url,
     record_push_event,
@@ -100,10 +100,11 @@ async def _run_sync_in_new_session(event_id):
             )).scalar_one_or_none()
             if event is None:
                 return
+            fetch_file, fetch_compare = get_fetchers()
             await process_event(
                 db, event,
                 fetch_file=fetch_file,
-                fetch_compare=fetch_compare_files,
+                fetch_compare=fetch_compare,
             )
     except Exception:
         logger.exception("background sync failed for event %s", event_id)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,6 +16,74 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # 읽기 전용 streaming replica (선택) — 설정 시 get_read_db endpoint 가 replica 로.
+    # replay 지연이 replica_max_lag_seconds 를 넘으면 primary fallback (측정은 replica_lag_check_seconds 마다),
+    # 쓰기 요청 후 read_your_writes_seconds 동안은 같은 클라이언트의 읽기도 primary.
+    # replica 접속 role 에 pg_read_all_stats 필요 (WAL 수신 상태 확인 — 없으면 쓰기 없는 동안 lag 판정이 보수적)
+    database_read_url: str | None = None
+    replica_max_lag_seconds: float = 5.0
+    replica_lag_check_seconds: float = 1.0
+    read_your_writes_seconds: float = 10.0
+    # 연결 pool (primary / replica 각각) — pool_size + max_overflow 가 프로세스당 최대 연결 수
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # checkout 대기 상한 (초) — 초과 시 TimeoutError
+    db_pool_recycle: int = 1800  # 이보다 오래된 연결은 checkout 시 재연결 (초, -1 = 끔)
+    db_pool_pre_ping: bool = True
+    # error group 상세는 직전 정상 SHA 조회를 별도 pooled 연결에서 병렬 — 요청당 연결 2개.
+    # 그 두 번째 연결의 프로세스당 동시 상한 (넘치면 연결 1개로 순차, 0 = 항상 순차).
+    # pool_size + max_overflow 안에서 다른 요청 몫을 남기도록 잡을 것
+    db_sibling_sessions: int = 4
+    # checkout 대기가 이 값 (ms) 을 넘으면 warning 로그
+    db_slow_checkout_ms: float = 200.0
+    # pgbouncer transaction pooling 뒤 — prepared statement cache 끔 + statement 이름 고유화.
+    # (LISTEN 기반 live tail 은 transaction pooling 에서 동작 안 함 — DATABASE_URL 은 session 모드 권장)
+    db_pgbouncer: bool = False
+
+    # 요청별 SQL 계측 (Server-Timing 헤더 + 로그) — DB 시간이 sql_slow_request_ms 이상이면 info,
+    # 같은 statement 가 sql_repeat_threshold 번 이상이면 N+1 후보 warning
+    sql_instrumentation_enabled: bool = True
+    sql_slow_request_ms: float = 500.0
+    sql_repeat_threshold: int = 5
+
+    # /metrics (Prometheus text format) — 기본 꺼짐 (404). metrics_token 설정 시 `Authorization: Bearer <token>`
+    # 필요, 토큰 없이 열려면 metrics_public=true 명시 (내부망 전용 배포 등).
+    # 멀티 워커면 metrics_multiproc_dir (워커 공유 디렉터리, 배포마다 비움) 로 파일 기반 합산
+    metrics_token: str | None = None
+    metrics_public: bool = False
+    metrics_multiproc_dir: str | None = None
+    metrics_flush_seconds: float = 5.0
+
+    # on-demand profiling (app/core/profiling.py) — profiling_secret 미설정이면 middleware 자체를 안 붙임.
+    # 서명 헤더 (admin) 또는 프로젝트 OWNER 의 `?profile=<mode>` 로 요청 1건을 profiler 아래에서 실행,
+    # 결과는 profiling_dir 에 최근 profiling_keep 개만 보관
+    profiling_secret: str | None = None
+    profiling_dir: str = str(BASE_DIR / "var" / "profiles")
+    profiling_keep: int = 50
+
+    # in-process tracing (app/core/tracing.py) — none 이면 span 을 만들지 않음.
+    # console: stdout 에 span 1줄씩 / otlp_file: tracing_otlp_path 에 OTLP/JSON (flush 마다 1줄 append)
+    tracing_exporter: Literal["none", "console", "otlp_file"] = "none"
+    tracing_otlp_path: str = str(BASE_DIR / "var" / "traces" / "spans.otlp.jsonl")
+    tracing_flush_seconds: float = 5.0
+    tracing_db_spans: bool = True  # statement 마다 db.query span (span 수가 가장 많음)
+
+    # 프로젝트 role 프로세스 cache TTL (초, 0 = 끔). 읽기 요청의 VIEWER 확인에만 사용 — 멀티 워커에서
+    # 제거된 멤버가 다른 워커에서 읽기 가능한 최대 시간 (EDITOR / OWNER 확인, 쓰기 요청은 항상 DB)
+    auth_role_cache_seconds: float = 30.0
+
+    # bcrypt (로그인 / 가입 / 토큰 발급) 전용 thread pool — 동시 실행 workers 개 + 대기 max_queue 개,
+    # 넘치면 503. bcrypt 가 GIL 을 놓으므로 workers 는 워커당 할당 코어 수 정도
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 32
+
+    # log ingest 토큰 verify 는 별도 pool — 로그인 폭주가 ingest 를 503 으로 밀어내지 않게.
+    # workers None = asyncio.to_thread 기본값 (cpu + 4, 최대 32)
+    ingest_token_verify_workers: int | None = None
+    ingest_token_verify_max_queue: int = 256
+    # verify 성공한 (key_id, secret) 재사용 TTL (초, 0 = 끔) — 같은 토큰의 연속 batch 는 bcrypt 생략.
+    # revoke 는 매 요청 DB 에서 확인하므로 즉시 반영
+    ingest_token_cache_seconds: float = 60.0
 
     # JWT
     secret_key: str
@@ -33,5 +102,17 @@ class Settings(BaseSettings):
     # Phase 3 — fingerprint 정규화: 절대경로→상대경로 strip 시 prefix
     app_project_root: str = "backend/"
 
+    # PLAN / handoff fetch backend — "api" (GitHub Contents/Compare) | "mirror" (로컬 bare mirror)
+    git_fetch_backend: Literal["api", "mirror"] = "api"
+    git_mirror_root: str = str(BASE_DIR / "var" / "git-mirrors")
+
+    # shutdown 시 in-flight background 작업 (reaper 등) drain 대기 상한 (초)
+    shutdown_drain_seconds: float = 10.0
+
+    # log live tail (SSE) — ingest NOTIFY on/off, 구독자별 buffer, 프로세스당 구독자 상한
+    log_stream_enabled: bool = True
+    log_stream_buffer_size: int = 1000
+    log_stream_max_subscribers: int = 200
+
 
 settings = Settings()
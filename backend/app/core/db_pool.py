@@ -0,0 +1,159 @@
+"""DB 연결 pool 계측 — checkout 대기 시간 histogram / 사용 중 / overflow / timeout.
+
+pool event (checkout / checkin) 는 대기 *후* 에만 불려 대기 시간을 못 잼 → pool class 의
+`_do_get` (queue 대기 + 새 연결 생성) 을 감싸 측정. pre_ping 은 포함 안 됨.
+대기 시간이 slow_checkout_ms 를 넘으면 pool 상태와 함께 warning (SLOW_WARNING_INTERVAL 당 1번,
+그 사이 건수는 다음 warning 에 합산) — ingest 피크에 요청이 조용히 연결을 기다리는 것을 드러냄.
+"""
+
+import bisect
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import REGISTRY, MetricFamily, Sample
+
+logger = logging.getLogger(__name__)
+
+# checkout 대기 histogram 상한 (ms). 마지막 bucket 은 +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+SLOW_WARNING_INTERVAL = 10.0
+
+
+class PoolMetrics:
+    """pool 1개의 누적 지표. 값 갱신은 event loop thread 에서만 (lock 불필요)."""
+
+    def __init__(self, name: str, *, slow_checkout_ms: float) -> None:
+        self.name = name
+        self.slow_checkout_ms = slow_checkout_ms
+        self.pool: Any = None  # 현재 pool (recreate 시 교체) — 사용 중 / overflow 는 조회 시점 값
+        self.wait_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_sum_ms = 0.0
+        self.checkouts = 0
+        self.timeouts = 0
+        self._slow_since_warning = 0
+        self._last_warning: float | None = None
+
+    def observe_wait(self, wait_ms: float, *, timed_out: bool = False) -> None:
+        self.wait_counts[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+        self.wait_sum_ms += wait_ms
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        if wait_ms >= self.slow_checkout_ms:
+            self._slow_since_warning += 1
+            self._maybe_warn(wait_ms, timed_out)
+
+    def _maybe_warn(self, wait_ms: float, timed_out: bool) -> None:
+        now = time.monotonic()
+        if self._last_warning is not None and now - self._last_warning < SLOW_WARNING_INTERVAL:
+            return
+        logger.warning(
+            "db pool %s: slow checkout %.0fms%s (%d slow since last warning) — %s",
+            self.name, wait_ms, " (timed out)" if timed_out else "",
+            self._slow_since_warning, self.pool.status() if self.pool is not None else "no pool",
+        )
+        self._slow_since_warning = 0
+        self._last_warning = now
+
+    def snapshot(self) -> dict[str, Any]:
+        pool = self.pool
+        return {
+            "size": pool.size() if pool is not None else 0,
+            "in_use": pool.checkedout() if pool is not None else 0,
+            # QueuePool.overflow() 는 pool_size 미만이면 음수
+            "overflow": max(pool.overflow(), 0) if pool is not None else 0,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_ms": {
+                "buckets": {
+                    **{str(le): count for le, count in zip(WAIT_BUCKETS_MS, self.wait_counts)},
+                    "+Inf": self.wait_counts[-1],
+                },
+                "sum": round(self.wait_sum_ms, 3),
+                "count": self.checkouts + self.timeouts,
+            },
+        }
+
+
+class _PoolInstrumentation:
+    """QueuePool 계열 mixin — `_do_get` 소요 시간을 metrics 에 기록."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.observe_wait((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_wait((time.perf_counter() - started) * 1000)
+        return record
+
+    def recreate(self):
+        # engine.dispose() 등으로 새 pool 이 만들어져도 같은 metrics 유지
+        pool = super().recreate()
+        attach_metrics(pool, self.metrics)
+        return pool
+
+
+class InstrumentedAsyncPool(_PoolInstrumentation, AsyncAdaptedQueuePool):
+    """create_async_engine(poolclass=...) 용."""
+
+
+def attach_metrics(pool: Any, metrics: PoolMetrics | None) -> None:
+    pool.metrics = metrics
+    if metrics is not None:
+        metrics.pool = pool
+
+
+# engine 이름 ("primary" / "replica") → metrics. /ready 등에서 조회
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def instrument_engine_pool(engine: Any, name: str, *, slow_checkout_ms: float) -> PoolMetrics:
+    metrics = PoolMetrics(name, slow_checkout_ms=slow_checkout_ms)
+    attach_metrics(engine.sync_engine.pool if hasattr(engine, "sync_engine") else engine.pool, metrics)
+    pool_metrics[name] = metrics
+    return metrics
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+
+def _collect() -> list[MetricFamily]:
+    """/metrics collector — scrape 시점 pool 상태 + 누적 checkout 지표."""
+    connections = MetricFamily(
+        "forps_db_pool_connections", "gauge", "DB pool connections by state (size / in_use / overflow)",
+    )
+    checkouts = MetricFamily(
+        "forps_db_pool_checkouts_total", "counter", "DB pool checkouts by result (ok / timeout)",
+    )
+    wait = MetricFamily(
+        "forps_db_pool_checkout_wait_seconds", "histogram", "Time spent waiting for a pooled connection",
+    )
+    for name, metrics in pool_metrics.items():
+        snap = metrics.snapshot()
+        for state in ("size", "in_use", "overflow"):
+            connections.samples.append(Sample("", {"pool": name, "state": state}, snap[state]))
+        checkouts.samples.append(Sample("", {"pool": name, "result": "ok"}, metrics.checkouts))
+        checkouts.samples.append(Sample("", {"pool": name, "result": "timeout"}, metrics.timeouts))
+        cumulative = 0
+        for bound_ms, count in zip((*WAIT_BUCKETS_MS, None), metrics.wait_counts):
+            cumulative += count
+            le = "+Inf" if bound_ms is None else str(bound_ms / 1000)
+            wait.samples.append(Sample("_bucket", {"pool": name, "le": le}, cumulative))
+        wait.samples.append(Sample("_sum", {"pool": name}, metrics.wait_sum_ms / 1000))
+        wait.samples.append(Sample("_count", {"pool": name}, cumulative))
+    return [connections, checkouts, wait]
+
+
+REGISTRY.add_collector(_collect)
@@ -0,0 +1,167 @@
+"""읽기 전용 replica 라우팅 — replica lag 감시 + read-your-writes pin.
+
+- ReplicaLagMonitor: replica 의 replay 지연을 check_interval 마다 1번만 측정 (요청마다 쿼리 안 함).
+  측정 실패 / max_lag_seconds 초과면 unhealthy → get_read_db 가 primary 로 fallback.
+- read-your-writes: 쓰기 요청 (POST/PUT/PATCH/DELETE) 은 그 요청 내내 primary 고정, 성공 응답에
+  `X-Forps-Primary-Until` (epoch 초) 를 실어 보냄. 클라이언트가 이 값을 다음 요청 헤더로 되돌려
+  보내면 그 시각까지 읽기도 primary — 방금 쓴 내용이 replica 에 아직 없어 사라져 보이는 것 방지.
+  쿠키가 아닌 헤더 — frontend 는 Bearer 토큰 + cross-origin (withCredentials 없음).
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_UNTIL_HEADER = "X-Forps-Primary-Until"
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# replica 상태 원자료 — lag 판정은 replica_lag (DB 없이 테스트 가능하게 분리).
+# pg_stat_wal_receiver.status 는 pg_read_all_stats 권한이 없으면 NULL → streaming 아님으로 취급 (안전한 쪽)
+_REPLICA_STATE_SQL = text("""
+    SELECT pg_is_in_recovery() AS in_recovery,
+           COALESCE(pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn(), false) AS caught_up,
+           EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') AS streaming,
+           EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())::float8 AS replay_age
+""")
+
+
+def replica_lag(
+    *, in_recovery: bool, caught_up: bool, streaming: bool, replay_age: float | None,
+) -> float:
+    """replay 지연 (초). primary 면 0.
+
+    streaming 중이고 받은 WAL 을 모두 replay 했으면 0 — 쓰기가 없는 동안
+    pg_last_xact_replay_timestamp 가 멈춰 있어 lag 가 커 보이는 것 방지.
+    WAL 수신이 끊기면 (walreceiver 중단 / primary 연결 불가) receive == replay 라도 "따라잡음" 이 아님 →
+    마지막 replay 이후 경과 시간 (그동안 primary 쓰기를 못 받았을 수 있음). replay 기록이 없으면 무한대.
+    """
+    if not in_recovery:
+        return 0.0
+    if caught_up and streaming:
+        return 0.0
+    if replay_age is None:
+        return float("inf")
+    return replay_age
+
+
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+
+def primary_pinned() -> bool:
+    """현재 요청이 primary 고정인지 (쓰기 요청 또는 X-Forps-Primary-Until 유효)."""
+    return _primary_pinned.get()
+
+
+def pin_primary() -> None:
+    """현재 요청의 남은 읽기를 primary 로 — GET 처리 중 쓰기를 하는 코드용."""
+    _primary_pinned.set(True)
+
+
+def engine_lag_probe(engine: AsyncEngine) -> Callable[[], Awaitable[float]]:
+    async def measure() -> float:
+        async with engine.connect() as conn:
+            state = (await conn.execute(_REPLICA_STATE_SQL)).one()
+        return replica_lag(**state._asdict())
+
+    return measure
+
+
+class ReplicaLagMonitor:
+    """replica lag 캐시. 동시 요청이 몰려도 측정은 check_interval 당 1번 (lock + 재확인)."""
+
+    def __init__(
+        self,
+        measure: Callable[[], Awaitable[float]],
+        *,
+        max_lag_seconds: float,
+        check_interval: float = 1.0,
+        timeout: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._measure = measure
+        self._max_lag = max_lag_seconds
+        self._interval = check_interval
+        self._timeout = timeout
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._checked_at: float | None = None
+        self._healthy = False
+        self.lag: float | None = None  # 마지막 측정값 (초). 측정 실패면 None
+
+    def _fresh(self) -> bool:
+        return self._checked_at is not None and self._clock() - self._checked_at < self._interval
+
+    async def healthy(self) -> bool:
+        if self._fresh():
+            return self._healthy
+        async with self._lock:
+            if self._fresh():  # 대기 중 다른 요청이 이미 측정
+                return self._healthy
+            try:
+                lag: float | None = await asyncio.wait_for(self._measure(), self._timeout)
+            except Exception as exc:  # noqa: BLE001 — 연결 실패 / timeout 모두 primary fallback
+                logger.warning("replica lag check failed: %s", exc)
+                lag = None
+            healthy = lag is not None and lag <= self._max_lag
+            if healthy != self._healthy:
+                if healthy:
+                    logger.info("replica reads resumed (lag=%.2fs)", lag)
+                elif lag is not None:
+                    logger.warning(
+                        "replica lag %.2fs > %.2fs — reads fall back to primary", lag, self._max_lag,
+                    )
+            self.lag = lag
+            self._healthy = healthy
+            self._checked_at = self._clock()
+            return healthy
+
+
+class ReadYourWritesMiddleware:
+    """요청별 primary pin 설정 + 쓰기 성공 응답에 X-Forps-Primary-Until 부착 (pure ASGI)."""
+
+    def __init__(
+        self, app: ASGIApp, *, pin_seconds: float, clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.app = app
+        self.pin_seconds = pin_seconds
+        self.clock = clock
+
+    def _header_pin_active(self, scope: Scope, now: float) -> bool:
+        raw = Headers(scope=scope).get(PRIMARY_UNTIL_HEADER)
+        if raw is None:
+            return False
+        try:
+            until = float(raw)
+        except ValueError:
+            return False
+        # 클라이언트 값은 최대 pin_seconds 까지만 인정 (영구 primary 고정 방지)
+        return now < min(until, now + self.pin_seconds)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        now = self.clock()
+        write = scope["method"] in _WRITE_METHODS
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers[PRIMARY_UNTIL_HEADER] = f"{self.clock() + self.pin_seconds:.3f}"
+            await send(message)
+
+        token = _primary_pinned.set(write or self._header_pin_active(scope, now))
+        try:
+            await self.app(scope, receive, send_wrapper if write else send)
+        finally:
+            _primary_pinned.reset(token)
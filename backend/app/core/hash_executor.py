@@ -0,0 +1,110 @@
+"""bcrypt 전용 bounded executor — 비밀번호 hash / verify, log ingest 토큰 verify / 발급.
+
+인스턴스 (security.py): hash_executor (로그인 / 가입 / 토큰 발급), token_verify_executor (ingest 토큰
+verify) — 로그인 폭주로 ingest 가 503 되지 않게 pool 분리.
+
+bcrypt (cost 12) 1회 ≈ 250ms. async handler 에서 동기로 부르면 그동안 event loop 가 멈춰
+같은 워커의 모든 요청 (log ingest 포함) 이 대기 → 전용 thread pool 로 분리.
+bcrypt 는 C 구현이 hash 중 GIL 을 놓음 → thread 로도 코어 수만큼 병렬 (process pool 불필요).
+
+기본 executor (`asyncio.to_thread`) 는 상한이 없어 로그인 폭주 시 대기열이 끝없이 쌓임 →
+workers + max_queue 를 넘는 요청은 바로 503 (Retry-After) — 느리게 성공하느니 빨리 거절.
+
+metrics (op = password_hash / password_verify / token_hash / token_verify):
+- forps_bcrypt_seconds{op}          — worker 안 실행 시간
+- forps_bcrypt_queue_seconds{op}    — 제출 → 실행 시작 대기
+- forps_bcrypt_rejected_total{op}   — 포화로 503
+- forps_bcrypt_pending              — 실행 + 대기 중 건수
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.core.metrics import Counter, Gauge, Histogram
+
+T = TypeVar("T")
+
+_BCRYPT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+BCRYPT_SECONDS = Histogram(
+    "forps_bcrypt_seconds", "bcrypt hash / verify time inside the worker", ["op"], buckets=_BCRYPT_BUCKETS,
+)
+BCRYPT_QUEUE_SECONDS = Histogram(
+    "forps_bcrypt_queue_seconds", "Time bcrypt work waited for a free worker", ["op"],
+    buckets=_BCRYPT_BUCKETS,
+)
+BCRYPT_REJECTED = Counter(
+    "forps_bcrypt_rejected_total", "bcrypt work shed with 503 because the pool was saturated", ["op"],
+)
+BCRYPT_PENDING = Gauge(
+    "forps_bcrypt_pending", "bcrypt work running or queued", multiprocess_mode="sum",
+)
+
+
+class HashExecutor:
+    """동시 실행 workers 개 + 대기 max_queue 개까지. 그 이상은 503."""
+
+    def __init__(self, *, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        # worker thread 의 done callback 에서도 감소 → lock
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, op: str, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            saturated = self._pending >= self.workers + self.max_queue
+            if not saturated:
+                self._pending += 1
+        if saturated:
+            BCRYPT_REJECTED.labels(op=op).inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="forps-bcrypt")
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[T, float, float]:
+            started = time.perf_counter()
+            result = func(*args)
+            return result, started - submitted, time.perf_counter() - started
+
+        try:
+            future = self._executor.submit(timed)
+        except BaseException:
+            self._release()
+            raise
+        # 대기 중 요청이 취소돼도 worker 가 끝날 때까지 자리를 차지 — 실제 실행 수 기준으로 제한
+        future.add_done_callback(self._release)
+        BCRYPT_PENDING.set(self._pending)
+        result, queued, elapsed = await asyncio.wrap_future(future)
+        # metrics 갱신은 event loop thread 에서만
+        BCRYPT_QUEUE_SECONDS.labels(op=op).observe(queued)
+        BCRYPT_SECONDS.labels(op=op).observe(elapsed)
+        BCRYPT_PENDING.set(self._pending)
+        return result
+
+    def shutdown(self) -> None:
+        """lifespan 종료 — 진행 중인 작업은 thread 에서 마저 끝남 (loop 는 안 기다림). 이후 run 은 새 pool."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
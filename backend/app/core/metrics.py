@@ -0,0 +1,350 @@
+"""의존성 없는 metrics registry — Counter / Gauge / Histogram, Prometheus text format (0.0.4).
+
+사용:
+    INGEST_EVENTS = Counter("forps_ingest_events_total", "...", ["outcome"])
+    INGEST_EVENTS.labels(outcome="accepted").inc(n)
+    with INGEST_SECONDS.time(): ...
+
+값 갱신은 event loop thread 에서만 (lock 없음). label 조합은 코드에 고정된 값만 —
+사용자 입력 (project_id, 에러 메시지 등) 을 label 로 쓰지 않음 (cardinality 폭증).
+
+멀티 워커 (uvicorn --workers N / gunicorn): 프로세스마다 registry 가 따로라 한 워커의 /metrics 는
+일부만 보임 → `METRICS_MULTIPROC_DIR` 설정 시 파일 기반 집계. 각 프로세스가 주기적으로
+`{dir}/metrics_{pid}.json` 에 자기 값을 기록 (tmp + rename), /metrics 는 디렉터리 전체를 합산.
+- counter / histogram: 모든 파일 합 (종료된 프로세스 값도 유지 — 누적값이 줄지 않게)
+- gauge: 살아있는 프로세스만, multiprocess_mode 에 따라 sum 또는 max
+배포 (재시작) 마다 디렉터리를 비울 것 — 이전 배포의 counter 가 계속 더해짐.
+"""
+
+import json
+import math
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+GaugeMode = Literal["sum", "max"]
+LabelKey = tuple[str, ...]
+
+
+@dataclass
+class Sample:
+    suffix: str  # "" / "_bucket" / "_sum" / "_count"
+    labels: dict[str, str]
+    value: float
+
+
+@dataclass
+class MetricFamily:
+    name: str
+    type: str  # counter / gauge / histogram
+    help: str
+    samples: list[Sample] = field(default_factory=list)
+    mode: GaugeMode = "sum"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, "_Metric"] = {}
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = []
+
+    def register(self, metric: "_Metric") -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """scrape 시점에 값을 만드는 collector (예: pool 사용량)."""
+        self._collectors.append(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        families = [m.collect() for m in self._metrics.values()]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        *,
+        registry: Registry | None = REGISTRY,
+    ) -> None:
+        self.name = name
+        self.help = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[LabelKey, object] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+        if registry is not None:
+            registry.register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, **labels: str):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {sorted(labels)}")
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self._children[()]
+
+    def _label_dict(self, key: LabelKey) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+
+class _CounterChild(_Value):
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("counter can only increase")
+        self.value += amount
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().inc(amount)
+
+    def collect(self) -> MetricFamily:
+        return MetricFamily(self.name, self.type, self.help, [
+            Sample("", self._label_dict(key), child.value) for key, child in self._children.items()
+        ])
+
+
+class _GaugeChild(_Value):
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(self, *args, multiprocess_mode: GaugeMode = "sum", **kwargs) -> None:
+        self.mode = multiprocess_mode
+        super().__init__(*args, **kwargs)
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._unlabelled().dec(amount)
+
+    def collect(self) -> MetricFamily:
+        return MetricFamily(self.name, self.type, self.help, [
+            Sample("", self._label_dict(key), child.value) for key, child in self._children.items()
+        ], mode=self.mode)
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 = +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(*args, **kwargs)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self):
+        return self._unlabelled().time()
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        for key, child in self._children.items():
+            labels = self._label_dict(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), child.counts):
+                cumulative += count
+                family.samples.append(Sample("_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            family.samples.append(Sample("_sum", labels, child.sum))
+            family.samples.append(Sample("_count", labels, cumulative))
+        return family
+
+
+# ── text format ─────────────────────────────────────────────
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render(families: Iterable[MetricFamily]) -> str:
+    lines: list[str] = []
+    for family in families:
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for sample in family.samples:
+            labels = ""
+            if sample.labels:
+                labels = "{" + ",".join(
+                    f'{k}="{_escape(str(v))}"' for k, v in sample.labels.items()
+                ) + "}"
+            lines.append(f"{family.name}{sample.suffix}{labels} {_format_value(sample.value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ── multiprocess (file) mode ────────────────────────────────
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MultiprocessStore:
+    """프로세스별 JSON 파일 기록 + 디렉터리 합산."""
+
+    def __init__(self, directory: str | Path, *, pid: int | None = None) -> None:
+        self.directory = Path(directory)
+        self.pid = pid if pid is not None else os.getpid()
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"metrics_{self.pid}.json"
+
+    def write(self, registry: Registry) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "pid": self.pid,
+            "families": [
+                {
+                    "name": f.name, "type": f.type, "help": f.help, "mode": f.mode,
+                    "samples": [[s.suffix, s.labels, s.value] for s in f.samples],
+                }
+                for f in registry.collect()
+            ],
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(tmp, self.path)
+
+    def merge(self, *, is_alive: Callable[[int], bool] = _pid_alive) -> list[MetricFamily]:
+        families: dict[str, MetricFamily] = {}
+        values: dict[str, dict[tuple, float]] = {}
+        for path in sorted(self.directory.glob("metrics_*.json")):
+            try:
+                payload = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # 쓰는 중 / 깨진 파일은 이번 scrape 에서 제외
+            alive = payload["pid"] == self.pid or is_alive(payload["pid"])
+            for raw in payload["families"]:
+                if raw["type"] == "gauge" and not alive:
+                    continue
+                family = families.setdefault(raw["name"], MetricFamily(
+                    raw["name"], raw["type"], raw["help"], mode=raw.get("mode", "sum"),
+                ))
+                merged = values.setdefault(raw["name"], {})
+                for suffix, labels, value in raw["samples"]:
+                    key = (suffix, tuple(labels.items()))
+                    if key not in merged:
+                        merged[key] = value
+                    elif family.type == "gauge" and family.mode == "max":
+                        merged[key] = max(merged[key], value)
+                    else:
+                        merged[key] += value
+        for name, family in families.items():
+            family.samples = [
+                Sample(suffix, dict(labels), value) for (suffix, labels), value in values[name].items()
+            ]
+        return list(families.values())
+
+
+def generate_latest(registry: Registry = REGISTRY, store: MultiprocessStore | None = None) -> str:
+    """/metrics 본문. store 가 있으면 자기 값을 먼저 기록 후 디렉터리 합산."""
+    if store is None:
+        return render(registry.collect())
+    store.write(registry)
+    return render(store.merge())
@@ -0,0 +1,427 @@
+"""요청 단위 on-demand profiling — 운영에서만 느린 요청 (/errors/{id}, sync 재처리, ingest) 진단용.
+
+켜는 법 (PROFILING_SECRET 설정 시에만 middleware 가 붙음 — 미설정이면 요청당 비용 0):
+- admin: `X-Forps-Profile: <mode>:<expires>:<sig>` 서명 헤더 (`python -m app.core.profiling <mode>` 로 발급).
+  sig = HMAC-SHA256(secret, "<mode>:<expires>") — 만료 시각 포함이라 헤더가 새도 잠깐만 유효.
+- 프로젝트 OWNER: `/api/v1/projects/{project_id}/...` 요청에 `?profile=<mode>`.
+  권한 없으면 flag 는 조용히 무시 (일반 요청으로 처리).
+
+mode:
+- cprofile — 결정적 profiler. 전체 결과는 `.prof` (pstats — snakeviz 등으로 열람)
+- sample   — event loop thread 를 5ms 간격 stack sampling. `.collapsed` (py-spy `--format raw` 와
+             같은 collapsed stack 형식 — speedscope / flamegraph.pl 로 바로 열람)
+- memory   — tracemalloc snapshot (`.tracemalloc`, `tracemalloc.Snapshot.load`). ingest batch 용
+
+응답 헤더: X-Forps-Profile-Id (다운로드 id) / X-Forps-Profile-Summary (상위 항목 요약) /
+X-Forps-Profile-Pid (`py-spy dump --pid` 등 외부 sampler 로 같은 워커를 볼 때).
+전체 결과는 `GET /api/v1/profiles/{id}` (같은 서명 헤더 필요).
+
+주의:
+- profiler 는 프로세스 (thread) 전역 — 같은 event loop 에서 동시에 돌던 다른 요청도 결과에 섞임.
+  동시에 1개만 profiling (나머지는 `X-Forps-Profile-Summary: busy` 로 일반 처리).
+- 요약 헤더를 붙이려고 응답을 끝까지 buffer — BackgroundTask (sync 재처리, fingerprint) 까지
+  profile 에 포함되는 대신 응답이 그만큼 늦음. streaming 응답 (SSE, 본문이 여러 chunk 인 /logs/export 등)
+  은 buffer 없이 통과, 단일 본문이어도 MAX_BUFFER_BYTES 를 넘으면 그 시점부터 통과.
+  통과한 응답은 요약 헤더 대신 `X-Forps-Profile-Summary: streamed` — profile id 는 서버 로그에.
+"""
+
+import argparse
+import cProfile
+import hashlib
+import hmac
+import io
+import logging
+import os
+import pstats
+import re
+import secrets
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, get_args
+from urllib.parse import parse_qs
+from uuid import UUID
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+ProfileMode = Literal["cprofile", "sample", "memory"]
+MODES: tuple[str, ...] = get_args(ProfileMode)
+
+PROFILE_HEADER = "X-Forps-Profile"
+PROFILE_ID_HEADER = "X-Forps-Profile-Id"
+PROFILE_SUMMARY_HEADER = "X-Forps-Profile-Summary"
+PROFILE_PID_HEADER = "X-Forps-Profile-Pid"
+PROFILE_QUERY_PARAM = "profile"
+
+SAMPLE_INTERVAL = 0.005
+_SUMMARY_TOP = 5
+_SUMMARY_CHARS = 600
+# 요약 헤더용 응답 buffer 상한 — 넘으면 요약 헤더 없이 통과 (큰 응답을 메모리에 쌓지 않음)
+MAX_BUFFER_BYTES = 1024 * 1024
+_TRACEMALLOC_FRAMES = 25
+_EXTENSIONS = {"cprofile": ".prof", "sample": ".collapsed", "memory": ".tracemalloc"}
+_PROFILE_ID_RE = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}$")
+_PROJECT_PATH_RE = re.compile(r"^/api/v1/projects/([0-9a-fA-F-]{36})(?:/|$)")
+
+# 동시에 1개만 — cProfile / tracemalloc / sampler 모두 프로세스 전역 상태
+_active = threading.Lock()
+
+
+# ── 서명 헤더 ────────────────────────────────────────────────
+
+
+def _signature(secret: str, message: str) -> str:
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+def sign(secret: str, mode: ProfileMode, *, ttl_seconds: int = 600, now: float | None = None) -> str:
+    """X-Forps-Profile 헤더 값 발급."""
+    expires = int((now if now is not None else time.time()) + ttl_seconds)
+    return f"{mode}:{expires}:{_signature(secret, f'{mode}:{expires}')}"
+
+
+def verify(secret: str, value: str, *, now: float | None = None) -> ProfileMode | None:
+    """서명 / 만료 확인 후 mode. 형식 오류 / 위조 / 만료면 None."""
+    try:
+        mode, expires_raw, sig = value.split(":")
+        expires = int(expires_raw)
+    except ValueError:
+        return None
+    if mode not in MODES:
+        return None
+    if not hmac.compare_digest(sig, _signature(secret, f"{mode}:{expires}")):
+        return None
+    if expires < (now if now is not None else time.time()):
+        return None
+    return mode  # type: ignore[return-value]
+
+
+# ── profiler ─────────────────────────────────────────────────
+
+
+@dataclass
+class ProfileResult:
+    id: str
+    mode: ProfileMode
+    summary: str
+    path: Path
+
+
+def new_profile_id() -> str:
+    return f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{secrets.token_hex(4)}"
+
+
+def profile_path(directory: str | Path, profile_id: str) -> Path | None:
+    """id → 저장된 파일. id 형식이 아니거나 (path traversal 방지) 없으면 None."""
+    if not _PROFILE_ID_RE.match(profile_id):
+        return None
+    for ext in _EXTENSIONS.values():
+        path = Path(directory) / f"{profile_id}{ext}"
+        if path.is_file():
+            return path
+    return None
+
+
+def _prune(directory: Path, keep: int) -> None:
+    """오래된 결과 정리 — 최근 keep 개만 유지 (id 가 UTC 시각으로 시작 → 이름순 = 시간순)."""
+    files = sorted(p for p in directory.iterdir() if p.suffix in _EXTENSIONS.values())
+    for path in files[:-keep] if keep > 0 else files:
+        path.unlink(missing_ok=True)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename}:{frame.f_lineno})"
+
+
+class StackSampler:
+    """대상 thread 의 stack 을 interval 마다 기록 (collapsed stack: root;...;leaf → 횟수)."""
+
+    def __init__(self, thread_id: int, *, interval: float = SAMPLE_INTERVAL) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="forps-profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels: list[str] = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+    def summary(self) -> str:
+        total = sum(self.stacks.values())
+        if not total:
+            return "samples=0"
+        leaves: Counter[str] = Counter()
+        for stack, n in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += n
+        top = ", ".join(f"{leaf} {n * 100 / total:.0f}%" for leaf, n in leaves.most_common(_SUMMARY_TOP))
+        return f"samples={total}; top={top}"
+
+
+def _cprofile_summary(profiler: cProfile.Profile, elapsed_ms: float) -> str:
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)  # tottime
+    top = ", ".join(
+        f"{name}({Path(filename).name}:{line}) {tottime * 1000:.1f}ms"
+        for (filename, line, name), (_cc, _nc, tottime, _ct, _callers) in rows[:_SUMMARY_TOP]
+    )
+    return f"wall_ms={elapsed_ms:.1f}; calls={stats.total_calls}; top={top}"
+
+
+def _memory_summary(snapshot: tracemalloc.Snapshot, peak: int) -> str:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+    top = ", ".join(
+        f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno} {stat.size / 1024:.1f}KiB"
+        for stat in snapshot.statistics("lineno")[:_SUMMARY_TOP]
+    )
+    return f"peak_kib={peak / 1024:.1f}; top={top}"
+
+
+async def run_profiled(
+    mode: ProfileMode,
+    call: Callable[[], Awaitable[None]],
+    *,
+    directory: str | Path,
+    keep: int = 50,
+) -> ProfileResult:
+    """call 을 profiler 아래에서 실행 → 결과 파일 저장. call 의 예외는 저장 후 그대로 전파."""
+    directory = Path(directory)
+    profile_id = new_profile_id()
+    started = time.perf_counter()
+    error: BaseException | None = None
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await call()
+        except BaseException as exc:  # noqa: BLE001 — 저장 후 재전파
+            error = exc
+        finally:
+            profiler.disable()
+        summary = _cprofile_summary(profiler, (time.perf_counter() - started) * 1000)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{profile_id}.prof"
+        profiler.dump_stats(path)
+    elif mode == "sample":
+        sampler = StackSampler(threading.get_ident())
+        sampler.start()
+        try:
+            await call()
+        except BaseException as exc:  # noqa: BLE001
+            error = exc
+        finally:
+            sampler.stop()
+        summary = f"wall_ms={(time.perf_counter() - started) * 1000:.1f}; {sampler.summary()}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{profile_id}.collapsed"
+        path.write_text(sampler.collapsed())
+    else:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(_TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        try:
+            await call()
+        except BaseException as exc:  # noqa: BLE001
+            error = exc
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if not was_tracing:
+                tracemalloc.stop()
+        summary = _memory_summary(snapshot, peak)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{profile_id}.tracemalloc"
+        snapshot.dump(str(path))
+
+    _prune(directory, keep)
+    result = ProfileResult(id=profile_id, mode=mode, summary=summary, path=path)
+    logger.info("profile %s mode=%s pid=%d %s", profile_id, mode, os.getpid(), summary)
+    if error is not None:
+        raise error
+    return result
+
+
+# ── middleware ───────────────────────────────────────────────
+
+OwnerCheck = Callable[[Scope], Awaitable[bool]]
+
+
+async def project_owner_check(scope: Scope) -> bool:
+    """`?profile=` 허용 여부 — path 의 프로젝트 OWNER 인지 (Bearer JWT + project_members)."""
+    from app.core.security import decode_access_token
+    from app.database import AsyncSessionLocal
+    from app.models.workspace import WorkspaceRole
+    from app.services.permission_service import get_effective_role
+
+    match = _PROJECT_PATH_RE.match(scope["path"])
+    authorization = Headers(scope=scope).get("authorization", "")
+    if match is None or not authorization.startswith("Bearer "):
+        return False
+    payload = decode_access_token(authorization.removeprefix("Bearer "))
+    try:
+        user_id = UUID(payload["sub"]) if payload else None
+        project_id = UUID(match.group(1))
+    except (KeyError, TypeError, ValueError):
+        return False
+    if user_id is None:
+        return False
+    async with AsyncSessionLocal() as db:
+        role = await get_effective_role(db, user_id, project_id, use_cache=False)
+    return role == WorkspaceRole.OWNER
+
+
+def _header_safe(value: str) -> str:
+    return value.encode("latin-1", "replace").decode("latin-1")[:_SUMMARY_CHARS]
+
+
+class ProfilingMiddleware:
+    """서명 헤더 / OWNER query flag 가 있는 요청만 profiler 아래에서 실행 (pure ASGI)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        secret: str,
+        directory: str | Path,
+        keep: int = 50,
+        owner_check: OwnerCheck = project_owner_check,
+    ) -> None:
+        self.app = app
+        self.secret = secret
+        self.directory = Path(directory)
+        self.keep = keep
+        self.owner_check = owner_check
+
+    async def _requested_mode(self, scope: Scope) -> ProfileMode | None:
+        header = Headers(scope=scope).get(PROFILE_HEADER)
+        if header is not None:
+            return verify(self.secret, header)
+        query = scope.get("query_string", b"")
+        if PROFILE_QUERY_PARAM.encode() not in query:
+            return None
+        mode = parse_qs(query.decode("latin-1")).get(PROFILE_QUERY_PARAM, [None])[0]
+        if mode not in MODES or not await self.owner_check(scope):
+            return None
+        return mode  # type: ignore[return-value]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        mode = await self._requested_mode(scope)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+        if not _active.acquire(blocking=False):
+            await self.app(scope, receive, _with_headers(send, {PROFILE_SUMMARY_HEADER: "busy"}))
+            return
+        try:
+            await self._profile(mode, scope, receive, send)
+        finally:
+            _active.release()
+
+    async def _profile(self, mode: ProfileMode, scope: Scope, receive: Receive, send: Send) -> None:
+        start: Message | None = None
+        buffered: list[Message] = []
+        buffered_bytes = 0
+        passthrough = False
+
+        async def pass_through(start_message: Message) -> None:
+            nonlocal passthrough
+            passthrough = True
+            headers = MutableHeaders(scope=start_message)
+            headers.append(PROFILE_SUMMARY_HEADER, "streamed")
+            headers.append(PROFILE_PID_HEADER, str(os.getpid()))
+            await send(start_message)
+
+        async def buffer(message: Message) -> None:
+            nonlocal start, buffered_bytes
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                content_type = Headers(raw=message.get("headers", [])).get("content-type", "")
+                if content_type.startswith("text/event-stream"):
+                    await pass_through(message)  # 첫 이벤트까지 기다리지 않음
+                else:
+                    start = message
+            else:
+                buffered.append(message)
+                buffered_bytes += len(message.get("body", b""))
+                # more_body — 본문이 여러 chunk 인 streaming 응답 (/logs/export 등)
+                streaming = message.get("more_body", False)
+                if (streaming or buffered_bytes > MAX_BUFFER_BYTES) and start is not None:
+                    await pass_through(start)
+                    for pending in buffered:
+                        await send(pending)
+                    buffered.clear()
+
+        result = await run_profiled(
+            mode, lambda: self.app(scope, receive, buffer), directory=self.directory, keep=self.keep,
+        )
+        if start is None or passthrough:
+            return
+        headers = MutableHeaders(scope=start)
+        headers.append(PROFILE_ID_HEADER, result.id)
+        headers.append(PROFILE_SUMMARY_HEADER, _header_safe(result.summary))
+        headers.append(PROFILE_PID_HEADER, str(os.getpid()))
+        await send(start)
+        for message in buffered:
+            await send(message)
+
+
+def _with_headers(send: Send, extra: dict[str, str]) -> Send:
+    async def wrapper(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(scope=message)
+            for name, value in extra.items():
+                headers.append(name, value)
+        await send(message)
+
+    return wrapper
+
+
+def main(argv: list[str] | None = None) -> None:
+    """서명 헤더 발급: `python -m app.core.profiling cprofile --ttl 600`."""
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description="X-Forps-Profile 헤더 발급")
+    parser.add_argument("mode", choices=MODES)
+    parser.add_argument("--ttl", type=int, default=600, help="유효 시간 (초)")
+    args = parser.parse_args(argv)
+    if not settings.profiling_secret:
+        parser.error("PROFILING_SECRET 미설정 — profiling 꺼져 있음")
+    print(f"{PROFILE_HEADER}: {sign(settings.profiling_secret, args.mode, ttl_seconds=args.ttl)}")
+
+
+if __name__ == "__main__":
+    main()
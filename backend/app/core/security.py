@@ -1,3 +1,4 @@
+import os
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -5,6 +6,7 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import settings
+from app.core.hash_executor import HashExecutor
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -19,6 +21,27 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# bcrypt 는 전용 bounded pool 에서 — async 코드는 hash_password / check_password 사용
+hash_executor = HashExecutor(
+    workers=settings.password_hash_workers, max_queue=settings.password_hash_max_queue,
+)
+# log ingest 토큰 verify 전용 — 로그인 / 가입과 자리를 다투지 않음
+token_verify_executor = HashExecutor(
+    workers=settings.ingest_token_verify_workers or min(32, (os.cpu_count() or 1) + 4),
+    max_queue=settings.ingest_token_verify_max_queue,
+)
+
+
+async def hash_password(password: str) -> str:
+    """get_password_hash 를 hash_executor 에서 (포화 시 503)."""
+    return await hash_executor.run("password_hash", get_password_hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """verify_password 를 hash_executor 에서 (포화 시 503)."""
+    return await hash_executor.run("password_verify", verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
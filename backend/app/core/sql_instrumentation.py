@@ -0,0 +1,207 @@
+"""요청 (또는 작업) 단위 SQL 계측 — 쿼리 수 / DB 시간 / 가장 느린 statement / 반복 statement (N+1).
+
+- Engine class 에 cursor event 를 걸어 모든 engine (primary / replica / 테스트 engine) 에 적용.
+  현재 context 에 QueryStats 가 없으면 ContextVar 조회 1번으로 끝 (계측 off 비용).
+  SQLAlchemy asyncio 의 greenlet 은 호출 task 의 context 를 공유 → 요청 task 의 stats 에 기록.
+- QueryStatsMiddleware: 요청마다 QueryStats — `Server-Timing: db;dur=..;desc="N queries"` 헤더,
+  느린 요청 / 반복 statement 는 structured 로그 (extra["sql"]).
+- track_queries(): 요청 밖 (scheduled job, 테스트 query budget) 에서 같은 계측. 중첩 시 바깥 stats 에도 합산.
+
+statement shape = bind 파라미터가 빠진 SQL 텍스트 (IN 목록 길이는 정규화). 같은 shape 이
+repeat_threshold 번 이상이면 N+1 후보 — 루프 안에서 row 마다 같은 쿼리를 보내는 패턴.
+파티션 / batch / item 단위로 일부러 나눈 루프 (export 스트리밍, backfill, GC, reaper) 는 caller 가
+expected_repeats() 로 감싸 N+1 판정에서 제외 (쿼리 수 / DB 시간에는 그대로 합산).
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT_THRESHOLD = 5
+_LOG_STATEMENT_CHARS = 300
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# asyncpg 의 expanding IN — `IN ($3, $4, $5)` 길이가 달라도 같은 shape
+_IN_LIST_RE = re.compile(r"IN \((?:\$\d+|\?|%\(\w+\)s)(?:, (?:\$\d+|\?|%\(\w+\)s))*\)")
+_START_KEY = "forps_query_started"
+
+
+def statement_shape(statement: str) -> str:
+    return _IN_LIST_RE.sub("IN (...)", _WHITESPACE_RE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    parent: "QueryStats | None" = None
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+    shapes: Counter = field(default_factory=Counter)
+    # shapes 중 expected_repeats() 안에서 실행된 수 — 반복 판정에서 뺌
+    expected: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float, *, expected: bool = False) -> None:
+        stats: QueryStats | None = self
+        shape = statement_shape(statement)
+        while stats is not None:
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.shapes[shape] += 1
+            if expected:
+                stats.expected[shape] += 1
+            if elapsed_ms > stats.slowest_ms:
+                stats.slowest_ms = elapsed_ms
+                stats.slowest_statement = shape
+            stats = stats.parent
+
+    def repeated(self, threshold: int = DEFAULT_REPEAT_THRESHOLD) -> list[tuple[str, int]]:
+        """threshold 번 이상 반복된 shape (많은 순). expected_repeats() 안의 실행은 세지 않음."""
+        unexpected = self.shapes - self.expected
+        return [(shape, n) for shape, n in unexpected.most_common() if n >= threshold]
+
+    def summary(self, *, repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD) -> dict[str, Any]:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_ms, 2),
+            "slowest_ms": round(self.slowest_ms, 2),
+            "slowest_statement": (self.slowest_statement or "")[:_LOG_STATEMENT_CHARS] or None,
+            "repeated": [
+                {"statement": shape[:_LOG_STATEMENT_CHARS], "count": n}
+                for shape, n in self.repeated(repeat_threshold)
+            ],
+        }
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> QueryStats | None:
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 쿼리 계측. 바깥에 stats 가 있으면 그쪽에도 합산."""
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+_repeats_expected: ContextVar[bool] = ContextVar("query_repeats_expected", default=False)
+
+
+@contextmanager
+def expected_repeats() -> Iterator[None]:
+    """의도된 반복 루프 표시 — 블록 안 statement 는 N+1 (repeated) 판정에서 제외.
+
+    async generator 안에서 yield 를 감싸지 말 것 (context 가 소비자 쪽으로 새어 나감) — 쿼리 호출만 감쌀 것.
+    """
+    token = _repeats_expected.set(True)
+    try:
+        yield
+    finally:
+        _repeats_expected.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.get(_START_KEY)
+    if stats is None or not started:
+        return
+    stats.record(
+        statement, (time.perf_counter() - started.pop()) * 1000, expected=_repeats_expected.get(),
+    )
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # 실패한 statement 는 after_cursor_execute 가 안 불림 → 시작 시각만 버림
+    conn = exception_context.connection
+    started = conn.info.get(_START_KEY) if conn is not None else None
+    if started:
+        started.pop()
+
+
+def server_timing(stats: QueryStats) -> str:
+    return f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"'
+
+
+def report(
+    stats: QueryStats,
+    label: str,
+    *,
+    slow_ms: float,
+    repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+) -> None:
+    """반복 statement 가 있으면 warning, 느리면 info, 나머지는 debug (extra["sql"] 에 summary)."""
+    summary = stats.summary(repeat_threshold=repeat_threshold)
+    args = (label, summary["queries"], summary["db_ms"], summary["slowest_ms"])
+    if summary["repeated"]:
+        top = summary["repeated"][0]
+        logger.warning(
+            "sql %s queries=%d db_ms=%.1f slowest_ms=%.1f — possible N+1: %d× %s",
+            *args, top["count"], top["statement"], extra={"sql": summary},
+        )
+    elif stats.total_ms >= slow_ms:
+        logger.info(
+            "sql %s queries=%d db_ms=%.1f slowest_ms=%.1f slowest=%s",
+            *args, summary["slowest_statement"], extra={"sql": summary},
+        )
+    else:
+        logger.debug("sql %s queries=%d db_ms=%.1f slowest_ms=%.1f", *args, extra={"sql": summary})
+
+
+class QueryStatsMiddleware:
+    """요청별 QueryStats + Server-Timing 헤더 + 요청 종료 시 report (pure ASGI)."""
+
+    def __init__(
+        self, app: ASGIApp, *, slow_ms: float, repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+    ) -> None:
+        self.app = app
+        self.slow_ms = slow_ms
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            # streaming 응답은 헤더 시점까지의 쿼리만 (본문 중 쿼리는 로그에만)
+            if message["type"] == "http.response.start" and stats.count:
+                MutableHeaders(scope=message).append("Server-Timing", server_timing(stats))
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if stats.count:
+                    report(
+                        stats, f"{scope['method']} {scope['path']}",
+                        slow_ms=self.slow_ms, repeat_threshold=self.repeat_threshold,
+                    )
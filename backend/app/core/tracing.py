@@ -0,0 +1,385 @@
+"""in-process tracing — OpenTelemetry 형태 (trace_id / span_id / parent / kind / attributes / status) 의 가벼운 span.
+
+에러 1건의 경로: POST /log-ingest → BackgroundTask → fingerprint_processor.process →
+error_group_service.upsert → log_alert_service.notify_new_error → Discord. 단계마다 session 이
+다르고 중간에 큐가 있어 "알림이 늦다" 때 어느 단계가 막혔는지 로그로는 안 보임 → 한 trace 로 묶음.
+
+- `traced(name)` / `start_span(name)` — 현재 span 의 자식 (없으면 새 trace 의 root).
+- 큐 작업: `bind(func)` 가 등록 시점의 context 를 잡아 실행 시 `queue <func>` consumer span 의
+  부모로 씀 (queue.wait_ms = 등록 → 실행 대기).
+- DB: Engine cursor event 로 statement 마다 `db.query` span (span 안에서 실행된 것만).
+- 외부 HTTP: `http_span(method, url)` — Discord / GitHub 호출.
+- export: console (span 1개 = 1줄) 또는 OTLP/JSON file (flush 1번 = ExportTraceServiceRequest 1줄,
+  otel-collector `otlpjsonfile` receiver 로 그대로 읽힘). span 은 buffer 에 모았다 주기 flush.
+
+TRACING_EXPORTER=none (기본) 이면 tracer 가 없음 — traced / bind 는 원래 함수 그대로 호출,
+start_span 은 no-op span, DB event 는 전역 변수 1번 확인으로 끝.
+
+같은 프로세스 안에서만 전파 (SpanContext.traceparent() 는 W3C 형식이라 외부로 넘길 때 사용 가능).
+SpanContext 에 root span 이름 / 시작 시각을 실어 보냄 → 하위 단계에서 end-to-end 지연 계산
+(`elapsed_since_root`).
+"""
+
+import functools
+import json
+import logging
+import os
+import secrets
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Literal, Protocol
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.sql_instrumentation import statement_shape
+
+logger = logging.getLogger(__name__)
+
+SpanKind = Literal["internal", "server", "client", "producer", "consumer"]
+# OTLP enum 값
+_KIND_CODES = {"internal": 1, "server": 2, "client": 3, "producer": 4, "consumer": 5}
+_STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+SCOPE_NAME = "forps"
+MAX_BUFFERED_SPANS = 10_000
+_DB_STATEMENT_CHARS = 500
+_START_KEY = "forps_trace_started"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str  # 32 hex
+    span_id: str  # 16 hex
+    root_name: str
+    root_started_ns: int
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent_span_id: str | None
+    kind: SpanKind = "internal"
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: Literal["unset", "ok", "error"] = "unset"
+    status_message: str | None = None
+    events: list[tuple[int, str, dict[str, Any]]] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = "error"
+        self.status_message = f"{type(exc).__name__}: {exc}"[:500]
+        self.events.append((time.time_ns(), "exception", {
+            "exception.type": type(exc).__name__, "exception.message": str(exc)[:500],
+        }))
+
+    def to_otlp(self) -> dict[str, Any]:
+        span: dict[str, Any] = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": _KIND_CODES[self.kind],
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": _STATUS_CODES[self.status]},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        if self.events:
+            span["events"] = [
+                {"timeUnixNano": str(ts), "name": name, "attributes": _otlp_attributes(attrs)}
+                for ts, name, attrs in self.events
+            ]
+        return span
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}  # OTLP/JSON — int64 는 문자열
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items() if v is not None]
+
+
+class _NoopSpan:
+    """tracing 꺼져 있을 때 start_span 이 주는 span — 호출부가 분기 없이 set_attribute 가능."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+# ── exporters ────────────────────────────────────────────────
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+
+class ConsoleExporter:
+    """span 1개 = 1줄 (개발용)."""
+
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        self.stream = stream
+
+    def export(self, spans: list[Span]) -> None:
+        stream = self.stream or sys.stdout
+        for span in spans:
+            parent = span.parent_span_id or "-"
+            stream.write(
+                f"[trace] {span.context.trace_id} {span.context.span_id} parent={parent} "
+                f"{span.name} {span.duration_ms:.1f}ms {span.status}"
+                f"{' ' + json.dumps(span.attributes, default=str) if span.attributes else ''}\n"
+            )
+        stream.flush()
+
+
+class OTLPJSONFileExporter:
+    """flush 1번 = ExportTraceServiceRequest JSON 1줄 (append)."""
+
+    def __init__(self, path: str | Path, *, service_name: str = "forps-backend") -> None:
+        self.path = Path(path)
+        self.resource = _otlp_attributes({
+            "service.name": service_name, "process.pid": os.getpid(),
+        })
+
+    def export(self, spans: list[Span]) -> None:
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": self.resource},
+                "scopeSpans": [{
+                    "scope": {"name": SCOPE_NAME},
+                    "spans": [s.to_otlp() for s in spans],
+                }],
+            }],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as fp:
+            fp.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+
+# ── tracer ───────────────────────────────────────────────────
+
+
+class Tracer:
+    """끝난 span buffer + exporter. buffer 가 가득 차면 오래된 것부터 버림 (flush 가 밀릴 때 메모리 상한)."""
+
+    def __init__(self, exporter: SpanExporter, *, db_spans: bool = True) -> None:
+        self.exporter = exporter
+        self.db_spans = db_spans
+        self.dropped = 0
+        self._buffer: deque[Span] = deque(maxlen=MAX_BUFFERED_SPANS)
+
+    def on_end(self, span: Span) -> None:
+        if len(self._buffer) == MAX_BUFFERED_SPANS:
+            self.dropped += 1
+        self._buffer.append(span)
+
+    def flush(self) -> int:
+        spans = list(self._buffer)
+        self._buffer.clear()
+        if spans:
+            try:
+                self.exporter.export(spans)
+            except Exception:
+                logger.exception("trace export failed (%d spans dropped)", len(spans))
+        return len(spans)
+
+
+_tracer: Tracer | None = None
+_current: ContextVar[Span | None] = ContextVar("trace_span", default=None)
+
+
+def configure(exporter: SpanExporter | None, *, db_spans: bool = True) -> Tracer | None:
+    """프로세스 tracer 설정. None 이면 tracing off."""
+    global _tracer
+    _tracer = Tracer(exporter, db_spans=db_spans) if exporter is not None else None
+    return _tracer
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def flush() -> int:
+    return _tracer.flush() if _tracer is not None else 0
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def current_context() -> SpanContext | None:
+    span = _current.get()
+    return span.context if span is not None else None
+
+
+def _new_span(
+    name: str, *, kind: SpanKind, parent: SpanContext | None, attributes: dict[str, Any] | None,
+) -> Span:
+    now = time.time_ns()
+    if parent is None:
+        context = SpanContext(secrets.token_hex(16), secrets.token_hex(8), name, now)
+    else:
+        context = SpanContext(
+            parent.trace_id, secrets.token_hex(8), parent.root_name, parent.root_started_ns,
+        )
+    return Span(
+        name, context, parent.span_id if parent else None, kind,
+        start_ns=now, attributes=dict(attributes or {}),
+    )
+
+
+@contextmanager
+def start_span(
+    name: str,
+    *,
+    kind: SpanKind = "internal",
+    parent: SpanContext | None = None,
+    attributes: dict[str, Any] | None = None,
+) -> Iterator[Span | _NoopSpan]:
+    """span 을 현재 span 으로 두고 블록 실행. 예외는 span 에 기록 후 그대로 전파."""
+    tracer = _tracer
+    if tracer is None:
+        yield NOOP_SPAN
+        return
+    span = _new_span(name, kind=kind, parent=parent or current_context(), attributes=attributes)
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        _current.reset(token)
+        span.end_ns = time.time_ns()
+        tracer.on_end(span)
+
+
+def traced(name: str, *, kind: SpanKind = "internal"):
+    """async 함수 decorator — 호출마다 span. tracing off 면 원래 함수 그대로."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with start_span(name, kind=kind):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def bind(func: Callable) -> Callable:
+    """큐 (BackgroundTask 등) 에 넣을 async 함수에 현재 trace context 를 묶음.
+
+    실행 시 `queue <func>` consumer span (부모 = 등록 시점 span) 아래에서 실행.
+    tracing off 거나 현재 span 이 없으면 func 그대로.
+    """
+    parent = current_context()
+    if _tracer is None or parent is None:
+        return func
+    enqueued_ns = time.time_ns()
+    name = getattr(func, "__name__", "task")
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with start_span(f"queue {name}", kind="consumer", parent=parent) as span:
+            span.set_attribute("queue.wait_ms", round((time.time_ns() - enqueued_ns) / 1_000_000, 3))
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def elapsed_since_root(root_name: str) -> float | None:
+    """현재 trace 의 root 가 root_name 이면 root 시작부터 지금까지 (초). 아니면 None."""
+    context = current_context()
+    if context is None or context.root_name != root_name:
+        return None
+    return (time.time_ns() - context.root_started_ns) / 1e9
+
+
+@contextmanager
+def http_span(method: str, url: str) -> Iterator[Span | _NoopSpan]:
+    """외부 HTTP 호출 client span. 호출부가 응답 후 `http.response.status_code` 설정."""
+    # webhook token 등이 path 에 있을 수 있음 — host 까지만 기록
+    host = url.split("://", 1)[-1].split("/", 1)[0]
+    with start_span(f"HTTP {method}", kind="client", attributes={
+        "http.request.method": method, "server.address": host,
+    }) as span:
+        yield span
+
+
+# ── DB spans (cursor event) ──────────────────────────────────
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _tracer is not None and _tracer.db_spans and _current.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.time_ns())
+
+
+def _record_db_span(conn, statement: str, error: BaseException | None) -> None:
+    started = conn.info.get(_START_KEY)
+    parent = _current.get()
+    tracer = _tracer
+    if not started:
+        return
+    start_ns = started.pop()
+    if tracer is None or parent is None:
+        return
+    span = _new_span("db.query", kind="client", parent=parent.context, attributes={
+        "db.system": conn.dialect.name,
+        "db.statement": statement_shape(statement)[:_DB_STATEMENT_CHARS],
+    })
+    span.start_ns = start_ns
+    span.end_ns = time.time_ns()
+    if error is not None:
+        span.record_exception(error)
+    tracer.on_end(span)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record_db_span(conn, statement, None)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None:
+        _record_db_span(conn, exception_context.statement or "", exception_context.original_exception)
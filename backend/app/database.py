@@ -1,9 +1,14 @@
 import ssl
+import uuid
+from typing import Annotated
 
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
+from app.core.db_pool import InstrumentedAsyncPool, instrument_engine_pool
+from app.core.db_routing import ReplicaLagMonitor, engine_lag_probe, primary_pinned
 
 
 # postgresql:// → postgresql+asyncpg://
@@ -27,12 +32,63 @@ def get_connect_args(url: str) -> dict:
     return {}
 
 
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def get_engine_options(url: str) -> dict:
+    """create_async_engine 인자 — pool 설정 (Settings) + pgbouncer 모드.
+
+    pgbouncer transaction pooling 은 트랜잭션마다 다른 backend 로 보낼 수 있어 연결에 묶인
+    prepared statement 가 깨짐 → asyncpg / SQLAlchemy 양쪽 statement cache 를 끄고
+    statement 이름을 고유하게 (이름 충돌 `prepared statement "__asyncpg_stmt_1__" already exists` 방지).
+    """
+    connect_args = get_connect_args(url)
+    if settings.db_pgbouncer:
+        connect_args |= {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    return {
+        "connect_args": connect_args,
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
 engine = create_async_engine(
-    get_async_url(settings.database_url),
-    connect_args=get_connect_args(settings.database_url),
+    get_async_url(settings.database_url), **get_engine_options(settings.database_url),
 )
+instrument_engine_pool(engine, "primary", slow_checkout_ms=settings.db_slow_checkout_ms)
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# 읽기 전용 replica (DATABASE_READ_URL 설정 시에만)
+read_engine = (
+    create_async_engine(
+        get_async_url(settings.database_read_url), **get_engine_options(settings.database_read_url),
+    )
+    if settings.database_read_url else None
+)
+if read_engine is not None:
+    instrument_engine_pool(read_engine, "replica", slow_checkout_ms=settings.db_slow_checkout_ms)
+ReadSessionLocal = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None else None
+)
+replica_monitor = (
+    ReplicaLagMonitor(
+        engine_lag_probe(read_engine),
+        max_lag_seconds=settings.replica_max_lag_seconds,
+        check_interval=settings.replica_lag_check_seconds,
+    )
+    if read_engine is not None else None
+)
+
 
 class Base(DeclarativeBase):
     pass
@@ -41,3 +97,22 @@ class Base(DeclarativeBase):
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db(primary: Annotated[AsyncSession, Depends(get_db)]):
+    """읽기 전용 endpoint 용 세션 — 가능하면 replica, 아니면 primary.
+
+    primary fallback: replica 미설정 / 요청이 primary pin (쓰기 요청 또는 read-your-writes 헤더) /
+    replica lag 초과 또는 측정 실패. fallback 시 get_db 세션을 그대로 공유 (권한 확인과 같은 세션).
+    이 세션으로 쓰기 금지 — replica 는 read-only.
+    """
+    if (
+        ReadSessionLocal is None
+        or replica_monitor is None
+        or primary_pinned()
+        or not await replica_monitor.healthy()
+    ):
+        yield primary
+        return
+    async with ReadSessionLocal() as session:
+        yield session
@@ -1,22 +1,63 @@
+from dataclasses import dataclass, field
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.core.security import decode_access_token
+from app.models.project import ProjectMember
 from app.models.user import User
+from app.models.workspace import WorkspaceRole
+from app.services.permission_service import role_cache
 
 security = HTTPBearer()
 
 
+# role cache 를 쓸 수 있는 요청 — 쓰기 요청은 항상 DB 에서 role 확인
+_CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass
+class AuthContext:
+    """요청 단위 인증 context — 사용자 + 이번 요청에서 확인한 프로젝트 role (멤버 아님 = None).
+
+    cached_roles — role 을 role cache 에서 가져온 project_id (EDITOR / OWNER 확인은 DB 에서 다시 읽음).
+    """
+
+    user: User
+    project_roles: dict[UUID, WorkspaceRole | None] = field(default_factory=dict)
+    cached_roles: set[UUID] = field(default_factory=set)
+    use_role_cache: bool = True
+
+
+def get_auth_context(request: Request) -> AuthContext | None:
+    """get_current_user 가 채운 context (인증 없는 요청이면 None)."""
+    return getattr(request.state, "auth", None)
+
+
+def _path_project_id(request: Request) -> UUID | None:
+    raw = request.path_params.get("project_id")
+    if raw is None:
+        return None
+    try:
+        return UUID(str(raw))
+    except ValueError:
+        return None  # path 검증 422 는 FastAPI 가 처리
+
+
 async def get_current_user(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> User:
+    """JWT → User. path 에 {project_id} 가 있으면 membership role 까지 같은 쿼리로 (LEFT JOIN).
+
+    role 은 request.state.auth (AuthContext) 에 실어 require_project_member 가 재조회 없이 사용.
+    """
     token = credentials.credentials
     payload = decode_access_token(token)
 
@@ -41,14 +82,42 @@ async def get_current_user(
             detail="Invalid user ID format"
         )
 
-    result = await db.execute(select(User).where(User.id == user_uuid))
-    user = result.scalar_one_or_none()
+    project_id = _path_project_id(request)
+    use_role_cache = request.method in _CACHEABLE_METHODS
+    role = (
+        role_cache.get(user_uuid, project_id)
+        if project_id is not None and use_role_cache else None
+    )
+    from_cache = role is not None
+    if project_id is None or role is not None:
+        result = await db.execute(select(User).where(User.id == user_uuid))
+        user = result.scalar_one_or_none()
+    else:
+        epoch = role_cache.epoch
+        stmt = (
+            select(User, ProjectMember.role)
+            .outerjoin(ProjectMember, and_(
+                ProjectMember.user_id == User.id, ProjectMember.project_id == project_id,
+            ))
+            .where(User.id == user_uuid)
+        )
+        row = (await db.execute(stmt)).one_or_none()
+        user, role = row if row is not None else (None, None)
+        if role is not None:
+            role_cache.set(user_uuid, project_id, role, epoch=epoch)
+
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
 
+    context = AuthContext(user, use_role_cache=use_role_cache)
+    if project_id is not None:
+        context.project_roles[project_id] = role
+        if from_cache:
+            context.cached_roles.add(project_id)
+    request.state.auth = context
     return user
 
 
@@ -1,64 +1,123 @@
 import asyncio
+import hmac
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.config import settings
+from app.core import db_pool, metrics, tracing
+from app.core.db_routing import PRIMARY_UNTIL_HEADER, ReadYourWritesMiddleware
+from app.core.profiling import (
+    PROFILE_ID_HEADER,
+    PROFILE_PID_HEADER,
+    PROFILE_SUMMARY_HEADER,
+    ProfilingMiddleware,
+)
+from app.core.security import hash_executor, token_verify_executor
+from app.core.sql_instrumentation import QueryStatsMiddleware
 from app.api.v1.router import api_v1_router
-from app.database import AsyncSessionLocal
-from app.services.discord_service import start_weekly_scheduler
-from app.services.git_repo_service import fetch_compare_files, fetch_file
-from app.services import log_fingerprint_reaper
-from app.services.push_event_reaper import reap_pending_events
-from app.services.sync_service import process_event
+from app.services.background_runner import BackgroundJobState, runner
+from app.services import job_runner, log_stream_service
+from app.services.scheduled_jobs import JOBS, LOG_FINGERPRINT_REAPER, PUSH_EVENT_REAPER
 
 logger = logging.getLogger(__name__)
 
 
+# 부팅 회수 lock 을 다른 프로세스가 잡고 있을 때 재시도 간격 (초)
+STARTUP_LOCK_RETRY_SECONDS = 5.0
+
+
+def _startup_recovery(job: job_runner.Job):
+    """부팅 시 1회 회수 — next_run_at 무시 (force).
+
+    다른 replica / 주기 실행이 lock 을 잡고 있으면 (LOCKED) 풀릴 때까지 재시도 — 이 프로세스에서
+    회수가 실제로 1회 돌기 전에는 끝나지 않음 (/ready 는 그동안 starting). shutdown 시작 시 중단.
+    """
+
+    async def _run(state: BackgroundJobState) -> None:
+        while await job_runner.run_job(
+            job, force=True, on_progress=state.add_progress,
+        ) is job_runner.JobRun.LOCKED:
+            try:
+                await asyncio.wait_for(runner.stopping.wait(), timeout=STARTUP_LOCK_RETRY_SECONDS)
+                return
+            except asyncio.TimeoutError:
+                pass
+        if state.processed:
+            logger.info("startup %s recovered %d items", job.name, state.processed)
+
+    return _run
+
+
+async def _run_job_scheduler(state: BackgroundJobState) -> None:
+    await job_runner.run_scheduler(JOBS, stopping=runner.stopping)
+
+
+# 멀티 워커 — 워커별 파일 기록 + /metrics 에서 합산
+_metrics_store = (
+    metrics.MultiprocessStore(settings.metrics_multiproc_dir)
+    if settings.metrics_multiproc_dir else None
+)
+
+
+def _configure_tracing() -> tracing.Tracer | None:
+    if settings.tracing_exporter == "console":
+        exporter = tracing.ConsoleExporter()
+    elif settings.tracing_exporter == "otlp_file":
+        exporter = tracing.OTLPJSONFileExporter(settings.tracing_otlp_path)
+    else:
+        return None
+    return tracing.configure(exporter, db_spans=settings.tracing_db_spans)
+
+
+_tracer = _configure_tracing()
+
+
+async def _flush_traces(state: BackgroundJobState) -> None:
+    """끝난 span 을 주기적으로 export. 종료 시 남은 것 1회."""
+    while not runner.stopping.is_set():
+        _tracer.flush()
+        try:
+            await asyncio.wait_for(runner.stopping.wait(), settings.tracing_flush_seconds)
+        except asyncio.TimeoutError:
+            pass
+    _tracer.flush()
+
+
+async def _flush_metrics(state: BackgroundJobState) -> None:
+    """다른 워커의 /metrics 가 이 워커 값을 보도록 주기 기록. 종료 시 마지막 1회."""
+    while not runner.stopping.is_set():
+        _metrics_store.write(metrics.REGISTRY)
+        try:
+            await asyncio.wait_for(runner.stopping.wait(), settings.metrics_flush_seconds)
+        except asyncio.TimeoutError:
+            pass
+    _metrics_store.write(metrics.REGISTRY)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: 미처리 push event 회수 (Phase 4 — sync_service 콜백 주입)
-    try:
-        from sqlalchemy import select
-
-        from app.models.git_push_event import GitPushEvent
-
-        async def _cb(ev: GitPushEvent) -> None:
-            # I-3 fix: 이벤트마다 fresh session — 한 이벤트의 세션 poison 이 다음으로 전파 안 되게
-            event_id = ev.id
-            async with AsyncSessionLocal() as inner_db:
-                refetched = (await inner_db.execute(
-                    select(GitPushEvent).where(GitPushEvent.id == event_id)
-                )).scalar_one_or_none()
-                if refetched is None:
-                    return
-                await process_event(
-                    inner_db, refetched,
-                    fetch_file=fetch_file,
-                    fetch_compare=fetch_compare_files,
-                )
-
-        async with AsyncSessionLocal() as outer_db:
-            reaped = await reap_pending_events(outer_db, _cb)
-
-        if reaped:
-            logger.info("startup reaper picked up %d pending push events", reaped)
-    except Exception:
-        logger.exception("startup reaper failed")
-
-    # Phase 3 — log_fingerprint_reaper: 미처리 ERROR↑ LogEvent 회수
-    try:
-        await log_fingerprint_reaper.run_reaper_once()
-    except Exception:
-        logger.exception("log_fingerprint_reaper failed at startup")
-
-    # Startup: 주간 리포트 스케줄러 시작
-    scheduler_task = asyncio.create_task(start_weekly_scheduler())
+    # Startup: 회수 작업은 background task — lifespan 은 즉시 yield 해서 트래픽 수용.
+    # 진행 상황은 /ready 로 노출 (/health 는 프로세스 생존만).
+    runner.start("push_event_reaper", _startup_recovery(PUSH_EVENT_REAPER))
+    runner.start("log_fingerprint_reaper", _startup_recovery(LOG_FINGERPRINT_REAPER))
+    # 주기 작업 스케줄러 (주간 리포트 / 파티션 / reaper / GC) — readiness 에 포함 안 함.
+    # shutdown 시 stopping 신호로 진행 중 job 을 마치고 종료 (deadline 초과 시 cancel)
+    runner.start("job_scheduler", _run_job_scheduler, blocks_ready=False)
+    if _metrics_store is not None:
+        runner.start("metrics_flush", _flush_metrics, blocks_ready=False)
+    if _tracer is not None:
+        runner.start("trace_flush", _flush_traces, blocks_ready=False)
     yield
-    # Shutdown: 스케줄러 정리
-    scheduler_task.cancel()
+    # Shutdown: in-flight 회수 작업 drain (deadline 초과분 cancel)
+    await runner.shutdown(settings.shutdown_drain_seconds)
+    # live tail LISTEN 연결 정리 (구독자가 남아 있어도 연결은 반납)
+    await log_stream_service.hub.close()
+    hash_executor.shutdown()
+    token_verify_executor.shutdown()
 
 
 app = FastAPI(
@@ -68,6 +127,28 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# on-demand profiling — secret 미설정이면 middleware 없음 (요청당 비용 0).
+# 가장 안쪽 (먼저 add) — profile 에 SQL 계측 / CORS 비용이 섞이지 않게
+if settings.profiling_secret:
+    app.add_middleware(
+        ProfilingMiddleware,
+        secret=settings.profiling_secret,
+        directory=settings.profiling_dir,
+        keep=settings.profiling_keep,
+    )
+
+# 요청별 쿼리 수 / DB 시간 — Server-Timing 헤더 + 느린 요청 / N+1 후보 로그
+if settings.sql_instrumentation_enabled:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        slow_ms=settings.sql_slow_request_ms,
+        repeat_threshold=settings.sql_repeat_threshold,
+    )
+
+# 읽기 replica 사용 시 — 쓰기 요청 primary pin + read-your-writes 헤더
+if settings.database_read_url:
+    app.add_middleware(ReadYourWritesMiddleware, pin_seconds=settings.read_your_writes_seconds)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -75,6 +156,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        PRIMARY_UNTIL_HEADER, PROFILE_ID_HEADER, PROFILE_SUMMARY_HEADER, PROFILE_PID_HEADER,
+    ],
 )
 
 
@@ -89,4 +173,37 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(authorization: str | None = Header(default=None)):
+    """Prometheus text format. METRICS_TOKEN 설정 시 Bearer 토큰 필요.
+
+    토큰도 METRICS_PUBLIC 도 없으면 404 — 설정 누락으로 내부 지표가 공개되지 않게 (fail closed).
+    """
+    if settings.metrics_token:
+        if not hmac.compare_digest(authorization or "", f"Bearer {settings.metrics_token}"):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    elif not settings.metrics_public:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return PlainTextResponse(
+        metrics.generate_latest(store=_metrics_store), media_type=metrics.CONTENT_TYPE,
+    )
+
+
+@app.get("/ready")
+async def ready():
+    """부팅 회수 작업 진행 상황. 모두 끝나기 전엔 503 (트래픽 수용은 이미 가능).
+
+    db_pool — engine 별 연결 pool 사용량 / checkout 대기 histogram (readiness 판단엔 미사용).
+    """
+    is_ready = runner.is_ready()
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "ready" if is_ready else "starting",
+            "jobs": runner.snapshot(),
+            "db_pool": db_pool.snapshot(),
+        },
+    )
+
+
 app.include_router(api_v1_router, prefix="/api/v1")
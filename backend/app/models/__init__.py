@@ -10,6 +10,13 @@ from app.models.log_ingest_token import LogIngestToken
 from app.models.rate_limit_window import RateLimitWindow
 from app.models.error_group import ErrorGroup, ErrorGroupStatus
 from app.models.log_event import LogEvent, LogLevel
+from app.models.scheduled_job import JobOutcome, ScheduledJob
+from app.models.version_observation import (
+    VersionCoverage,
+    VersionFingerprintCount,
+    VersionObservation,
+)
+from app.models.project_task_stats import ProjectTaskStats
 
 __all__ = [
     "User",
@@ -29,4 +36,10 @@ __all__ = [
     "ErrorGroupStatus",
     "LogEvent",
     "LogLevel",
+    "ScheduledJob",
+    "JobOutcome",
+    "VersionObservation",
+    "VersionCoverage",
+    "VersionFingerprintCount",
+    "ProjectTaskStats",
 ]
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, LargeBinary, Text
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,6 +15,9 @@ class Handoff(Base):
     설계서: 2026-04-26-ai-task-automation-design.md §4.2
     UNIQUE (project_id, commit_sha) — webhook 재전송 멱등성.
     commit_sha 는 40자 hex full (CHECK 제약 alembic 에서).
+
+    본문은 snapshot (raw_content) 또는 같은 branch 이전 버전 대비 delta (content_base_id +
+    content_delta) — 복원은 handoff_storage_service.load_content. 30일 지나면 GC 가 본문 제거.
     """
 
     __tablename__ = "handoffs"
@@ -28,7 +31,12 @@ class Handoff(Base):
     commit_sha: Mapped[str]
     pushed_at: Mapped[datetime]
 
-    raw_content: Mapped[str | None] = mapped_column(Text)  # 30일 후 NULL (별도 GC, Phase 후반)
+    raw_content: Mapped[str | None] = mapped_column(Text)  # snapshot 본문. delta 행 / 30일 후 NULL
+    content_base_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("handoffs.id", ondelete="SET NULL")
+    )
+    content_delta: Mapped[bytes | None] = mapped_column(LargeBinary)  # zlib(JSON line ops)
+    content_depth: Mapped[int] = mapped_column(default=0)  # snapshot 까지 delta 수 (0 = snapshot)
     parsed_tasks: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON)
     free_notes: Mapped[dict[str, Any] | None] = mapped_column(JSON)
 
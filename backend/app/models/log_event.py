@@ -3,15 +3,23 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import ForeignKey, Text
-from sqlalchemy.dialects.postgresql import JSON
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Computed, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import Mapped, deferred, mapped_column
 
 from app.database import Base
 
 # version_sha 미확인 sentinel — ingest 레이어와 동일 값 (CHECK 제약: 40자 hex OR 'unknown')
 UNKNOWN_SHA: str = "unknown"
 
+# search_tsv generated 식 — alembic 9c4f2b7d1e05 와 동일해야 함.
+# 'simple' config: 형태소 분석 / 불용어 없음 (한국어 · 식별자 혼재 로그에 언어별 stemming 부적합)
+SEARCH_TSV_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(message, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(exception_message, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(logger_name, '')), 'C')"
+)
+
 
 class LogLevel(str, enum.Enum):
     DEBUG = "debug"
@@ -37,6 +45,8 @@ class LogEvent(Base):
     """
 
     __tablename__ = "log_events"
+    # INSERT 후 generated search_tsv 를 RETURNING 으로 되읽지 않음 (ingest hot path)
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
@@ -55,11 +65,18 @@ class LogEvent(Base):
     exception_class: Mapped[str | None] = mapped_column(default=None)
     exception_message: Mapped[str | None] = mapped_column(Text, default=None)
     stack_trace: Mapped[str | None] = mapped_column(Text, default=None)
-    stack_frames: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON, default=None)
+    stack_frames: Mapped[list[dict[str, Any]] | None] = mapped_column(JSONB, default=None)
     fingerprint: Mapped[str | None] = mapped_column(default=None)
     fingerprinted_at: Mapped[datetime | None] = mapped_column(default=None)
 
     # 선택
     user_id_external: Mapped[str | None] = mapped_column(default=None)
     request_id: Mapped[str | None] = mapped_column(default=None)
-    extra: Mapped[dict[str, Any] | None] = mapped_column(JSON, default=None)
+    # JSONB — 최근 파티션에 jsonb_path_ops GIN (log_partition_service.maintain_extra_indexes)
+    extra: Mapped[dict[str, Any] | None] = mapped_column(JSONB, default=None)
+
+    # 풀텍스트 검색 (log_search_service) — DB generated column, 조회 시 로드 안 함
+    search_tsv: Mapped[Any] = deferred(mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_TSV_EXPRESSION, persisted=True),
+    ))
@@ -0,0 +1,42 @@
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ProjectTaskStats(Base):
+    """프로젝트별 task 카운터 — 목록 task_count / 주간 리포트가 tasks 를 스캔하지 않고 읽음.
+
+    todo / doing / done / blocked 는 archived 아닌 task 의 status 별 수, archived 는 status 무관.
+    overdue 는 archived 아님 + due_date < overdue_as_of + status todo/doing.
+    유지 / 복구: task_stats_service (task 변경과 같은 트랜잭션 + task_stats_reconcile 주기 작업).
+    """
+
+    __tablename__ = "project_task_stats"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    todo_count: Mapped[int] = mapped_column(default=0)
+    doing_count: Mapped[int] = mapped_column(default=0)
+    done_count: Mapped[int] = mapped_column(default=0)
+    blocked_count: Mapped[int] = mapped_column(default=0)
+    archived_count: Mapped[int] = mapped_column(default=0)
+    overdue_count: Mapped[int] = mapped_column(default=0)
+    # overdue_count 가 기준으로 삼은 날짜 (UTC) — 날짜가 바뀌면 reconcile 이 재계산
+    overdue_as_of: Mapped[date]
+
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @hybrid_property
+    def task_count(self) -> int:
+        """전체 task 수 — 인스턴스 값 / SQL 식 (목록 쿼리) 둘 다."""
+        return (
+            self.todo_count + self.doing_count + self.done_count + self.blocked_count
+            + self.archived_count
+        )
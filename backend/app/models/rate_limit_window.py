@@ -12,7 +12,7 @@ class RateLimitWindow(Base):
 
     설계서: 2026-04-26-error-log-design.md §4.1
     PRIMARY KEY (project_id, token_id, window_start) — 분 단위 truncate.
-    24시간 지난 row 는 별도 cron 으로 GC (Phase 7).
+    24시간 지난 row 는 rate_limit_window_gc 주기 작업이 GC (services/scheduled_jobs.py).
     """
 
     __tablename__ = "rate_limit_windows"
@@ -0,0 +1,43 @@
+import enum
+from datetime import datetime
+
+from sqlalchemy import Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class JobOutcome(str, enum.Enum):
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+
+
+class ScheduledJob(Base):
+    """주기 작업 1개의 스케줄 + 마지막 실행 기록 — 운영자용 scheduler health.
+
+    job_runner 가 `pg_try_advisory_lock` 리스를 잡은 프로세스만 실행 → 다중 worker/replica 에서도 1회.
+    next_run_at 이 DB 에 있어 모든 프로세스가 같은 스케줄을 봄 (재부팅해도 주간 리포트 중복 없음).
+    heartbeat_at — RUNNING 인데 오래 갱신 안 됐으면 실행 중 프로세스가 죽은 것
+    (advisory lock 은 연결 종료로 자동 해제 → 다음 tick 에 다른 프로세스가 재실행).
+    """
+
+    __tablename__ = "scheduled_jobs"
+
+    name: Mapped[str] = mapped_column(primary_key=True)
+    next_run_at: Mapped[datetime]
+
+    last_started_at: Mapped[datetime | None] = mapped_column(default=None)
+    last_finished_at: Mapped[datetime | None] = mapped_column(default=None)
+    last_duration_ms: Mapped[int | None] = mapped_column(default=None)
+    last_outcome: Mapped[JobOutcome | None] = mapped_column(default=None)
+    last_error: Mapped[str | None] = mapped_column(Text, default=None)
+    last_processed: Mapped[int | None] = mapped_column(default=None)
+    run_count: Mapped[int] = mapped_column(default=0)
+
+    holder: Mapped[str | None] = mapped_column(default=None)  # "hostname:pid"
+    heartbeat_at: Mapped[datetime | None] = mapped_column(default=None)
+
+    def __init__(self, **kwargs: object) -> None:
+        kwargs.setdefault("run_count", 0)
+        super().__init__(**kwargs)
@@ -0,0 +1,75 @@
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import ForeignKey, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class VersionObservation(Base):
+    """(project, environment, version_sha) 별 관측 구간 + 그 버전에서 본 fingerprint 집합.
+
+    설계서: 2026-05-01-error-log-phase4-query-design.md §2.2 (직전 정상 SHA)
+    ingest (record_events) / fingerprint_processor (record_fingerprint) 가 같은 트랜잭션에서 유지.
+    배포 전 데이터는 version_observation_backfill 주기 작업이 log_events 에서 채움.
+    version_sha 'unknown' 은 기록 안 함 — 직전 정상 SHA 후보가 될 수 없음.
+    """
+
+    __tablename__ = "version_observations"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    environment: Mapped[str] = mapped_column(primary_key=True)
+    version_sha: Mapped[str] = mapped_column(primary_key=True)
+
+    first_seen_at: Mapped[datetime]
+    last_seen_at: Mapped[datetime]
+    # ERROR↑ fingerprint 만 (fingerprint 는 ERROR↑ 에만 계산됨). 정렬 / 중복 없음 보장 안 함 — 집합으로만 사용
+    fingerprints: Mapped[list[str]] = mapped_column(ARRAY(Text), default=list)
+
+
+class VersionCoverage(Base):
+    """(project, environment) 별 발생 수 (version_fingerprint_counts) 집계 경계.
+
+    live_since — record_fingerprint 가 이 pair 를 처음 센 시각. 이후 fingerprint 처리된 event 는 live_count,
+    이전 것은 backfill 이 backfill_count 로 (fingerprinted_at < live_since) → 중복 / 누락 없음.
+    live 집계 전 데이터만 있는 pair 는 backfill 이 실행 시작 시각으로 등록.
+    backfilled_from — backfill 이 발생 수를 집계한 가장 오래된 파티션 일자 (None = 아직).
+    history_complete — version_observations 에 배포 전 기록까지 반영됨 (backfill 이 끝까지 돈 뒤 true).
+    그 전에는 live ingest 가 만든 관측만 있어 직전 정상 SHA lookup 이 log_events scan 으로 fallback.
+    """
+
+    __tablename__ = "version_coverage"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    environment: Mapped[str] = mapped_column(primary_key=True)
+    live_since: Mapped[datetime]
+    backfilled_from: Mapped[date | None] = mapped_column(default=None)
+    history_complete: Mapped[bool] = mapped_column(default=False)
+
+
+class VersionFingerprintCount(Base):
+    """(project, environment, version_sha, fingerprint, 수신 일자) 별 발생 수 — release 비교 발생률용.
+
+    log_events 원본 scan 대신 이 요약을 합산 (보존 기간이 지나 파티션이 삭제돼도 남음).
+    - live_count — record_fingerprint 가 event 마다 +1
+    - backfill_count — backfill 이 파티션 (일자) 단위로 다시 세어 SET (재실행해도 결과 동일)
+    """
+
+    __tablename__ = "version_fingerprint_counts"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    environment: Mapped[str] = mapped_column(primary_key=True)
+    version_sha: Mapped[str] = mapped_column(primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(primary_key=True)
+    day: Mapped[date] = mapped_column(primary_key=True)
+
+    live_count: Mapped[int] = mapped_column(default=0)
+    backfill_count: Mapped[int] = mapped_column(default=0)
@@ -4,7 +4,7 @@
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -74,9 +74,42 @@ class ErrorGroupSummary(BaseModel):
     resolved_in_version_sha: str | None = None
 
 
+class ErrorGroupListItem(BaseModel):
+    """GET /errors 목록 항목 — `fields=` 로 고른 필드만 채워짐 (exclude_unset 직렬화).
+
+    기본 (fields 미지정) 은 ErrorGroupSummary 와 같은 키.
+    """
+    id: UUID | None = None
+    fingerprint: str | None = None
+    exception_class: str | None = None
+    exception_message_sample: str | None = None
+    event_count: int | None = None
+    status: str | None = None  # ErrorGroupStatus enum value
+    first_seen_at: datetime | None = None
+    first_seen_version_sha: str | None = None
+    last_seen_at: datetime | None = None
+    last_seen_version_sha: str | None = None
+    resolved_at: datetime | None = None
+    resolved_by_user_id: UUID | None = None
+    resolved_in_version_sha: str | None = None
+    # `?sparkline=` 지정 시에만 — bucket 별 발생 수 (오래된 → 최근)
+    sparkline: list[int] | None = None
+
+
+class SparklineWindow(BaseModel):
+    """sparkline 배열의 시간축. i 번째 값 = [start + i*bucket_seconds, +bucket_seconds)."""
+    start: datetime
+    bucket_seconds: int
+    buckets: int
+
+
 class ErrorGroupListResponse(BaseModel):
-    items: list[ErrorGroupSummary]
-    total: int
+    """total — `?total=` 모드. estimate 면 COUNT_EXACT_LIMIT 초과 시 planner 추정치 (total_is_estimate)."""
+    items: list[ErrorGroupListItem]
+    total: int | None
+    total_is_estimate: bool = False
+    next_cursor: str | None = None  # None — 마지막 페이지
+    sparkline_window: SparklineWindow | None = None
 
 
 # ---- LogEvent ----
@@ -98,9 +131,52 @@ class LogEventSummary(BaseModel):
     exception_message: str | None
 
 
+class LogEventListItem(BaseModel):
+    """GET /logs 목록 항목 — `fields=` 로 고른 필드만 채워짐 (exclude_unset 직렬화).
+
+    기본 (fields 미지정) 은 LogEventSummary 와 같은 키. extra / stack_* 는 명시 요청 시에만.
+    """
+    id: UUID | None = None
+    level: str | None = None  # LogLevel enum value
+    message: str | None = None
+    logger_name: str | None = None
+    version_sha: str | None = None
+    environment: str | None = None
+    hostname: str | None = None
+    emitted_at: datetime | None = None
+    received_at: datetime | None = None
+    fingerprint: str | None = None
+    exception_class: str | None = None
+    exception_message: str | None = None
+    request_id: str | None = None
+    user_id_external: str | None = None
+    extra: dict[str, Any] | None = None
+    stack_trace: str | None = None
+    stack_frames: list[dict[str, Any]] | None = None
+
+
 class LogEventListResponse(BaseModel):
-    items: list[LogEventSummary]
-    total: int
+    items: list[LogEventListItem]
+    total: int | None
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
+
+
+# ---- GET /requests/{request_id} ----
+
+class RequestTraceEvent(LogEventSummary):
+    """trace 항목 — offset_ms 는 첫 이벤트 emitted_at 기준."""
+    user_id_external: str | None
+    extra: dict[str, Any] | None
+    offset_ms: float
+
+
+class RequestTraceResponse(BaseModel):
+    request_id: str
+    started_at: datetime
+    duration_ms: float  # 첫 ~ 마지막 이벤트 emitted_at 간격
+    events: list[RequestTraceEvent]
+    truncated: bool = False  # REQUEST_TRACE_LIMIT 초과 — 앞부분만
 
 
 # ---- 상세 ----
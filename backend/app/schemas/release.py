@@ -0,0 +1,38 @@
+"""release compare API 의 Pydantic schemas.
+
+설계서: 2026-05-01-error-log-phase4-query-design.md §2.2
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.schemas.log_query import ErrorGroupSummary
+
+
+class ReleaseVersion(BaseModel):
+    """비교 대상 버전 1개. observed_hours — 발생률 분모 (최소 1시간)."""
+    version_sha: str
+    first_seen_at: datetime
+    last_seen_at: datetime
+    observed_hours: float
+    error_events: int
+
+
+class ReleaseGroupDelta(BaseModel):
+    """fingerprint 1개의 base / head 비교. group 은 ErrorGroup 이 아직 없으면 None."""
+    fingerprint: str
+    group: ErrorGroupSummary | None
+    base_count: int
+    head_count: int
+    base_rate_per_hour: float
+    head_rate_per_hour: float
+
+
+class ReleaseCompareResponse(BaseModel):
+    environment: str
+    base: ReleaseVersion
+    head: ReleaseVersion
+    new: list[ReleaseGroupDelta]
+    disappeared: list[ReleaseGroupDelta]
+    increased: list[ReleaseGroupDelta]
@@ -2,7 +2,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import check_password, create_access_token, hash_password
 from app.models.user import User
 from app.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from app.schemas.auth import (
@@ -28,7 +28,7 @@ async def register(db: AsyncSession, data: RegisterRequest) -> AuthResponse:
     user = User(
         email=data.email,
         name=data.name,
-        password_hash=get_password_hash(data.password),
+        password_hash=await hash_password(data.password),
     )
     db.add(user)
     await db.flush()
@@ -86,7 +86,7 @@ async def login(db: AsyncSession, data: LoginRequest) -> AuthResponse:
     result = await db.execute(select(User).where(User.email == data.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(data.password, user.password_hash):
+    if not user or not await check_password(data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -0,0 +1,131 @@
+"""lifespan 밖에서 도는 background 작업 관리 — 진행 상황 추적 + graceful drain.
+
+부팅 시 reaper (push event / log fingerprint) 를 lifespan 안에서 await 하면
+backlog 가 클 때 앱이 트래픽을 못 받고 Render health check 에 죽는다.
+→ lifespan 은 작업을 task 로 띄우기만 하고 바로 yield. 진행 상황은 `/ready` 가 노출.
+
+- blocks_ready=True 작업 (부팅 회수) 이 모두 끝나야 `is_ready()` True.
+  실패도 "끝남" 으로 취급 — 다음 부팅 / 다음 주기에 재시도되므로 트래픽을 막을 이유 없음.
+- shutdown: deadline 까지 in-flight 작업 대기 → 남은 task cancel.
+  reaper 는 이벤트 단위 fresh session 이라 cancel 돼도 미처리 row 는 NULL 로 남아 다음 회수 대상.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackgroundJobState:
+    """background 작업 1개의 진행 상황 — `/ready` 응답 항목."""
+
+    name: str
+    blocks_ready: bool = True
+    drain: bool = True  # False — 무한 루프 (scheduler). shutdown 시 대기 없이 즉시 cancel
+    status: str = "pending"  # pending | running | done | failed | cancelled
+    processed: int = 0
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+
+    def add_progress(self, count: int = 1) -> None:
+        self.processed += count
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "processed": self.processed,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+JobFunc = Callable[[BackgroundJobState], Awaitable[None]]
+
+_TERMINAL = ("done", "failed", "cancelled")
+
+
+class BackgroundRunner:
+    """프로세스당 1개 (`runner`). lifespan 이 start / shutdown 호출."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, BackgroundJobState] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        # shutdown 시작 신호 — 루프형 작업 (job scheduler) 이 현재 tick 을 마치고 스스로 종료
+        self.stopping = asyncio.Event()
+
+    def start(
+        self,
+        name: str,
+        func: JobFunc,
+        *,
+        blocks_ready: bool = True,
+        drain: bool = True,
+    ) -> asyncio.Task:
+        """작업을 task 로 띄우고 즉시 반환. 같은 이름 재등록 시 상태 초기화."""
+        state = BackgroundJobState(name=name, blocks_ready=blocks_ready, drain=drain)
+        self._jobs[name] = state
+        task = asyncio.create_task(self._run(state, func), name=f"background:{name}")
+        self._tasks[name] = task
+        return task
+
+    async def _run(self, state: BackgroundJobState, func: JobFunc) -> None:
+        state.status = "running"
+        state.started_at = datetime.utcnow()
+        try:
+            await func(state)
+        except asyncio.CancelledError:
+            state.status = "cancelled"
+            raise
+        except Exception as exc:
+            logger.exception("background job %s failed", state.name)
+            state.status = "failed"
+            state.error = f"{type(exc).__name__}: {exc}"
+        else:
+            state.status = "done"
+        finally:
+            state.finished_at = datetime.utcnow()
+
+    def is_ready(self) -> bool:
+        return all(
+            s.status in _TERMINAL for s in self._jobs.values() if s.blocks_ready
+        )
+
+    def snapshot(self) -> list[dict]:
+        return [s.as_dict() for s in self._jobs.values()]
+
+    async def shutdown(self, deadline: float) -> None:
+        """deadline(초) 까지 in-flight 작업 drain → 남은 task cancel 후 정리 대기."""
+        self.stopping.set()
+        to_drain: list[asyncio.Task] = []
+        to_cancel: list[asyncio.Task] = []
+        for name, task in self._tasks.items():
+            if task.done():
+                continue
+            (to_drain if self._jobs[name].drain else to_cancel).append(task)
+
+        for task in to_cancel:
+            task.cancel()
+
+        if to_drain:
+            _, still_running = await asyncio.wait(to_drain, timeout=deadline)
+            for task in still_running:
+                logger.warning(
+                    "background task %s did not finish within %.1fs — cancelling",
+                    task.get_name(), deadline,
+                )
+                task.cancel()
+            to_cancel.extend(still_running)
+
+        if to_cancel:
+            await asyncio.gather(*to_cancel, return_exceptions=True)
+        self._tasks.clear()
+
+
+runner = BackgroundRunner()
@@ -1,15 +1,17 @@
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from uuid import UUID
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core import tracing
 from app.models.project import Project
 from app.models.task import Task, TaskStatus
+from app.services import task_stats_service
+from app.services.task_stats_service import OVERDUE_STATUSES
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +23,12 @@ SCHEDULE_HOUR = 0     # UTC 0시 = KST 9시
 async def send_webhook(content: str, webhook_url: str) -> None:
     """Discord webhook URL로 메시지 전송"""
     async with httpx.AsyncClient() as client:
-        response = await client.post(
-            webhook_url,
-            json={"content": content},
-        )
+        with tracing.http_span("POST", webhook_url) as span:
+            response = await client.post(
+                webhook_url,
+                json={"content": content},
+            )
+            span.set_attribute("http.response.status_code", response.status_code)
         response.raise_for_status()
 
 
@@ -56,25 +60,31 @@ def _format_overdue_task(task: Task) -> str:
 async def build_project_summary(project_id: UUID, db: AsyncSession, sender_name: str = "") -> str:
     """프로젝트 주간 리포트 생성"""
     now = datetime.utcnow()
-    today = datetime(now.year, now.month, now.day)
+    today = now.date()
     week_ago = now - timedelta(days=7)
 
     date_from = week_ago.strftime("%m/%d")
     date_to = now.strftime("%m/%d")
 
-    stmt = (
-        select(Project)
-        .where(Project.id == project_id)
-        .options(
-            selectinload(Project.tasks).selectinload(Task.assignee),
-        )
-    )
-    result = await db.execute(stmt)
-    project = result.scalar_one_or_none()
-
+    project = await db.get(Project, project_id)
     if not project:
         return "_프로젝트를 찾을 수 없습니다._"
 
+    # 전체 task 대신 리포트에 나오는 것만 — 지난 7일 업데이트 + 마감 초과. 현황 숫자는 카운터 (마감 초과 제외)
+    overdue_cond = (
+        Task.archived_at.is_(None)
+        & (Task.due_date < today)
+        & Task.status.in_(OVERDUE_STATUSES)
+    )
+    stmt = (
+        select(Task)
+        .where(Task.project_id == project_id, or_(Task.updated_at >= week_ago, overdue_cond))
+        .options(selectinload(Task.assignee))
+        .order_by(Task.created_at)
+    )
+    tasks = (await db.execute(stmt)).scalars().all()
+    stats = await task_stats_service.get_stats(db, project_id)
+
     lines: list[str] = []
     sender_tag = f"[**{sender_name}**] " if sender_name else ""
     lines.append(f"📊 {sender_tag}**forps 주간 리포트** ({date_from} ~ {date_to})")
@@ -91,17 +101,23 @@ async def build_project_summary(project_id: UUID, db: AsyncSession, sender_name:
 
     overdue: list[Task] = []
 
-    for task in project.tasks:
+    for task in tasks:
         if task.updated_at >= week_ago:
             status_groups[task.status].append(task)
 
-        if (
-            task.due_date
-            and task.due_date < today
-            and task.status in (TaskStatus.TODO, TaskStatus.DOING)
-        ):
+        if task_stats_service.task_state(task, today).overdue:
             overdue.append(task)
 
+    if stats is not None and stats.task_count:
+        counts = " · ".join(
+            f"{STATUS_LABELS[status][0]} {getattr(stats, f'{status.value}_count')}"
+            for status in (TaskStatus.DONE, TaskStatus.DOING, TaskStatus.TODO, TaskStatus.BLOCKED)
+        )
+        # 마감 초과는 오늘 기준으로 조회한 목록 수 — 카운터의 overdue_count 는 overdue_as_of 기준이라
+        # 자정 직후 (reconcile 전) 에는 어제 값
+        lines.append(f"현황: {counts} (마감 초과 {len(overdue)}, 보관 {stats.archived_count})")
+    lines.append("")
+
     has_tasks = any(tasks for tasks in status_groups.values())
 
     if has_tasks:
@@ -127,21 +143,14 @@ async def build_project_summary(project_id: UUID, db: AsyncSession, sender_name:
     return "\n".join(lines)
 
 
-def _seconds_until_next_schedule() -> float:
-    """다음 월요일 오전 9시(KST)까지 남은 초 계산"""
-    now = datetime.utcnow()
-    days_ahead = SCHEDULE_WEEKDAY - now.weekday()
-    if days_ahead < 0 or (days_ahead == 0 and now.hour >= SCHEDULE_HOUR):
-        days_ahead += 7
-
-    next_run = now.replace(hour=SCHEDULE_HOUR, minute=0, second=0, microsecond=0) + timedelta(days=days_ahead)
-    return (next_run - now).total_seconds()
-
+async def send_all_project_summaries() -> int:
+    """webhook URL이 설정된 프로젝트에 대해 주간 리포트 전송. 전송 성공 수 반환.
 
-async def _send_all_project_summaries() -> None:
-    """webhook URL이 설정된 프로젝트에 대해 주간 리포트 전송"""
+    스케줄링은 job_runner (`weekly_report` job, 매주 SCHEDULE_WEEKDAY / SCHEDULE_HOUR UTC).
+    """
     from app.database import AsyncSessionLocal
 
+    sent = 0
     async with AsyncSessionLocal() as db:
         stmt = select(Project).where(Project.discord_webhook_url.isnot(None))
         result = await db.execute(stmt)
@@ -151,17 +160,7 @@ async def _send_all_project_summaries() -> None:
             try:
                 summary = await build_project_summary(project.id, db, sender_name="자동 리포트")
                 await send_webhook(summary, project.discord_webhook_url)
+                sent += 1
             except Exception:
                 logger.exception("Failed to send weekly summary for project %s", project.id)
-
-
-async def start_weekly_scheduler() -> None:
-    """매주 월요일 오전 9시(KST)에 주간 리포트 자동 전송"""
-    while True:
-        wait_seconds = _seconds_until_next_schedule()
-        logger.info("Next weekly report in %.0f seconds", wait_seconds)
-        await asyncio.sleep(wait_seconds)
-        try:
-            await _send_all_project_summaries()
-        except Exception:
-            logger.exception("Weekly scheduler error")
+    return sent
@@ -13,6 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import tracing
 from app.models.error_group import ErrorGroup, ErrorGroupStatus
 from app.models.log_event import LogEvent
 
@@ -38,19 +39,28 @@ def _select_for_update(project_id: UUID, fingerprint: str):
 
 
 def _apply_update(group: ErrorGroup, event: LogEvent) -> bool:
-    """기존 group 에 event 반영. transitioned_to_regression 반환."""
+    """기존 group 에 event 반영. transitioned_to_regression 반환.
+
+    reaper 가 밀린 과거 event 를 늦게 처리할 수 있음 — first_seen / last_seen 은 처리 순서가 아닌
+    received_at 의 min / max 로 유지 (상세 조회가 이 구간으로 recent events 를 bound).
+    """
     transitioned = False
     if group.status == ErrorGroupStatus.RESOLVED:
         group.status = ErrorGroupStatus.REGRESSED
         transitioned = True
-    group.last_seen_at = event.received_at
-    group.last_seen_version_sha = event.version_sha
+    if event.received_at >= group.last_seen_at:
+        group.last_seen_at = event.received_at
+        group.last_seen_version_sha = event.version_sha
+    if event.received_at < group.first_seen_at:
+        group.first_seen_at = event.received_at
+        group.first_seen_version_sha = event.version_sha
     group.event_count += 1
     if event.exception_message:
         group.exception_message_sample = event.exception_message
     return transitioned
 
 
+@tracing.traced("error_group_service.upsert")
 async def upsert(
     db: AsyncSession,
     *,
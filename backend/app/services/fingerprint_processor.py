@@ -3,19 +3,48 @@
 설계서: 2026-05-01-error-log-phase3-design.md §2.4, §3.3
 """
 
+import time
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import tracing
+from app.core.metrics import Counter, Histogram
 from app.models.log_event import LogEvent
-from app.services import error_group_service, fingerprint_service, log_alert_service
+from app.services import (
+    error_group_service,
+    fingerprint_service,
+    log_alert_service,
+    version_observation_service,
+)
 
+FINGERPRINT_EVENTS = Counter(
+    "forps_fingerprint_events_total",
+    "Fingerprinted log events by result (new_group / existing_group / failed)",
+    ["result"],
+)
+FINGERPRINT_SECONDS = Histogram(
+    "forps_fingerprint_duration_seconds", "fingerprint_processor.process latency (alert 포함)",
+)
 
+
+@tracing.traced("fingerprint_processor.process")
 async def process(db: AsyncSession, event: LogEvent) -> None:
-    """fingerprint 계산 → ErrorGroup UPSERT → fingerprinted_at 마킹 + commit → 신규면 알림.
+    """fingerprint 계산 → ErrorGroup UPSERT + 버전 fingerprint 집합 → fingerprinted_at 마킹 + commit → 신규면 알림.
 
     설계서 §2.4 — commit 후 알림 (Phase 6 학습: DB 일관 상태에서 발송).
     """
+    started = time.perf_counter()
+    try:
+        is_new = await _process(db, event)
+    except Exception:
+        FINGERPRINT_EVENTS.labels(result="failed").inc()
+        raise
+    FINGERPRINT_EVENTS.labels(result="new_group" if is_new else "existing_group").inc()
+    FINGERPRINT_SECONDS.observe(time.perf_counter() - started)
+
+
+async def _process(db: AsyncSession, event: LogEvent) -> bool:
     fingerprint = fingerprint_service.compute(
         exception_class=event.exception_class or "UnknownError",
         stack_frames=event.stack_frames,
@@ -26,6 +55,8 @@ async def process(db: AsyncSession, event: LogEvent) -> None:
         db, project_id=event.project_id, fingerprint=fingerprint, event=event,
     )
 
+    await version_observation_service.record_fingerprint(db, event, fingerprint)
+
     event.fingerprint = fingerprint
     event.fingerprinted_at = datetime.utcnow()
     await db.commit()
@@ -35,3 +66,4 @@ async def process(db: AsyncSession, event: LogEvent) -> None:
         await log_alert_service.notify_new_error(
             db, project_id=event.project_id, group=result.group, event=event,
         )
+    return result.is_new
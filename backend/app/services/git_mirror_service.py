@@ -0,0 +1,144 @@
+"""로컬 bare mirror 기반 fetch backend — Contents/Compare API 대체.
+
+설계서: 2026-04-26-ai-task-automation-design.md §5.1 (②), §7.1
+GitHub REST 는 PAT 당 5k/h — 같은 PAT 를 공유하는 프로젝트 전체가 push 마다 Contents (+ truncated 시 Compare)
+호출을 나눠 쓴다. mirror backend 는 repo 별 bare mirror 를 `settings.git_mirror_root` 아래 유지하고
+요청된 sha 가 없을 때만 incremental `git fetch` (push 당 1회) — 이후 읽기는 로컬 object read.
+
+- fetch_file / fetch_compare_files: sync_service.FetchFile / FetchCompare 시그니처 그대로.
+- fetch_file: `<sha>:<path>` 가 없으면 None (Contents API 404 와 동일 의미).
+- fetch_compare_files: `git diff --name-only base...head` — Compare API 와 같은 merge-base 기준.
+- PAT 는 remote URL 에 넣지 않고 fetch 시 `http.extraHeader` 로만 전달 (mirror config 에 평문 저장 방지).
+- 같은 mirror 에 대한 fetch 는 프로세스 내 asyncio.Lock + 파일 flock 으로 직렬화 (worker 간 ref lock 충돌 회피).
+"""
+
+import asyncio
+import base64
+import fcntl
+import hashlib
+import logging
+import os
+import re
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SHA_RE = re.compile(r"^[0-9a-fA-F]{4,40}$")
+_mirror_locks: dict[str, asyncio.Lock] = {}
+
+
+class GitMirrorError(RuntimeError):
+    """git 명령 실패 (네트워크 / 인증 / 존재하지 않는 sha 등). process_event 가 실패 path 로 기록."""
+
+
+def mirror_path(repo_url: str) -> Path:
+    """repo URL → mirror 디렉토리. 사람이 알아볼 수 있는 이름 + URL 해시 (충돌 방지)."""
+    normalized = repo_url.strip().rstrip("/")
+    if normalized.endswith(".git"):
+        normalized = normalized[:-4]
+    owner_repo = "_".join(normalized.rsplit("/", 2)[-2:])
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", owner_repo)
+    digest = hashlib.sha256(normalized.encode()).hexdigest()[:12]
+    return Path(settings.git_mirror_root) / f"{slug}-{digest}.git"
+
+
+def _auth_config(repo_url: str, pat: str | None) -> list[str]:
+    if not pat or not repo_url.startswith("https://"):
+        return []
+    token = base64.b64encode(f"x-access-token:{pat}".encode()).decode()
+    return ["-c", f"http.extraHeader=Authorization: Basic {token}"]
+
+
+async def _git(*args: str, cwd: Path | None = None, check: bool = True) -> tuple[int, bytes]:
+    """git subprocess. 반환 (returncode, stdout). check=True 면 실패 시 GitMirrorError."""
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    )
+    stdout, stderr = await proc.communicate()
+    if check and proc.returncode != 0:
+        # args 에 extraHeader (PAT) 가 있을 수 있어 명령 전체는 남기지 않음
+        subcommand = next((a for a in args if not a.startswith("-") and "=" not in a), "?")
+        raise GitMirrorError(
+            f"git {subcommand} failed ({proc.returncode}): {stderr.decode(errors='replace').strip()}"
+        )
+    return proc.returncode, stdout
+
+
+@asynccontextmanager
+async def _locked(path: Path):
+    lock = _mirror_locks.setdefault(str(path), asyncio.Lock())
+    async with lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(f"{path}.lock", os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+async def _has_commit(path: Path, sha: str) -> bool:
+    code, _ = await _git("cat-file", "-e", f"{sha}^{{commit}}", cwd=path, check=False)
+    return code == 0
+
+
+async def ensure_commits(repo_url: str, pat: str | None, *shas: str) -> Path:
+    """mirror 준비 + shas 가 모두 로컬에 있도록 보장. mirror 경로 반환.
+
+    없을 때만 fetch — 최초 1회 `clone --mirror`, 이후 `fetch --prune` (incremental).
+    force-push 로 ref 에서 빠진 sha 는 sha 직접 fetch 로 한 번 더 시도.
+    """
+    for sha in shas:
+        if not _SHA_RE.match(sha):
+            raise GitMirrorError(f"invalid sha: {sha!r}")
+
+    path = mirror_path(repo_url)
+    if path.exists() and all([await _has_commit(path, sha) for sha in shas]):
+        return path
+
+    auth = _auth_config(repo_url, pat)
+    async with _locked(path):
+        if not path.exists():
+            logger.info("creating git mirror %s", path.name)
+            await _git(*auth, "clone", "--mirror", "--quiet", repo_url, str(path))
+        missing = [sha for sha in shas if not await _has_commit(path, sha)]
+        if missing:
+            await _git(*auth, "fetch", "--prune", "--quiet", "origin", cwd=path)
+            missing = [sha for sha in missing if not await _has_commit(path, sha)]
+        if missing:
+            await _git(*auth, "fetch", "--quiet", "origin", *missing, cwd=path)
+    return path
+
+
+async def fetch_file(
+    repo_url: str,
+    pat: str | None,
+    sha: str,
+    path: str,
+) -> str | None:
+    """mirror 에서 `<sha>:<path>` blob → text. 파일 없음 → None."""
+    mirror = await ensure_commits(repo_url, pat, sha)
+    code, content = await _git("cat-file", "blob", f"{sha}:{path}", cwd=mirror, check=False)
+    if code != 0:
+        return None
+    return content.decode("utf-8")
+
+
+async def fetch_compare_files(
+    repo_url: str,
+    pat: str | None,
+    base_sha: str,
+    head_sha: str,
+) -> list[str]:
+    """base...head 변경 파일 경로 — Compare API `files[*].filename` 대응 (rename 은 새 경로)."""
+    mirror = await ensure_commits(repo_url, pat, base_sha, head_sha)
+    _, out = await _git("diff", "--name-only", f"{base_sha}...{head_sha}", cwd=mirror)
+    return [line for line in out.decode("utf-8").splitlines() if line]
@@ -5,6 +5,9 @@
 - fetch_compare_files: Compare API — base...head 변경 파일 경로 리스트.
 
 Auth: 프로젝트별 PAT (Fernet 복호화는 호출자 책임). PAT NULL 이면 unauthenticated.
+
+`settings.git_fetch_backend == "mirror"` 이면 `get_fetchers()` 가 git_mirror_service 의 로컬 mirror
+구현을 돌려줌 (REST rate limit 회피). 호출자는 직접 import 대신 `get_fetchers()` 사용.
 """
 
 import base64
@@ -12,6 +15,9 @@ import re
 
 import httpx
 
+from app.config import settings
+from app.core import tracing
+
 
 _GITHUB_API = "https://api.github.com"
 _REPO_RE = re.compile(r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/?#]+?)(?:\.git)?/?$")
@@ -69,7 +75,9 @@ async def fetch_file(
     url = f"{_GITHUB_API}/repos/{owner}/{repo}/contents/{path}?ref={sha}"
     request = httpx.Request("GET", url, headers=auth_headers(pat))
     async with httpx.AsyncClient(timeout=timeout) as client:
-        res = await client.send(request)
+        with tracing.http_span(request.method, str(request.url)) as span:
+            res = await client.send(request)
+            span.set_attribute("http.response.status_code", res.status_code)
     if res.status_code == 404:
         return None
     raise_for_status(res, request)
@@ -92,7 +100,18 @@ async def fetch_compare_files(
     url = f"{_GITHUB_API}/repos/{owner}/{repo}/compare/{base_sha}...{head_sha}"
     request = httpx.Request("GET", url, headers=auth_headers(pat))
     async with httpx.AsyncClient(timeout=timeout) as client:
-        res = await client.send(request)
+        with tracing.http_span(request.method, str(request.url)) as span:
+            res = await client.send(request)
+            span.set_attribute("http.response.status_code", res.status_code)
     raise_for_status(res, request)
     data = res.json()
     return [f["filename"] for f in data.get("files", [])]
+
+
+def get_fetchers():
+    """설정된 backend 의 (fetch_file, fetch_compare_files) — sync_service.process_event 주입용."""
+    if settings.git_fetch_backend == "mirror":
+        from app.services import git_mirror_service
+
+        return git_mirror_service.fetch_file, git_mirror_service.fetch_compare_files
+    return fetch_file, fetch_compare_files
@@ -10,9 +10,17 @@
      - 들여쓰기 ≥ 2 인 체크박스 → Subtask (parent = 직전 최상위 체크박스)
      - `### 마지막 커밋` / `### 다음` / `### 블로커` 자유 텍스트 → FreeNotes
   4) sections 정렬: date desc (최신 = sections[0])
+
+handoff 파일은 하루 1 섹션씩 계속 자란다 (수년치 ~1MB). sync 는 최신 섹션만 쓰므로
+`scan_handoff` 는 날짜 헤더 위치만 스캔하고 최신 섹션만 즉시 파싱 — 나머지는 접근 시 파싱.
+`parse_handoff` (전체 파싱) 는 같은 스캐너 위에서 모든 섹션을 materialize.
+
+정규식은 라인 길이에 선형 — 들여쓰기 alternation 겹침 / lazy `.*?` + `\s*$` 조합 제거
+(수천 칸 공백 라인에서 지수/제곱 backtracking 발생했음).
 """
 
 import re
+from collections.abc import Iterator, Sequence
 
 from app.schemas.parsed_handoff import (
     CheckItem,
@@ -27,21 +35,29 @@ class MalformedHandoffError(ValueError):
     """필수 헤더(파일 헤더 또는 일자 섹션) 부재."""
 
 
+# 파일 전체 대상 스캐너 — 줄 단위 `\s` 를 개행 제외 공백 `[^\S\n]` 로 옮긴 multiline 버전
 _HEADER_RE = re.compile(
-    r"^#\s+Handoff\s*:\s*(?P<branch>\S+)\s+—\s+@(?P<user>[A-Za-z0-9_-]+)\s*$"
+    r"^#[^\S\n]+Handoff[^\S\n]*:[^\S\n]*(?P<branch>[^\s]+)[^\S\n]+—[^\S\n]+"
+    r"@(?P<user>[A-Za-z0-9_-]+)[^\S\n]*$",
+    re.MULTILINE,
+)
+_DATE_SECTION_RE = re.compile(
+    r"^##[^\S\n]+(?P<date>\d{4}-\d{2}-\d{2})[^\S\n]*$", re.MULTILINE
 )
-_DATE_SECTION_RE = re.compile(r"^##\s+(?P<date>\d{4}-\d{2}-\d{2})\s*$")
 _FREE_NOTE_HEADERS = {
     "마지막 커밋": "last_commit",
     "다음": "next",
     "블로커": "blockers",
 }
-_FREE_NOTE_HEADER_RE = re.compile(r"^###\s+(?P<name>.+?)\s*$")
+# name / extra / text 는 greedy `.*` + 호출부 strip() — lazy + `\s*$` 의 제곱 backtracking 회피
+_FREE_NOTE_HEADER_RE = re.compile(r"^###\s+(?P<name>.+)$")
 _TOP_CHECK_RE = re.compile(
-    r"^-\s+\[(?P<check>[ xX])\]\s+(?P<id>task-[A-Za-z0-9_-]+)\s*(?P<extra>.*?)\s*$"
+    r"^-\s+\[(?P<check>[ xX])\]\s+(?P<id>task-[A-Za-z0-9_-]+)(?P<extra>.*)$"
 )
+# 들여쓰기 단위 (탭 | 공백 2칸) 는 서로 겹치지 않음 — `(?:    |\t|  )+` 는 4칸을 1×4 / 2×2 로
+# 나누는 경우의 수가 지수적으로 늘어 매칭 실패 시 backtracking 폭발.
 _SUB_CHECK_RE = re.compile(
-    r"^(?P<indent>(?:    |\t|  )+)-\s+\[(?P<check>[ xX])\]\s+(?P<text>.+?)\s*$"
+    r"^(?P<indent>(?:\t|  )+)-\s+\[(?P<check>[ xX])\]\s+(?P<text>.+)$"
 )
 
 
@@ -120,52 +136,91 @@ def _parse_section_body(body_lines: list[str]) -> tuple[list[CheckItem], list[Su
     return checks, subtasks, free_notes
 
 
-def parse_handoff(text: str) -> ParsedHandoff:
-    """handoff 텍스트 → ParsedHandoff. sections 는 date desc."""
-    lines = text.splitlines()
-    branch: str | None = None
-    author: str | None = None
-
-    for line in lines:
-        m = _HEADER_RE.match(line)
-        if m:
-            branch = m.group("branch")
-            author = m.group("user")
-            break
-
-    if branch is None or author is None:
+class _LazySections(Sequence[HandoffSection]):
+    """date desc 섹션 시퀀스 — 인덱스 접근 시점에 해당 섹션만 파싱 (결과 캐시)."""
+
+    def __init__(self, text: str, spans: list[tuple[str, int, int]]) -> None:
+        self._text = text
+        self._spans = spans  # (date, body_start, body_end) — date desc
+        self._cache: dict[int, HandoffSection] = {}
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        section = self._cache.get(index)
+        if section is None:
+            date, start, end = self._spans[index]
+            checks, subtasks, free_notes = _parse_section_body(
+                self._text[start:end].splitlines()
+            )
+            section = HandoffSection(
+                date=date, checks=checks, subtasks=subtasks, free_notes=free_notes,
+            )
+            self._cache[index] = section
+        return section
+
+    def __iter__(self) -> Iterator[HandoffSection]:
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def dates(self) -> list[str]:
+        return [date for date, _, _ in self._spans]
+
+
+class LazyHandoff:
+    """`scan_handoff` 결과 — 헤더 + 섹션 위치만 보유. `latest` 는 즉시 파싱됨."""
+
+    def __init__(self, branch: str, author_git_login: str, sections: _LazySections) -> None:
+        self.branch = branch
+        self.author_git_login = author_git_login
+        self.sections = sections
+        self.latest: HandoffSection = sections[0]
+
+    def to_parsed(self) -> ParsedHandoff:
+        """전체 섹션 materialize — 기존 `parse_handoff` 결과와 동일."""
+        return ParsedHandoff(
+            branch=self.branch,
+            author_git_login=self.author_git_login,
+            sections=list(self.sections),
+        )
+
+
+def scan_handoff(text: str) -> LazyHandoff:
+    """헤더 + `## YYYY-MM-DD` 위치만 스캔, 최신 섹션만 파싱. 나머지 섹션은 lazy.
+
+    최신 = date 최대값 중 파일에서 먼저 나온 섹션 (전체 파싱의 stable sort 와 동일).
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    header = _HEADER_RE.search(text)
+    if header is None:
         raise MalformedHandoffError("missing or malformed `# Handoff: <branch> — @<user>` header")
 
-    # 날짜 섹션으로 분할
-    section_blocks: list[tuple[str, list[str]]] = []  # (date, body_lines)
-    current_date: str | None = None
-    current_body: list[str] = []
-    for line in lines:
-        date_match = _DATE_SECTION_RE.match(line)
-        if date_match:
-            if current_date is not None:
-                section_blocks.append((current_date, current_body))
-            current_date = date_match.group("date")
-            current_body = []
-        elif current_date is not None:
-            current_body.append(line)
-    if current_date is not None:
-        section_blocks.append((current_date, current_body))
-
-    if not section_blocks:
+    headers = list(_DATE_SECTION_RE.finditer(text))
+    if not headers:
         raise MalformedHandoffError("no `## YYYY-MM-DD` section found")
 
-    sections = []
-    for date, body in section_blocks:
-        checks, subtasks, free_notes = _parse_section_body(body)
-        sections.append(
-            HandoffSection(
-                date=date,
-                checks=checks,
-                subtasks=subtasks,
-                free_notes=free_notes,
-            )
-        )
-    sections.sort(key=lambda s: s.date, reverse=True)
+    spans: list[tuple[str, int, int]] = []
+    for i, m in enumerate(headers):
+        body_end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        spans.append((m.group("date"), min(m.end() + 1, body_end), body_end))
+    spans.sort(key=lambda span: span[0], reverse=True)
+
+    return LazyHandoff(
+        branch=header.group("branch"),
+        author_git_login=header.group("user"),
+        sections=_LazySections(text, spans),
+    )
+
 
-    return ParsedHandoff(branch=branch, author_git_login=author, sections=sections)
+def parse_handoff(text: str) -> ParsedHandoff:
+    """handoff 텍스트 → ParsedHandoff (전체 섹션). sections 는 date desc."""
+    return scan_handoff(text).to_parsed()
@@ -0,0 +1,210 @@
+"""handoff 본문 저장 — 같은 branch 직전 버전 대비 line delta + 주기적 full snapshot.
+
+설계서: 2026-04-26-ai-task-automation-design.md §4.2
+handoff 파일은 push 마다 "직전 파일 + 섹션 하나" — 매번 raw_content 전체를 저장하면
+history 총량이 push 수의 제곱으로 늘어난다.
+
+저장 형식 (handoffs 행):
+- snapshot: raw_content = 전체 텍스트, content_delta / content_base_id NULL, content_depth 0
+- delta:    content_base_id = 기준 버전, content_delta = zlib(JSON line ops), content_depth = base + 1
+  ops: ["c", start, end] — base 의 [start:end] 라인 복사 / ["i", [lines...]] — 라인 삽입
+- depth 가 SNAPSHOT_INTERVAL 에 닿거나 delta 가 원문 대비 충분히 작지 않으면 snapshot.
+  → 어떤 버전이든 복원 비용은 최대 SNAPSHOT_INTERVAL 개 delta 적용.
+
+GC (`purge_expired_content`): pushed_at 이 CONTENT_RETENTION 지난 행의 본문 제거.
+제거 대상을 base 로 쓰는 (이번 batch 밖) 행은 먼저 snapshot 으로 materialize → 체인 끊김 없음.
+"""
+
+import asyncio
+import difflib
+import json
+import logging
+import uuid
+import zlib
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.handoff import Handoff
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INTERVAL = 32
+# delta 가 원문 크기의 이 비율을 넘으면 (짧은 파일 / 대규모 재작성) delta 이득 없음 → snapshot
+_MAX_DELTA_RATIO = 0.5
+CONTENT_RETENTION = timedelta(days=30)
+_GC_BATCH_SIZE = 200
+_GC_BATCH_PAUSE_SECONDS = 0.5
+
+
+def make_delta(base: str, new: str) -> bytes:
+    """base → new 라인 delta (zlib JSON). 공통 prefix/suffix 를 먼저 잘라 difflib 입력 최소화."""
+    a = base.splitlines(keepends=True)
+    b = new.splitlines(keepends=True)
+
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[len(a) - 1 - suffix] == b[len(b) - 1 - suffix]:
+        suffix += 1
+
+    ops: list[list] = []
+    if prefix:
+        ops.append(["c", 0, prefix])
+    a_mid, b_mid = a[prefix:len(a) - suffix], b[prefix:len(b) - suffix]
+    matcher = difflib.SequenceMatcher(None, a_mid, b_mid, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["c", prefix + i1, prefix + i2])
+        elif j2 > j1:  # replace / insert — delete 는 복사 안 하는 것으로 표현
+            ops.append(["i", b_mid[j1:j2]])
+    if suffix:
+        ops.append(["c", len(a) - suffix, len(a)])
+    return zlib.compress(json.dumps(ops, ensure_ascii=False).encode("utf-8"))
+
+
+def apply_delta(base: str, delta: bytes) -> str:
+    a = base.splitlines(keepends=True)
+    out: list[str] = []
+    for op in json.loads(zlib.decompress(delta)):
+        if op[0] == "c":
+            out.extend(a[op[1]:op[2]])
+        else:
+            out.extend(op[1])
+    return "".join(out)
+
+
+async def _load_chain(db: AsyncSession, handoff_id: uuid.UUID) -> list[tuple]:
+    """handoff_id → snapshot 까지 (id, base_id, raw_content, delta) 체인. 최근 → snapshot 순."""
+    chain_cte = (
+        select(
+            Handoff.id, Handoff.content_base_id, Handoff.raw_content, Handoff.content_delta,
+        )
+        .where(Handoff.id == handoff_id)
+        .cte("chain", recursive=True)
+    )
+    parent = select(
+        Handoff.id, Handoff.content_base_id, Handoff.raw_content, Handoff.content_delta,
+    ).join(chain_cte, Handoff.id == chain_cte.c.content_base_id)
+    chain_cte = chain_cte.union_all(parent)
+    rows = (await db.execute(select(chain_cte))).all()
+    by_id = {row.id: row for row in rows}
+
+    ordered = []
+    current = by_id.get(handoff_id)
+    while current is not None:
+        ordered.append(current)
+        if current.content_delta is None:
+            break
+        current = by_id.get(current.content_base_id)
+    return ordered
+
+
+async def load_content(db: AsyncSession, handoff_id: uuid.UUID) -> str | None:
+    """임의 버전 본문 복원. GC 됐거나 체인이 끊겼으면 None."""
+    chain = await _load_chain(db, handoff_id)
+    if not chain:
+        return None
+    snapshot = chain[-1]
+    if snapshot.content_delta is not None or snapshot.raw_content is None:
+        return None
+    text = snapshot.raw_content
+    for row in reversed(chain[:-1]):
+        text = apply_delta(text, row.content_delta)
+    return text
+
+
+async def store_content(db: AsyncSession, handoff: Handoff, text: str) -> None:
+    """신규 Handoff 의 본문 필드 채움 (flush 전 호출). 직전 버전이 있으면 delta."""
+    previous = (await db.execute(
+        select(Handoff.id, Handoff.content_depth)
+        .where(
+            Handoff.project_id == handoff.project_id,
+            Handoff.branch == handoff.branch,
+            Handoff.commit_sha != handoff.commit_sha,
+            or_(Handoff.raw_content.is_not(None), Handoff.content_delta.is_not(None)),
+        )
+        .order_by(Handoff.pushed_at.desc(), Handoff.created_at.desc())
+        .limit(1)
+    )).first()
+
+    _set_snapshot(handoff, text)
+    if previous is None or previous.content_depth + 1 >= SNAPSHOT_INTERVAL:
+        return
+    base_text = await load_content(db, previous.id)
+    if base_text is None:
+        return
+    delta = make_delta(base_text, text)
+    if len(delta) > len(text.encode("utf-8")) * _MAX_DELTA_RATIO:
+        return
+    handoff.raw_content = None
+    handoff.content_base_id = previous.id
+    handoff.content_delta = delta
+    handoff.content_depth = previous.content_depth + 1
+
+
+def _set_snapshot(handoff: Handoff, text: str) -> None:
+    handoff.raw_content = text
+    handoff.content_base_id = None
+    handoff.content_delta = None
+    handoff.content_depth = 0
+
+
+async def purge_expired_content(
+    db: AsyncSession,
+    *,
+    now: datetime | None = None,
+    batch_size: int = _GC_BATCH_SIZE,
+    pause_seconds: float = _GC_BATCH_PAUSE_SECONDS,
+) -> int:
+    """retention 지난 handoff 본문 제거 (parsed_tasks / free_notes 는 유지). 제거 행 수 반환.
+
+    batch (오래된 순) 마다:
+      1) batch 행을 base 로 쓰는 batch 밖 행 → snapshot 으로 materialize
+      2) batch 행 본문 NULL
+      3) commit + pause — 긴 트랜잭션 / IO burst 회피
+    """
+    cutoff = (now or datetime.utcnow()) - CONTENT_RETENTION
+    purged = 0
+    while True:
+        batch_ids = (await db.execute(
+            select(Handoff.id)
+            .where(
+                Handoff.pushed_at < cutoff,
+                or_(Handoff.raw_content.is_not(None), Handoff.content_delta.is_not(None)),
+            )
+            .order_by(Handoff.pushed_at)
+            .limit(batch_size)
+        )).scalars().all()
+        if not batch_ids:
+            return purged
+
+        dependents = (await db.execute(
+            select(Handoff.id).where(
+                Handoff.content_base_id.in_(batch_ids),
+                Handoff.id.not_in(batch_ids),
+                Handoff.content_delta.is_not(None),
+            )
+        )).scalars().all()
+        for dep_id in dependents:
+            text = await load_content(db, dep_id)
+            await db.execute(
+                update(Handoff).where(Handoff.id == dep_id).values(
+                    raw_content=text, content_base_id=None, content_delta=None, content_depth=0,
+                )
+            )
+
+        await db.execute(
+            update(Handoff)
+            .where(Handoff.id.in_(batch_ids))
+            .values(raw_content=None, content_base_id=None, content_delta=None, content_depth=0)
+        )
+        await db.commit()
+        purged += len(batch_ids)
+        logger.info("handoff content GC: purged %d (rebased %d)", len(batch_ids), len(dependents))
+        if len(batch_ids) < batch_size:
+            return purged
+        await asyncio.sleep(pause_seconds)
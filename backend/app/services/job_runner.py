@@ -0,0 +1,251 @@
+"""주기 작업 runner — Postgres advisory lock 리스 기반 leader election.
+
+lifespan 마다 asyncio task 로 스케줄러/reaper 를 돌리면 uvicorn worker / replica 수 N 만큼
+주간 리포트가 N 번 나가고 reaper 가 같은 backlog 를 중복 처리한다.
+
+- 스케줄 (next_run_at) 은 `scheduled_jobs` 테이블에 — 모든 프로세스가 같은 값을 봄.
+- 실행 직전 job 별 `pg_try_advisory_lock` — 못 잡으면 다른 프로세스가 실행 중 → skip.
+  lock 은 전용 연결의 session-level lock 이라 프로세스가 죽으면 연결 종료로 자동 해제.
+- lock 획득 후 next_run_at 재확인 (다른 프로세스가 방금 끝냈을 수 있음).
+- 실행 중 heartbeat_at 주기 갱신, 종료 시 duration / outcome / error 기록.
+"""
+
+import asyncio
+import enum
+import logging
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.core.sql_instrumentation import report, track_queries
+from app.database import AsyncSessionLocal
+from app.models.scheduled_job import JobOutcome, ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_lock(key1, key2) 의 key1 — 다른 advisory lock 사용처와 충돌 방지용 namespace ("forp")
+LOCK_NAMESPACE = 0x666F7270
+HEARTBEAT_INTERVAL = timedelta(seconds=15)
+TICK_SECONDS = 30.0
+
+ProgressCallback = Callable[[int], None]
+JobFunc = Callable[[ProgressCallback], Awaitable[int | None]]
+
+
+class JobRun(str, enum.Enum):
+    """run_job 결과 — LOCKED 는 다른 프로세스가 같은 job 을 실행 중 (이번엔 실행 안 함)."""
+
+    RAN = "ran"
+    LOCKED = "locked"
+    NOT_DUE = "not_due"  # lock 대기 사이 다른 프로세스가 이미 실행 + next_run_at 갱신
+
+
+class Interval:
+    """고정 간격. 첫 등록 시 즉시 due (reaper / GC — 부팅 직후 1회 실행이 자연스러움)."""
+
+    def __init__(self, every: timedelta) -> None:
+        self.every = every
+
+    def first(self, now: datetime) -> datetime:
+        return now
+
+    def next_after(self, started_at: datetime) -> datetime:
+        return started_at + self.every
+
+
+class Weekly:
+    """매주 weekday(0=월) hour 시 (UTC). 첫 등록 시 다음 slot — 배포 직후 리포트 발송 방지."""
+
+    def __init__(self, weekday: int, hour: int) -> None:
+        self.weekday = weekday
+        self.hour = hour
+
+    def first(self, now: datetime) -> datetime:
+        return self.next_after(now)
+
+    def next_after(self, started_at: datetime) -> datetime:
+        days_ahead = self.weekday - started_at.weekday()
+        if days_ahead < 0 or (days_ahead == 0 and started_at.hour >= self.hour):
+            days_ahead += 7
+        slot = started_at.replace(hour=self.hour, minute=0, second=0, microsecond=0)
+        return slot + timedelta(days=days_ahead)
+
+
+Schedule = Interval | Weekly
+
+
+@dataclass(frozen=True)
+class Job:
+    """등록 단위. func 는 progress 콜백을 받고 처리 건수 (또는 None) 반환."""
+
+    name: str
+    schedule: Schedule
+    func: JobFunc
+
+
+def _holder() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _register_stmt(job: Job, now: datetime):
+    return (
+        pg_insert(ScheduledJob)
+        .values(name=job.name, next_run_at=job.schedule.first(now), run_count=0)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+
+
+async def ensure_registered(jobs: list[Job], *, now: datetime | None = None) -> None:
+    """scheduled_jobs 에 없는 job 만 INSERT (ON CONFLICT DO NOTHING) — 기존 스케줄 보존."""
+    now = now or datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        for job in jobs:
+            await db.execute(_register_stmt(job, now))
+        await db.commit()
+
+
+async def _heartbeat(name: str) -> None:
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL.total_seconds())
+        try:
+            async with AsyncSessionLocal() as db:
+                row = await db.get(ScheduledJob, name)
+                if row is not None:
+                    row.heartbeat_at = datetime.utcnow()
+                    await db.commit()
+        except Exception:
+            logger.exception("heartbeat update failed for job %s", name)
+
+
+async def run_job(
+    job: Job,
+    *,
+    force: bool = False,
+    on_progress: ProgressCallback | None = None,
+    now: datetime | None = None,
+) -> JobRun:
+    """lock 리스 획득 시 1회 실행. 실제로 실행했으면 JobRun.RAN (job 이 실패해도).
+
+    force=True — next_run_at 무시 (부팅 회수처럼 "지금 1회" 가 필요한 경우). lock 은 여전히 필수 —
+    못 잡으면 JobRun.LOCKED 이므로 "반드시 1회" 가 필요한 caller 는 재시도.
+    job 예외는 삼키고 FAILED 로 기록 — 스케줄러 루프가 죽지 않게.
+    """
+    async with AsyncSessionLocal() as lock_db:
+        # session-level advisory lock 은 연결에 귀속 — AUTOCOMMIT 전용 연결을 job 끝까지 점유
+        lock_conn = await lock_db.connection(
+            execution_options={"isolation_level": "AUTOCOMMIT"}
+        )
+        acquired = (await lock_conn.execute(
+            select(func.pg_try_advisory_lock(LOCK_NAMESPACE, func.hashtext(job.name)))
+        )).scalar_one()
+        if not acquired:
+            logger.debug("job %s is held by another process — skip", job.name)
+            return JobRun.LOCKED
+
+        try:
+            return await _run_locked(job, force=force, on_progress=on_progress, now=now)
+        finally:
+            await lock_conn.execute(
+                select(func.pg_advisory_unlock(LOCK_NAMESPACE, func.hashtext(job.name)))
+            )
+
+
+async def _run_locked(
+    job: Job,
+    *,
+    force: bool,
+    on_progress: ProgressCallback | None,
+    now: datetime | None,
+) -> JobRun:
+    started_at = now or datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        # 부팅 회수 (force) 가 scheduler 의 ensure_registered 보다 먼저 올 수 있음
+        await db.execute(_register_stmt(job, started_at))
+        row = await db.get(ScheduledJob, job.name)
+        if not force and row.next_run_at > started_at:
+            return JobRun.NOT_DUE
+        row.last_started_at = started_at
+        row.last_outcome = JobOutcome.RUNNING
+        row.holder = _holder()
+        row.heartbeat_at = started_at
+        await db.commit()
+
+    heartbeat = asyncio.create_task(_heartbeat(job.name))
+    t0 = time.perf_counter()
+    outcome = JobOutcome.SUCCESS
+    error: str | None = None
+    processed: int | None = None
+    try:
+        with track_queries() as queries:
+            processed = await job.func(on_progress or (lambda _n: None))
+    except Exception as exc:
+        logger.exception("scheduled job %s failed", job.name)
+        outcome = JobOutcome.FAILED
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        heartbeat.cancel()
+        duration_ms = int((time.perf_counter() - t0) * 1000)
+        # cancel (shutdown deadline 초과) 시에도 기록 시도 — 실패해도 lock 은 연결 종료로 해제
+        async with AsyncSessionLocal() as db:
+            row = await db.get(ScheduledJob, job.name)
+            if row is not None:
+                row.next_run_at = job.schedule.next_after(started_at)
+                row.last_finished_at = datetime.utcnow()
+                row.last_duration_ms = duration_ms
+                row.last_outcome = outcome
+                row.last_error = error
+                row.last_processed = processed
+                row.run_count += 1
+                row.heartbeat_at = row.last_finished_at
+                await db.commit()
+
+    logger.info(
+        "scheduled job %s %s in %d ms (processed=%s, queries=%d, db_ms=%d)",
+        job.name, outcome.value, duration_ms, processed, queries.count, queries.total_ms,
+    )
+    # 작업은 원래 오래 걸림 — 반복 statement (N+1 후보) 만 warning
+    report(queries, f"job {job.name}", slow_ms=float("inf"), repeat_threshold=settings.sql_repeat_threshold)
+    return JobRun.RAN
+
+
+async def run_due_jobs(jobs: list[Job], *, now: datetime | None = None) -> list[str]:
+    """next_run_at <= now 인 job 들을 동시 실행 (job 별 lock). 실행한 job 이름 반환."""
+    now = now or datetime.utcnow()
+    by_name = {job.name: job for job in jobs}
+    async with AsyncSessionLocal() as db:
+        due_names = (await db.execute(
+            select(ScheduledJob.name).where(
+                ScheduledJob.name.in_(by_name),
+                ScheduledJob.next_run_at <= now,
+            )
+        )).scalars().all()
+
+    due = [by_name[name] for name in due_names]
+    results = await asyncio.gather(*(run_job(job, now=now) for job in due))
+    return [job.name for job, result in zip(due, results) if result is JobRun.RAN]
+
+
+async def run_scheduler(
+    jobs: list[Job],
+    *,
+    stopping: asyncio.Event,
+    tick_seconds: float = TICK_SECONDS,
+) -> None:
+    """tick 마다 due job 실행. stopping set 시 진행 중 tick 을 마치고 종료 (graceful drain)."""
+    await ensure_registered(jobs)
+    while not stopping.is_set():
+        try:
+            await run_due_jobs(jobs)
+        except Exception:
+            logger.exception("job scheduler tick failed")
+        try:
+            await asyncio.wait_for(stopping.wait(), timeout=tick_seconds)
+        except asyncio.TimeoutError:
+            pass
@@ -10,14 +10,25 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import tracing
+from app.core.metrics import Histogram
 from app.models.error_group import ErrorGroup
 from app.models.log_event import LogEvent
 from app.models.project import Project
-from app.services import notification_dispatcher
+from app.services import log_ingest_service, notification_dispatcher
 
 logger = logging.getLogger(__name__)
 
+# ingest 요청 시작 → Discord 전송 완료. trace 로 이어진 경우만 (reaper 회수분은 root 가 달라 제외).
+# p99: histogram_quantile(0.99, rate(forps_ingest_to_alert_seconds_bucket[5m]))
+INGEST_TO_ALERT_SECONDS = Histogram(
+    "forps_ingest_to_alert_seconds",
+    "End-to-end latency from the ingest request to the new-error alert being sent (traced only)",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
 
+
+@tracing.traced("log_alert_service.notify_new_error")
 async def notify_new_error(
     db: AsyncSession,
     *,
@@ -49,12 +60,17 @@ async def notify_new_error(
     )
 
     try:
-        await notification_dispatcher.dispatch_discord_alert(db, project, content)
+        sent = await notification_dispatcher.dispatch_discord_alert(db, project, content)
     except Exception:
         logger.exception(
             "Discord alert dispatch failed for new error group=%s", group.id,
         )
         return
 
+    if sent:
+        elapsed = tracing.elapsed_since_root(log_ingest_service.INGEST_REQUEST_SPAN)
+        if elapsed is not None:
+            INGEST_TO_ALERT_SECONDS.observe(elapsed)
+
     group.last_alerted_new_at = datetime.utcnow()
     await db.commit()
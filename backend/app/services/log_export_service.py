@@ -0,0 +1,272 @@
+"""LogEvent 오프라인 분석용 export — NDJSON / CSV (선택 gzip), 메모리 상수.
+
+설계서: 2026-05-01-error-log-phase4-query-design.md §3.3 (/logs 100건 페이징 대체)
+- 일별 파티션 범위마다 쿼리 1개 (received_at [day_start, day_end) — 파티션 1개만 스캔),
+  server-side cursor (`stream` + yield_per) 로 batch 단위 fetch. ORM 객체 대신 Core row → identity map 없음.
+- 정렬은 (received_at, id) 오름차순. 각 row 의 `cursor` 가 재개 토큰 — 끊긴 지점의 마지막 cursor 를
+  같은 필터와 함께 `cursor=` 로 넘기면 그 다음 row 부터 이어감.
+- 프로젝트당 동시 export 상한 — transaction-level advisory lock slot (프로세스 / replica 공통).
+  export 전체가 트랜잭션 1개 (일관된 snapshot) — 끝나거나 연결이 끊기면 lock 도 자동 해제.
+"""
+
+import csv
+import io
+import json
+import logging
+import zlib
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.sql_instrumentation import expected_repeats
+from app.database import AsyncSessionLocal
+from app.models.log_event import LogEvent, LogLevel
+from app.services.log_query_service import decode_cursor, encode_cursor, log_filters
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MAX_EXPORT_RANGE = timedelta(days=31)
+DEFAULT_EXPORT_RANGE = timedelta(days=1)
+MAX_CONCURRENT_EXPORTS_PER_PROJECT = 2
+# server-side cursor fetch 단위 / 응답 chunk 크기
+YIELD_PER = 1000
+FLUSH_BYTES = 64 * 1024
+
+# job_runner.LOCK_NAMESPACE 와 구분되는 advisory lock namespace
+EXPORT_LOCK_NAMESPACE = 0x464F5258  # "FORX"
+
+EXPORT_COLUMNS = (
+    LogEvent.id, LogEvent.received_at, LogEvent.emitted_at, LogEvent.level,
+    LogEvent.logger_name, LogEvent.message,
+    LogEvent.exception_class, LogEvent.exception_message, LogEvent.stack_trace,
+    LogEvent.fingerprint, LogEvent.version_sha, LogEvent.environment, LogEvent.hostname,
+    LogEvent.request_id, LogEvent.user_id_external, LogEvent.extra,
+)
+CSV_HEADER = [c.key for c in EXPORT_COLUMNS] + ["cursor"]
+
+# /logs cursor (내림차순) 와 섞이지 않도록 별도 tag
+_CURSOR_SORT = "export"
+
+
+class ExportBusyError(Exception):
+    """프로젝트 동시 export 상한 도달 — endpoint 가 429 매핑."""
+
+
+class InvalidExportRangeError(ValueError):
+    """since >= until 또는 MAX_EXPORT_RANGE 초과 — endpoint 가 400 매핑."""
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    """timezone-aware (`?since=...Z`, `+09:00`) → naive UTC (received_at 은 TIMESTAMP WITHOUT TIME ZONE)."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def export_range(
+    since: datetime | None, until: datetime | None, *, now: datetime | None = None,
+) -> tuple[datetime, datetime]:
+    """[since, until) — 기본은 최근 DEFAULT_EXPORT_RANGE. offset 이 붙은 입력은 UTC 로 변환."""
+    since, until = _naive_utc(since), _naive_utc(until)
+    until = until or now or datetime.utcnow()
+    since = since or until - DEFAULT_EXPORT_RANGE
+    if since >= until:
+        raise InvalidExportRangeError("since must be before until")
+    if until - since > MAX_EXPORT_RANGE:
+        raise InvalidExportRangeError(f"export range exceeds {MAX_EXPORT_RANGE.days} days")
+    return since, until
+
+
+def partition_ranges(since: datetime, until: datetime) -> list[tuple[datetime, datetime]]:
+    """[since, until) 을 일별 파티션 경계 (00:00 UTC) 로 자름."""
+    ranges = []
+    start = since
+    while start < until:
+        day_end = datetime.combine(start.date() + timedelta(days=1), datetime.min.time())
+        end = min(day_end, until)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, LogLevel):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _row_dict(row: Any) -> dict[str, Any]:
+    item = {key: _jsonable(value) for key, value in row._mapping.items()}
+    item["cursor"] = encode_cursor(_CURSOR_SORT, row.received_at, row.id)
+    return item
+
+
+def format_ndjson(row: Any) -> str:
+    return json.dumps(_row_dict(row), ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class _CsvFormatter:
+    """row → CSV 한 줄. extra 는 JSON 문자열."""
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _line(self, values: list[Any]) -> str:
+        self._writer.writerow(values)
+        line = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return line
+
+    def header(self) -> str:
+        return self._line(CSV_HEADER)
+
+    def row(self, row: Any) -> str:
+        item = _row_dict(row)
+        if item["extra"] is not None:
+            item["extra"] = json.dumps(item["extra"], ensure_ascii=False, separators=(",", ":"))
+        return self._line([item[key] for key in CSV_HEADER])
+
+
+async def _try_acquire_slot(db: AsyncSession, project_id: UUID) -> int | None:
+    for slot in range(MAX_CONCURRENT_EXPORTS_PER_PROJECT):
+        acquired = (await db.execute(select(func.pg_try_advisory_xact_lock(
+            EXPORT_LOCK_NAMESPACE, func.hashtext(f"{project_id}:{slot}"),
+        )))).scalar_one()
+        if acquired:
+            return slot
+    return None
+
+
+class LogExport:
+    """열린 export 1건 — 세션 (트랜잭션 + lock slot) 보유. `body()` 가 끝나거나 중단되면 반납."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: UUID,
+        conditions: list,
+        ranges: list[tuple[datetime, datetime]],
+        after: tuple[datetime, UUID] | None,
+        fmt: ExportFormat,
+        gzip: bool,
+    ) -> None:
+        self._db = db
+        self._project_id = project_id
+        self._conditions = conditions
+        self._ranges = ranges
+        self._after = after
+        self._fmt = fmt
+        self._gzip = gzip
+        self._closed = False
+        self.rows = 0
+
+    async def close(self) -> None:
+        """세션 반납 (rollback → xact lock 해제). 여러 번 호출해도 안전."""
+        if self._closed:
+            return
+        self._closed = True
+        await self._db.close()
+
+    async def _lines(self) -> AsyncIterator[str]:
+        csv_formatter = _CsvFormatter() if self._fmt == "csv" else None
+        if csv_formatter is not None:
+            yield csv_formatter.header()
+        for start, end in self._ranges:
+            stmt = (
+                select(*EXPORT_COLUMNS)
+                .where(*self._conditions, LogEvent.received_at >= start, LogEvent.received_at < end)
+                .order_by(LogEvent.received_at, LogEvent.id)
+            )
+            if self._after is not None:
+                stmt = stmt.where(tuple_(LogEvent.received_at, LogEvent.id) > tuple_(*self._after))
+            with expected_repeats():  # 파티션마다 같은 shape 1개 — N+1 아님
+                result = await self._db.stream(stmt.execution_options(yield_per=YIELD_PER))
+            async for row in result:
+                self.rows += 1
+                yield csv_formatter.row(row) if csv_formatter is not None else format_ndjson(row)
+
+    async def body(self) -> AsyncIterator[bytes]:
+        """응답 본문 — FLUSH_BYTES 단위 chunk (gzip 이면 압축 후)."""
+        compressor = zlib.compressobj(wbits=31) if self._gzip else None  # 31 — gzip 헤더
+        pending: list[bytes] = []
+        pending_size = 0
+        try:
+            async for line in self._lines():
+                data = line.encode()
+                pending.append(data)
+                pending_size += len(data)
+                if pending_size >= FLUSH_BYTES:
+                    chunk = b"".join(pending)
+                    pending, pending_size = [], 0
+                    chunk = compressor.compress(chunk) if compressor is not None else chunk
+                    if chunk:
+                        yield chunk
+            chunk = b"".join(pending)
+            if compressor is not None:
+                chunk = compressor.compress(chunk) + compressor.flush()
+            if chunk:
+                yield chunk
+            logger.info("log export project=%s rows=%d", self._project_id, self.rows)
+        finally:
+            await self.close()
+
+
+async def open_export(
+    *,
+    project_id: UUID,
+    fmt: ExportFormat = "ndjson",
+    gzip: bool = False,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    level: LogLevel | None = None,
+    q: str | None = None,
+    request_id: str | None = None,
+    user_id_external: str | None = None,
+    extra: dict[str, str] | None = None,
+    cursor: str | None = None,
+    now: datetime | None = None,
+) -> LogExport:
+    """필터 / 범위 / cursor 검증 + slot 획득까지 마치고 LogExport 반환 (본문 스트리밍 전 에러 확정).
+
+    InvalidExportRangeError / InvalidCursorError / InvalidSearchQueryError — 400.
+    ExportBusyError — 프로젝트 동시 export 상한.
+    """
+    since, until = export_range(since, until, now=now)
+    after = decode_cursor(cursor, _CURSOR_SORT) if cursor is not None else None
+    _search, conditions = log_filters(
+        project_id=project_id, level=level, q=q,
+        request_id=request_id, user_id_external=user_id_external, extra=extra,
+    )
+    ranges = [
+        (start, end) for start, end in partition_ranges(since, until)
+        if after is None or end > after[0]  # 재개 — 이미 끝난 파티션은 건너뜀
+    ]
+
+    db = AsyncSessionLocal()
+    try:
+        slot = await _try_acquire_slot(db, project_id)
+    except BaseException:
+        await db.close()
+        raise
+    if slot is None:
+        await db.close()
+        raise ExportBusyError(
+            f"too many concurrent exports for this project (max {MAX_CONCURRENT_EXPORTS_PER_PROJECT})"
+        )
+    return LogExport(
+        db, project_id=project_id, conditions=conditions, ranges=ranges,
+        after=after, fmt=fmt, gzip=gzip,
+    )
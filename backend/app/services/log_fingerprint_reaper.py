@@ -2,12 +2,15 @@
 
 설계서: 2026-05-01-error-log-phase3-design.md §2.7, §3.6
 chunked 100건/batch — 큰 backlog 안전. fresh session per event (Phase 4 학습).
+lifespan 밖 background task 로 실행 (background_runner) — on_progress 로 `/ready` 진행률 보고.
 """
 
 import logging
+from collections.abc import Callable
 
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_
 
+from app.core.metrics import Gauge
 from app.database import AsyncSessionLocal
 from app.models.log_event import LogEvent, LogLevel
 from app.services import fingerprint_processor
@@ -16,33 +19,65 @@ logger = logging.getLogger(__name__)
 
 REAPER_BATCH_SIZE = 100
 
+# 회차 시작 시 backlog (partial index count) → 회차 끝에 실패로 남은 수. 모든 프로세스가 같은 DB → max
+FINGERPRINT_BACKLOG = Gauge(
+    "forps_log_fingerprint_reaper_backlog",
+    "ERROR+ log events without fingerprint (as of the last reaper pass)",
+    multiprocess_mode="max",
+)
 
-async def run_reaper_once() -> None:
-    """level >= ERROR AND fingerprinted_at IS NULL 회수.
+_UNFINGERPRINTED = (
+    LogEvent.level.in_([LogLevel.ERROR, LogLevel.CRITICAL]),
+    LogEvent.fingerprinted_at.is_(None),
+)
+
+
+async def run_reaper_once(
+    *, on_progress: Callable[[int], None] | None = None,
+) -> int:
+    """level >= ERROR AND fingerprinted_at IS NULL 회수. 처리 시도한 이벤트 수 반환.
 
     `idx_log_unfingerprinted` partial index 사용 (Phase 1 alembic 이미 생성).
-    received_at ASC — 오래된 것 우선.
+    (received_at, id) ASC keyset — 오래된 것 우선. 실패한 이벤트는 NULL 로 남지만
+    keyset 이 앞으로만 진행하므로 같은 batch 를 무한 재조회하지 않음 (다음 회차에 재시도).
     """
+    processed = 0
+    failed = 0
+    last_key: tuple | None = None
+    async with AsyncSessionLocal() as count_db:
+        FINGERPRINT_BACKLOG.set(
+            (await count_db.execute(select(func.count()).where(*_UNFINGERPRINTED))).scalar_one()
+        )
     while True:
         async with AsyncSessionLocal() as lookup_db:
             stmt = (
-                select(LogEvent.id)
-                .where(LogEvent.level.in_([LogLevel.ERROR, LogLevel.CRITICAL]))
-                .where(LogEvent.fingerprinted_at.is_(None))
-                .order_by(LogEvent.received_at.asc())
+                select(LogEvent.id, LogEvent.received_at)
+                .where(*_UNFINGERPRINTED)
+                .order_by(LogEvent.received_at.asc(), LogEvent.id.asc())
                 .limit(REAPER_BATCH_SIZE)
             )
-            ids = (await lookup_db.execute(stmt)).scalars().all()
+            if last_key is not None:
+                stmt = stmt.where(tuple_(LogEvent.received_at, LogEvent.id) > last_key)
+            rows = (await lookup_db.execute(stmt)).all()
 
-        if not ids:
+        if not rows:
             break
+        last_key = (rows[-1].received_at, rows[-1].id)
 
-        for event_id in ids:
+        for row in rows:
             try:
                 async with AsyncSessionLocal() as inner_db:
-                    event = await inner_db.get(LogEvent, event_id)
+                    event = await inner_db.get(LogEvent, row.id)
                     if event is None or event.fingerprinted_at is not None:
                         continue
                     await fingerprint_processor.process(inner_db, event)
             except Exception:
-                logger.exception("reaper failed for log event %s", event_id)
+                failed += 1
+                logger.exception("reaper failed for log event %s", row.id)
+            finally:
+                processed += 1
+                if on_progress is not None:
+                    on_progress(1)
+
+    FINGERPRINT_BACKLOG.set(failed)
+    return processed
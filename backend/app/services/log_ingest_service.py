@@ -3,10 +3,13 @@
 설계서: 2026-05-01-error-log-phase2-ingest-design.md §3.1
 """
 
-import asyncio
+import hashlib
+import hmac
 import json as _json
 import logging
+import os
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
@@ -14,16 +17,50 @@ from uuid import UUID
 import bcrypt
 from fastapi import HTTPException
 from pydantic import ValidationError
+from sqlalchemy import delete, select, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import tracing
+from app.config import settings
+from app.core.security import token_verify_executor
+from app.core.metrics import Counter, Histogram
 from app.models.log_event import LogEvent, LogLevel
 from app.models.log_ingest_token import LogIngestToken
 from app.models.rate_limit_window import RateLimitWindow
 from app.schemas.log_ingest import LogEventInput
+from app.services import log_stream_service, version_observation_service
 
 logger = logging.getLogger(__name__)
 
+# POST /log-ingest root span 이름 — 하위 단계 (알림) 에서 end-to-end 지연 계산 기준
+INGEST_REQUEST_SPAN = "log_ingest.request"
+
+INGEST_BATCHES = Counter(
+    "forps_ingest_batches_total",
+    "Ingest batches by outcome (ok / rate_limited / empty / invalid_payload / unauthorized / shed)",
+    ["outcome"],
+)
+INGEST_EVENTS = Counter(
+    "forps_ingest_events_total", "Ingested log events (accepted / rejected)", ["outcome"],
+)
+INGEST_REJECTED = Counter(
+    "forps_ingest_rejected_events_total",
+    "Rejected log events by reason (schema / version_sha / extra_too_large / level / rate_limited)",
+    ["reason"],
+)
+INGEST_CLIENT_DROPPED = Counter(
+    "forps_ingest_client_dropped_events_total",
+    "Events the client reported dropping before send (X-Forps-Dropped-Since-Last)",
+)
+INGEST_BATCH_SIZE = Histogram(
+    "forps_ingest_batch_size", "Events per ingest batch",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+)
+INGEST_SECONDS = Histogram(
+    "forps_ingest_batch_duration_seconds", "ingest_batch latency (rate limit → commit)",
+)
+
 
 def _invalid_token() -> HTTPException:
     """timing attack 회피용 통일 401 — 사유 구분 안 함."""
@@ -51,11 +88,53 @@ async def parse_token(authorization_header: str | None) -> tuple[UUID, str]:
     return key_id, secret
 
 
+class VerifiedTokenCache:
+    """bcrypt verify 에 성공한 토큰 secret → TTL 동안 재검증 생략 (같은 토큰의 연속 batch).
+
+    secret 원문 대신 프로세스별 random key HMAC 만 보관. secret_hash 도 digest 에 포함 → 토큰이
+    재발급되면 자동 miss. 실패한 시도는 기록 안 함 (틀린 secret 은 항상 bcrypt 경로).
+    """
+
+    def __init__(self, ttl_seconds: float, *, max_entries: int = 10_000, clock=time.monotonic) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._key = os.urandom(32)
+        self._entries: dict[UUID, tuple[bytes, float]] = {}
+
+    def _digest(self, secret_hash: str, secret: str) -> bytes:
+        msg = secret_hash.encode("utf-8") + b"\0" + secret.encode("utf-8")
+        return hmac.new(self._key, msg, hashlib.sha256).digest()
+
+    def hit(self, key_id: UUID, secret_hash: str, secret: str) -> bool:
+        entry = self._entries.get(key_id)
+        if entry is None:
+            return False
+        digest, expires_at = entry
+        if self._clock() >= expires_at:
+            self._entries.pop(key_id, None)
+            return False
+        return hmac.compare_digest(digest, self._digest(secret_hash, secret))
+
+    def set(self, key_id: UUID, secret_hash: str, secret: str) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        if key_id not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))  # 가장 오래 전에 넣은 것
+        self._entries[key_id] = (self._digest(secret_hash, secret), self._clock() + self.ttl_seconds)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+verified_tokens = VerifiedTokenCache(settings.ingest_token_cache_seconds)
+
+
 async def verify_token(db: AsyncSession, key_id: UUID, secret: str) -> LogIngestToken:
-    """key_id lookup → bcrypt verify → last_used_at 갱신 (in-memory).
+    """key_id lookup → bcrypt verify (최근 성공한 secret 이면 생략) → last_used_at 갱신 (in-memory).
 
-    실패 시 401 (사유 구분 안 함). 성공 시 token 반환.
-    DB commit 은 caller (ingest_batch) 가 묶음.
+    실패 시 401 (사유 구분 안 함), verify pool 포화 시 503. 성공 시 token 반환.
+    revoke 는 cache 와 무관하게 매번 DB 값으로 확인. DB commit 은 caller (ingest_batch) 가 묶음.
     """
     token = await db.get(LogIngestToken, key_id)
     if token is None:
@@ -63,14 +142,17 @@ async def verify_token(db: AsyncSession, key_id: UUID, secret: str) -> LogIngest
     if token.revoked_at is not None:
         raise _invalid_token()
 
-    # bcrypt 동기 — async endpoint 에서 event loop block 회피
-    is_valid = await asyncio.to_thread(
-        bcrypt.checkpw,
-        secret.encode("utf-8"),
-        token.secret_hash.encode("utf-8"),
-    )
-    if not is_valid:
-        raise _invalid_token()
+    if not verified_tokens.hit(key_id, token.secret_hash, secret):
+        # bcrypt 동기 — ingest 전용 bounded pool 에서 (event loop block 회피, 포화 시 503)
+        is_valid = await token_verify_executor.run(
+            "token_verify",
+            bcrypt.checkpw,
+            secret.encode("utf-8"),
+            token.secret_hash.encode("utf-8"),
+        )
+        if not is_valid:
+            raise _invalid_token()
+        verified_tokens.set(key_id, token.secret_hash, secret)
 
     token.last_used_at = datetime.utcnow()
     return token
@@ -114,10 +196,52 @@ async def check_rate_limit(
         )
 
 
+RATE_LIMIT_WINDOW_RETENTION = timedelta(hours=24)
+_GC_BATCH_SIZE = 5000
+
+
+async def purge_expired_rate_limit_windows(
+    db: AsyncSession,
+    *,
+    now: datetime | None = None,
+    batch_size: int = _GC_BATCH_SIZE,
+) -> int:
+    """24시간 지난 RateLimitWindow GC — batch 단위 DELETE + commit. 삭제 수 반환.
+
+    batch 마다 commit — 긴 트랜잭션 / 대량 row lock 회피 (ingest UPSERT 와 경합 최소화).
+    """
+    cutoff = (now or datetime.utcnow()) - RATE_LIMIT_WINDOW_RETENTION
+    deleted = 0
+    while True:
+        expired = (
+            select(RateLimitWindow.project_id, RateLimitWindow.token_id, RateLimitWindow.window_start)
+            .where(RateLimitWindow.window_start < cutoff)
+            .limit(batch_size)
+        )
+        result = await db.execute(
+            delete(RateLimitWindow).where(
+                tuple_(
+                    RateLimitWindow.project_id,
+                    RateLimitWindow.token_id,
+                    RateLimitWindow.window_start,
+                ).in_(expired)
+            )
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
 _VERSION_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
 _EXTRA_MAX_BYTES = 4 * 1024  # 4KB
 
 
+def _reject(index: int, reason_code: str, reason: str) -> tuple[None, dict]:
+    INGEST_REJECTED.labels(reason=reason_code).inc()
+    return None, {"index": index, "reason": reason}
+
+
 def validate_event(
     event_dict: dict[str, Any], index: int, project_id: UUID,
 ) -> tuple[LogEvent | None, dict | None]:
@@ -132,23 +256,23 @@ def validate_event(
         first = e.errors()[0]
         loc = ".".join(str(x) for x in first["loc"])
         msg = first["msg"]
-        return None, {"index": index, "reason": f"{loc}: {msg}"}
+        return _reject(index, "schema", f"{loc}: {msg}")
 
     # version_sha 형식
     if parsed.version_sha != "unknown" and not _VERSION_SHA_RE.match(parsed.version_sha):
-        return None, {"index": index, "reason": "version_sha format invalid"}
+        return _reject(index, "version_sha", "version_sha format invalid")
 
     # extra 크기 (JSON 직렬화 후 byte 수)
     if parsed.extra is not None:
         extra_bytes = len(_json.dumps(parsed.extra).encode("utf-8"))
         if extra_bytes > _EXTRA_MAX_BYTES:
-            return None, {"index": index, "reason": f"extra exceeds {_EXTRA_MAX_BYTES} bytes"}
+            return _reject(index, "extra_too_large", f"extra exceeds {_EXTRA_MAX_BYTES} bytes")
 
     # LogLevel 정규화 (대소문자 무관)
     try:
         level = LogLevel(parsed.level.lower())
     except ValueError:
-        return None, {"index": index, "reason": f"level invalid: {parsed.level}"}
+        return _reject(index, "level", f"level invalid: {parsed.level}")
 
     # timezone-aware → naive UTC (DB 컬럼 TIMESTAMP WITHOUT TIME ZONE)
     emitted_at = parsed.emitted_at
@@ -185,6 +309,7 @@ async def insert_events(db: AsyncSession, events: list[LogEvent]) -> int:
     return len(events)
 
 
+@tracing.traced("log_ingest_service.ingest_batch")
 async def ingest_batch(
     db: AsyncSession,
     *,
@@ -204,22 +329,33 @@ async def ingest_batch(
             "log_ingest token=%s dropped %d events since last batch",
             token.id, dropped_since_last,
         )
+        INGEST_CLIENT_DROPPED.inc(dropped_since_last)
 
     events_raw = payload_dict.get("events")
     if not isinstance(events_raw, list) or not events_raw:
         # caller 가 400 매핑 — 빈/잘못된 events
+        INGEST_BATCHES.labels(outcome="empty").inc()
         raise HTTPException(status_code=400, detail="events list required and non-empty")
 
+    started = time.perf_counter()
+    INGEST_BATCH_SIZE.observe(len(events_raw))
+
     now = now or datetime.utcnow()
 
     # last_used_at 갱신 (verify_token 이 in-memory 설정했을 수도 있고, 직접 호출일 수도 있음)
     token.last_used_at = now
 
     # rate limit — 전체 batch_size 기준
-    await check_rate_limit(
-        db, project_id=token.project_id, token=token,
-        batch_size=len(events_raw), now=now,
-    )
+    try:
+        await check_rate_limit(
+            db, project_id=token.project_id, token=token,
+            batch_size=len(events_raw), now=now,
+        )
+    except HTTPException:
+        INGEST_BATCHES.labels(outcome="rate_limited").inc()
+        INGEST_REJECTED.labels(reason="rate_limited").inc(len(events_raw))
+        INGEST_EVENTS.labels(outcome="rejected").inc(len(events_raw))
+        raise
 
     # per-event validate (partial success)
     accepted: list[LogEvent] = []
@@ -233,9 +369,17 @@ async def ingest_batch(
 
     if accepted:
         await insert_events(db, accepted)
+        await version_observation_service.record_events(db, accepted)
+        # live tail NOTIFY — 같은 트랜잭션이라 commit 된 batch 만 전달
+        await log_stream_service.publish(db, token.project_id, accepted)
 
-    # token.last_used_at + RateLimitWindow + LogEvent batch 모두 commit
+    # token.last_used_at + RateLimitWindow + LogEvent batch + version_observations + NOTIFY 모두 commit
     await db.commit()
 
+    INGEST_BATCHES.labels(outcome="ok").inc()
+    INGEST_EVENTS.labels(outcome="accepted").inc(len(accepted))
+    INGEST_EVENTS.labels(outcome="rejected").inc(len(rejected))
+    INGEST_SECONDS.observe(time.perf_counter() - started)
+
     accepted_ids = [e.id for e in accepted]
     return len(accepted), rejected, accepted_ids
@@ -0,0 +1,114 @@
+"""log_events daily partition 유지 — 미래 파티션 pre-create + 최근 파티션 extra GIN.
+
+설계서: 2026-04-26-error-log-design.md §4.1
+Phase 1 alembic 은 마이그레이션 시점 기준 31일치만 만든다. 그 뒤로는 이 작업이
+매 주기 `PARTITION_DAYS_AHEAD` 일 앞까지 채워야 INSERT 가 "no partition" 으로 실패하지 않음.
+파티션 이름 규약은 alembic 과 동일 — `log_events_YYYYMMDD`.
+
+extra (JSONB) 의 jsonb_path_ops GIN 은 parent 가 아닌 파티션 단위 (alembic a7c3e5f9b214).
+조회는 대부분 최근 로그 대상 — 오래된 파티션까지 인덱스를 유지하면 쓰기 / 저장 비용만 든다.
+`maintain_extra_indexes` 가 EXTRA_INDEX_DAYS 이내 (+ 미래) 파티션엔 생성, 그보다 오래된 건 삭제.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+PARTITION_DAYS_AHEAD = 14
+EXTRA_INDEX_DAYS = 7
+
+
+def partition_name(day: date) -> str:
+    return f"log_events_{day.strftime('%Y%m%d')}"
+
+
+def extra_index_name(day: date) -> str:
+    return f"{partition_name(day)}_extra_gin"
+
+
+async def list_partitions(db: AsyncSession) -> list[tuple[date, str]]:
+    """규약 (`log_events_YYYYMMDD`) 을 따르는 파티션 (day, 이름) — day 오름차순.
+
+    수동 생성 등 규약 밖 파티션은 제외 (유지보수 / backfill 이 건드리지 않음).
+    """
+    names = (await db.execute(text("""
+        SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'log_events'::regclass
+    """))).scalars()
+    partitions = []
+    for name in names:
+        try:
+            day = datetime.strptime(name.removeprefix("log_events_"), "%Y%m%d").date()
+        except ValueError:
+            continue
+        partitions.append((day, name))
+    return sorted(partitions)
+
+
+async def ensure_partitions(
+    db: AsyncSession,
+    *,
+    days_ahead: int = PARTITION_DAYS_AHEAD,
+    today: date | None = None,
+) -> int:
+    """오늘 ~ today + days_ahead 파티션 중 없는 것만 생성. 생성한 수 반환.
+
+    to_regclass 로 존재 확인 후 CREATE — 이미 있으면 DDL 없음 (ACCESS EXCLUSIVE lock 회피).
+    """
+    today = today or datetime.utcnow().date()
+    created = 0
+    for offset in range(days_ahead + 1):
+        day = today + timedelta(days=offset)
+        name = partition_name(day)
+        exists = (await db.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name},
+        )).scalar_one()
+        if exists:
+            continue
+        next_day = day + timedelta(days=1)
+        await db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF log_events "
+            f"FOR VALUES FROM ('{day.isoformat()}') TO ('{next_day.isoformat()}')"
+        ))
+        created += 1
+        logger.info("created log_events partition %s", name)
+    await db.commit()
+    return created
+
+
+async def maintain_extra_indexes(
+    db: AsyncSession,
+    *,
+    keep_days: int = EXTRA_INDEX_DAYS,
+    today: date | None = None,
+) -> int:
+    """today - keep_days 이후 파티션엔 extra GIN 생성, 이전 파티션에선 삭제. DDL 수 반환.
+
+    정상 주기에선 새로 만든 (빈) 미래 파티션에만 CREATE 가 일어나 lock 시간 무시 가능.
+    """
+    today = today or datetime.utcnow().date()
+    cutoff = today - timedelta(days=keep_days)
+    indexed = set((await db.execute(text("""
+        SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'log_events'::regclass
+          AND to_regclass(c.relname || '_extra_gin') IS NOT NULL
+    """))).scalars())
+    changed = 0
+    for day, relname in await list_partitions(db):
+        if day >= cutoff and relname not in indexed:
+            await db.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {extra_index_name(day)} "
+                f"ON {relname} USING gin (extra jsonb_path_ops)"
+            ))
+            changed += 1
+        elif day < cutoff and relname in indexed:
+            await db.execute(text(f"DROP INDEX IF EXISTS {extra_index_name(day)}"))
+            changed += 1
+    await db.commit()
+    if changed:
+        logger.info("log_events extra GIN maintenance: %d index DDL", changed)
+    return changed
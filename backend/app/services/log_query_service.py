@@ -4,17 +4,187 @@
 spec §6.2 의 데이터 흐름 그대로.
 """
 
-from datetime import datetime
+import asyncio
+import base64
+import json
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Literal, TypeVar
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ClauseElement, ColumnElement, Executable, Row, func, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
 
+from app.config import settings
 from app.models.error_group import ErrorGroup, ErrorGroupStatus
 from app.models.git_push_event import GitPushEvent
 from app.models.handoff import Handoff
 from app.models.log_event import LogEvent, LogLevel
 from app.models.task import Task
+from app.services import version_observation_service
+from app.services.log_search_service import SearchQuery, extra_condition, parse_query
+
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+GroupSort = Literal["last_seen", "first_seen", "event_count"]
+LogSort = Literal["recent", "relevance"]
+TotalMode = Literal["exact", "estimate", "none"]
+
+# sort mode → 정렬 컬럼. 각각 (project_id, <col> DESC, id DESC) 인덱스 보유 (alembic 5d7e9a1c3b28)
+_GROUP_SORT_COLUMNS = {
+    "last_seen": ErrorGroup.last_seen_at,
+    "first_seen": ErrorGroup.first_seen_at,
+    "event_count": ErrorGroup.event_count,
+}
+# estimate 모드에서 이 수 이하면 정확한 count (LIMIT 으로 상한 — 비용 bounded)
+COUNT_EXACT_LIMIT = 1000
+# group 상세의 병렬 조회용 추가 연결 — 프로세스 전체 동시 상한 (0 = 항상 순차)
+_SIBLING_SESSIONS = asyncio.Semaphore(settings.db_sibling_sessions)
+
+# `fields=` 로 고를 수 있는 컬럼 (응답 순서). 목록 기본값은 UI 가 쓰는 것만 —
+# TOAST 되는 extra / stack_trace / stack_frames 는 명시 요청 시에만 읽음
+LOG_FIELDS = (
+    "id", "level", "message", "logger_name", "version_sha", "environment", "hostname",
+    "emitted_at", "received_at", "fingerprint", "exception_class", "exception_message",
+    "request_id", "user_id_external", "extra", "stack_trace", "stack_frames",
+)
+LOG_LIST_FIELDS = LOG_FIELDS[:12]  # = LogEventSummary
+GROUP_FIELDS = (
+    "id", "fingerprint", "exception_class", "exception_message_sample", "event_count", "status",
+    "first_seen_at", "first_seen_version_sha", "last_seen_at", "last_seen_version_sha",
+    "resolved_at", "resolved_by_user_id", "resolved_in_version_sha",
+)
+
+
+class InvalidCursorError(ValueError):
+    """디코딩 불가 / 다른 sort mode 의 cursor. endpoint 가 400 으로 변환."""
+
+
+class InvalidFieldsError(ValueError):
+    """`fields=` 에 모르는 필드. endpoint 가 400 으로 변환."""
+
+
+def split_fields(raw: str | None) -> list[str] | None:
+    """`?fields=level,message` → ["level", "message"]. 미지정이면 None (기본 필드)."""
+    if raw is None:
+        return None
+    return [f.strip() for f in raw.split(",") if f.strip()]
+
+
+def select_fields(
+    requested: Sequence[str] | None,
+    *,
+    allowed: Sequence[str],
+    default: Sequence[str],
+    required: Sequence[str] = (),
+) -> tuple[str, ...]:
+    """요청 필드 검증 + 필수 필드 (cursor 인코딩용) 추가. allowed 순서로 반환."""
+    if requested is None:
+        wanted = set(default)
+    else:
+        unknown = set(requested) - set(allowed)
+        if unknown:
+            raise InvalidFieldsError(f"unknown fields: {', '.join(sorted(unknown))}")
+        wanted = set(requested)
+    wanted.update(required)
+    return tuple(f for f in allowed if f in wanted)
+
+
+def _cursor_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, tuple):
+        return [_cursor_value(v) for v in value]
+    return value
+
+
+def encode_cursor(sort: str, value: datetime | int | tuple, row_id: UUID) -> str:
+    """opaque cursor — base64url(JSON [sort, value, id]). 클라이언트는 내용 해석하지 않음.
+
+    relevance 의 value 는 (rank, received_at) — 같은 rank 동률 안에서도 pruning 가능하도록.
+    """
+    raw = _cursor_value(value)
+    payload = json.dumps([sort, raw, str(row_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[datetime | int | tuple, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, raw, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort:
+            raise InvalidCursorError("cursor was issued for a different sort")
+        if sort == "event_count":
+            value = int(raw)
+        elif sort == "relevance":
+            rank, received_at = raw
+            value = (float(rank), datetime.fromisoformat(received_at))
+        else:
+            value = datetime.fromisoformat(raw)
+        return value, UUID(row_id)
+    except InvalidCursorError:
+        raise
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("malformed cursor") from exc
+
+
+def group_cursor(group: ErrorGroup | Row, sort: GroupSort) -> str:
+    return encode_cursor(sort, getattr(group, _GROUP_SORT_COLUMNS[sort].key), group.id)
+
+
+def log_cursor(event: LogEvent | Row, sort: LogSort = "recent") -> str:
+    """relevance 는 list_logs row 의 search_rank 컬럼 사용."""
+    if sort == "relevance":
+        return encode_cursor("relevance", (event.search_rank, event.received_at), event.id)
+    return encode_cursor("received_at", event.received_at, event.id)
+
+
+class _Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON) <select>` — bind 파라미터를 그대로 쓰는 planner 추정용."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _count(db: AsyncSession, filtered: Select, mode: TotalMode) -> int | None:
+    """filtered: 필터만 적용된 select (정렬 / limit 없음).
+
+    exact    — COUNT(*) 전체.
+    estimate — LIMIT COUNT_EXACT_LIMIT+1 로 bounded count, 상한에 닿으면 planner 추정치.
+    none     — None (count 쿼리 없음).
+    """
+    if mode == "none":
+        return None
+    if mode == "exact":
+        return (await db.execute(
+            select(func.count()).select_from(filtered.order_by(None).subquery())
+        )).scalar_one()
+
+    bounded = filtered.order_by(None).limit(COUNT_EXACT_LIMIT + 1).subquery()
+    n = (await db.execute(select(func.count()).select_from(bounded))).scalar_one()
+    if n <= COUNT_EXACT_LIMIT:
+        return n
+    plan = (await db.execute(_Explain(filtered.order_by(None)))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return max(int(plan[0]["Plan"]["Plan Rows"]), n)
+
+
+def is_estimated_total(mode: TotalMode, total: int | None) -> bool:
+    """응답의 total_is_estimate — estimate 모드에서 bounded count 상한을 넘은 경우만."""
+    return mode == "estimate" and total is not None and total > COUNT_EXACT_LIMIT
 
 
 async def list_groups(
@@ -23,34 +193,115 @@ async def list_groups(
     project_id: UUID,
     status: ErrorGroupStatus | None = None,
     since: datetime | None = None,
+    sort: GroupSort = "last_seen",
+    cursor: str | None = None,
     offset: int = 0,
     limit: int = 50,
-) -> tuple[list[ErrorGroup], int]:
-    """ErrorGroup 목록. 필터 + offset/limit. last_seen_at desc.
+    total_mode: TotalMode = "exact",
+    fields: Sequence[str] | None = None,
+) -> tuple[list[Row], int | None]:
+    """ErrorGroup 목록. 필터 + (sort 컬럼, id) desc keyset.
 
+    cursor 지정 시 offset 무시 — 다음 페이지 cursor 는 `group_cursor(rows[-1], sort)`.
+    offset 은 기존 클라이언트 호환용 (깊은 페이지는 cursor 권장).
     environment 필터 미포함 (v1) — ErrorGroup 자체엔 environment 컬럼 없음.
+    fields: GROUP_FIELDS 부분집합 (기본 전체) — Core select, ORM 객체 없이 Row 반환.
+            id / sort 컬럼은 cursor 용으로 항상 포함. InvalidFieldsError — 모르는 필드.
     """
-    base = select(ErrorGroup).where(ErrorGroup.project_id == project_id)
-    count_base = select(func.count()).select_from(ErrorGroup).where(
+    sort_col = _GROUP_SORT_COLUMNS[sort]
+    columns = select_fields(
+        fields, allowed=GROUP_FIELDS, default=GROUP_FIELDS, required=("id", sort_col.key),
+    )
+    filtered = select(*(getattr(ErrorGroup, c) for c in columns)).where(
         ErrorGroup.project_id == project_id
     )
-
     if status is not None:
-        base = base.where(ErrorGroup.status == status)
-        count_base = count_base.where(ErrorGroup.status == status)
+        filtered = filtered.where(ErrorGroup.status == status)
     if since is not None:
-        base = base.where(ErrorGroup.last_seen_at >= since)
-        count_base = count_base.where(ErrorGroup.last_seen_at >= since)
+        filtered = filtered.where(ErrorGroup.last_seen_at >= since)
 
-    base = base.order_by(ErrorGroup.last_seen_at.desc()).offset(offset).limit(limit)
+    page = filtered.order_by(sort_col.desc(), ErrorGroup.id.desc()).limit(limit)
+    if cursor is not None:
+        value, row_id = decode_cursor(cursor, sort)
+        page = page.where(tuple_(sort_col, ErrorGroup.id) < tuple_(value, row_id))
+    elif offset:
+        page = page.offset(offset)
 
-    rows = (await db.execute(base)).scalars().all()
-    total = (await db.execute(count_base)).scalar_one()
+    rows = (await db.execute(page)).all()
+    total = await _count(db, filtered, total_mode)
     return list(rows), total
 
 
+SparklineRange = Literal["24h", "7d"]
+
+# range → (bucket 수, bucket 크기). payload 는 정수 배열 — 24 / 28 칸
+SPARKLINE_RANGES: dict[str, tuple[int, timedelta]] = {
+    "24h": (24, timedelta(hours=1)),
+    "7d": (28, timedelta(hours=6)),
+}
+
+# 페이지 fingerprint 전체를 쿼리 1개로 — generate_series 로 빈 bucket 을 0 으로 채움.
+# idx_log_fingerprint (project_id, fingerprint) + received_at 범위 → 범위 밖 파티션 pruning
+_SPARKLINE_SQL = text("""
+    WITH counts AS (
+        SELECT fingerprint,
+               date_bin(CAST(:step AS interval), received_at, CAST(:start AS timestamp)) AS bucket,
+               count(*) AS n
+        FROM log_events
+        WHERE project_id = :project_id
+          AND fingerprint = ANY(CAST(:fingerprints AS text[]))
+          AND received_at >= :start AND received_at < :end
+        GROUP BY 1, 2
+    )
+    SELECT fp.fingerprint, array_agg(coalesce(c.n, 0) ORDER BY b.bucket) AS counts
+    FROM unnest(CAST(:fingerprints AS text[])) AS fp(fingerprint)
+    CROSS JOIN generate_series(
+        CAST(:start AS timestamp), CAST(:last_bucket AS timestamp), CAST(:step AS interval)
+    ) AS b(bucket)
+    LEFT JOIN counts c ON c.fingerprint = fp.fingerprint AND c.bucket = b.bucket
+    GROUP BY fp.fingerprint
+""")
+
+
+def sparkline_window(range_: SparklineRange, now: datetime | None = None) -> tuple[datetime, timedelta, int]:
+    """(start, bucket, bucket 수). 마지막 bucket 이 now 를 포함 (진행 중 bucket)."""
+    buckets, step = SPARKLINE_RANGES[range_]
+    now = now or datetime.utcnow()
+    epoch = datetime(2000, 1, 1)
+    current = epoch + ((now - epoch) // step) * step
+    return current + step - buckets * step, step, buckets
+
+
+async def group_sparklines(
+    db: AsyncSession,
+    *,
+    project_id: UUID,
+    fingerprints: list[str],
+    range_: SparklineRange = "24h",
+    now: datetime | None = None,
+) -> tuple[datetime, timedelta, dict[str, list[int]]]:
+    """fingerprint 별 고정 bucket 발생 수 (오래된 → 최근). (start, bucket, {fingerprint: counts})."""
+    start, step, buckets = sparkline_window(range_, now)
+    if not fingerprints:
+        return start, step, {}
+    rows = (await db.execute(_SPARKLINE_SQL, {
+        "project_id": project_id,
+        "fingerprints": list(fingerprints),
+        "step": step,
+        "start": start,
+        "last_bucket": start + (buckets - 1) * step,
+        "end": start + buckets * step,
+    })).all()
+    return start, step, {fp: list(counts) for fp, counts in rows}
+
+
 _RECENT_EVENTS_LIMIT = 50
-_WARNING_OR_HIGHER = (LogLevel.WARNING, LogLevel.ERROR, LogLevel.CRITICAL)
+# recent events — LogEventSummary 필드만 (stack_trace / stack_frames / extra / search_tsv 제외)
+_RECENT_EVENT_COLUMNS = (
+    LogEvent.id, LogEvent.level, LogEvent.message, LogEvent.logger_name, LogEvent.version_sha,
+    LogEvent.environment, LogEvent.hostname, LogEvent.emitted_at, LogEvent.received_at,
+    LogEvent.fingerprint, LogEvent.exception_class, LogEvent.exception_message,
+)
 
 
 async def _find_previous_good_sha(
@@ -61,11 +312,34 @@ async def _find_previous_good_sha(
     target_fingerprint: str,
     before_received_at: datetime,
 ) -> str | None:
-    """직전 정상 SHA — LEFT JOIN + IS NULL 패턴.
+    """직전 정상 SHA — 설계서 §2.2. 같은 environment 에서 target_fingerprint 가 *없었던* 가장 최근 SHA.
 
-    설계서 §2.2.
-    같은 environment 에서 target_fingerprint 가 *없었던* 가장 최근 SHA.
+    version_observations 인덱스 lookup. 해당 environment 관측이 배포 전 기록까지 반영되기 전이면
+    (backfill 미완료 — live ingest 가 배포 직후부터 관측을 만들어 "관측 있음" 으로는 판단 불가)
+    log_events anti-join 으로 fallback.
     """
+    if await version_observation_service.history_complete(
+        db, project_id=project_id, environment=environment,
+    ):
+        return await version_observation_service.find_previous_good_sha(
+            db, project_id=project_id, environment=environment,
+            fingerprint=target_fingerprint, before=before_received_at,
+        )
+    return await _scan_previous_good_sha(
+        db, project_id=project_id, environment=environment,
+        target_fingerprint=target_fingerprint, before_received_at=before_received_at,
+    )
+
+
+async def _scan_previous_good_sha(
+    db: AsyncSession,
+    *,
+    project_id: UUID,
+    environment: str,
+    target_fingerprint: str,
+    before_received_at: datetime,
+) -> str | None:
+    """LEFT JOIN + IS NULL 패턴 — log_events 전 파티션 scan. version_observations backfill 전 fallback."""
     le = LogEvent.__table__.alias("le")
     le_target = LogEvent.__table__.alias("le_target")
     # DISTINCT 불필요 — LIMIT 1 으로 가장 최근 1건만 반환 (SHA 1 개).
@@ -96,6 +370,25 @@ async def _find_previous_good_sha(
     return result.scalar_one_or_none()
 
 
+async def _gather_with_sibling(
+    db: AsyncSession,
+    main: Callable[[], Awaitable[T]],
+    side: Callable[[AsyncSession], Awaitable[U]],
+) -> tuple[T, U]:
+    """main() (db 연결) ∥ side (db 와 같은 engine 의 별도 세션 = 별도 pooled 연결).
+
+    read-only 전용. 별도 연결이라 side 에는 db 의 미커밋 변경이 안 보임.
+    동시 sibling 세션이 db_sibling_sessions 개로 차 있으면 추가 연결 없이 db 에서 순차 —
+    상세 조회 폭주가 pool 을 두 배로 점유해 다른 요청의 checkout 대기를 늘리지 않게.
+    """
+    if _SIBLING_SESSIONS.locked():
+        return await main(), await side(db)
+    async with _SIBLING_SESSIONS:  # locked() 아님 → 대기 없이 획득
+        async with AsyncSession(bind=db.bind, expire_on_commit=False) as session:
+            main_result, side_result = await asyncio.gather(main(), side(session))
+    return main_result, side_result
+
+
 async def _collect_git_context(
     db: AsyncSession,
     *,
@@ -150,6 +443,11 @@ async def get_group_detail(
 ) -> dict | None:
     """ErrorGroup 상세 + recent events + git 컨텍스트 + 직전 정상 SHA.
 
+    round trip: group (PK) → recent events → git 컨텍스트 3 SQL ∥ 직전 정상 SHA (별도 pooled 연결).
+    요청당 연결 최대 2개 — 작은 git 컨텍스트 조회 3개는 같은 연결에서 순차. 두 번째 연결은
+    프로세스당 db_sibling_sessions 개까지만, 그 이상 동시 요청은 연결 1개로 순차 (_gather_with_sibling).
+    recent events 는 received_at 을 group 의 first_seen_at ~ last_seen_at (처리된 event 의 min / max) 으로 bound —
+    상수 범위라 planner 가 그 밖의 파티션을 plan 단계에서 제외. 컬럼도 LogEventSummary 분만.
     None — group 미존재 또는 다른 project 소속.
     """
     group = await db.get(ErrorGroup, group_id)
@@ -158,8 +456,13 @@ async def get_group_detail(
 
     events_stmt = (
         select(LogEvent)
-        .where(LogEvent.fingerprint == group.fingerprint)
-        .where(LogEvent.project_id == project_id)
+        .options(load_only(*_RECENT_EVENT_COLUMNS))
+        .where(
+            LogEvent.project_id == project_id,
+            LogEvent.fingerprint == group.fingerprint,
+            LogEvent.received_at >= group.first_seen_at,
+            LogEvent.received_at <= group.last_seen_at,
+        )
         .order_by(LogEvent.received_at.desc())
         .limit(_RECENT_EVENTS_LIMIT)
     )
@@ -169,24 +472,28 @@ async def get_group_detail(
         e.version_sha for e in recent_events
         if e.version_sha and e.version_sha != "unknown"
     }
-    git_context = await _collect_git_context(
-        db, project_id=project_id, version_shas=shas,
-    )
 
-    previous_good_sha: str | None = None
-    # environment 는 recent 50 events 중 oldest 의 environment.
-    # 한 fingerprint 가 여러 environment 발생 시 부정확할 수 있음 (recent 50 에 진짜 first event 누락 가능).
-    # 후속: ErrorGroup 에 first_environment 컬럼 추가 검토.
-    if recent_events:
+    async def previous_good(session: AsyncSession) -> str | None:
+        # environment 는 recent 50 events 중 oldest 의 environment.
+        # 한 fingerprint 가 여러 environment 발생 시 부정확할 수 있음 (recent 50 에 진짜 first event 누락 가능).
+        # 후속: ErrorGroup 에 first_environment 컬럼 추가 검토.
+        if not recent_events:
+            return None
         first_event = min(recent_events, key=lambda e: e.received_at)
-        previous_good_sha = await _find_previous_good_sha(
-            db,
+        return await _find_previous_good_sha(
+            session,
             project_id=project_id,
             environment=first_event.environment,
             target_fingerprint=group.fingerprint,
             before_received_at=group.first_seen_at,
         )
 
+    git_context, previous_good_sha = await _gather_with_sibling(
+        db,
+        lambda: _collect_git_context(db, project_id=project_id, version_shas=shas),
+        previous_good,
+    )
+
     return {
         "group": group,
         "recent_events": list(recent_events),
@@ -197,6 +504,37 @@ async def get_group_detail(
     }
 
 
+def log_filters(
+    *,
+    project_id: UUID,
+    level: LogLevel | None = None,
+    since: datetime | None = None,
+    q: str | None = None,
+    request_id: str | None = None,
+    user_id_external: str | None = None,
+    extra: dict[str, str] | None = None,
+) -> tuple[SearchQuery | None, list[ColumnElement[bool]]]:
+    """list_logs / log_export_service 공용 WHERE 조건. (해석된 q, 조건 목록).
+
+    InvalidSearchQueryError — 해석 불가 q.
+    """
+    conditions: list[ColumnElement[bool]] = [LogEvent.project_id == project_id]
+    search = parse_query(q) if q is not None and q.strip() else None
+    if search is not None and search.conditions:
+        conditions.append(search.where_clause())
+    if level is not None:
+        conditions.append(LogEvent.level == level)
+    if since is not None:
+        conditions.append(LogEvent.received_at >= since)
+    if request_id is not None:
+        conditions.append(LogEvent.request_id == request_id)
+    if user_id_external is not None:
+        conditions.append(LogEvent.user_id_external == user_id_external)
+    for path, value in (extra or {}).items():
+        conditions.append(extra_condition(path, value))
+    return search, conditions
+
+
 async def list_logs(
     db: AsyncSession,
     *,
@@ -204,37 +542,97 @@ async def list_logs(
     level: LogLevel | None = None,
     since: datetime | None = None,
     q: str | None = None,
+    request_id: str | None = None,
+    user_id_external: str | None = None,
+    extra: dict[str, str] | None = None,
+    sort: LogSort | None = None,
+    cursor: str | None = None,
     offset: int = 0,
     limit: int = 100,
-) -> tuple[list[LogEvent], int]:
-    """LogEvent 조회. level/since/q 필터, received_at desc.
-
-    q: pg_trgm ILIKE — Phase 1 alembic 의 idx_log_message_trgm partial (level >= WARNING) 활용.
-    q 지정 시 자동 level >= WARNING 강제 (인덱스 partial WHERE 매칭).
+    total_mode: TotalMode = "exact",
+    fields: Sequence[str] | None = None,
+) -> tuple[list[Row], int | None]:
+    """LogEvent 조회. level/since/q 필터 + keyset.
+
+    q: log_search_service 문법 (단어 / "구문" / prefix* / OR / -제외 / 필드:값 / *부분문자열*).
+       search_tsv GIN (alembic 9c4f2b7d1e05) — 모든 level 대상, level 필터와 AND.
+    request_id / user_id_external: 정확히 일치 (partial btree, alembic a7c3e5f9b214).
+    extra: {"tenant_id": "acme", "user.plan": "pro"} — 키 경로별 jsonpath 동등 조건 AND.
+    sort: recent — (received_at, id) desc.
+          relevance — (ts_rank, received_at, id) desc. q 에 텍스트 항이 있을 때 기본값.
+          각 row 에 search_rank 컬럼이 붙음 (cursor 인코딩용).
+    cursor 는 received_at 을 포함 — 파티션 pruning 이 깊은 페이지에서도 동작 (OFFSET 은 앞 페이지 전부 스캔).
+    fields: LOG_FIELDS 부분집합 (기본 LOG_LIST_FIELDS) 만 SELECT — Core select, ORM 객체 없이 Row 반환.
+            id / received_at 은 cursor 용으로 항상 포함.
+    InvalidSearchQueryError — 해석 불가 q. InvalidFieldsError — 모르는 필드.
     """
-    base = select(LogEvent).where(LogEvent.project_id == project_id)
-    count_base = select(func.count()).select_from(LogEvent).where(
-        LogEvent.project_id == project_id
+    columns = select_fields(
+        fields, allowed=LOG_FIELDS, default=LOG_LIST_FIELDS, required=("id", "received_at"),
     )
-
-    if q is not None and q.strip():
-        # pg_trgm 인덱스 활용 — level >= WARNING 자동 강제
-        warning_or_higher = LogEvent.level.in_(_WARNING_OR_HIGHER)
-        base = base.where(warning_or_higher).where(LogEvent.message.ilike(f"%{q}%"))
-        count_base = count_base.where(warning_or_higher).where(
-            LogEvent.message.ilike(f"%{q}%")
+    search, conditions = log_filters(
+        project_id=project_id, level=level, since=since, q=q,
+        request_id=request_id, user_id_external=user_id_external, extra=extra,
+    )
+    filtered = select(*(getattr(LogEvent, c) for c in columns)).where(*conditions)
+
+    if sort is None:
+        sort = "relevance" if search is not None and search.tsquery is not None else "recent"
+    if sort == "relevance" and (search is None or search.tsquery is None):
+        sort = "recent"  # 랭킹할 텍스트 항 없음 — 최신순과 동일
+
+    if sort == "relevance":
+        rank = func.ts_rank(LogEvent.search_tsv, search.tsquery)
+        page = (
+            filtered.add_columns(rank.label("search_rank"))
+            .order_by(rank.desc(), LogEvent.received_at.desc(), LogEvent.id.desc())
+            .limit(limit)
         )
-    elif level is not None:
-        # q 가 없을 때만 level 단일 매칭 적용. q + level 동시 시 q 우선 (단순화)
-        base = base.where(LogEvent.level == level)
-        count_base = count_base.where(LogEvent.level == level)
+        if cursor is not None:
+            (rank_value, received_at), row_id = decode_cursor(cursor, "relevance")
+            page = page.where(
+                tuple_(rank, LogEvent.received_at, LogEvent.id)
+                < tuple_(rank_value, received_at, row_id)
+            )
+        elif offset:
+            page = page.offset(offset)
+    else:
+        page = filtered.order_by(LogEvent.received_at.desc(), LogEvent.id.desc()).limit(limit)
+        if cursor is not None:
+            received_at, row_id = decode_cursor(cursor, "received_at")
+            page = page.where(
+                LogEvent.received_at <= received_at,  # 상한 — pruning 용 (row 비교만으론 안 됨)
+                tuple_(LogEvent.received_at, LogEvent.id) < tuple_(received_at, row_id),
+            )
+        elif offset:
+            page = page.offset(offset)
 
-    if since is not None:
-        base = base.where(LogEvent.received_at >= since)
-        count_base = count_base.where(LogEvent.received_at >= since)
+    rows = list((await db.execute(page)).all())
+    total = await _count(db, filtered, total_mode)
+    return rows, total
 
-    base = base.order_by(LogEvent.received_at.desc()).offset(offset).limit(limit)
 
-    rows = (await db.execute(base)).scalars().all()
-    total = (await db.execute(count_base)).scalar_one()
-    return list(rows), total
+REQUEST_TRACE_LIMIT = 1000
+
+
+async def get_request_trace(
+    db: AsyncSession,
+    *,
+    project_id: UUID,
+    request_id: str,
+    since: datetime | None = None,
+    limit: int = REQUEST_TRACE_LIMIT,
+) -> tuple[list[LogEvent], bool]:
+    """한 request 의 모든 LogEvent — emitted_at (동률 received_at, id) 오름차순. (rows, truncated).
+
+    idx_log_project_request 로 파티션별 index probe. since 로 파티션 범위를 좁힐 수 있음.
+    """
+    stmt = (
+        select(LogEvent)
+        .where(LogEvent.project_id == project_id, LogEvent.request_id == request_id)
+        .order_by(LogEvent.emitted_at, LogEvent.received_at, LogEvent.id)
+        .limit(limit + 1)
+    )
+    if since is not None:
+        stmt = stmt.where(LogEvent.received_at >= since)
+    rows = list((await db.execute(stmt)).scalars().all())
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,157 @@
+"""GET /logs `q` 검색 문법 → SQL 조건.
+
+설계서: 2026-05-01-error-log-phase4-query-design.md §3.3 (풀텍스트 확장)
+log_events.search_tsv (generated: message A / exception_message B / logger_name C, 'simple' config)
++ 파티션별 GIN. 모든 level 검색 가능 — 이전 ILIKE 경로는 partial trgm 인덱스 때문에 WARNING↑ 강제였음.
+
+문법 (공백 구분, AND 암묵):
+  timeout                 단어
+  "connection reset"      구문 (phraseto_tsquery — 인접 순서)
+  conn*                   prefix
+  a OR b                  OR (AND 보다 약하게 결합)
+  -word / NOT word        제외
+  *substr*                부분 문자열 — message ILIKE (pg_trgm 인덱스). tsvector 로 표현 불가한 경우만
+  logger:app.db*          필드 필터 (logger / host / env / level). 값 끝 * 는 prefix, -logger:x 는 제외
+
+결과 정렬은 호출부가 결정 — tsquery 가 있으면 ts_rank(search_tsv, tsquery) 사용 가능.
+
+extra 필터 (`extra_condition`): /logs 의 `extra.<key>[.<key>...]=<value>` 쿼리 파라미터 →
+jsonpath `@@` (jsonb_path_ops GIN — 최근 파티션).
+"""
+
+import json
+import math
+import re
+from dataclasses import dataclass, field
+
+from sqlalchemy import and_, cast, func, literal, not_, or_
+from sqlalchemy.dialects.postgresql import JSONPATH
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.log_event import LogEvent, LogLevel
+
+TS_CONFIG = "simple"
+
+_TOKEN_RE = re.compile(
+    r'(?P<neg>-)?(?:(?P<field>logger|host|env|level):)?(?:"(?P<quoted>[^"]*)"|(?P<bare>[^\s"]+))'
+)
+_EXTRA_KEY_RE = re.compile(r"^[^.\s]+(?:\.[^.\s]+)*$")
+MAX_EXTRA_FILTERS = 10
+_FIELD_COLUMNS = {
+    "logger": LogEvent.logger_name,
+    "host": LogEvent.hostname,
+    "env": LogEvent.environment,
+}
+
+
+class InvalidSearchQueryError(ValueError):
+    """해석 불가 q (예: 알 수 없는 level). endpoint 가 400 으로 변환."""
+
+
+@dataclass
+class SearchQuery:
+    tsquery: ColumnElement | None = None  # rank 계산용 (positive 텍스트 항만)
+    conditions: list[ColumnElement] = field(default_factory=list)
+
+    def where_clause(self) -> ColumnElement:
+        return and_(*self.conditions) if self.conditions else literal(True)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _text_tsquery(text: str, *, phrase: bool) -> ColumnElement:
+    if phrase:
+        return func.phraseto_tsquery(TS_CONFIG, text)
+    if text.endswith("*") and len(text) > 1:
+        # 'lexeme':* — quote_literal 로 tsquery 문법 문자 무력화
+        return func.to_tsquery(TS_CONFIG, func.quote_literal(text.rstrip("*")) + ":*")
+    return func.plainto_tsquery(TS_CONFIG, text)
+
+
+def _field_condition(name: str, value: str) -> ColumnElement:
+    if name == "level":
+        try:
+            return LogEvent.level == LogLevel(value.lower())
+        except ValueError as exc:
+            raise InvalidSearchQueryError(f"unknown level: {value!r}") from exc
+    column = _FIELD_COLUMNS[name]
+    if value.endswith("*"):
+        return column.like(_escape_like(value.rstrip("*")) + "%")
+    return column == value
+
+
+def parse_query(q: str) -> SearchQuery:
+    """q → SearchQuery. 항 단위 조건을 AND, `OR` 로 묶인 인접 항은 OR."""
+    groups: list[list[tuple[ColumnElement, ColumnElement | None]]] = [[]]
+    pending_not = False
+
+    for m in _TOKEN_RE.finditer(q):
+        quoted, bare = m.group("quoted"), m.group("bare")
+        if m.group("field") is None and quoted is None:
+            if bare == "OR":
+                groups.append([])
+                continue
+            if bare in ("AND", "&&"):
+                continue
+            if bare == "NOT":
+                pending_not = True
+                continue
+        negate = bool(m.group("neg")) or pending_not
+        pending_not = False
+        value = quoted if quoted is not None else bare
+        if not value or not value.strip("*"):
+            continue
+
+        ts: ColumnElement | None = None
+        if m.group("field"):
+            cond = _field_condition(m.group("field"), value)
+        elif quoted is None and value.startswith("*"):
+            # 부분 문자열 — tsvector 는 단어 경계 기준이라 trigram 으로만 가능
+            cond = LogEvent.message.ilike(f"%{_escape_like(value.strip('*'))}%")
+        else:
+            ts = _text_tsquery(value, phrase=quoted is not None)
+            cond = LogEvent.search_tsv.op("@@")(ts)
+
+        if negate:
+            groups[-1].append((not_(cond), None))
+        else:
+            groups[-1].append((cond, ts))
+
+    groups = [g for g in groups if g]
+    if not groups:
+        return SearchQuery()
+
+    ors: list[ColumnElement] = []
+    rank_parts: list[ColumnElement] = []
+    for group in groups:
+        ors.append(and_(*(cond for cond, _ in group)))
+        rank_parts.extend(ts for _, ts in group if ts is not None)
+
+    tsquery: ColumnElement | None = None
+    for part in rank_parts:
+        tsquery = part if tsquery is None else tsquery.op("||")(part)
+    return SearchQuery(tsquery=tsquery, conditions=[or_(*ors)])
+
+
+def extra_condition(path: str, value: str) -> ColumnElement:
+    """`tenant_id` / `user.plan` + 문자열 값 → `extra @@ '$."user"."plan" == "pro"'`.
+
+    쿼리 파라미터는 항상 문자열 — 값이 JSON scalar (숫자 / true / false / null) 로도 해석되면
+    그 타입과 문자열 둘 다 매칭 (`extra.attempt=3` 이 3 과 "3" 모두 찾음).
+    """
+    if not _EXTRA_KEY_RE.match(path):
+        raise InvalidSearchQueryError(f"invalid extra key: {path!r}")
+    accessor = "$" + "".join(f".{json.dumps(key, ensure_ascii=False)}" for key in path.split("."))
+    literals = [json.dumps(value, ensure_ascii=False)]
+    try:
+        scalar = json.loads(value)
+    except ValueError:
+        scalar = value
+    if not isinstance(scalar, (str, list, dict)) and not (
+        isinstance(scalar, float) and not math.isfinite(scalar)  # NaN / Infinity — jsonpath 리터럴 없음
+    ):
+        literals.append(json.dumps(scalar))
+    predicate = " || ".join(f"{accessor} == {lit}" for lit in literals)
+    return LogEvent.extra.op("@@")(cast(predicate, JSONPATH))
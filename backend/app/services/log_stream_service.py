@@ -0,0 +1,337 @@
+"""log live tail — ingest → pg NOTIFY → 프로세스당 LISTEN 1개 → SSE 구독자 fan-out.
+
+설계서: 2026-05-01-error-log-phase4-query-design.md §3.3 (/logs 폴링 대체)
+on-call 화면이 /logs 를 수 초마다 폴링하면 사용자 × 프로젝트마다 ORDER BY + COUNT 가 반복된다.
+→ ingest 트랜잭션 안에서 batch 요약을 NOTIFY (commit 시에만 전달, rollback 이면 사라짐),
+  각 worker 프로세스는 LISTEN 연결 1개 (`hub`) 로 받아 in-memory 로 구독자에게 나눠줌.
+
+- 구독자마다 bounded queue — 느린 소비자는 새 이벤트를 버리고 dropped 카운터만 증가
+  (SSE `dropped` 이벤트로 통지 — 클라이언트가 /logs 로 구간 재조회)
+- LISTEN 연결은 첫 구독자 때 열고 마지막 구독자가 나가면 닫음 (유휴 worker 는 pool 점유 0)
+- 재연결 시 그 사이 NOTIFY 는 유실 → 구독자에게 `resync` 통지
+- 필터 (level / logger / q) 는 서버 측 in-memory — /logs 의 tsquery 문법 대신 단어 AND 부분 문자열
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import engine
+from app.models.log_event import LogEvent, LogLevel
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "forps_log_events"
+
+# PostgreSQL NOTIFY payload 상한 8000 bytes — 여유를 두고 chunk 분할
+NOTIFY_PAYLOAD_LIMIT = 7900
+# 미리보기 길이 — 전체 본문은 /logs 또는 request trace 로 조회
+MESSAGE_PREVIEW_CHARS = 500
+EXCEPTION_PREVIEW_CHARS = 300
+
+HEARTBEAT_SECONDS = 15.0
+RETRY_MS = 3000
+LISTEN_CHECK_SECONDS = 5.0
+MAX_RECONNECT_BACKOFF = 30.0
+
+_RESYNC = object()
+
+
+class StreamUnavailableError(Exception):
+    """프로세스 구독자 상한 도달 — endpoint 가 503 매핑."""
+
+
+def _truncate(value: str | None, limit: int) -> str | None:
+    if value is None or len(value) <= limit:
+        return value
+    return value[:limit] + "…"
+
+
+def summarize_event(event: LogEvent) -> dict[str, Any]:
+    """NOTIFY 에 싣는 이벤트 요약 (LogEventSummary 와 같은 wire shape). flush 후 객체 기준."""
+    return {
+        "id": str(event.id),
+        "level": event.level.value,
+        "message": _truncate(event.message, MESSAGE_PREVIEW_CHARS),
+        "logger_name": event.logger_name,
+        "version_sha": event.version_sha,
+        "environment": event.environment,
+        "hostname": event.hostname,
+        "emitted_at": event.emitted_at.isoformat(),
+        "received_at": event.received_at.isoformat(),
+        "fingerprint": event.fingerprint,
+        "exception_class": event.exception_class,
+        "exception_message": _truncate(event.exception_message, EXCEPTION_PREVIEW_CHARS),
+    }
+
+
+def encode_notifications(project_id: uuid.UUID, events: list[LogEvent]) -> list[str]:
+    """batch → NOTIFY payload 목록. 각 payload 는 NOTIFY_PAYLOAD_LIMIT bytes 이하.
+
+    형식: `{"p": "<project_id>", "e": [<summary>, ...]}` — 요약 1건이 상한을 넘으면 (비정상적으로 긴
+    logger_name / hostname) 버림.
+    """
+    head = '{"p":"%s","e":[' % project_id
+    tail = "]}"
+    base = len(head.encode()) + len(tail)
+    payloads: list[str] = []
+    chunk: list[str] = []
+    size = base
+    for event in events:
+        item = json.dumps(summarize_event(event), ensure_ascii=False, separators=(",", ":"))
+        item_size = len(item.encode()) + 1  # 구분자 ","
+        if base + item_size > NOTIFY_PAYLOAD_LIMIT:
+            logger.warning("log_stream: event %s summary exceeds NOTIFY limit — skipped", event.id)
+            continue
+        if chunk and size + item_size > NOTIFY_PAYLOAD_LIMIT:
+            payloads.append(head + ",".join(chunk) + tail)
+            chunk, size = [], base
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        payloads.append(head + ",".join(chunk) + tail)
+    return payloads
+
+
+async def publish(db: AsyncSession, project_id: uuid.UUID, events: list[LogEvent]) -> None:
+    """ingest 트랜잭션 안에서 NOTIFY — commit 시점에 전달. commit 은 caller."""
+    if not settings.log_stream_enabled or not events:
+        return
+    for payload in encode_notifications(project_id, events):
+        await db.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+@dataclass
+class StreamFilter:
+    """구독자별 서버 측 필터. 모두 AND.
+
+    - level: 정확히 일치 (/logs 의 level 과 같은 의미)
+    - logger: logger_name 이 같거나 `<logger>.` 로 시작 (하위 logger 포함)
+    - q: 공백 구분 단어 모두가 message / exception_class / exception_message 에 포함 (대소문자 무시)
+    """
+
+    level: LogLevel | None = None
+    logger: str | None = None
+    q: str | None = None
+    _terms: list[str] = field(init=False, default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        self._terms = [t.casefold() for t in (self.q or "").split()]
+
+    def matches(self, event: dict[str, Any]) -> bool:
+        if self.level is not None and event["level"] != self.level.value:
+            return False
+        if self.logger is not None:
+            name = event["logger_name"]
+            if name != self.logger and not name.startswith(self.logger + "."):
+                return False
+        if self._terms:
+            haystack = " ".join(
+                event[k] or "" for k in ("message", "exception_class", "exception_message")
+            ).casefold()
+            if not all(term in haystack for term in self._terms):
+                return False
+        return True
+
+
+class Subscription:
+    """SSE 연결 1개. queue 가 차면 새 이벤트를 버리고 dropped 증가 (순서 유지, 최신 쪽 유실)."""
+
+    def __init__(self, project_id: uuid.UUID, stream_filter: StreamFilter, buffer_size: int) -> None:
+        self.project_id = project_id
+        self.filter = stream_filter
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.dropped = 0
+        self._reported_dropped = 0
+
+    def offer(self, item: Any) -> bool:
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        return True
+
+    def take_dropped(self) -> int:
+        """마지막 보고 이후 새로 버린 건수."""
+        delta = self.dropped - self._reported_dropped
+        self._reported_dropped = self.dropped
+        return delta
+
+
+ListenConnect = Callable[[], AbstractAsyncContextManager[Any]]
+
+
+@asynccontextmanager
+async def _engine_listen_connection() -> AsyncIterator[Any]:
+    """engine pool 에서 AUTOCOMMIT 연결 1개 → asyncpg driver 연결.
+
+    LISTEN 상태가 남은 연결이 pool 로 돌아가지 않도록 끝나면 invalidate (닫고 버림).
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        raw = await conn.get_raw_connection()
+        try:
+            yield raw.driver_connection
+        finally:
+            await conn.invalidate()
+
+
+class LogStreamHub:
+    """프로세스당 1개 (`hub`). LISTEN 연결 1개를 모든 SSE 구독자가 공유."""
+
+    def __init__(
+        self,
+        *,
+        connect: ListenConnect = _engine_listen_connection,
+        buffer_size: int | None = None,
+        max_subscribers: int | None = None,
+    ) -> None:
+        self._connect = connect
+        self._buffer_size = buffer_size or settings.log_stream_buffer_size
+        self._max_subscribers = max_subscribers or settings.log_stream_max_subscribers
+        self._subscribers: dict[uuid.UUID, set[Subscription]] = {}
+        self._listen_task: asyncio.Task | None = None
+        # LISTEN 등록 완료 ~ 연결 끊김 사이에만 set
+        self.listening = asyncio.Event()
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    def has_capacity(self) -> bool:
+        return self.subscriber_count < self._max_subscribers
+
+    @asynccontextmanager
+    async def subscribe(
+        self, project_id: uuid.UUID, stream_filter: StreamFilter,
+    ) -> AsyncIterator[Subscription]:
+        if not self.has_capacity():
+            raise StreamUnavailableError("too many live tail subscribers")
+        sub = Subscription(project_id, stream_filter, self._buffer_size)
+        self._subscribers.setdefault(project_id, set()).add(sub)
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(self._listen(), name="log_stream:listen")
+        try:
+            yield sub
+        finally:
+            subs = self._subscribers.get(project_id)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[project_id]
+            if not self._subscribers:
+                await self.close()
+
+    async def close(self) -> None:
+        task, self._listen_task = self._listen_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def dispatch(self, payload: str) -> None:
+        """NOTIFY payload 1개 → 해당 프로젝트 구독자 중 필터 통과한 곳에 put."""
+        try:
+            message = json.loads(payload)
+            project_id = uuid.UUID(message["p"])
+            events = message["e"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("log_stream: malformed notification ignored")
+            return
+        subs = self._subscribers.get(project_id)
+        if not subs:
+            return
+        for sub in subs:
+            for event in events:
+                if not sub.filter.matches(event):
+                    continue
+                if sub.offer(event):
+                    self.delivered += 1
+                else:
+                    self.dropped += 1
+
+    def _broadcast_resync(self) -> None:
+        for subs in self._subscribers.values():
+            for sub in subs:
+                sub.offer(_RESYNC)
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        self.dispatch(payload)
+
+    async def _listen(self) -> None:
+        """LISTEN 유지 루프. 연결이 끊기면 backoff 후 재연결 + 구독자에게 resync."""
+        backoff = 1.0
+        connected_before = False
+        while True:
+            try:
+                async with self._connect() as conn:
+                    await conn.add_listener(CHANNEL, self._on_notify)
+                    self.listening.set()
+                    if connected_before:
+                        self._broadcast_resync()
+                    connected_before = True
+                    backoff = 1.0
+                    while not conn.is_closed():
+                        await asyncio.sleep(LISTEN_CHECK_SECONDS)
+                logger.warning("log_stream: LISTEN connection closed — reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("log_stream: LISTEN connection failed")
+            finally:
+                self.listening.clear()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, MAX_RECONNECT_BACKOFF)
+
+
+hub = LogStreamHub()
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+async def sse_stream(
+    stream_hub: LogStreamHub,
+    project_id: uuid.UUID,
+    stream_filter: StreamFilter,
+    *,
+    heartbeat_seconds: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """SSE 본문 generator. client 연결 종료 시 StreamingResponse 가 cancel → 구독 해제.
+
+    이벤트 종류:
+    - `log` — LogEventSummary 와 같은 shape (message 는 미리보기)
+    - `dropped` — {"count": 이번에 버린 수, "total": 누적} (느린 소비자)
+    - `resync` — LISTEN 재연결로 구간 유실 가능. 클라이언트가 /logs 로 재조회
+    heartbeat 는 SSE comment (`: ping`) — proxy idle timeout 방지.
+    """
+    async with stream_hub.subscribe(project_id, stream_filter) as sub:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            try:
+                item = await asyncio.wait_for(sub.queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            dropped = sub.take_dropped()
+            if dropped:
+                yield _sse("dropped", {"count": dropped, "total": sub.dropped})
+            if item is _RESYNC:
+                yield _sse("resync", {})
+            else:
+                yield f"id: {item['id']}\n" + _sse("log", item)
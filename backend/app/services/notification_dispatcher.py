@@ -7,6 +7,8 @@ from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import tracing
+from app.core.metrics import Counter, Histogram
 from app.models.project import Project
 from app.services import discord_service
 
@@ -14,28 +16,45 @@ logger = logging.getLogger(__name__)
 
 DISABLE_THRESHOLD = 3
 
+DISCORD_ALERTS = Counter(
+    "forps_discord_alerts_total",
+    "Discord alerts by result (sent / failed / skipped_no_url / skipped_disabled)",
+    ["result"],
+)
+DISCORD_AUTO_DISABLED = Counter(
+    "forps_discord_auto_disabled_total", "Projects auto-disabled after consecutive failures",
+)
+DISCORD_SEND_SECONDS = Histogram(
+    "forps_discord_send_duration_seconds", "Discord webhook send latency (success + failure)",
+)
 
+
+@tracing.traced("notification_dispatcher.dispatch_discord_alert")
 async def dispatch_discord_alert(
     db: AsyncSession,
     project: Project,
     content: str,
-) -> None:
+) -> bool:
     """Discord 알림 1점 진입. URL NULL / disabled 체크 + 실패 시 counter 갱신.
 
     실패가 메인 처리에 영향 안 가도록 catch — caller 는 await 만 하면 됨.
-    counter 갱신은 같은 session 의 commit 으로 영속.
+    counter 갱신은 같은 session 의 commit 으로 영속. 반환: 실제 전송 여부.
     """
     if project.discord_webhook_url is None:
-        return
+        DISCORD_ALERTS.labels(result="skipped_no_url").inc()
+        return False
     if project.discord_disabled_at is not None:
+        DISCORD_ALERTS.labels(result="skipped_disabled").inc()
         logger.info(
             "Discord disabled for project %s since %s — skip",
             project.id, project.discord_disabled_at,
         )
-        return
+        return False
 
     try:
-        await discord_service.send_webhook(content, project.discord_webhook_url)
+        with DISCORD_SEND_SECONDS.time():
+            await discord_service.send_webhook(content, project.discord_webhook_url)
+        DISCORD_ALERTS.labels(result="sent").inc()
         # 성공 — counter > 0 이면 reset
         if project.discord_consecutive_failures > 0:
             project.discord_consecutive_failures = 0
@@ -46,11 +65,14 @@ async def dispatch_discord_alert(
                     "Failed to reset Discord failure counter for project %s",
                     project.id,
                 )
+        return True
     except Exception:
         logger.exception("Discord alert failed for project %s", project.id)
+        DISCORD_ALERTS.labels(result="failed").inc()
         project.discord_consecutive_failures += 1
         if project.discord_consecutive_failures >= DISABLE_THRESHOLD:
             project.discord_disabled_at = datetime.utcnow()
+            DISCORD_AUTO_DISABLED.inc()
             logger.warning(
                 "Discord auto-disabled for project %s after %d consecutive failures",
                 project.id, project.discord_consecutive_failures,
@@ -62,3 +84,4 @@ async def dispatch_discord_alert(
                 "Failed to record Discord failure counter for project %s",
                 project.id,
             )
+        return False
@@ -1,24 +1,97 @@
+"""프로젝트 role 조회 + 프로세스 TTL cache.
+
+대시보드 1화면에 project endpoint 6~10개 — 요청마다 같은 (user, project) role 을 다시 SELECT 하던 것을
+짧은 TTL cache 로 흡수. 멤버 추가 / role 변경 / 제거 / 프로젝트 삭제 시 projects endpoint 가 명시 무효화.
+멀티 워커에서는 다른 워커 cache 가 TTL 동안 남음 → cache 는 읽기 (GET / HEAD) 의 VIEWER 확인에만 사용.
+EDITOR / OWNER 가 필요한 확인과 쓰기 요청은 항상 DB 에서 새로 읽음 (use_cache=False) — 강등 / 제거된
+멤버가 TTL 동안 쓰기 / 삭제를 하지 못하게. 남는 위험은 제거된 멤버가 최대 auth_role_cache_seconds 동안
+읽기 가능한 것 (0 이면 끔). 멤버 아님 (None) 은 cache 안 함 — 방금 추가된 멤버가 다른 워커에서 403 받지 않게.
+"""
+import time
 from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.workspace import WorkspaceRole
 from app.models.project import ProjectMember
 
 
+class RoleCache:
+    """(user_id, project_id) → role. event loop thread 에서만 접근 (lock 없음).
+
+    epoch — 무효화마다 증가. 조회 전에 읽어 둔 epoch 로 set → 조회와 set 사이에 무효화가 있었으면 버림
+    (무효화 전에 읽은 이전 role 을 무효화 뒤에 다시 cache 하는 race 방지).
+    """
+
+    def __init__(self, ttl_seconds: float, *, max_entries: int = 10_000, clock=time.monotonic) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[tuple[UUID, UUID], tuple[float, WorkspaceRole]] = {}
+        self.epoch = 0
+
+    def get(self, user_id: UUID, project_id: UUID) -> WorkspaceRole | None:
+        entry = self._entries.get((user_id, project_id))
+        if entry is None:
+            return None
+        expires, role = entry
+        if expires <= self._clock():
+            del self._entries[(user_id, project_id)]
+            return None
+        return role
+
+    def set(self, user_id: UUID, project_id: UUID, role: WorkspaceRole, *, epoch: int) -> None:
+        if self.ttl_seconds <= 0 or epoch != self.epoch:
+            return
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()  # 상한 도달 — 전부 버리고 다시 채움 (만료 scan 보다 단순)
+        self._entries[(user_id, project_id)] = (self._clock() + self.ttl_seconds, role)
+
+    def invalidate(self, user_id: UUID, project_id: UUID) -> None:
+        self.epoch += 1
+        self._entries.pop((user_id, project_id), None)
+
+    def invalidate_project(self, project_id: UUID) -> None:
+        self.epoch += 1
+        for key in [k for k in self._entries if k[1] == project_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self.epoch += 1
+        self._entries.clear()
+
+
+role_cache = RoleCache(settings.auth_role_cache_seconds)
+
+
 async def get_effective_role(
-    db: AsyncSession, user_id: UUID, project_id: UUID
+    db: AsyncSession, user_id: UUID, project_id: UUID, *, use_cache: bool = True,
 ) -> WorkspaceRole | None:
-    stmt = select(ProjectMember).where(
+    """use_cache=False — cache 를 읽지 않고 DB 에서 (EDITOR / OWNER 확인, 쓰기 요청). 읽은 값은 cache 갱신."""
+    if use_cache:
+        cached = role_cache.get(user_id, project_id)
+        if cached is not None:
+            return cached
+
+    epoch = role_cache.epoch
+    stmt = select(ProjectMember.role).where(
         ProjectMember.project_id == project_id, ProjectMember.user_id == user_id
     )
-    result = await db.execute(stmt)
-    project_member = result.scalar_one_or_none()
+    role = (await db.execute(stmt)).scalar_one_or_none()
+    if role is not None:
+        role_cache.set(user_id, project_id, role, epoch=epoch)
+    return role
+
+
+def invalidate_role(user_id: UUID, project_id: UUID) -> None:
+    """멤버 추가 / role 변경 / 제거 직후 호출."""
+    role_cache.invalidate(user_id, project_id)
 
-    if project_member:
-        return project_member.role
 
-    return None
+def invalidate_project(project_id: UUID) -> None:
+    """프로젝트 삭제 직후 호출 (멤버 전체)."""
+    role_cache.invalidate_project(project_id)
 
 
 def can_edit(role: WorkspaceRole | None) -> bool:
@@ -4,11 +4,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.project import Project, ProjectMember
-from app.models.task import Task
+from app.models.project_task_stats import ProjectTaskStats
 from app.models.user import User
 from app.models.workspace import WorkspaceRole
 from app.schemas.project import ProjectCreate, ProjectUpdate
-from app.services.permission_service import get_effective_role
 
 
 async def create_project(
@@ -38,63 +37,51 @@ async def create_project(
     return project
 
 
-async def get_workspace_projects(
-    db: AsyncSession,
-    workspace_id: UUID,
-    user_id: UUID,
-) -> list[dict]:
-    """워크스페이스의 프로젝트 목록"""
-    stmt = select(Project).where(Project.workspace_id == workspace_id)
-    result = await db.execute(stmt)
-    projects = result.scalars().all()
+def _project_listing_stmt(user_id: UUID):
+    """Project + 내 role + task_count 한 쿼리.
 
-    project_list = []
-    for project in projects:
-        role = await get_effective_role(db, user_id, project.id)
-        if not role:
-            continue
+    멤버십 JOIN 이 곧 권한 필터 (role 별도 조회 없음), task_count 는 project_task_stats 카운터
+    (row 없으면 task 도 없음 → 0). project 당 role / count 쿼리 2개씩 돌던 N+1 제거.
+    """
+    return (
+        select(
+            Project, ProjectMember.role,
+            func.coalesce(ProjectTaskStats.task_count, 0).label("task_count"),
+        )
+        .join(
+            ProjectMember,
+            (ProjectMember.project_id == Project.id) & (ProjectMember.user_id == user_id),
+        )
+        .outerjoin(ProjectTaskStats, ProjectTaskStats.project_id == Project.id)
+    )
 
-        # task_count
-        count_stmt = select(func.count()).where(Task.project_id == project.id)
-        count_result = await db.execute(count_stmt)
-        task_count = count_result.scalar()
 
+async def _project_listing(db: AsyncSession, stmt) -> list[dict]:
+    result = await db.execute(stmt)
+    project_list = []
+    for project, role, task_count in result.all():
         proj_dict = {**project.__dict__, "my_role": role, "task_count": task_count}
         if role != WorkspaceRole.OWNER:
             proj_dict["discord_webhook_url"] = None
         project_list.append(proj_dict)
-
     return project_list
 
 
-async def get_user_projects(
+async def get_workspace_projects(
     db: AsyncSession,
+    workspace_id: UUID,
     user_id: UUID,
 ) -> list[dict]:
-    stmt = (
-        select(Project)
-        .join(ProjectMember, ProjectMember.project_id == Project.id)
-        .where(ProjectMember.user_id == user_id)
-    )
-    result = await db.execute(stmt)
-    projects = result.scalars().all()
-
-    project_list = []
-    for project in projects:
-        role = await get_effective_role(db, user_id, project.id)
-        if not role:
-            continue
+    """워크스페이스의 프로젝트 목록 (내가 멤버인 것만)"""
+    stmt = _project_listing_stmt(user_id).where(Project.workspace_id == workspace_id)
+    return await _project_listing(db, stmt)
 
-        count_stmt = select(func.count()).where(Task.project_id == project.id)
-        count_result = await db.execute(count_stmt)
-        task_count = count_result.scalar()
 
-        proj_dict = {**project.__dict__, "my_role": role, "task_count": task_count}
-        if role != WorkspaceRole.OWNER:
-            proj_dict["discord_webhook_url"] = None
-        project_list.append(proj_dict)
-
-    return project_list
+async def get_user_projects(
+    db: AsyncSession,
+    user_id: UUID,
+) -> list[dict]:
+    return await _project_listing(db, _project_listing_stmt(user_id))
 
 
 async def get_project(db: AsyncSession, project_id: UUID) -> Project | None:
@@ -141,7 +128,7 @@ async def delete_project(db: AsyncSession, project: Project) -> None:
 
 
 async def get_project_task_count(db: AsyncSession, project_id: UUID) -> int:
-    stmt = select(func.count()).where(Task.project_id == project_id)
+    stmt = select(ProjectTaskStats.task_count).where(ProjectTaskStats.project_id == project_id)
     result = await db.execute(stmt)
     return int(result.scalar() or 0)
 
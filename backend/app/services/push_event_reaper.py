@@ -17,11 +17,19 @@ from datetime import datetime, timedelta
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import Gauge
 from app.database import AsyncSessionLocal
 from app.models.git_push_event import GitPushEvent
 
 logger = logging.getLogger(__name__)
 
+# 회차 시작 시 발견한 미처리 수 → 회차 끝에 callback 실패로 남은 수. 모든 프로세스가 같은 DB 를 봄 → max
+PUSH_EVENT_BACKLOG = Gauge(
+    "forps_push_event_reaper_backlog",
+    "Unprocessed push events older than the grace period (as of the last reaper pass)",
+    multiprocess_mode="max",
+)
+
 
 REAPER_GRACE = timedelta(minutes=5)
 
@@ -46,7 +54,9 @@ async def reap_pending_events(
         .order_by(GitPushEvent.received_at)
     )
     rows = (await db.execute(stmt)).scalars().all()
+    PUSH_EVENT_BACKLOG.set(len(rows))
 
+    failed = 0
     for event in rows:
         if callback is None:
             logger.info(
@@ -60,11 +70,14 @@ async def reap_pending_events(
         try:
             await callback(event)
         except Exception:
+            failed += 1
             logger.exception(
                 "reaper callback failed for event %s — leaving processed_at NULL",
                 event.id,
             )
 
+    if callback is not None:
+        PUSH_EVENT_BACKLOG.set(failed)
     return len(rows)
 
 
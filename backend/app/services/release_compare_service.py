@@ -0,0 +1,174 @@
+"""두 배포 버전 (SHA) 간 에러 비교 — 새로 생김 / 사라짐 / 발생률 증가.
+
+설계서: 2026-05-01-error-log-phase4-query-design.md §2.2 (version_observations)
+fingerprint 집합은 version_observations.fingerprints (버전당 row 1개) 에서 바로 차집합.
+발생 수는 version_fingerprint_counts (record_fingerprint / backfill 이 유지) 의 버전별 합 —
+PK prefix range scan, log_events 는 읽지 않음. backfill 이 배포 전 파티션을 다 훑기 전까지는
+오래된 버전의 발생 수가 적게 보일 수 있음.
+
+발생률 = 발생 수 / 관측 시간 (last_seen - first_seen, 최소 MIN_EXPOSURE). 배포 직후 head 는
+관측 시간이 짧아 disappeared 가 많이 보일 수 있음 — 응답의 observed_hours 로 판단.
+"""
+
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.error_group import ErrorGroup
+from app.models.version_observation import VersionObservation
+from app.services import version_observation_service
+
+# 관측 시간이 이보다 짧으면 이 값으로 — 배포 직후 몇 건으로 발생률이 폭증해 보이는 것 방지
+MIN_EXPOSURE = timedelta(hours=1)
+DEFAULT_RATE_FACTOR = 2.0
+DEFAULT_MIN_EVENTS = 5
+
+SHA_PREFIX_RE = re.compile(r"^[0-9a-f]{7,40}$")
+_SHA_LENGTH = 40
+
+
+class AmbiguousVersionError(ValueError):
+    """SHA prefix 가 관측된 버전 여러 개와 일치 — endpoint 가 400 매핑."""
+
+
+@dataclass
+class VersionSummary:
+    observation: VersionObservation
+    counts: dict[str, int]
+
+    @property
+    def version_sha(self) -> str:
+        return self.observation.version_sha
+
+    @property
+    def fingerprints(self) -> set[str]:
+        return set(self.observation.fingerprints)
+
+    @property
+    def observed_hours(self) -> float:
+        span = self.observation.last_seen_at - self.observation.first_seen_at
+        return max(span, MIN_EXPOSURE).total_seconds() / 3600
+
+    def rate(self, fingerprint: str) -> float:
+        return self.counts.get(fingerprint, 0) / self.observed_hours
+
+
+@dataclass
+class GroupDelta:
+    fingerprint: str
+    group: ErrorGroup | None
+    base_count: int
+    head_count: int
+    base_rate: float
+    head_rate: float
+
+
+@dataclass
+class ReleaseComparison:
+    environment: str
+    base: VersionSummary
+    head: VersionSummary
+    new: list[GroupDelta]
+    disappeared: list[GroupDelta]
+    increased: list[GroupDelta]
+
+
+async def resolve_version(
+    db: AsyncSession, *, project_id: uuid.UUID, environment: str, sha: str,
+) -> VersionObservation | None:
+    """전체 SHA 또는 prefix (7자 이상) → 관측된 버전. 없으면 None, 여러 개면 AmbiguousVersionError."""
+    stmt = select(VersionObservation).where(
+        VersionObservation.project_id == project_id,
+        VersionObservation.environment == environment,
+    )
+    if len(sha) == _SHA_LENGTH:
+        stmt = stmt.where(VersionObservation.version_sha == sha)
+    else:
+        # hex prefix 범위 — PK 인덱스 range scan ('g' 는 모든 hex 문자보다 큼)
+        stmt = stmt.where(
+            VersionObservation.version_sha >= sha, VersionObservation.version_sha < sha + "g",
+        )
+    rows = (await db.execute(stmt.limit(2))).scalars().all()
+    if len(rows) > 1:
+        raise AmbiguousVersionError(f"version prefix {sha!r} is ambiguous")
+    return rows[0] if rows else None
+
+
+async def _fingerprint_counts(db: AsyncSession, observation: VersionObservation) -> dict[str, int]:
+    return await version_observation_service.fingerprint_counts(
+        db, project_id=observation.project_id, environment=observation.environment,
+        version_sha=observation.version_sha,
+    )
+
+
+async def compare_versions(
+    db: AsyncSession,
+    *,
+    project_id: uuid.UUID,
+    environment: str,
+    base_sha: str,
+    head_sha: str,
+    rate_factor: float = DEFAULT_RATE_FACTOR,
+    min_events: int = DEFAULT_MIN_EVENTS,
+) -> ReleaseComparison | None:
+    """base → head 비교. 둘 중 하나라도 관측 기록이 없으면 None.
+
+    - new: head 에만 있는 fingerprint (head 발생 수 내림차순)
+    - disappeared: base 에만 있는 fingerprint (base 발생 수 내림차순)
+    - increased: 양쪽에 있고 head 발생률 >= base 발생률 × rate_factor, head 발생 수 >= min_events
+    """
+    base_obs = await resolve_version(db, project_id=project_id, environment=environment, sha=base_sha)
+    head_obs = await resolve_version(db, project_id=project_id, environment=environment, sha=head_sha)
+    if base_obs is None or head_obs is None:
+        return None
+
+    base = VersionSummary(base_obs, await _fingerprint_counts(db, base_obs))
+    head = VersionSummary(head_obs, await _fingerprint_counts(db, head_obs))
+
+    # 집합은 version_observations 기준, 집계로만 보이는 fingerprint (처리 순서 race) 도 포함
+    base_fps = base.fingerprints | set(base.counts)
+    head_fps = head.fingerprints | set(head.counts)
+    new_fps = head_fps - base_fps
+    gone_fps = base_fps - head_fps
+    increased_fps = {
+        fp for fp in base_fps & head_fps
+        if head.counts.get(fp, 0) >= min_events and head.rate(fp) >= base.rate(fp) * rate_factor
+    }
+
+    changed = new_fps | gone_fps | increased_fps
+    groups: dict[str, ErrorGroup] = {}
+    if changed:
+        groups = {
+            g.fingerprint: g for g in (await db.execute(
+                select(ErrorGroup).where(
+                    ErrorGroup.project_id == project_id, ErrorGroup.fingerprint.in_(changed),
+                )
+            )).scalars()
+        }
+
+    def delta(fp: str) -> GroupDelta:
+        return GroupDelta(
+            fingerprint=fp, group=groups.get(fp),
+            base_count=base.counts.get(fp, 0), head_count=head.counts.get(fp, 0),
+            base_rate=base.rate(fp), head_rate=head.rate(fp),
+        )
+
+    def ratio(d: GroupDelta) -> float:
+        return d.head_rate / d.base_rate if d.base_rate else float("inf")
+
+    return ReleaseComparison(
+        environment=environment,
+        base=base,
+        head=head,
+        new=sorted((delta(fp) for fp in new_fps), key=lambda d: (-d.head_count, d.fingerprint)),
+        disappeared=sorted(
+            (delta(fp) for fp in gone_fps), key=lambda d: (-d.base_count, d.fingerprint),
+        ),
+        increased=sorted(
+            (delta(fp) for fp in increased_fps), key=lambda d: (-ratio(d), d.fingerprint),
+        ),
+    )
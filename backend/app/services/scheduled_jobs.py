@@ -0,0 +1,120 @@
+"""주기 작업 정의 — job_runner 가 leader election 후 실행.
+
+- weekly_report: 매주 월 00:00 UTC (= KST 09:00) Discord 주간 요약
+- log_partition_maintenance: log_events 일별 파티션 미리 생성 (PARTITION_DAYS_AHEAD 일치)
+  + 최근 EXTRA_INDEX_DAYS 파티션에만 extra GIN 유지
+- push_event_reaper / log_fingerprint_reaper: BackgroundTask 유실분 주기 회수 (부팅 시 1회 + 10분 간격)
+- rate_limit_window_gc: 24시간 지난 rate_limit_windows row 삭제
+- handoff_content_gc: 30일 지난 handoff 본문 제거 (delta 체인 rebase, batch + pause)
+- version_observation_backfill: 배포 전 log_events → version_observations + 발생 수 요약 (이어서 진행, 완료 후엔 거의 no-op)
+- task_stats_reconcile: project_task_stats 재집계 — drift 복구 + 날짜 바뀐 overdue 갱신 (1시간 간격)
+
+item / batch / 파티션 단위로 도는 작업은 expected_repeats() 안에서 실행 — job_runner 의 N+1 경고 대상 아님.
+"""
+
+import logging
+from datetime import timedelta
+
+from sqlalchemy import select
+
+from app.core.sql_instrumentation import expected_repeats
+from app.database import AsyncSessionLocal
+from app.models.git_push_event import GitPushEvent
+from app.services import log_fingerprint_reaper, task_stats_service, version_observation_service
+from app.services.discord_service import SCHEDULE_HOUR, SCHEDULE_WEEKDAY, send_all_project_summaries
+from app.services.git_repo_service import get_fetchers
+from app.services.handoff_storage_service import purge_expired_content
+from app.services.job_runner import Interval, Job, ProgressCallback, Weekly
+from app.services.log_ingest_service import purge_expired_rate_limit_windows
+from app.services.log_partition_service import ensure_partitions, maintain_extra_indexes
+from app.services.push_event_reaper import reap_pending_events
+from app.services.sync_service import process_event
+
+logger = logging.getLogger(__name__)
+
+REAPER_INTERVAL = timedelta(minutes=10)
+
+
+async def recover_push_events(on_progress: ProgressCallback) -> int:
+    """미처리 push event 회수 (Phase 4 — sync_service 콜백 주입)."""
+    fetch_file, fetch_compare = get_fetchers()
+
+    async def _cb(ev: GitPushEvent) -> None:
+        # I-3 fix: 이벤트마다 fresh session — 한 이벤트의 세션 poison 이 다음으로 전파 안 되게
+        event_id = ev.id
+        try:
+            async with AsyncSessionLocal() as inner_db:
+                refetched = (await inner_db.execute(
+                    select(GitPushEvent).where(GitPushEvent.id == event_id)
+                )).scalar_one_or_none()
+                if refetched is None:
+                    return
+                await process_event(
+                    inner_db, refetched,
+                    fetch_file=fetch_file,
+                    fetch_compare=fetch_compare,
+                )
+        finally:
+            on_progress(1)
+
+    async with AsyncSessionLocal() as outer_db:
+        with expected_repeats():
+            return await reap_pending_events(outer_db, _cb)
+
+
+async def recover_log_fingerprints(on_progress: ProgressCallback) -> int:
+    """Phase 3 — log_fingerprint_reaper: 미처리 ERROR↑ LogEvent 회수."""
+    with expected_repeats():
+        return await log_fingerprint_reaper.run_reaper_once(on_progress=on_progress)
+
+
+async def _weekly_report(on_progress: ProgressCallback) -> int:
+    return await send_all_project_summaries()
+
+
+async def _maintain_log_partitions(on_progress: ProgressCallback) -> int:
+    async with AsyncSessionLocal() as db:
+        created = await ensure_partitions(db)
+        return created + await maintain_extra_indexes(db)
+
+
+async def _gc_rate_limit_windows(on_progress: ProgressCallback) -> int:
+    async with AsyncSessionLocal() as db:
+        return await purge_expired_rate_limit_windows(db)
+
+
+async def _gc_handoff_content(on_progress: ProgressCallback) -> int:
+    async with AsyncSessionLocal() as db:
+        with expected_repeats():
+            return await purge_expired_content(db)
+
+
+async def _backfill_version_observations(on_progress: ProgressCallback) -> int:
+    async with AsyncSessionLocal() as db:
+        with expected_repeats():
+            return await version_observation_service.backfill(db, on_progress=on_progress)
+
+
+async def _reconcile_task_stats(on_progress: ProgressCallback) -> int:
+    async with AsyncSessionLocal() as db:
+        with expected_repeats():
+            return await task_stats_service.reconcile(db)
+
+
+PUSH_EVENT_REAPER = Job("push_event_reaper", Interval(REAPER_INTERVAL), recover_push_events)
+LOG_FINGERPRINT_REAPER = Job(
+    "log_fingerprint_reaper", Interval(REAPER_INTERVAL), recover_log_fingerprints,
+)
+
+JOBS: list[Job] = [
+    Job("weekly_report", Weekly(SCHEDULE_WEEKDAY, SCHEDULE_HOUR), _weekly_report),
+    Job("log_partition_maintenance", Interval(timedelta(hours=6)), _maintain_log_partitions),
+    PUSH_EVENT_REAPER,
+    LOG_FINGERPRINT_REAPER,
+    Job("rate_limit_window_gc", Interval(timedelta(hours=1)), _gc_rate_limit_windows),
+    Job("handoff_content_gc", Interval(timedelta(hours=24)), _gc_handoff_content),
+    Job(
+        "version_observation_backfill", Interval(timedelta(hours=24)), _backfill_version_observations,
+    ),
+    Job("task_stats_reconcile", Interval(timedelta(hours=1)), _reconcile_task_stats),
+]
@@ -8,11 +8,12 @@
   3) PLAN/handoff 매칭 — 둘 다 없으면 sync 종료 (processed_at = now)
   4) git_repo_service 로 head_sha 기준 raw fetch
   5) plan_parser_service / handoff_parser_service 호출
-  6) DB 반영: Task status / archived_at / Handoff INSERT / TaskEvent
+  6) DB 반영: Task status / archived_at / project_task_stats / Handoff INSERT / TaskEvent
   7) processed_at = now (성공/실패 모두). 실패면 error 도 기록.
 """
 
 import logging
+import time
 import uuid
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
@@ -20,6 +21,7 @@ from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import Counter, Histogram
 from app.models.git_push_event import GitPushEvent
 from app.models.project import Project
 from app.services import notification_dispatcher
@@ -30,6 +32,36 @@ logger = logging.getLogger(__name__)
 FetchFile = Callable[[str, str | None, str, str], Awaitable[str | None]]
 FetchCompare = Callable[[str, str | None, str, str], Awaitable[list[str]]]
 
+SYNC_EVENTS = Counter(
+    "forps_sync_events_total",
+    "Processed push events by outcome (success / failed / skipped / project_missing / error)",
+    ["outcome"],
+)
+SYNC_SECONDS = Histogram(
+    "forps_sync_duration_seconds", "process_event latency by outcome", ["outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+SYNC_FETCHES = Counter(
+    "forps_sync_fetch_total",
+    "Git fetch calls during sync by kind (file / compare) and result (ok / not_found / error)",
+    ["kind", "result"],
+)
+
+
+def _counted_fetch(fetch: FetchFile | FetchCompare, kind: str):
+    """fetch 호출 결과별 카운트 — fetch_file 은 404 를 None 으로 반환."""
+
+    async def counted(*args):
+        try:
+            result = await fetch(*args)
+        except Exception:
+            SYNC_FETCHES.labels(kind=kind, result="error").inc()
+            raise
+        SYNC_FETCHES.labels(kind=kind, result="not_found" if result is None else "ok").inc()
+        return result
+
+    return counted
+
 
 @dataclass
 class PlanChanges:
@@ -58,20 +90,41 @@ async def process_event(
     동시 호출 시 후행 caller 는 lock 대기 → 선행 caller commit 후 processed_at 갱신본 보고 return.
     final commit 시 lock release. process_event 가 단일 outer commit 구조라 그대로 적용 가능.
     """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        outcome = await _process_event(
+            db, event,
+            fetch_file=_counted_fetch(fetch_file, "file"),
+            fetch_compare=_counted_fetch(fetch_compare, "compare"),
+        )
+    finally:
+        SYNC_EVENTS.labels(outcome=outcome).inc()
+        SYNC_SECONDS.labels(outcome=outcome).observe(time.perf_counter() - started)
+
+
+async def _process_event(
+    db: AsyncSession,
+    event: GitPushEvent,
+    *,
+    fetch_file: FetchFile,
+    fetch_compare: FetchCompare,
+) -> str:
+    """process_event 본체 — 결과 (metrics outcome) 반환."""
     # FOR UPDATE 로 row 점유 — 동시 caller 차단.
     # SQLAlchemy 2.0: db.refresh(obj, with_for_update=...). nowait=False 로 lock 대기.
     await db.refresh(event, with_for_update={"nowait": False})
 
     if event.processed_at is not None:
         logger.info("event %s already processed at %s — skip", event.id, event.processed_at)
-        return
+        return "skipped"
 
     project = await db.get(Project, event.project_id)
     if project is None:
         event.processed_at = datetime.utcnow()
         event.error = "project not found"
         await db.commit()
-        return
+        return "project_missing"
 
     event_id = event.id  # 세션 poison 후 expire 대비
     # B2: rollback 후 project/event 가 expire — Discord 알림에 필요한 값 미리 캡처.
@@ -111,6 +164,7 @@ async def process_event(
                 logger.exception(
                     "Failed to dispatch push summary alert for event %s", event_id,
                 )
+        return "success"
     except Exception as exc:
         # I-2 fix: _process_inner 내부에서 예외 발생 시 세션이 poisoned 상태일 수 있음.
         # rollback → SQLAlchemy 가 pending/new 객체를 identity map 에서 자동 제거.
@@ -144,6 +198,7 @@ async def process_event(
                 logger.exception(
                     "Failed to dispatch sync-failure alert for event %s", event_id,
                 )
+        return "failed"
 
 
 async def _process_inner(
@@ -305,10 +360,12 @@ async def _apply_plan(
     from app.models.task_event import TaskEvent, TaskEventAction
     from app.models.user import User
     from app.services.plan_parser_service import parse_plan
+    from app.services.task_stats_service import TaskStatsDelta
 
     parsed = parse_plan(plan_text)  # DuplicateExternalIdError 는 process_event 가 catch
 
     changes = PlanChanges()
+    stats = TaskStatsDelta()
 
     # `@username` → user_id 매핑. parser 가 lowercase 가 아닌 핸들도 통과시킬 수 있어
     # User.username (lowercase 만 허용) 과 매칭하려면 비교 시 lower 정규화.
@@ -357,6 +414,7 @@ async def _apply_plan(
             )
             db.add(t)
             await db.flush()
+            stats.change(project.id, None, stats.state(t))
             db.add(TaskEvent(
                 task_id=t.id,
                 action=TaskEventAction.SYNCED_FROM_PLAN,
@@ -370,6 +428,7 @@ async def _apply_plan(
             # NOTE: 신규 INSERT 는 changes 에 담지 않음 (YAGNI — sprint init noise 회피)
         else:
             previous_status = existing_task.status
+            before = stats.state(existing_task)
             # I-1 fix: archived 였으면 un-archive (재 INSERT 아님 — 히스토리 보존)
             if existing_task.archived_at is not None:
                 existing_task.archived_at = None
@@ -399,6 +458,7 @@ async def _apply_plan(
                 ))
                 changes.unchecked.append((parsed_task.external_id, parsed_task.title))
             # else: status 변경 없음 — last_commit_sha 도 안 바꿈
+            stats.change(project.id, before, stats.state(existing_task))
 
             # assignee 는 status 와 독립적으로 sync — PLAN.md 가 source of truth
             if existing_task.assignee_id != new_assignee_id:
@@ -418,7 +478,9 @@ async def _apply_plan(
     parsed_ids = {t.external_id for t in parsed.tasks}
     for ext_id, task in existing.items():
         if ext_id not in parsed_ids and task.archived_at is None:
+            before = stats.state(task)
             task.archived_at = datetime.utcnow()
+            stats.change(project.id, before, stats.state(task))
             db.add(TaskEvent(
                 task_id=task.id,
                 action=TaskEventAction.ARCHIVED_FROM_PLAN,
@@ -429,6 +491,7 @@ async def _apply_plan(
             ))
             changes.archived.append((ext_id, task.title))
 
+    await stats.apply(db)
     return changes
 
 
@@ -438,23 +501,22 @@ async def _apply_handoff(
     event: GitPushEvent,
     handoff_text: str,
 ) -> bool:
-    """handoff 파싱 → Handoff INSERT (UNIQUE 멱등) + raw_content 저장.
+    """handoff 파싱 → Handoff INSERT (UNIQUE 멱등) + 본문 저장 (직전 버전 대비 delta / snapshot).
 
-    parsed_tasks 는 sections[0].checks (active 섹션). free_notes 는 sections[0] 의
-    free_notes + subtasks 합본. 다중 날짜 history 는 raw_content 에 보존.
+    parsed_tasks 는 최신 섹션 (active) 의 checks. free_notes 는 active 섹션의
+    free_notes + subtasks 합본. 다중 날짜 history 는 본문에 보존 — 파싱하지 않음
+    (scan_handoff 가 최신 섹션만 파싱).
 
     Returns: True (INSERT 또는 UNIQUE conflict savepoint skip — 둘 다 DB 에 handoff 존재).
     """
     from sqlalchemy.exc import IntegrityError
 
     from app.models.handoff import Handoff
-    from app.services.handoff_parser_service import parse_handoff
-
-    parsed = parse_handoff(handoff_text)
-    if not parsed.sections:
-        return False
+    from app.services.handoff_parser_service import scan_handoff
+    from app.services.handoff_storage_service import store_content
 
-    active = parsed.sections[0]
+    parsed = scan_handoff(handoff_text)
+    active = parsed.latest
     parsed_tasks = [
         {"external_id": c.external_id, "checked": c.checked, "extra": c.extra}
         for c in active.checks
@@ -479,10 +541,10 @@ async def _apply_handoff(
         author_git_login=parsed.author_git_login,
         commit_sha=event.head_commit_sha,
         pushed_at=event.received_at,
-        raw_content=handoff_text,
         parsed_tasks=parsed_tasks,
         free_notes=free_notes,
     )
+    await store_content(db, handoff, handoff_text)
     try:
         async with db.begin_nested():
             db.add(handoff)
@@ -9,6 +9,7 @@ from app.models.handoff import Handoff
 from app.models.task import Task, TaskSource
 from app.models.task_event import TaskEvent, TaskEventAction
 from app.schemas.task import TaskCreate, TaskUpdate, TaskFilters
+from app.services.task_stats_service import TaskStatsDelta
 
 
 def _task_query():
@@ -125,6 +126,9 @@ async def create_task(
     await db.flush()
 
     db.add(TaskEvent(task_id=task.id, user_id=user_id, action=TaskEventAction.CREATED))
+    stats = TaskStatsDelta()
+    stats.change(project_id, None, stats.state(task))
+    await stats.apply(db)
     await db.commit()
     await db.refresh(task)
 
@@ -139,6 +143,8 @@ async def update_task(
     if not task:
         return None
 
+    stats = TaskStatsDelta()
+    before = stats.state(task)
     changes: dict = {}
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -156,6 +162,8 @@ async def update_task(
         db.add(
             TaskEvent(task_id=task_id, user_id=user_id, action=action, changes=changes)
         )
+        stats.change(task.project_id, before, stats.state(task))
+        await stats.apply(db)
 
     await db.commit()
     return await get_task(db, task_id)
@@ -171,6 +179,9 @@ async def delete_task(db: AsyncSession, task_id: UUID, user_id: UUID) -> bool:
     db.add(TaskEvent(task_id=task_id, user_id=user_id, action=TaskEventAction.DELETED))
     await db.flush()
 
+    stats = TaskStatsDelta()
+    stats.change(task.project_id, stats.state(task), None)
     await db.delete(task)
+    await stats.apply(db)
     await db.commit()
     return True
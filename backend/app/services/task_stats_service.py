@@ -0,0 +1,235 @@
+"""project_task_stats 유지 + drift 복구.
+
+카운터 정의는 ProjectTaskStats 참고 (task_count = status 별 합 + archived).
+
+유지 경로 — task 변경과 같은 트랜잭션, commit 직전 UPSERT 1회 (`col = col + delta`, read-modify-write 없음):
+- task_service create_task / update_task / delete_task
+- sync_service._apply_plan — PLAN 반영 1회분 증감을 모아서
+카운터 row 는 task 변경 뒤 마지막에 잠금 → 같은 프로젝트의 동시 task 변경은 commit 까지 직렬화, 잠금 순서 고정.
+
+overdue 는 task 변경 없이도 날짜가 바뀌면 달라짐 → overdue_as_of 날짜 기준 값. 유지 경로 UPSERT 가
+다른 날짜 기준 row 를 만나면 overdue 증감 대신 그 프로젝트만 오늘 기준으로 재집계 (같은 문장).
+reconcile (task_stats_reconcile 주기 작업) 이 날짜 rollover 와 위 경로 밖 변경 (수동 SQL, project 간 bulk 등)
+으로 생긴 drift 를 재집계로 복구.
+"""
+
+import logging
+import uuid
+from collections import Counter as CountDelta
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import ScalarSelect, case, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import Counter
+from app.models.project import Project
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# 주간 리포트 "마감 초과" 와 같은 기준
+OVERDUE_STATUSES = (TaskStatus.TODO, TaskStatus.DOING)
+
+COUNTER_COLUMNS = (
+    "todo_count", "doing_count", "done_count", "blocked_count", "archived_count", "overdue_count",
+)
+
+TASK_STATS_REPAIRED = Counter(
+    "forps_task_stats_repaired_total",
+    "project_task_stats rows rewritten by reconcile by reason (drift / overdue_rollover)",
+    ["reason"],
+)
+
+
+def _today() -> date:
+    return datetime.utcnow().date()
+
+
+@dataclass(frozen=True)
+class TaskState:
+    """카운터 관점의 task 상태 — 변경 전후 비교용."""
+    bucket: str  # status 값 또는 "archived"
+    overdue: bool
+
+
+def task_state(task: Task, today: date) -> TaskState:
+    archived = task.archived_at is not None
+    return TaskState(
+        bucket="archived" if archived else task.status.value,
+        overdue=(
+            not archived
+            and task.due_date is not None
+            and task.due_date < today
+            and task.status in OVERDUE_STATUSES
+        ),
+    )
+
+
+class TaskStatsDelta:
+    """트랜잭션 안의 task 변경을 project 별 카운터 증감으로 누적 → apply 에서 한 번에 반영."""
+
+    def __init__(self, today: date | None = None) -> None:
+        self.today = today or _today()
+        self._deltas: dict[uuid.UUID, CountDelta[str]] = defaultdict(CountDelta)
+
+    def state(self, task: Task) -> TaskState:
+        return task_state(task, self.today)
+
+    def change(
+        self, project_id: uuid.UUID, before: TaskState | None, after: TaskState | None,
+    ) -> None:
+        """before None = 생성, after None = 삭제."""
+        delta = self._deltas[project_id]
+        if before is not None:
+            delta[f"{before.bucket}_count"] -= 1
+            delta["overdue_count"] -= before.overdue
+        if after is not None:
+            delta[f"{after.bucket}_count"] += 1
+            delta["overdue_count"] += after.overdue
+
+    async def apply(self, db: AsyncSession) -> None:
+        """누적 증감 UPSERT (증감 없으면 쿼리 없음). commit 은 caller."""
+        rows = []
+        # 정렬 — 여러 프로젝트를 건드리는 트랜잭션끼리 row lock 순서 고정 (deadlock 회피)
+        for project_id, delta in sorted(self._deltas.items()):
+            if not any(delta.values()):
+                continue
+            rows.append({
+                "project_id": project_id,
+                **{col: delta[col] for col in COUNTER_COLUMNS},
+                "overdue_as_of": self.today,
+                "updated_at": datetime.utcnow(),
+            })
+        self._deltas.clear()
+        if not rows:
+            return
+
+        stmt = pg_insert(ProjectTaskStats).values(rows)
+        set_ = {col: getattr(ProjectTaskStats, col) + stmt.excluded[col] for col in COUNTER_COLUMNS}
+        # overdue 증감은 self.today 기준 — 저장값이 다른 날 기준 (rollover 후 reconcile 전) 이면 더하지 않고
+        # 같은 문장에서 오늘 기준으로 다시 셈 (이 트랜잭션의 task 변경 반영 후)
+        set_["overdue_count"] = case(
+            (
+                ProjectTaskStats.overdue_as_of == stmt.excluded.overdue_as_of,
+                ProjectTaskStats.overdue_count + stmt.excluded.overdue_count,
+            ),
+            else_=_overdue_recount(self.today),
+        )
+        set_["overdue_as_of"] = stmt.excluded.overdue_as_of
+        set_["updated_at"] = stmt.excluded.updated_at
+        await db.execute(stmt.on_conflict_do_update(index_elements=["project_id"], set_=set_))
+
+
+def _overdue_recount(today: date) -> ScalarSelect[int]:
+    """ON CONFLICT 로 갱신 중인 카운터 row 의 프로젝트 overdue 재집계 (today 기준) — scalar subquery."""
+    return (
+        select(func.count(Task.id))
+        .where(
+            # ON CONFLICT SET 안에서는 SQLAlchemy 가 correlate 하지 않아 (FROM 에 추가됨) 컬럼을 직접 참조
+            Task.project_id == literal_column(f"{ProjectTaskStats.__tablename__}.project_id"),
+            Task.archived_at.is_(None),
+            Task.due_date < today,
+            Task.status.in_(OVERDUE_STATUSES),
+        )
+        .scalar_subquery()
+    )
+
+
+def _count_columns(today: date) -> list:
+    active = Task.archived_at.is_(None)
+    columns = [
+        func.count(Task.id).filter(active, Task.status == status).label(f"{status.value}_count")
+        for status in (TaskStatus.TODO, TaskStatus.DOING, TaskStatus.DONE, TaskStatus.BLOCKED)
+    ]
+    columns.append(func.count(Task.id).filter(Task.archived_at.isnot(None)).label("archived_count"))
+    columns.append(
+        func.count(Task.id).filter(
+            active, Task.due_date < today, Task.status.in_(OVERDUE_STATUSES),
+        ).label("overdue_count")
+    )
+    return columns
+
+
+def _needs_repair(stored: ProjectTaskStats | None, counts: dict[str, int], today: date) -> str | None:
+    """재기록 사유 — None 이면 일치."""
+    if stored is None:
+        return "drift"
+    if any(getattr(stored, col) != counts[col] for col in COUNTER_COLUMNS if col != "overdue_count"):
+        return "drift"
+    if stored.overdue_as_of != today:
+        return "overdue_rollover"
+    if stored.overdue_count != counts["overdue_count"]:
+        return "drift"
+    return None
+
+
+async def get_stats(db: AsyncSession, project_id: uuid.UUID) -> ProjectTaskStats | None:
+    return await db.get(ProjectTaskStats, project_id)
+
+
+async def reconcile(db: AsyncSession, *, today: date | None = None) -> int:
+    """전 프로젝트 재집계 → 저장값과 다른 row 만 재기록. 재기록한 프로젝트 수 반환.
+
+    1) 잠금 없이 전체 집계 1회와 비교해 후보 선별 (평소엔 여기서 끝)
+    2) 후보마다 카운터 row 를 FOR UPDATE 로 잠근 뒤 재집계 → 절대값 기록, 프로젝트별 commit.
+       잠근 뒤 센 값은 commit 된 task 변경을 모두 포함하고, 진행 중인 변경은 이 row 잠금을 기다렸다가
+       증감을 그 위에 더함 → 동시 변경과 겹쳐도 증감 유실 없음.
+    """
+    today = today or _today()
+    counted = (await db.execute(
+        select(Project.id, *_count_columns(today))
+        .outerjoin(Task, Task.project_id == Project.id)
+        .group_by(Project.id)
+    )).all()
+    stored = {
+        s.project_id: s for s in (await db.execute(select(ProjectTaskStats))).scalars().all()
+    }
+    suspects = sorted(
+        row.id for row in counted
+        if _needs_repair(stored.get(row.id), row._asdict(), today) is not None
+    )
+    await db.rollback()  # 1) 의 snapshot / identity map 정리 — 2) 는 항상 새로 읽음
+
+    repaired = 0
+    for project_id in suspects:
+        try:
+            async with db.begin_nested():
+                await db.execute(
+                    pg_insert(ProjectTaskStats)
+                    .values(project_id=project_id, overdue_as_of=today, updated_at=datetime.utcnow())
+                    .on_conflict_do_nothing(index_elements=["project_id"])
+                )
+        except IntegrityError:  # 그 사이 프로젝트 삭제 (FK)
+            await db.rollback()
+            continue
+        stats = (await db.execute(
+            select(ProjectTaskStats)
+            .where(ProjectTaskStats.project_id == project_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )).scalar_one_or_none()
+        if stats is None:  # 그 사이 프로젝트 삭제
+            await db.rollback()
+            continue
+        counts = (await db.execute(
+            select(*_count_columns(today)).where(Task.project_id == project_id)
+        )).one()._asdict()
+        reason = _needs_repair(stats, counts, today)
+        if reason is not None:
+            if reason == "drift":
+                logger.warning(
+                    "task stats drift for project %s: stored=%s actual=%s", project_id,
+                    {col: getattr(stats, col) for col in COUNTER_COLUMNS}, counts,
+                )
+            for col in COUNTER_COLUMNS:
+                setattr(stats, col, counts[col])
+            stats.overdue_as_of = today
+            TASK_STATS_REPAIRED.labels(reason=reason).inc()
+            repaired += 1
+        await db.commit()
+    return repaired
@@ -0,0 +1,285 @@
+"""version_observations 유지 + 직전 정상 SHA lookup.
+
+설계서: 2026-05-01-error-log-phase4-query-design.md §2.2
+직전 정상 SHA = "X 이전에 처음 관측된 (배포된) 버전 중 가장 최근, fingerprint F 가 한 번도 없었던 것".
+log_events self anti-join (전 파티션) 대신 (project, environment, first_seen_at DESC) 인덱스 lookup.
+
+유지 경로:
+- record_events — ingest batch 의 (environment, version_sha) 별 first/last seen UPSERT (ingest 트랜잭션 내)
+- record_fingerprint — fingerprint_processor 가 계산한 fingerprint 를 해당 버전 집합에 추가 + 발생 수 +1
+  (version_fingerprint_counts.live_count — release 비교 발생률)
+- backfill — 배포 전 log_events 를 파티션 단위로 집계 (version_observation_backfill 주기 작업).
+  발생 수는 fingerprinted_at < version_coverage.live_since 인 event 만 — 그 이후는 record_fingerprint 가 셈
+"""
+
+import logging
+import uuid
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import exists, func, not_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.log_event import UNKNOWN_SHA, LogEvent
+from app.models.version_observation import (
+    VersionCoverage,
+    VersionFingerprintCount,
+    VersionObservation,
+)
+from app.services.log_partition_service import list_partitions
+
+logger = logging.getLogger(__name__)
+
+# last_seen_at 이 이 간격 안쪽이면 UPDATE 생략 — 같은 버전 연속 batch 마다 row 쓰기 방지
+LAST_SEEN_GRANULARITY = timedelta(minutes=1)
+
+_PK = ["project_id", "environment", "version_sha"]
+
+# 파티션 하루치 집계 → 기존 row 와 merge (least / greatest / 집합 합). 재실행해도 결과 동일 (idempotent)
+_BACKFILL_PARTITION_SQL = text("""
+    INSERT INTO version_observations
+        (project_id, environment, version_sha, first_seen_at, last_seen_at, fingerprints)
+    SELECT project_id, environment, version_sha, min(received_at), max(received_at),
+           coalesce(array_agg(DISTINCT fingerprint) FILTER (WHERE fingerprint IS NOT NULL), '{}')
+    FROM log_events
+    WHERE received_at >= :day_start AND received_at < :day_end AND version_sha <> :unknown
+    GROUP BY project_id, environment, version_sha
+    ON CONFLICT (project_id, environment, version_sha) DO UPDATE SET
+        first_seen_at = least(version_observations.first_seen_at, excluded.first_seen_at),
+        last_seen_at = greatest(version_observations.last_seen_at, excluded.last_seen_at),
+        fingerprints = ARRAY(
+            SELECT DISTINCT unnest(version_observations.fingerprints || excluded.fingerprints)
+        )
+""")
+
+
+# 파티션 하루치 발생 수 — 이번 실행 대상 pair 만, live_since 이전에 fingerprint 처리된 event 만
+# (이후는 record_fingerprint 의 live_count). SET 이라 재실행해도 결과 동일 (idempotent)
+_BACKFILL_COUNTS_SQL = text("""
+    INSERT INTO version_fingerprint_counts
+        (project_id, environment, version_sha, fingerprint, day, backfill_count)
+    SELECT e.project_id, e.environment, e.version_sha, e.fingerprint, CAST(:day AS date), count(*)
+    FROM log_events e
+    JOIN version_coverage c ON c.project_id = e.project_id AND c.environment = e.environment
+    WHERE e.received_at >= :day_start AND e.received_at < :day_end AND e.version_sha <> :unknown
+      AND e.fingerprint IS NOT NULL AND e.fingerprinted_at < c.live_since
+      AND c.live_since <= :run_started
+      AND (c.backfilled_from IS NULL OR c.backfilled_from > CAST(:day AS date))
+    GROUP BY e.project_id, e.environment, e.version_sha, e.fingerprint
+    ON CONFLICT (project_id, environment, version_sha, fingerprint, day) DO UPDATE SET
+        backfill_count = excluded.backfill_count
+""")
+
+_MARK_BACKFILLED_SQL = text("""
+    UPDATE version_coverage SET backfilled_from = CAST(:day AS date)
+    WHERE live_since <= :run_started
+      AND (backfilled_from IS NULL OR backfilled_from > CAST(:day AS date))
+""")
+
+# 발생 수 live 집계 시작 전 (배포 전) 데이터만 있는 pair — 실행 시작 시각을 경계로 등록
+_REGISTER_HISTORICAL_SQL = text("""
+    INSERT INTO version_coverage (project_id, environment, live_since, history_complete)
+    SELECT DISTINCT project_id, environment, CAST(:run_started AS timestamp),
+           EXISTS (SELECT 1 FROM version_coverage WHERE history_complete)
+    FROM version_observations
+    ON CONFLICT (project_id, environment) DO NOTHING
+""")
+
+# 끝까지 돈 실행 — 시작 시점에 등록된 pair 는 관측 구간 / fingerprint 집합이 배포 전 기록까지 반영됨
+_MARK_HISTORY_COMPLETE_SQL = text("""
+    UPDATE version_coverage SET history_complete = true
+    WHERE NOT history_complete AND live_since <= :run_started
+""")
+
+# backfill 이 한 번이라도 끝까지 돌았으면 이후 새 pair 의 배포 전 기록도 이미 관측에 반영돼 있음
+_ANY_HISTORY_COMPLETE = exists().where(VersionCoverage.history_complete)
+
+# version_coverage row 가 commit 돼 있음을 확인한 (project_id, environment) — 이후 coverage UPSERT 생략
+_covered: set[tuple[uuid.UUID, str]] = set()
+
+
+async def _ensure_coverage(db: AsyncSession, project_id: uuid.UUID, environment: str) -> None:
+    """live 집계 경계 등록 — live_since 는 이 pair 를 처음 센 record_fingerprint 시각 (동시 등록이면 가장 이른 것).
+
+    live_since 이후 fingerprint 처리된 event 는 전부 record_fingerprint 가 셈 → backfill 과 겹치지 않음.
+    """
+    if (project_id, environment) in _covered:
+        return
+    stmt = pg_insert(VersionCoverage).values(
+        project_id=project_id, environment=environment, live_since=datetime.utcnow(),
+        history_complete=_ANY_HISTORY_COMPLETE,
+    )
+    changed = (await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["project_id", "environment"],
+            set_={"live_since": stmt.excluded.live_since},
+            where=stmt.excluded.live_since < VersionCoverage.live_since,
+        )
+        .returning(VersionCoverage.environment)
+    )).first()
+    # 방금 쓴 row 는 이 트랜잭션이 rollback 되면 사라짐 → 이미 있던 (commit 된) row 를 확인했을 때만 cache
+    if changed is None:
+        _covered.add((project_id, environment))
+
+
+async def record_events(db: AsyncSession, events: list[LogEvent]) -> None:
+    """flush 된 (received_at 채워진) LogEvent 들의 버전 관측 갱신. commit 은 caller."""
+    spans: dict[tuple[str, str], tuple[datetime, datetime]] = {}
+    for event in events:
+        if event.version_sha == UNKNOWN_SHA:
+            continue
+        key = (event.environment, event.version_sha)
+        first, last = spans.get(key, (event.received_at, event.received_at))
+        spans[key] = (min(first, event.received_at), max(last, event.received_at))
+    if not spans:
+        return
+
+    project_id = events[0].project_id
+    stmt = pg_insert(VersionObservation).values([
+        {
+            "project_id": project_id, "environment": env, "version_sha": sha,
+            "first_seen_at": first, "last_seen_at": last, "fingerprints": [],
+        }
+        # 정렬 — 동시 batch 간 row lock 획득 순서 고정 (deadlock 회피)
+        for (env, sha), (first, last) in sorted(spans.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=_PK,
+        set_={
+            "first_seen_at": func.least(VersionObservation.first_seen_at, stmt.excluded.first_seen_at),
+            "last_seen_at": func.greatest(VersionObservation.last_seen_at, stmt.excluded.last_seen_at),
+        },
+        where=(
+            (stmt.excluded.first_seen_at < VersionObservation.first_seen_at)
+            | (stmt.excluded.last_seen_at >= VersionObservation.last_seen_at + LAST_SEEN_GRANULARITY)
+        ),
+    )
+    await db.execute(stmt)
+
+
+async def record_fingerprint(db: AsyncSession, event: LogEvent, fingerprint: str) -> None:
+    """event 버전의 fingerprint 집합에 추가 (이미 있으면 no-op) + 발생 수 +1. commit 은 caller.
+
+    event 당 1번 — fingerprint_processor 가 fingerprinted_at 마킹과 같은 트랜잭션에서 호출.
+    """
+    if event.version_sha == UNKNOWN_SHA:
+        return
+    await _ensure_coverage(db, event.project_id, event.environment)
+    count_stmt = pg_insert(VersionFingerprintCount).values(
+        project_id=event.project_id, environment=event.environment, version_sha=event.version_sha,
+        fingerprint=fingerprint, day=event.received_at.date(), live_count=1,
+    )
+    await db.execute(count_stmt.on_conflict_do_update(
+        index_elements=["project_id", "environment", "version_sha", "fingerprint", "day"],
+        set_={"live_count": VersionFingerprintCount.live_count + 1},
+    ))
+    stmt = pg_insert(VersionObservation).values(
+        project_id=event.project_id, environment=event.environment, version_sha=event.version_sha,
+        first_seen_at=event.received_at, last_seen_at=event.received_at,
+        fingerprints=[fingerprint],
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=_PK,
+        set_={"fingerprints": func.array_append(VersionObservation.fingerprints, fingerprint)},
+        where=not_(VersionObservation.fingerprints.contains([fingerprint])),
+    )
+    await db.execute(stmt)
+
+
+async def fingerprint_counts(
+    db: AsyncSession, *, project_id: uuid.UUID, environment: str, version_sha: str,
+) -> dict[str, int]:
+    """버전의 fingerprint 별 발생 수 — version_fingerprint_counts 합산 (PK prefix range scan)."""
+    total = func.sum(VersionFingerprintCount.live_count + VersionFingerprintCount.backfill_count)
+    rows = (await db.execute(
+        select(VersionFingerprintCount.fingerprint, total)
+        .where(
+            VersionFingerprintCount.project_id == project_id,
+            VersionFingerprintCount.environment == environment,
+            VersionFingerprintCount.version_sha == version_sha,
+        )
+        .group_by(VersionFingerprintCount.fingerprint)
+    )).all()
+    return {fingerprint: int(count) for fingerprint, count in rows}
+
+
+async def history_complete(db: AsyncSession, *, project_id: uuid.UUID, environment: str) -> bool:
+    """이 pair 의 version_observations 가 배포 전 기록까지 다 반영됐는지 (version_coverage.history_complete)."""
+    return bool((await db.execute(
+        select(VersionCoverage.history_complete).where(
+            VersionCoverage.project_id == project_id, VersionCoverage.environment == environment,
+        )
+    )).scalar_one_or_none())
+
+
+async def find_previous_good_sha(
+    db: AsyncSession,
+    *,
+    project_id: uuid.UUID,
+    environment: str,
+    fingerprint: str,
+    before: datetime,
+) -> str | None:
+    """before 이전에 처음 관측된 버전 중 가장 최근 + fingerprint 미발생. 인덱스 역순 scan → 첫 매칭."""
+    return (await db.execute(
+        select(VersionObservation.version_sha)
+        .where(
+            VersionObservation.project_id == project_id,
+            VersionObservation.environment == environment,
+            VersionObservation.first_seen_at < before,
+            not_(VersionObservation.fingerprints.contains([fingerprint])),
+        )
+        .order_by(VersionObservation.first_seen_at.desc())
+        .limit(1)
+    )).scalar_one_or_none()
+
+
+async def backfill(
+    db: AsyncSession,
+    *,
+    on_progress: Callable[[int], None] | None = None,
+) -> int:
+    """기존 log_events → version_observations + 발생 수 (version_fingerprint_counts). 집계한 파티션 수 반환.
+
+    최신 → 과거 순으로 파티션마다 집계 + commit. 과거 방향으로만 내려가므로 중단돼도 다음 실행이 이어감.
+    - 관측 구간 / fingerprint 집합: 진행 경계는 현재 min(first_seen_at). 그 이후 파티션은
+      ingest 경로 (record_events) 또는 이전 실행이 이미 반영.
+    - 발생 수: pair 별 version_coverage.backfilled_from (집계를 마친 가장 오래된 일자) 보다 과거만.
+      실행 중 새로 등록된 pair (live_since > 실행 시작) 는 다음 실행에서.
+    끝까지 돌면 실행 시작 시점에 등록된 pair 를 history_complete 로 — 직전 정상 SHA lookup 이 그때부터 관측 사용.
+    """
+    run_started = datetime.utcnow()
+    await db.execute(_REGISTER_HISTORICAL_SQL, {"run_started": run_started})
+    await db.commit()
+
+    frontier = (await db.execute(select(func.min(VersionObservation.first_seen_at)))).scalar_one()
+    counted = (await db.execute(
+        select(VersionCoverage.backfilled_from).where(VersionCoverage.live_since <= run_started)
+    )).scalars().all()
+    # 발생 수 집계가 남은 가장 최신 일자 (미만) — backfilled_from 이 없는 pair 가 있으면 전 파티션
+    counts_before = None if None in counted else max(counted, default=date.min)
+
+    partitions = [
+        (day, name) for day, name in await list_partitions(db)
+        if frontier is None or day <= frontier.date() or counts_before is None or day < counts_before
+    ]
+    done = 0
+    for day, _name in reversed(partitions):
+        day_start = datetime.combine(day, datetime.min.time())
+        params = {
+            "day_start": day_start, "day_end": day_start + timedelta(days=1), "unknown": UNKNOWN_SHA,
+        }
+        if frontier is None or day <= frontier.date():
+            await db.execute(_BACKFILL_PARTITION_SQL, params)
+        await db.execute(_BACKFILL_COUNTS_SQL, {**params, "day": day, "run_started": run_started})
+        await db.execute(_MARK_BACKFILLED_SQL, {"day": day, "run_started": run_started})
+        await db.commit()
+        done += 1
+        if on_progress is not None:
+            on_progress(done)
+    await db.execute(_MARK_HISTORY_COMPLETE_SQL, {"run_started": run_started})
+    await db.commit()
+    if done:
+        logger.info("version_observations backfill: %d partitions", done)
+    return done
@@ -0,0 +1,73 @@
+"""handoff 파서 — 전체 파싱 (parse_handoff) vs section-lazy (scan_handoff().latest).
+
+사용:
+    cd backend
+    python -m benchmarks.bench_handoff_parser --size-mb 1 --repeat 20
+
+DB 불필요. 하루 1 섹션씩 쌓인 수년치 handoff 를 합성 (목표 크기까지 날짜 증가) 하고
+sync 경로 (`_apply_handoff` 가 쓰는 최신 섹션만) 와 전체 파싱의 시간을 비교한다.
+"""
+
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+
+from app.services.handoff_parser_service import parse_handoff, scan_handoff
+
+
+def build_handoff(size_bytes: int) -> tuple[str, int]:
+    """size_bytes 이상이 될 때까지 일자 섹션 추가. (텍스트, 섹션 수) 반환."""
+    parts = ["# Handoff: feature/long-running — @alice\n"]
+    total = len(parts[0])
+    day = date(2020, 1, 1)
+    n = 0
+    while total < size_bytes:
+        section = (
+            f"\n## {day.isoformat()}\n\n"
+            f"- [x] task-{n:04d} 로그인 폼 검증 (완료)\n"
+            f"  - [x] 이메일 입력 필드\n"
+            f"  - [ ] 비밀번호 강도 표시\n"
+            f"- [ ] task-{n + 1:04d} (60% 완료)\n"
+            f"    - [ ] 에러 메시지 i18n\n\n"
+            f"### 마지막 커밋\n\nabc{n:04d} — 폼 검증 로직 정리\n\n"
+            f"### 다음\n\n- API 연동\n- 리뷰 반영\n\n"
+            f"### 블로커\n\n없음\n"
+        )
+        parts.append(section)
+        total += len(section.encode())
+        day += timedelta(days=1)
+        n += 1
+    return "".join(parts), n
+
+
+def _time(fn, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text, sections = build_handoff(int(args.size_mb * 1024 * 1024))
+    print(f"handoff: {len(text.encode()) / 1024:.0f} KiB, {sections} sections")
+
+    full = _time(lambda: parse_handoff(text), args.repeat)
+    lazy = _time(lambda: scan_handoff(text).latest, args.repeat)
+    for label, samples in (("parse_handoff (all sections)", full), ("scan_handoff().latest", lazy)):
+        print(
+            f"{label:32s} median {statistics.median(samples):8.2f} ms  "
+            f"min {min(samples):8.2f} ms"
+        )
+    print(f"speedup: {statistics.median(full) / statistics.median(lazy):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""handoff 본문 저장량 — 전체 raw 저장 vs delta + snapshot (handoff_storage_service 정책).
+
+사용:
+    cd backend
+    python -m benchmarks.bench_handoff_storage --days 730 --pushes-per-day 3
+
+DB 불필요. 하루 1 섹션 추가 + 같은 날 체크박스 갱신 push 들을 합성해서
+store_content 와 같은 규칙 (SNAPSHOT_INTERVAL / delta 비율 상한) 으로 저장 바이트를 합산한다.
+raw 쪽은 TOAST 압축을 감안해 zlib 압축 크기도 함께 출력.
+"""
+
+import argparse
+import time
+import zlib
+from datetime import date, timedelta
+
+from app.services.handoff_storage_service import (
+    _MAX_DELTA_RATIO,
+    SNAPSHOT_INTERVAL,
+    apply_delta,
+    make_delta,
+)
+
+
+def _section(day: date, n: int, done: int) -> str:
+    checks = "".join(
+        f"- [{'x' if i < done else ' '}] task-{n * 3 + i:04d} 작업 {i} 진행 상황\n"
+        f"  - [{'x' if i < done else ' '}] 세부 항목\n"
+        for i in range(3)
+    )
+    return (
+        f"\n## {day.isoformat()}\n\n{checks}\n"
+        f"### 마지막 커밋\n\nabc{n:04d} — 폼 검증 로직 정리\n\n"
+        f"### 다음\n\n- API 연동\n- 리뷰 반영\n\n"
+        f"### 블로커\n\n없음\n"
+    )
+
+
+def build_pushes(days: int, pushes_per_day: int) -> list[str]:
+    """push 순서대로의 handoff 파일 버전. 최신 섹션이 맨 위."""
+    header = "# Handoff: feature/long-running — @alice\n"
+    older = ""
+    versions = []
+    day = date(2024, 1, 1)
+    for n in range(days):
+        for push in range(pushes_per_day):
+            versions.append(header + _section(day, n, push) + older)
+        older = _section(day, n, pushes_per_day) + older
+        day += timedelta(days=1)
+    return versions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--pushes-per-day", type=int, default=3)
+    args = parser.parse_args()
+
+    versions = build_pushes(args.days, args.pushes_per_day)
+    raw_bytes = sum(len(v.encode()) for v in versions)
+    raw_compressed = sum(len(zlib.compress(v.encode())) for v in versions)
+
+    stored = 0
+    stored_compressed = 0  # snapshot 도 TOAST 압축된다고 가정
+    snapshots = 0
+    depth = -1
+    started = time.perf_counter()
+    for prev, text in zip([None, *versions], versions):
+        if prev is None or depth + 1 >= SNAPSHOT_INTERVAL:
+            stored += len(text.encode())
+            stored_compressed += len(zlib.compress(text.encode()))
+            snapshots += 1
+            depth = 0
+            continue
+        delta = make_delta(prev, text)
+        if len(delta) > len(text.encode()) * _MAX_DELTA_RATIO:
+            stored += len(text.encode())
+            stored_compressed += len(zlib.compress(text.encode()))
+            snapshots += 1
+            depth = 0
+            continue
+        assert apply_delta(prev, delta) == text
+        stored += len(delta)
+        stored_compressed += len(delta)
+        depth += 1
+    elapsed = time.perf_counter() - started
+
+    mib = 1024 * 1024
+    print(f"pushes: {len(versions)}  latest file: {len(versions[-1].encode()) / 1024:.0f} KiB")
+    print(f"raw (every push full):        {raw_bytes / mib:9.1f} MiB")
+    print(f"raw, zlib per row (~TOAST):   {raw_compressed / mib:9.1f} MiB")
+    print(f"delta + snapshot every {SNAPSHOT_INTERVAL:<3d}:  {stored / mib:9.1f} MiB  ({snapshots} snapshots)")
+    print(f"  with snapshots zlib (~TOAST): {stored_compressed / mib:9.1f} MiB")
+    print(
+        f"savings: {raw_bytes / stored:.1f}x uncompressed, "
+        f"{raw_compressed / stored_compressed:.1f}x with TOAST-style compression on both sides"
+    )
+    print(f"delta encode+verify: {elapsed * 1000 / len(versions):.2f} ms/push")
+
+
+if __name__ == "__main__":
+    main()
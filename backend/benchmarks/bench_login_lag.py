@@ -0,0 +1,71 @@
+"""동시 로그인 부하에서 event loop lag — bcrypt 동기 호출 vs hash_executor.
+
+사용:
+    cd backend
+    python -m benchmarks.bench_login_lag --requests 40 --concurrency 20 --workers 2
+
+DB 없이 로그인의 CPU 부분 (passlib bcrypt verify, cost 12) 만 재현. 부하 동안 5ms 주기 tick 의
+지연 (= 같은 워커의 다른 요청이 기다리는 시간) p50 / p99 / max 와 로그인 처리량을 출력.
+
+- inline — 변경 전: async handler 안에서 verify_password 직접 호출
+- pool   — check_password (전용 bounded thread pool)
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.hash_executor import HashExecutor
+from app.core.security import pwd_context
+
+
+async def _measure(mode: str, *, requests: int, concurrency: int, workers: int) -> None:
+    hashed = pwd_context.hash("bench-password")
+    executor = HashExecutor(workers=workers, max_queue=requests)
+    semaphore = asyncio.Semaphore(concurrency)
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + 0.005
+            await asyncio.sleep(0.005)
+            lags.append((time.perf_counter() - expected) * 1000)
+
+    async def login() -> None:
+        async with semaphore:
+            if mode == "inline":
+                assert pwd_context.verify("bench-password", hashed)
+            else:
+                assert await executor.run("password_verify", pwd_context.verify, "bench-password", hashed)
+            await asyncio.sleep(0)  # 요청 사이 다른 task 에 양보 (응답 전송 등)
+
+    tick = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick
+    executor.shutdown()
+
+    lags.sort()
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{mode:<7} logins/s={requests / elapsed:7.1f}  loop lag ms: "
+        f"p50={statistics.median(lags):7.1f} p99={p99:7.1f} max={lags[-1]:7.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    for mode in ("inline", "pool"):
+        await _measure(mode, requests=args.requests, concurrency=args.concurrency, workers=args.workers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
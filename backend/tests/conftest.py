@@ -11,6 +11,7 @@ Per-test fresh DB; teardown terminates connections then DROPs. Not pytest-xdist
 import logging
 import os
 import uuid
+from contextlib import contextmanager
 
 os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://placeholder/forps_test")
 os.environ.setdefault("SECRET_KEY", "test-secret-not-used-by-tests")
@@ -24,6 +25,7 @@ from testcontainers.postgres import PostgresContainer
 
 # Patch app.config.settings at import time so env.py picks up real URLs later
 import app.config  # noqa: E402 — ensures settings singleton is in sys.modules
+from app.core.sql_instrumentation import DEFAULT_REPEAT_THRESHOLD, track_queries  # noqa: E402
 
 
 def _reenable_app_loggers() -> None:
@@ -62,6 +64,20 @@ def _install_caplog_handler_on_app_logger(caplog: pytest.LogCaptureFixture):
     app_logger.removeHandler(caplog.handler)
     app_logger.setLevel(original_level)
 
+
+@pytest.fixture(autouse=True)
+def _clear_role_cache():
+    """permission_service 의 role cache / ingest 토큰 verify cache 가 테스트 사이에 남지 않게."""
+    from app.services.log_ingest_service import verified_tokens
+    from app.services.permission_service import role_cache
+
+    role_cache.clear()
+    verified_tokens.clear()
+    yield
+    role_cache.clear()
+    verified_tokens.clear()
+
+
 # ---------------------------------------------------------------------------
 # Session-scoped: one PG container for the entire test run
 # ---------------------------------------------------------------------------
@@ -185,3 +201,30 @@ async def async_session(upgraded_db):
     async with session_factory() as session:
         yield session
     await engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# Query budget — endpoint / service 의 쿼리 수 회귀 방지
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def query_budget():
+    """블록 안 쿼리 수 <= max_queries + 같은 statement 반복 (N+1) 없음 검증.
+
+    사용:
+        with query_budget(6) as stats:
+            res = await client.get(...)
+        # stats.count / stats.shapes 로 추가 비교 가능
+    """
+
+    @contextmanager
+    def budget(max_queries: int, *, repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD):
+        with track_queries() as stats:
+            yield stats
+        details = "\n".join(f"  {n}x {shape[:200]}" for shape, n in stats.shapes.most_common())
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries > budget {max_queries}:\n{details}"
+        )
+        assert not stats.repeated(repeat_threshold), f"repeated statements (N+1?):\n{details}"
+
+    return budget
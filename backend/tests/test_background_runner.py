@@ -0,0 +1,136 @@
+"""background_runner — lifespan 밖 background 작업 / readiness / graceful drain.
+
+부팅 회수 작업이 lifespan 을 막지 않도록 task 로 분리 (startup critical path 제거).
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.background_runner import BackgroundJobState, BackgroundRunner
+
+
+async def test_ready_only_after_blocking_jobs_finish():
+    runner = BackgroundRunner()
+    release = asyncio.Event()
+
+    async def job(state: BackgroundJobState) -> None:
+        state.add_progress(3)
+        await release.wait()
+
+    runner.start("reaper", job)
+    await asyncio.sleep(0)
+    assert runner.is_ready() is False
+    assert runner.snapshot()[0]["status"] == "running"
+    assert runner.snapshot()[0]["processed"] == 3
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert runner.is_ready() is True
+    assert runner.snapshot()[0]["status"] == "done"
+
+
+async def test_non_blocking_job_does_not_gate_readiness():
+    runner = BackgroundRunner()
+
+    async def forever(state: BackgroundJobState) -> None:
+        await asyncio.sleep(3600)
+
+    runner.start("scheduler", forever, blocks_ready=False, drain=False)
+    await asyncio.sleep(0)
+    assert runner.is_ready() is True
+    await runner.shutdown(deadline=1.0)
+
+
+async def test_failed_job_counts_as_finished(caplog: pytest.LogCaptureFixture):
+    """실패한 회수 작업이 readiness 를 영구히 막지 않음 — error 만 노출."""
+    runner = BackgroundRunner()
+
+    async def boom(state: BackgroundJobState) -> None:
+        raise RuntimeError("db down")
+
+    runner.start("reaper", boom)
+    await asyncio.sleep(0.01)
+    assert runner.is_ready() is True
+    snap = runner.snapshot()[0]
+    assert snap["status"] == "failed"
+    assert snap["error"] == "RuntimeError: db down"
+
+
+async def test_shutdown_drains_in_flight_job_within_deadline():
+    runner = BackgroundRunner()
+    finished = []
+
+    async def short(state: BackgroundJobState) -> None:
+        await asyncio.sleep(0.05)
+        finished.append(state.name)
+
+    runner.start("reaper", short)
+    await runner.shutdown(deadline=1.0)
+    assert finished == ["reaper"]
+    assert runner.snapshot()[0]["status"] == "done"
+
+
+async def test_shutdown_cancels_job_past_deadline():
+    runner = BackgroundRunner()
+
+    async def slow(state: BackgroundJobState) -> None:
+        await asyncio.sleep(3600)
+
+    runner.start("reaper", slow)
+    await runner.shutdown(deadline=0.05)
+    assert runner.snapshot()[0]["status"] == "cancelled"
+
+
+async def test_shutdown_cancels_non_drain_job_immediately():
+    """scheduler 같은 무한 루프는 deadline 을 기다리지 않음."""
+    runner = BackgroundRunner()
+
+    async def forever(state: BackgroundJobState) -> None:
+        await asyncio.sleep(3600)
+
+    runner.start("scheduler", forever, blocks_ready=False, drain=False)
+    await asyncio.sleep(0)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await runner.shutdown(deadline=30.0)
+    assert loop.time() - started < 1.0
+    assert runner.snapshot()[0]["status"] == "cancelled"
+
+
+async def test_ready_endpoint_reports_progress(monkeypatch: pytest.MonkeyPatch):
+    """GET /ready — 회수 중 503 + jobs 진행률, 완료 후 200."""
+    from cryptography.fernet import Fernet
+    from httpx import ASGITransport, AsyncClient
+
+    monkeypatch.setenv("FORPS_FERNET_KEY", Fernet.generate_key().decode())
+    import app.main
+
+    runner = BackgroundRunner()
+    monkeypatch.setattr(app.main, "runner", runner)
+    release = asyncio.Event()
+
+    async def job(state: BackgroundJobState) -> None:
+        state.add_progress(5)
+        await release.wait()
+
+    runner.start("log_fingerprint_reaper", job)
+    await asyncio.sleep(0)
+
+    transport = ASGITransport(app=app.main.app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get("/ready")
+        assert res.status_code == 503
+        body = res.json()
+        assert body["status"] == "starting"
+        assert body["jobs"][0]["name"] == "log_fingerprint_reaper"
+        assert body["jobs"][0]["processed"] == 5
+
+        # /health 는 회수 진행과 무관하게 200
+        assert (await ac.get("/health")).status_code == 200
+
+        release.set()
+        await asyncio.sleep(0.01)
+        res = await ac.get("/ready")
+        assert res.status_code == 200
+        assert res.json()["status"] == "ready"
@@ -0,0 +1,104 @@
+"""db_pool — checkout 대기 histogram / 사용 중 / overflow / timeout / slow warning, pgbouncer 옵션.
+
+계측 mixin 을 동기 QueuePool + fake DBAPI 연결에 붙여 검증 (DB 불필요).
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from app import database
+from app.core import db_pool
+from app.core.db_pool import InstrumentedAsyncPool, PoolMetrics, attach_metrics
+
+
+class _FakeConnection:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _InstrumentedQueuePool(db_pool._PoolInstrumentation, QueuePool):
+    pass
+
+
+def _pool(*, slow_checkout_ms: float = 10_000, **kwargs) -> tuple[QueuePool, PoolMetrics]:
+    kwargs.setdefault("pool_size", 1)
+    kwargs.setdefault("max_overflow", 1)
+    pool = _InstrumentedQueuePool(_FakeConnection, **kwargs)
+    metrics = PoolMetrics("test", slow_checkout_ms=slow_checkout_ms)
+    attach_metrics(pool, metrics)
+    return pool, metrics
+
+
+def test_checkout_records_wait_in_use_and_overflow():
+    pool, metrics = _pool()
+
+    first, second = pool.connect(), pool.connect()
+    snap = metrics.snapshot()
+    assert snap["in_use"] == 2
+    assert snap["overflow"] == 1
+    assert snap["checkouts"] == 2
+    assert snap["wait_ms"]["count"] == 2
+    assert sum(snap["wait_ms"]["buckets"].values()) == 2
+
+    first.close()
+    second.close()
+    snap = metrics.snapshot()
+    assert snap["in_use"] == 0
+    assert snap["overflow"] == 0
+
+
+def test_checkout_timeout_is_counted_and_warned(caplog):
+    pool, metrics = _pool(max_overflow=0, timeout=0.05, slow_checkout_ms=20)
+    held = pool.connect()
+
+    with caplog.at_level(logging.WARNING, logger="app.core.db_pool"):
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+
+    assert metrics.timeouts == 1
+    assert metrics.checkouts == 1
+    # timeout (~50ms) 까지 대기 → 50 또는 100 bucket
+    buckets = metrics.snapshot()["wait_ms"]["buckets"]
+    assert buckets["50"] + buckets["100"] == 1
+    assert "slow checkout" in caplog.text and "timed out" in caplog.text
+    held.close()
+
+
+def test_slow_warning_is_rate_limited(caplog):
+    metrics = PoolMetrics("test", slow_checkout_ms=100)
+    with caplog.at_level(logging.WARNING, logger="app.core.db_pool"):
+        for _ in range(5):
+            metrics.observe_wait(150)
+        metrics.observe_wait(1)
+    # conftest 가 'app' logger 에도 caplog handler 를 붙여 record 가 중복될 수 있음 → id 로 dedupe
+    assert len({id(r) for r in caplog.records if "slow checkout" in r.getMessage()}) == 1
+    assert metrics.snapshot()["wait_ms"]["buckets"]["250"] == 5
+
+
+def test_recreate_keeps_metrics():
+    pool, metrics = _pool()
+    new_pool = pool.recreate()
+    assert new_pool.metrics is metrics
+    assert metrics.pool is new_pool
+
+
+def test_engine_options_from_settings(monkeypatch):
+    monkeypatch.setattr(database.settings, "db_pool_size", 20)
+    monkeypatch.setattr(database.settings, "db_pgbouncer", False)
+    options = database.get_engine_options("postgresql://u:p@localhost/db")
+    assert options["pool_size"] == 20
+    assert options["poolclass"] is InstrumentedAsyncPool
+    assert "statement_cache_size" not in options["connect_args"]
+
+    monkeypatch.setattr(database.settings, "db_pgbouncer", True)
+    connect_args = database.get_engine_options("postgresql://u:p@localhost/db")["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
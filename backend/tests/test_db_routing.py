@@ -0,0 +1,190 @@
+"""읽기 replica 라우팅 — lag 감시 / read-your-writes pin / get_read_db fallback.
+
+replica 는 lag 측정 함수와 세션 factory 를 fake 로 대체 (lag 시뮬레이션, DB 불필요).
+"""
+
+import asyncio
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app import database
+from app.core import db_routing
+from app.core.db_routing import (
+    PRIMARY_UNTIL_HEADER,
+    ReadYourWritesMiddleware,
+    ReplicaLagMonitor,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _monitor(lags: list, **kwargs) -> tuple[ReplicaLagMonitor, list, _Clock]:
+    calls: list = []
+    clock = _Clock()
+
+    async def measure() -> float:
+        calls.append(clock.now)
+        lag = lags[min(len(calls), len(lags)) - 1]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+    kwargs.setdefault("max_lag_seconds", 5.0)
+    return ReplicaLagMonitor(measure, clock=clock, **kwargs), calls, clock
+
+
+async def test_monitor_caches_lag_within_check_interval():
+    monitor, calls, clock = _monitor([0.5, 30.0], check_interval=2.0)
+
+    assert await monitor.healthy() is True
+    clock.now += 1.0
+    assert await monitor.healthy() is True
+    assert len(calls) == 1
+
+    clock.now += 1.5  # interval 경과 → 재측정, lag 초과
+    assert await monitor.healthy() is False
+    assert monitor.lag == 30.0
+    assert len(calls) == 2
+
+
+async def test_monitor_measures_once_for_concurrent_requests():
+    monitor, calls, _ = _monitor([0.1])
+    results = await asyncio.gather(*(monitor.healthy() for _ in range(20)))
+    assert all(results)
+    assert len(calls) == 1
+
+
+async def test_monitor_failure_falls_back_then_recovers():
+    monitor, _, clock = _monitor([ConnectionRefusedError("replica down"), 0.2])
+
+    assert await monitor.healthy() is False
+    assert monitor.lag is None
+    clock.now += 1.0
+    assert await monitor.healthy() is True
+
+
+def test_disconnected_replica_is_not_treated_as_caught_up():
+    lag = db_routing.replica_lag
+    assert lag(in_recovery=False, caught_up=False, streaming=False, replay_age=None) == 0.0
+    assert lag(in_recovery=True, caught_up=True, streaming=True, replay_age=3600.0) == 0.0
+    # walreceiver 중단 — receive == replay 지만 새 WAL 을 못 받는 중 → 마지막 replay 이후 경과
+    assert lag(in_recovery=True, caught_up=True, streaming=False, replay_age=42.0) == 42.0
+    assert lag(in_recovery=True, caught_up=True, streaming=False, replay_age=None) == float("inf")
+    assert lag(in_recovery=True, caught_up=False, streaming=True, replay_age=1.5) == 1.5
+
+
+async def test_monitor_marks_disconnected_replica_unhealthy_once_stale():
+    state = {"in_recovery": True, "caught_up": True, "streaming": False, "replay_age": 1.0}
+
+    async def measure() -> float:
+        return db_routing.replica_lag(**state)
+
+    clock = _Clock()
+    monitor = ReplicaLagMonitor(measure, max_lag_seconds=5.0, clock=clock)
+    assert await monitor.healthy() is True
+    state["replay_age"] = 6.0  # 수신이 끊긴 채 시간 경과
+    clock.now += 1.0
+    assert await monitor.healthy() is False
+
+
+def _routing_app(pin_seconds: float = 10.0, clock=None) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, pin_seconds=pin_seconds, clock=clock or _Clock())
+
+    @app.get("/read")
+    async def read():
+        return {"pinned": db_routing.primary_pinned()}
+
+    @app.post("/write")
+    async def write():
+        return {"pinned": db_routing.primary_pinned()}
+
+    return app
+
+
+async def _request(app: FastAPI, method: str, path: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path, **kwargs)
+
+
+async def test_write_request_pins_itself_and_returns_primary_until():
+    app = _routing_app(pin_seconds=10.0)
+
+    write = await _request(app, "POST", "/write")
+    assert write.json() == {"pinned": True}
+    assert float(write.headers[PRIMARY_UNTIL_HEADER]) == 1010.0
+
+    read = await _request(app, "GET", "/read")
+    assert read.json() == {"pinned": False}
+    assert PRIMARY_UNTIL_HEADER not in read.headers
+
+
+async def test_read_after_write_header_pins_until_expiry():
+    clock = _Clock()
+    app = _routing_app(pin_seconds=10.0, clock=clock)
+    headers = {PRIMARY_UNTIL_HEADER: "1010.0"}
+
+    assert (await _request(app, "GET", "/read", headers=headers)).json() == {"pinned": True}
+    clock.now = 1011.0
+    assert (await _request(app, "GET", "/read", headers=headers)).json() == {"pinned": False}
+    # 숫자가 아니면 무시, 먼 미래 값은 now + pin_seconds 로 상한 (여전히 pin)
+    assert (await _request(app, "GET", "/read", headers={PRIMARY_UNTIL_HEADER: "x"})).json() == {
+        "pinned": False,
+    }
+    assert (await _request(app, "GET", "/read", headers={PRIMARY_UNTIL_HEADER: "1e12"})).json() == {
+        "pinned": True,
+    }
+
+
+async def test_get_read_db_routes_by_lag_and_pin(monkeypatch):
+    primary, replica = object(), object()
+
+    class _ReplicaSession:
+        async def __aenter__(self):
+            return replica
+
+        async def __aexit__(self, *exc):
+            return False
+
+    lag = {"value": 0.5}
+
+    async def measure() -> float:
+        return lag["value"]
+
+    monitor = ReplicaLagMonitor(measure, max_lag_seconds=5.0, check_interval=0)
+    monkeypatch.setattr(database, "ReadSessionLocal", _ReplicaSession)
+    monkeypatch.setattr(database, "replica_monitor", monitor)
+
+    app = FastAPI()
+
+    async def override_get_db():
+        yield primary
+
+    app.dependency_overrides[database.get_db] = override_get_db
+    app.add_middleware(ReadYourWritesMiddleware, pin_seconds=10.0)
+
+    @app.get("/read")
+    async def read(db=Depends(database.get_read_db)):
+        return {"replica": db is replica}
+
+    @app.post("/write")
+    async def write(db=Depends(database.get_read_db)):
+        return {"replica": db is replica}
+
+    assert (await _request(app, "GET", "/read")).json() == {"replica": True}
+    assert (await _request(app, "POST", "/write")).json() == {"replica": False}
+
+    lag["value"] = 12.0  # replica 지연 → primary
+    assert (await _request(app, "GET", "/read")).json() == {"replica": False}
+
+    monkeypatch.setattr(database, "ReadSessionLocal", None)  # replica 미설정
+    lag["value"] = 0.0
+    assert (await _request(app, "GET", "/read")).json() == {"replica": False}
@@ -5,7 +5,7 @@
 
 import asyncio
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from sqlalchemy import select
@@ -94,6 +94,27 @@ async def test_upsert_updates_existing_open_group(async_session: AsyncSession):
     assert result.group.exception_message_sample == "boom2"
 
 
+async def test_upsert_late_out_of_order_event_keeps_seen_bounds(async_session: AsyncSession):
+    """reaper 가 과거 event 를 늦게 처리 — last_seen 은 그대로, first_seen 은 더 이른 쪽으로."""
+    proj = await _seed_project(async_session)
+    recent = _make_event(proj, version_sha="b" * 40)
+    late = _make_event(proj, version_sha="a" * 40)
+    late.received_at = recent.received_at - timedelta(days=3)
+    async_session.add_all([recent, late])
+    await async_session.flush()
+
+    for event in (recent, late):
+        result = await error_group_service.upsert(
+            async_session, project_id=proj.id, fingerprint="fp-1", event=event,
+        )
+    await async_session.commit()
+
+    group = result.group
+    assert group.event_count == 2
+    assert (group.last_seen_at, group.last_seen_version_sha) == (recent.received_at, "b" * 40)
+    assert (group.first_seen_at, group.first_seen_version_sha) == (late.received_at, "a" * 40)
+
+
 async def test_upsert_transitions_resolved_to_regressed(async_session: AsyncSession):
     """기존 RESOLVED → REGRESSED 전이, transitioned=True."""
     proj = await _seed_project(async_session)
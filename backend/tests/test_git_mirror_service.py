@@ -0,0 +1,107 @@
+"""git_mirror_service — 로컬 file-path remote 로 bare mirror fetch backend 검증 (네트워크 없음).
+
+설계서: 2026-04-26-ai-task-automation-design.md §5.1 (②), §7.1
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from app.config import settings
+from app.services import git_mirror_service
+from app.services.git_mirror_service import GitMirrorError, fetch_compare_files, fetch_file
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True,
+        env={
+            "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com",
+            "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@example.com",
+            "HOME": str(cwd), "PATH": "/usr/bin:/bin:/usr/local/bin",
+        },
+    ).stdout.strip()
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> str:
+    for rel, content in files.items():
+        target = repo / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def remote(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setattr(settings, "git_mirror_root", str(tmp_path / "mirrors"))
+    repo = tmp_path / "remote"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    return repo
+
+
+async def test_fetch_file_reads_blob_at_sha(remote):
+    sha1 = _commit(remote, {"PLAN.md": "v1\n"}, "one")
+    sha2 = _commit(remote, {"PLAN.md": "v2\n"}, "two")
+
+    assert await fetch_file(str(remote), None, sha2, "PLAN.md") == "v2\n"
+    # 이전 sha 도 같은 mirror 에서 읽힘
+    assert await fetch_file(str(remote), None, sha1, "PLAN.md") == "v1\n"
+
+
+async def test_fetch_file_missing_path_returns_none(remote):
+    sha = _commit(remote, {"PLAN.md": "x\n"}, "one")
+    assert await fetch_file(str(remote), None, sha, "handoffs/main.md") is None
+
+
+async def test_new_push_triggers_incremental_fetch(remote):
+    """mirror 생성 후 remote 에 새 커밋 → 해당 sha 요청 시 fetch 로 따라잡음."""
+    sha1 = _commit(remote, {"PLAN.md": "v1\n"}, "one")
+    await fetch_file(str(remote), None, sha1, "PLAN.md")
+    mirror = git_mirror_service.mirror_path(str(remote))
+    assert mirror.exists()
+
+    sha2 = _commit(remote, {"handoffs/main.md": "# h\n"}, "two")
+    assert await fetch_file(str(remote), None, sha2, "handoffs/main.md") == "# h\n"
+
+
+async def test_compare_lists_changed_paths(remote):
+    base = _commit(remote, {"PLAN.md": "v1\n", "src/a.py": "a\n"}, "base")
+    _commit(remote, {"src/a.py": "a2\n"}, "mid")
+    head = _commit(remote, {"handoffs/main.md": "# h\n"}, "head")
+
+    files = await fetch_compare_files(str(remote), None, base, head)
+    assert sorted(files) == ["handoffs/main.md", "src/a.py"]
+
+
+async def test_unknown_sha_raises(remote):
+    _commit(remote, {"PLAN.md": "v1\n"}, "one")
+    with pytest.raises(GitMirrorError):
+        await fetch_file(str(remote), None, "f" * 40, "PLAN.md")
+
+
+async def test_invalid_sha_rejected_before_git(remote):
+    with pytest.raises(GitMirrorError):
+        await fetch_file(str(remote), None, "--upload-pack=evil", "PLAN.md")
+
+
+def test_mirror_path_is_stable_and_distinct(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "git_mirror_root", str(tmp_path))
+    a = git_mirror_service.mirror_path("https://github.com/owner/repo")
+    assert a == git_mirror_service.mirror_path("https://github.com/owner/repo.git/")
+    assert a != git_mirror_service.mirror_path("https://github.com/other/repo")
+    assert a.name.startswith("owner_repo-")
+
+
+def test_get_fetchers_selects_backend(monkeypatch):
+    from app.services import git_repo_service
+
+    monkeypatch.setattr(settings, "git_fetch_backend", "mirror")
+    assert git_repo_service.get_fetchers() == (fetch_file, fetch_compare_files)
+    monkeypatch.setattr(settings, "git_fetch_backend", "api")
+    assert git_repo_service.get_fetchers() == (
+        git_repo_service.fetch_file, git_repo_service.fetch_compare_files,
+    )
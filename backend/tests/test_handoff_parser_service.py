@@ -223,3 +223,64 @@ abc1234
     assert s_new.free_notes.next == "내일"
     s_old = h.sections[1]
     assert s_old.free_notes.last_commit is None
+
+
+# ---- scan_handoff (section-lazy) ----
+
+
+def test_scan_handoff_matches_full_parse():
+    from app.services.handoff_parser_service import scan_handoff
+
+    lazy = scan_handoff(FIXTURE)
+    full = parse_handoff(FIXTURE)
+    assert lazy.latest == full.sections[0]
+    assert list(lazy.sections) == full.sections
+    assert lazy.sections.dates == [s.date for s in full.sections]
+
+
+def test_scan_handoff_parses_only_latest_eagerly():
+    from app.services.handoff_parser_service import scan_handoff
+
+    text = (
+        "# Handoff: main — @alice\n\n"
+        "## 2026-04-01\n- [x] task-001\n\n"
+        "## 2026-04-03\n- [ ] task-003\n\n"
+        "## 2026-04-02\n- [x] task-002\n"
+    )
+    lazy = scan_handoff(text)
+    assert lazy.latest.date == "2026-04-03"
+    assert [c.external_id for c in lazy.latest.checks] == ["task-003"]
+    assert list(lazy.sections._cache) == [0]  # 나머지는 접근 전까지 미파싱
+
+    assert lazy.sections[-1].date == "2026-04-01"
+    assert sorted(lazy.sections._cache) == [0, 2]
+
+
+def test_scan_handoff_crlf_line_endings():
+    from app.services.handoff_parser_service import scan_handoff
+
+    text = "# Handoff: main — @alice\r\n\r\n## 2026-04-26\r\n- [x] task-001 (done)\r\n"
+    latest = scan_handoff(text).latest
+    assert latest.checks[0].external_id == "task-001"
+    assert latest.checks[0].extra == "(done)"
+
+
+def test_pathological_lines_do_not_backtrack():
+    """긴 공백 들여쓰기 + 매칭 실패 / trailing 공백 라인 — 선형 시간."""
+    import time
+
+    indent = "  " * 5000
+    text = (
+        "# Handoff: main — @alice\n\n## 2026-04-26\n"
+        f"- [ ] task-001{' ' * 20000}x\n"
+        f"{indent}- [x] sub item{' ' * 20000}\n"
+        f"{indent}-- not a checkbox\n"
+        f"{indent}\t - [ ]\n"
+    )
+    started = time.perf_counter()
+    parsed = parse_handoff(text)
+    assert time.perf_counter() - started < 1.0
+
+    section = parsed.sections[0]
+    assert section.checks[0].extra == "x"
+    assert [s.text for s in section.subtasks] == ["sub item"]
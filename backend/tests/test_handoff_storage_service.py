@@ -0,0 +1,124 @@
+"""handoff_storage_service — line delta 저장 / 복원 / retention GC."""
+
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.handoff import Handoff
+from app.models.project import Project
+from app.models.workspace import Workspace
+from app.services import handoff_storage_service
+from app.services.handoff_storage_service import (
+    apply_delta,
+    load_content,
+    make_delta,
+    purge_expired_content,
+    store_content,
+)
+
+
+def _history(days: int) -> list[str]:
+    """최신 섹션이 위에 쌓이는 handoff — 버전 i 는 섹션 i+1 개."""
+    header = "# Handoff: main — @alice\n"
+    sections: list[str] = []
+    versions = []
+    for i in range(days):
+        sections.insert(0, (
+            f"\n## 2026-01-{i + 1:02d}\n\n"
+            f"- [x] task-{i:03d} 로그인 폼 검증 (완료)\n"
+            f"  - [x] 이메일 입력 필드\n"
+            f"  - [ ] 비밀번호 강도 표시\n"
+            f"- [ ] task-{i + 1:03d} (60% 완료)\n\n"
+            f"### 마지막 커밋\n\nabc{i:04d} — 폼 검증 로직 정리\n\n"
+            f"### 다음\n\n- API 연동\n- 리뷰 반영\n"
+        ))
+        versions.append(header + "".join(sections))
+    return versions
+
+
+def test_delta_roundtrip_prepend_append_and_edit():
+    base = "a\nb\nc\n"
+    for new in ("x\na\nb\nc\n", "a\nb\nc\nd\n", "a\nB\nc", "", "only\n"):
+        assert apply_delta(base, make_delta(base, new)) == new
+
+
+def test_delta_roundtrip_without_trailing_newline_and_crlf():
+    base = "line1\r\nline2"
+    new = "line0\r\nline1\r\nline2 changed"
+    assert apply_delta(base, make_delta(base, new)) == new
+
+
+def test_delta_is_small_for_daily_section():
+    versions = _history(30)
+    delta = make_delta(versions[-2], versions[-1])
+    assert len(delta) < len(versions[-1].encode()) / 10
+
+
+# ---------------------------------------------------------------------------
+# DB
+# ---------------------------------------------------------------------------
+
+
+async def _seed_project(db: AsyncSession) -> Project:
+    ws = Workspace(name="ws", slug=f"ws-{uuid.uuid4().hex[:8]}")
+    db.add(ws)
+    await db.flush()
+    proj = Project(workspace_id=ws.id, name="p")
+    db.add(proj)
+    await db.commit()
+    return proj
+
+
+async def _push(db: AsyncSession, proj: Project, text: str, *, pushed_at: datetime) -> Handoff:
+    handoff = Handoff(
+        project_id=proj.id, branch="main", author_git_login="alice",
+        commit_sha=uuid.uuid4().hex + "0" * 8, pushed_at=pushed_at,
+        parsed_tasks=[], free_notes={},
+    )
+    await store_content(db, handoff, text)
+    db.add(handoff)
+    await db.commit()
+    return handoff
+
+
+async def test_store_content_uses_deltas_and_periodic_snapshots(async_session, monkeypatch):
+    monkeypatch.setattr(handoff_storage_service, "SNAPSHOT_INTERVAL", 4)
+    proj = await _seed_project(async_session)
+    versions = _history(10)
+    start = datetime.utcnow() - timedelta(days=1)
+    rows = [
+        await _push(async_session, proj, text, pushed_at=start + timedelta(minutes=i))
+        for i, text in enumerate(versions)
+    ]
+
+    assert [r.content_depth for r in rows] == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+    assert rows[1].raw_content is None and rows[1].content_delta is not None
+    for row, text in zip(rows, versions):
+        assert await load_content(async_session, row.id) == text
+
+
+async def test_gc_purges_expired_and_rebases_dependents(async_session):
+    proj = await _seed_project(async_session)
+    versions = _history(6)
+    now = datetime.utcnow()
+    rows = [
+        await _push(async_session, proj, text, pushed_at=now - timedelta(days=40 - i))
+        for i, text in enumerate(versions[:3])
+    ] + [
+        await _push(async_session, proj, text, pushed_at=now - timedelta(days=3 - i))
+        for i, text in enumerate(versions[3:])
+    ]
+
+    purged = await purge_expired_content(async_session, now=now, batch_size=2, pause_seconds=0)
+    assert purged == 3
+
+    for row in rows[:3]:
+        await async_session.refresh(row)
+        assert row.raw_content is None and row.content_delta is None
+        assert await load_content(async_session, row.id) is None
+    # 첫 retention 내 버전이 snapshot 으로 rebase — 이후 체인 복원 가능
+    await async_session.refresh(rows[3])
+    assert rows[3].content_depth == 0 and rows[3].raw_content == versions[3]
+    for row, text in zip(rows[3:], versions[3:]):
+        assert await load_content(async_session, row.id) == text
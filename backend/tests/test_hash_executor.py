@@ -0,0 +1,139 @@
+"""bcrypt 전용 bounded executor — event loop lag / 포화 시 503 / latency metric / ingest 토큰 verify 분리."""
+
+import asyncio
+import threading
+import time
+
+import bcrypt
+import pytest
+from fastapi import HTTPException
+
+from app.core.hash_executor import BCRYPT_REJECTED, BCRYPT_SECONDS, HashExecutor
+
+
+async def _max_loop_lag(work) -> float:
+    """work 실행 동안 5ms 주기 tick 의 최대 지연 (초)."""
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            expected = time.perf_counter() + 0.005
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - expected)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.02)
+    try:
+        await work()
+    finally:
+        done.set()
+        await tick
+    return max(lags)
+
+
+async def test_concurrent_bcrypt_keeps_event_loop_responsive():
+    password = b"correct horse battery staple"
+    hashed = bcrypt.hashpw(password, bcrypt.gensalt(rounds=10))
+    started = time.perf_counter()
+    bcrypt.checkpw(password, hashed)
+    one_hash = time.perf_counter() - started
+
+    executor = HashExecutor(workers=2, max_queue=16)
+
+    async def pooled():
+        results = await asyncio.gather(*(
+            executor.run("password_verify", bcrypt.checkpw, password, hashed) for _ in range(6)
+        ))
+        assert all(results)
+
+    async def inline():
+        for _ in range(2):
+            bcrypt.checkpw(password, hashed)
+
+    try:
+        pooled_lag = await _max_loop_lag(pooled)
+    finally:
+        executor.shutdown()
+    inline_lag = await _max_loop_lag(inline)
+
+    assert inline_lag >= one_hash * 0.8  # 동기 호출 — hash 1회만큼 loop 정지
+    assert pooled_lag < one_hash / 2
+    assert executor.pending == 0
+
+
+async def test_saturated_pool_sheds_with_503():
+    executor = HashExecutor(workers=1, max_queue=1)
+    gate = threading.Event()
+    rejected = BCRYPT_REJECTED.labels(op="test_op")
+    before = rejected.value
+
+    running = [asyncio.create_task(executor.run("test_op", gate.wait, 5)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    assert executor.pending == 2
+
+    with pytest.raises(HTTPException) as exc:
+        await executor.run("test_op", gate.wait, 5)
+    assert exc.value.status_code == 503
+    assert exc.value.headers == {"Retry-After": "1"}
+    assert rejected.value == before + 1
+
+    gate.set()
+    assert await asyncio.gather(*running) == [True, True]
+    assert executor.pending == 0
+    # 자리가 나면 다시 수용
+    assert await executor.run("test_op", lambda: "ok") == "ok"
+    executor.shutdown()
+
+
+async def test_records_latency_per_operation():
+    executor = HashExecutor(workers=1, max_queue=0)
+    histogram = BCRYPT_SECONDS.labels(op="timed_op")
+    before = sum(histogram.counts)
+
+    await executor.run("timed_op", time.sleep, 0.02)
+    executor.shutdown()
+
+    assert sum(histogram.counts) == before + 1
+    assert histogram.sum >= 0.02
+
+
+async def test_login_saturation_does_not_shed_ingest_token_verify():
+    from app.core.security import hash_executor, token_verify_executor
+
+    gate = threading.Event()
+    capacity = hash_executor.workers + hash_executor.max_queue
+    logins = [asyncio.create_task(hash_executor.run("password_verify", gate.wait, 5)) for _ in range(capacity)]
+    await asyncio.sleep(0.01)
+    try:
+        with pytest.raises(HTTPException):
+            await hash_executor.run("password_verify", gate.wait, 5)
+        # ingest 토큰 verify 는 별도 pool — 로그인 포화와 무관
+        assert await token_verify_executor.run("token_verify", lambda: "ok") == "ok"
+    finally:
+        gate.set()
+        await asyncio.gather(*logins)
+
+
+def test_verified_token_cache_ttl_and_secret_binding():
+    import uuid
+
+    from app.services.log_ingest_service import VerifiedTokenCache
+
+    now = [0.0]
+    cache = VerifiedTokenCache(60, max_entries=2, clock=lambda: now[0])
+    k1, k2, k3 = (uuid.uuid4() for _ in range(3))
+
+    cache.set(k1, "hash-1", "secret")
+    assert cache.hit(k1, "hash-1", "secret")
+    assert not cache.hit(k1, "hash-1", "other")  # 틀린 secret
+    assert not cache.hit(k1, "hash-2", "secret")  # 재발급된 토큰
+    cache.set(k2, "hash", "s")
+    cache.set(k3, "hash", "s")  # 상한 — 가장 오래된 k1 제거
+    assert not cache.hit(k1, "hash-1", "secret")
+    now[0] = 60.0
+    assert not cache.hit(k2, "hash", "s")  # 만료
+
+    disabled = VerifiedTokenCache(0)
+    disabled.set(k1, "hash", "s")
+    assert not disabled.hit(k1, "hash", "s")
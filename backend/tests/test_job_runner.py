@@ -0,0 +1,184 @@
+"""job_runner — 스케줄 계산 + advisory lock leader election + 실행 기록."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.scheduled_job import JobOutcome, ScheduledJob
+from app.services import job_runner
+from app.services.background_runner import BackgroundJobState, BackgroundRunner
+from app.services.job_runner import Interval, Job, JobRun, Weekly
+
+
+def test_weekly_next_slot_same_week():
+    # 2026-05-06 = 수요일 → 다음 월요일 00:00
+    assert Weekly(0, 0).next_after(datetime(2026, 5, 6, 13, 30)) == datetime(2026, 5, 11, 0, 0)
+
+
+def test_weekly_slot_passed_today_rolls_to_next_week():
+    # 월요일 00:00 정각 실행 직후 → 다음 주 월요일 (같은 slot 재실행 방지)
+    assert Weekly(0, 0).next_after(datetime(2026, 5, 11, 0, 0)) == datetime(2026, 5, 18, 0, 0)
+
+
+def test_weekly_first_is_future_slot_interval_first_is_now():
+    now = datetime(2026, 5, 6, 13, 30)
+    assert Weekly(0, 0).first(now) > now
+    assert Interval(timedelta(minutes=10)).first(now) == now
+    assert Interval(timedelta(minutes=10)).next_after(now) == now + timedelta(minutes=10)
+
+
+async def test_startup_recovery_waits_for_lock_until_it_runs(monkeypatch):
+    """다른 프로세스가 lock 보유 (LOCKED) → 재시도, 실제로 1회 실행된 뒤에야 끝남."""
+    from app import main
+
+    results = iter([JobRun.LOCKED, JobRun.LOCKED, JobRun.RAN])
+    calls: list[bool] = []
+
+    async def _run_job(job, *, force, on_progress):
+        calls.append(force)
+        return next(results)
+
+    monkeypatch.setattr(job_runner, "run_job", _run_job)
+    monkeypatch.setattr(main, "runner", BackgroundRunner())
+    monkeypatch.setattr(main, "STARTUP_LOCK_RETRY_SECONDS", 0.01)
+
+    job = Job("reaper_like", Interval(timedelta(minutes=5)), None)
+    await main._startup_recovery(job)(BackgroundJobState("reaper_like"))
+    assert calls == [True, True, True]
+
+    # shutdown 시작 → 재시도 중단
+    calls.clear()
+    main.runner.stopping.set()
+    monkeypatch.setattr(job_runner, "run_job", lambda *a, **kw: _locked(calls))
+    await asyncio.wait_for(
+        main._startup_recovery(job)(BackgroundJobState("reaper_like")), timeout=1,
+    )
+    assert calls == [1]
+
+
+async def _locked(calls: list) -> JobRun:
+    calls.append(1)
+    return JobRun.LOCKED
+
+
+# ---------------------------------------------------------------------------
+# DB — AsyncSessionLocal 을 per-test DB 로 교체
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def _db_jobs(upgraded_db, monkeypatch):
+    engine = create_async_engine(upgraded_db["async_url"], echo=False)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(job_runner, "AsyncSessionLocal", factory)
+    yield factory
+    asyncio.get_event_loop().run_until_complete(engine.dispose())
+
+
+async def test_run_job_records_success(_db_jobs):
+    calls: list[int] = []
+
+    async def _work(on_progress):
+        on_progress(3)
+        calls.append(1)
+        return 3
+
+    job = Job("test_job", Interval(timedelta(minutes=10)), _work)
+    progress: list[int] = []
+    assert await job_runner.run_job(job, on_progress=progress.append) is JobRun.RAN
+
+    async with _db_jobs() as db:
+        row = await db.get(ScheduledJob, "test_job")
+    assert calls == [1]
+    assert progress == [3]
+    assert row.last_outcome == JobOutcome.SUCCESS
+    assert row.last_processed == 3
+    assert row.run_count == 1
+    assert row.last_duration_ms is not None
+    assert row.next_run_at > row.last_started_at
+
+
+async def test_run_job_records_failure(_db_jobs):
+    async def _boom(on_progress):
+        raise RuntimeError("nope")
+
+    job = Job("boom_job", Interval(timedelta(minutes=10)), _boom)
+    assert await job_runner.run_job(job) is JobRun.RAN
+
+    async with _db_jobs() as db:
+        row = await db.get(ScheduledJob, "boom_job")
+    assert row.last_outcome == JobOutcome.FAILED
+    assert "RuntimeError: nope" in row.last_error
+
+
+async def test_run_job_skips_when_lock_held_elsewhere(_db_jobs):
+    """다른 프로세스(연결) 가 lock 보유 중 → 실행 안 함."""
+    calls: list[int] = []
+
+    async def _work(on_progress):
+        calls.append(1)
+        return None
+
+    job = Job("locked_job", Interval(timedelta(minutes=10)), _work)
+    async with _db_jobs() as other:
+        conn = await other.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        await conn.execute(select(func.pg_advisory_lock(
+            job_runner.LOCK_NAMESPACE, func.hashtext(job.name),
+        )))
+        assert await job_runner.run_job(job, force=True) is JobRun.LOCKED
+        await conn.execute(select(func.pg_advisory_unlock(
+            job_runner.LOCK_NAMESPACE, func.hashtext(job.name),
+        )))
+
+    assert calls == []
+    assert await job_runner.run_job(job, force=True) is JobRun.RAN
+    assert calls == [1]
+
+
+async def test_concurrent_runners_execute_once(_db_jobs):
+    """replica 2개가 같은 tick 에 due job 을 보면 1번만 실행."""
+    calls: list[int] = []
+
+    async def _slow(on_progress):
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return None
+
+    job = Job("weekly_like", Interval(timedelta(days=7)), _slow)
+    now = datetime.utcnow()
+    await job_runner.ensure_registered([job], now=now)
+
+    ran = await asyncio.gather(
+        job_runner.run_due_jobs([job], now=now),
+        job_runner.run_due_jobs([job], now=now),
+    )
+    assert sum(len(r) for r in ran) == 1
+    assert calls == [1]
+
+
+async def test_run_due_jobs_skips_not_yet_due(_db_jobs):
+    async def _work(on_progress):
+        return None
+
+    job = Job("weekly_report_like", Weekly(0, 0), _work)
+    await job_runner.ensure_registered([job])  # Weekly → 다음 slot (미래)
+    assert await job_runner.run_due_jobs([job]) == []
+
+
+async def test_scheduler_exits_on_stopping(_db_jobs):
+    calls: list[int] = []
+
+    async def _work(on_progress):
+        calls.append(1)
+        return None
+
+    job = Job("tick_job", Interval(timedelta(hours=1)), _work)
+    stopping = asyncio.Event()
+    task = asyncio.create_task(job_runner.run_scheduler([job], stopping=stopping, tick_seconds=60))
+    await asyncio.sleep(0.5)
+    stopping.set()
+    await asyncio.wait_for(task, timeout=5)
+    assert calls == [1]
@@ -96,6 +96,39 @@ async def test_list_errors_normal(client_with_db, async_session: AsyncSession):
     assert body["items"][0]["fingerprint"] == "fp-1"
 
 
+async def test_list_errors_sparkline_opt_in(client_with_db, async_session: AsyncSession):
+    """?sparkline=24h — 항목마다 24칸 정수 배열 + 시간축. 미지정 시 항목에 키 없음."""
+    user, proj = await _seed_user_project(async_session)
+    async_session.add(_make_group(proj))
+    await async_session.commit()
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+
+    res = await client_with_db.get(f"/api/v1/projects/{proj.id}/errors?sparkline=24h", headers=headers)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["items"][0]["sparkline"] == [0] * 24
+    assert body["sparkline_window"]["bucket_seconds"] == 3600
+    assert body["sparkline_window"]["buckets"] == 24
+
+    res = await client_with_db.get(f"/api/v1/projects/{proj.id}/errors", headers=headers)
+    assert "sparkline" not in res.json()["items"][0]
+    assert res.json()["sparkline_window"] is None
+
+
+async def test_list_errors_sparse_fields(client_with_db, async_session: AsyncSession):
+    """fields= — 지정 필드 + id / sort 컬럼만."""
+    user, proj = await _seed_user_project(async_session)
+    async_session.add(_make_group(proj))
+    await async_session.commit()
+
+    res = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/errors?fields=exception_class,status",
+        headers={"Authorization": f"Bearer {_auth_token(user)}"},
+    )
+    assert res.status_code == 200
+    assert set(res.json()["items"][0]) == {"id", "exception_class", "status", "last_seen_at"}
+
+
 async def test_list_errors_404_for_non_member(
     client_with_db, async_session: AsyncSession,
 ):
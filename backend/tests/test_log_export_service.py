@@ -0,0 +1,95 @@
+"""log_export_service — 범위 검증 / 파티션 분할 / row 포맷 (DB 불필요).
+
+endpoint + 스트리밍 + 재개 + 동시성 상한은 test_log_logs_endpoint.
+"""
+
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.log_event import LogLevel
+from app.services import log_export_service
+from app.services.log_export_service import (
+    InvalidExportRangeError,
+    export_range,
+    format_ndjson,
+    partition_ranges,
+)
+from app.services.log_query_service import decode_cursor
+
+
+def test_export_range_defaults_and_limits():
+    now = datetime(2026, 5, 10, 12, 0)
+    assert export_range(None, None, now=now) == (now - timedelta(days=1), now)
+
+    with pytest.raises(InvalidExportRangeError):
+        export_range(now, now, now=now)
+    with pytest.raises(InvalidExportRangeError):
+        export_range(now - timedelta(days=32), now)
+
+
+def test_export_range_normalizes_aware_inputs_to_naive_utc():
+    now = datetime(2026, 5, 10, 12, 0)
+    kst = timezone(timedelta(hours=9))
+    since, until = export_range(datetime(2026, 5, 10, 9, 0, tzinfo=kst), None, now=now)
+    assert (since, until) == (datetime(2026, 5, 10, 0, 0), now)
+    assert since.tzinfo is None
+
+    since, until = export_range(
+        datetime(2026, 5, 9, 0, 0, tzinfo=timezone.utc), datetime(2026, 5, 10, 0, 0, tzinfo=timezone.utc),
+    )
+    assert (since, until) == (datetime(2026, 5, 9), datetime(2026, 5, 10))
+
+
+def test_partition_ranges_split_on_utc_midnight():
+    since = datetime(2026, 5, 1, 22, 30)
+    until = datetime(2026, 5, 3, 1, 0)
+    assert partition_ranges(since, until) == [
+        (since, datetime(2026, 5, 2)),
+        (datetime(2026, 5, 2), datetime(2026, 5, 3)),
+        (datetime(2026, 5, 3), until),
+    ]
+    assert partition_ranges(datetime(2026, 5, 2), datetime(2026, 5, 3)) == [
+        (datetime(2026, 5, 2), datetime(2026, 5, 3)),
+    ]
+
+
+class _Row:
+    """Core Row 흉내 — `_mapping` + 속성 접근."""
+
+    def __init__(self, **values):
+        self._mapping = values
+        self.__dict__.update(values)
+
+
+def _row() -> _Row:
+    values = {c.key: None for c in log_export_service.EXPORT_COLUMNS}
+    values.update(
+        id=uuid.uuid4(), received_at=datetime(2026, 5, 1, 1, 2, 3), emitted_at=datetime(2026, 5, 1, 1, 2),
+        level=LogLevel.ERROR, message="줄\n바꿈", extra={"k": 1},
+    )
+    return _Row(**values)
+
+
+def test_format_ndjson_one_line_with_export_cursor():
+    row = _row()
+    line = format_ndjson(row)
+    assert line.endswith("\n") and line.count("\n") == 1
+
+    item = json.loads(line)
+    assert item["level"] == "error"
+    assert item["message"] == "줄\n바꿈"
+    assert decode_cursor(item["cursor"], "export") == (row.received_at, row.id)
+
+
+def test_csv_formatter_header_and_row():
+    formatter = log_export_service._CsvFormatter()
+    text = formatter.header() + formatter.row(_row())
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert list(rows[0]) == log_export_service.CSV_HEADER
+    assert rows[0]["extra"] == '{"k":1}'
+    assert rows[0]["message"] == "줄\n바꿈"
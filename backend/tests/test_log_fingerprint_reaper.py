@@ -104,3 +104,34 @@ async def test_reaper_chunked_processes_large_backlog(
         select(LogEvent).where(LogEvent.project_id == proj.id)
     )).scalars().all()
     assert all(e.fingerprinted_at is not None for e in rows)
+
+
+async def test_reaper_reports_progress_and_returns_count(async_session: AsyncSession):
+    """on_progress 콜백 — /ready 진행률 보고용. 반환값 = 처리 시도 수."""
+    await _seed_unfingerprinted_events(async_session, count=5, level=LogLevel.ERROR)
+
+    progress: list[int] = []
+    processed = await log_fingerprint_reaper.run_reaper_once(on_progress=progress.append)
+
+    assert processed == 5
+    assert sum(progress) == 5
+
+
+async def test_reaper_does_not_spin_on_failing_event(
+    async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch,
+):
+    """처리 실패 이벤트는 NULL 로 남지만 keyset 진행 — 같은 batch 무한 재조회 안 함."""
+    await _seed_unfingerprinted_events(async_session, count=3, level=LogLevel.ERROR)
+
+    calls = 0
+
+    async def always_fail(db, event):
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(log_fingerprint_reaper.fingerprint_processor, "process", always_fail)
+
+    processed = await log_fingerprint_reaper.run_reaper_once()
+    assert processed == 3
+    assert calls == 3
@@ -12,6 +12,7 @@ from unittest.mock import patch
 import bcrypt
 import pytest
 from cryptography.fernet import Fernet
+from fastapi import HTTPException
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -190,6 +191,30 @@ async def test_ingest_auth_failures_401(client_with_db, async_session: AsyncSess
     assert res.status_code == 401
 
 
+async def test_ingest_verify_pool_saturated_503_counted_as_shed(
+    client_with_db, async_session: AsyncSession,
+):
+    """토큰 verify pool 포화 503 은 unauthorized 가 아니라 shed 로 집계."""
+    from app.services.log_ingest_service import INGEST_BATCHES
+
+    proj, token, secret = await _seed_token(async_session)
+    shed = INGEST_BATCHES.labels(outcome="shed")
+    unauthorized = INGEST_BATCHES.labels(outcome="unauthorized")
+    before = (shed.value, unauthorized.value)
+
+    async def busy(*args, **kwargs):
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+
+    with patch("app.services.log_ingest_service.token_verify_executor.run", side_effect=busy):
+        res = await client_with_db.post(
+            "/api/v1/log-ingest", json={"events": [_valid_event()]},
+            headers={"Authorization": f"Bearer {token.id}.{secret}"},
+        )
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
+    assert (shed.value, unauthorized.value) == (before[0] + 1, before[1])
+
+
 async def test_ingest_rate_limit_429(client_with_db, async_session: AsyncSession):
     """rate limit 초과 → 429 + Retry-After 헤더."""
     proj, token, secret = await _seed_token(async_session, rate_limit_per_minute=2)
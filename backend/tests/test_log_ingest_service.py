@@ -119,6 +119,36 @@ async def test_verify_token_success_and_last_used(async_session: AsyncSession):
     assert verified.last_used_at is not None
 
 
+async def test_verify_token_reuses_recent_success_but_checks_revoke(
+    async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch,
+):
+    """같은 토큰 연속 batch → bcrypt 1회. 틀린 secret 은 항상 bcrypt → 401, revoke 는 즉시 반영."""
+    proj, token, secret = await _seed_project_and_token(async_session)
+    calls = []
+    real_checkpw = log_ingest_service.bcrypt.checkpw
+
+    def counting_checkpw(password, hashed):
+        calls.append(password)
+        return real_checkpw(password, hashed)
+
+    monkeypatch.setattr(log_ingest_service.bcrypt, "checkpw", counting_checkpw)
+
+    await log_ingest_service.verify_token(async_session, token.id, secret)
+    await log_ingest_service.verify_token(async_session, token.id, secret)
+    assert len(calls) == 1
+
+    with pytest.raises(HTTPException) as exc:
+        await log_ingest_service.verify_token(async_session, token.id, "wrong-secret")
+    assert exc.value.status_code == 401
+    assert len(calls) == 2
+
+    token.revoked_at = datetime.utcnow()
+    await async_session.commit()
+    with pytest.raises(HTTPException) as exc:
+        await log_ingest_service.verify_token(async_session, token.id, secret)
+    assert exc.value.status_code == 401
+
+
 # ---- check_rate_limit ----
 
 async def test_check_rate_limit_first_call_inserts_window(async_session: AsyncSession):
@@ -199,6 +229,27 @@ async def test_check_rate_limit_next_minute_new_row(async_session: AsyncSession)
     assert row2.event_count == 3
 
 
+async def test_purge_expired_rate_limit_windows(async_session: AsyncSession):
+    """24시간 지난 window 만 삭제 — batch 경계 넘어도 전부 정리."""
+    proj, token, _ = await _seed_project_and_token(async_session, rate_limit_per_minute=600)
+    now = datetime(2026, 5, 2, 12, 0, 0)
+    for minutes_ago in (60 * 25, 60 * 25 + 1, 60 * 25 + 2, 5):
+        await log_ingest_service.check_rate_limit(
+            async_session, project_id=proj.id, token=token, batch_size=1,
+            now=now - timedelta(minutes=minutes_ago),
+        )
+
+    deleted = await log_ingest_service.purge_expired_rate_limit_windows(
+        async_session, now=now, batch_size=2,
+    )
+    assert deleted == 3
+
+    from sqlalchemy import select
+    from app.models.rate_limit_window import RateLimitWindow
+    remaining = (await async_session.execute(select(RateLimitWindow.window_start))).scalars().all()
+    assert remaining == [datetime(2026, 5, 2, 11, 55, 0)]
+
+
 # ---- validate_event ----
 
 def _valid_event_dict() -> dict:
@@ -333,6 +384,45 @@ async def test_ingest_batch_partial_success(async_session: AsyncSession, caplog)
     assert token.last_used_at is not None
 
 
+async def test_ingest_batch_records_version_observation(async_session: AsyncSession):
+    """accepted event 의 (environment, version_sha) 가 같은 트랜잭션에서 version_observations 에."""
+    from sqlalchemy import select
+    from app.models.version_observation import VersionObservation
+
+    proj, token, _ = await _seed_project_and_token(async_session)
+    events = [_valid_event_dict() for _ in range(3)]
+    events[2]["version_sha"] = "unknown"
+
+    await log_ingest_service.ingest_batch(async_session, token=token, payload_dict={"events": events})
+
+    rows = (await async_session.execute(
+        select(VersionObservation).where(VersionObservation.project_id == proj.id)
+    )).scalars().all()
+    assert [(r.environment, r.version_sha) for r in rows] == [("production", "a" * 40)]
+    assert rows[0].first_seen_at <= rows[0].last_seen_at
+
+
+async def test_ingest_batch_notifies_live_tail_on_commit(async_session: AsyncSession, monkeypatch):
+    """ingest 트랜잭션의 NOTIFY 가 commit 후 LISTEN hub 구독자에게 도달."""
+    import asyncio
+    from app.services import log_stream_service
+
+    monkeypatch.setattr(log_stream_service, "engine", async_session.bind)
+    hub = log_stream_service.LogStreamHub()
+    proj, token, _ = await _seed_project_and_token(async_session)
+
+    async with hub.subscribe(proj.id, log_stream_service.StreamFilter()) as sub:
+        await asyncio.wait_for(hub.listening.wait(), timeout=5)
+        await log_ingest_service.ingest_batch(
+            async_session, token=token, payload_dict={"events": [_valid_event_dict()] * 2},
+        )
+        first = await asyncio.wait_for(sub.queue.get(), timeout=5)
+        second = await asyncio.wait_for(sub.queue.get(), timeout=5)
+
+    assert first["logger_name"] == second["logger_name"]
+    assert first["id"] != second["id"]
+
+
 async def test_ingest_batch_dropped_header_logs_warning(
     async_session: AsyncSession, caplog,
 ):
@@ -115,10 +115,10 @@ async def test_list_logs_404_for_non_member(
 
 
 async def test_list_logs_q_full_text(client_with_db, async_session: AsyncSession):
-    """q 풀텍스트 — level >= WARNING 자동."""
+    """q 풀텍스트 — 모든 level 대상 (INFO 포함)."""
     user, proj = await _seed_user_project(async_session)
     e1 = _make_log_event(proj, level=LogLevel.ERROR, message="contains needle here")
-    e2 = _make_log_event(proj, level=LogLevel.INFO, message="info with needle")  # 제외 — INFO
+    e2 = _make_log_event(proj, level=LogLevel.INFO, message="info with needle")
     e3 = _make_log_event(proj, level=LogLevel.ERROR, message="no match")  # 제외 — q 매칭 X
     async_session.add_all([e1, e2, e3])
     await async_session.commit()
@@ -131,5 +131,264 @@ async def test_list_logs_q_full_text(client_with_db, async_session: AsyncSession
     )
     assert res.status_code == 200
     body = res.json()
-    assert body["total"] == 1
-    assert body["items"][0]["message"] == "contains needle here"
+    assert body["total"] == 2
+    assert {i["message"] for i in body["items"]} == {"contains needle here", "info with needle"}
+
+
+async def test_list_logs_invalid_search_query_400(client_with_db, async_session: AsyncSession):
+    user, proj = await _seed_user_project(async_session)
+    res = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/logs",
+        params={"q": "level:loud"},
+        headers={"Authorization": f"Bearer {_auth_token(user)}"},
+    )
+    assert res.status_code == 400
+
+
+async def test_list_logs_next_cursor_and_invalid_cursor(client_with_db, async_session: AsyncSession):
+    user, proj = await _seed_user_project(async_session)
+    async_session.add_all([_make_log_event(proj, message=f"m{i}") for i in range(3)])
+    await async_session.commit()
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+
+    res = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/logs", params={"limit": 2}, headers=headers,
+    )
+    body = res.json()
+    assert body["total"] == 3 and body["total_is_estimate"] is False
+    assert body["next_cursor"]
+
+    res2 = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/logs",
+        params={"limit": 2, "cursor": body["next_cursor"], "total": "none"},
+        headers=headers,
+    )
+    body2 = res2.json()
+    assert len(body2["items"]) == 1
+    assert body2["total"] is None and body2["next_cursor"] is None
+    assert {i["id"] for i in body["items"]}.isdisjoint({i["id"] for i in body2["items"]})
+
+    res3 = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/logs", params={"cursor": "garbage"}, headers=headers,
+    )
+    assert res3.status_code == 400
+
+
+async def test_list_logs_extra_and_request_filters(client_with_db, async_session: AsyncSession):
+    """?extra.<key>= (중첩 경로, 숫자 문자열) + request_id / user_id 필터."""
+    user, proj = await _seed_user_project(async_session)
+    e1 = _make_log_event(proj, message="acme pro")
+    e1.extra = {"tenant_id": "acme", "user": {"plan": "pro"}, "attempt": 3}
+    e1.request_id = "req-1"
+    e1.user_id_external = "u-1"
+    e2 = _make_log_event(proj, message="acme free")
+    e2.extra = {"tenant_id": "acme", "user": {"plan": "free"}}
+    e3 = _make_log_event(proj, message="no extra")
+    async_session.add_all([e1, e2, e3])
+    await async_session.commit()
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+    url = f"/api/v1/projects/{proj.id}/logs"
+
+    async def messages(params: dict) -> set[str]:
+        res = await client_with_db.get(url, params=params, headers=headers)
+        assert res.status_code == 200, res.text
+        return {i["message"] for i in res.json()["items"]}
+
+    assert await messages({"extra.tenant_id": "acme"}) == {"acme pro", "acme free"}
+    assert await messages({"extra.tenant_id": "acme", "extra.user.plan": "pro"}) == {"acme pro"}
+    assert await messages({"extra.attempt": "3"}) == {"acme pro"}
+    assert await messages({"request_id": "req-1"}) == {"acme pro"}
+    assert await messages({"user_id": "u-1"}) == {"acme pro"}
+
+    res = await client_with_db.get(url, params={"extra.a..b": "x"}, headers=headers)
+    assert res.status_code == 400
+
+
+async def test_list_logs_sparse_fields(client_with_db, async_session: AsyncSession):
+    """기본은 요약 필드만 (extra / stack_trace 없음). fields= 는 지정 필드 + cursor 용 id / received_at."""
+    user, proj = await _seed_user_project(async_session)
+    e = _make_log_event(proj)
+    e.stack_trace = "Traceback ...\n" * 200
+    e.extra = {"tenant_id": "acme"}
+    async_session.add(e)
+    await async_session.commit()
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+    url = f"/api/v1/projects/{proj.id}/logs"
+
+    item = (await client_with_db.get(url, headers=headers)).json()["items"][0]
+    assert set(item) == {
+        "id", "level", "message", "logger_name", "version_sha", "environment", "hostname",
+        "emitted_at", "received_at", "fingerprint", "exception_class", "exception_message",
+    }
+
+    res = await client_with_db.get(url, params={"fields": "level,message,extra"}, headers=headers)
+    assert res.status_code == 200
+    assert res.json()["items"][0] == {
+        "id": str(e.id), "level": "error", "message": "boom",
+        "received_at": res.json()["items"][0]["received_at"], "extra": {"tenant_id": "acme"},
+    }
+
+    res = await client_with_db.get(url, params={"fields": "level,password_hash"}, headers=headers)
+    assert res.status_code == 400
+
+
+async def test_list_logs_query_budget_independent_of_page_size(
+    client_with_db, async_session: AsyncSession, query_budget,
+):
+    """쿼리 수는 page 크기와 무관 (row 별 추가 쿼리 없음) + Server-Timing 헤더."""
+    user, proj = await _seed_user_project(async_session)
+    async_session.add_all([_make_log_event(proj, message=f"m{i}") for i in range(30)])
+    await async_session.commit()
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+
+    counts = []
+    for limit in (3, 30):
+        with query_budget(8) as stats:
+            res = await client_with_db.get(
+                f"/api/v1/projects/{proj.id}/logs", params={"limit": limit}, headers=headers,
+            )
+        assert res.status_code == 200
+        assert len(res.json()["items"]) == limit
+        assert res.headers["Server-Timing"].startswith("db;dur=")
+        counts.append(stats.count)
+    assert counts[0] == counts[1]
+
+
+async def test_request_trace_orders_by_emitted_at_with_ms_offsets(
+    client_with_db, async_session: AsyncSession,
+):
+    from datetime import timedelta
+
+    user, proj = await _seed_user_project(async_session)
+    start = datetime.utcnow() - timedelta(minutes=1)
+    events = []
+    for i, offset_ms in enumerate((250, 0, 1500)):
+        e = _make_log_event(proj, message=f"step {i}")
+        e.emitted_at = start + timedelta(milliseconds=offset_ms)
+        e.request_id = "req-trace"
+        events.append(e)
+    other = _make_log_event(proj, message="other request")
+    other.request_id = "req-other"
+    async_session.add_all([*events, other])
+    await async_session.commit()
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+
+    res = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/requests/req-trace", headers=headers,
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert [e["message"] for e in body["events"]] == ["step 1", "step 0", "step 2"]
+    assert [e["offset_ms"] for e in body["events"]] == [0.0, 250.0, 1500.0]
+    assert body["duration_ms"] == 1500.0
+    assert body["truncated"] is False
+
+    res = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/requests/req-missing", headers=headers,
+    )
+    assert res.status_code == 404
+
+
+@pytest.fixture()
+def export_sessions(async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    """log_export_service 는 자체 세션 (AsyncSessionLocal) 으로 스트리밍 — 테스트 DB 로 교체."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from app.services import log_export_service
+
+    factory = async_sessionmaker(async_session.bind, expire_on_commit=False)
+    monkeypatch.setattr(log_export_service, "AsyncSessionLocal", factory)
+    return factory
+
+
+def _logs_cursor(row: dict) -> str:
+    """같은 row 의 /logs (내림차순) cursor."""
+    from app.services.log_query_service import encode_cursor
+    return encode_cursor("received_at", datetime.fromisoformat(row["received_at"]), uuid.UUID(row["id"]))
+
+
+async def test_export_ndjson_ascending_and_resumable(
+    client_with_db, async_session: AsyncSession, export_sessions,
+):
+    import json
+    from datetime import timedelta
+
+    user, proj = await _seed_user_project(async_session)
+    base = datetime.utcnow().replace(hour=1, minute=0, second=0, microsecond=0)
+    for i in range(3):
+        e = _make_log_event(proj, message=f"m{i}")
+        e.received_at = base + timedelta(minutes=i)
+        async_session.add(e)
+    await async_session.commit()
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+    url = f"/api/v1/projects/{proj.id}/logs/export"
+    params = {"since": base.isoformat(), "until": (base + timedelta(hours=1)).isoformat()}
+
+    res = await client_with_db.get(url, params=params, headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert [r["message"] for r in rows] == ["m0", "m1", "m2"]
+    assert rows[0]["level"] == "error"
+
+    res = await client_with_db.get(url, params={**params, "cursor": rows[0]["cursor"]}, headers=headers)
+    assert [json.loads(line)["message"] for line in res.text.splitlines()] == ["m1", "m2"]
+
+    # /logs 의 cursor 는 export 에서 거부
+    res = await client_with_db.get(
+        url, params={**params, "cursor": _logs_cursor(rows[0])}, headers=headers,
+    )
+    assert res.status_code == 400
+
+
+async def test_export_csv_gzip(client_with_db, async_session: AsyncSession, export_sessions):
+    import csv
+    import gzip
+    import io
+
+    user, proj = await _seed_user_project(async_session)
+    e = _make_log_event(proj, message='comma, "quoted"')
+    e.extra = {"tenant_id": "acme"}
+    async_session.add(e)
+    await async_session.commit()
+
+    res = await client_with_db.get(
+        f"/api/v1/projects/{proj.id}/logs/export",
+        params={"format": "csv", "gzip": "true"},
+        headers={"Authorization": f"Bearer {_auth_token(user)}"},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/gzip"
+    assert res.headers["content-disposition"].endswith('.csv.gz"')
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(res.content).decode())))
+    assert len(rows) == 1
+    assert rows[0]["message"] == 'comma, "quoted"'
+    assert rows[0]["extra"] == '{"tenant_id":"acme"}'
+
+
+async def test_export_range_and_concurrency_limits(
+    client_with_db, async_session: AsyncSession, export_sessions,
+):
+    from app.services import log_export_service
+
+    user, proj = await _seed_user_project(async_session)
+    headers = {"Authorization": f"Bearer {_auth_token(user)}"}
+    url = f"/api/v1/projects/{proj.id}/logs/export"
+
+    res = await client_with_db.get(
+        url, params={"since": "2026-01-01T00:00:00", "until": "2026-03-01T00:00:00"}, headers=headers,
+    )
+    assert res.status_code == 400
+
+    held = [
+        await log_export_service.open_export(project_id=proj.id)
+        for _ in range(log_export_service.MAX_CONCURRENT_EXPORTS_PER_PROJECT)
+    ]
+    try:
+        res = await client_with_db.get(url, headers=headers)
+        assert res.status_code == 429
+    finally:
+        for export in held:
+            await export.close()
+
+    res = await client_with_db.get(url, headers=headers)
+    assert res.status_code == 200
@@ -3,6 +3,7 @@
 설계서: 2026-05-01-error-log-phase4-query-design.md §3.1
 """
 
+import asyncio
 import uuid
 from datetime import datetime, timedelta
 
@@ -16,7 +17,7 @@ from app.models.log_event import LogEvent, LogLevel
 from app.models.project import Project
 from app.models.task import Task, TaskSource, TaskStatus
 from app.models.workspace import Workspace
-from app.services import log_query_service
+from app.services import error_group_service, log_query_service
 
 
 async def _seed_project(db: AsyncSession) -> Project:
@@ -113,6 +114,87 @@ async def test_list_groups_pagination_total_correct(async_session: AsyncSession)
     assert len(rows2) == 1  # 5 - 4 = 1
 
 
+async def test_list_groups_cursor_walks_all_pages_per_sort(async_session: AsyncSession):
+    """sort mode 별 cursor 순회 — 중복 / 누락 없이 정렬 순서대로."""
+    from datetime import timedelta
+
+    proj = await _seed_project(async_session)
+    base = datetime(2026, 5, 1, 12, 0, 0)
+    for i in range(7):
+        g = _make_group(proj, fingerprint=f"fp-{i}", last_seen_at=base + timedelta(minutes=i))
+        g.first_seen_at = base - timedelta(minutes=i)
+        g.event_count = i % 3  # 동률 → id tie-break
+        async_session.add(g)
+    await async_session.commit()
+
+    for sort, key in (
+        ("last_seen", lambda g: (g.last_seen_at, g.id)),
+        ("first_seen", lambda g: (g.first_seen_at, g.id)),
+        ("event_count", lambda g: (g.event_count, g.id)),
+    ):
+        seen: list[ErrorGroup] = []
+        cursor = None
+        while True:
+            rows, total = await log_query_service.list_groups(
+                async_session, project_id=proj.id, sort=sort, cursor=cursor, limit=3,
+                total_mode="none",
+            )
+            assert total is None
+            seen.extend(rows)
+            if len(rows) < 3:
+                break
+            cursor = log_query_service.group_cursor(rows[-1], sort)
+        assert len(seen) == 7
+        assert [g.id for g in seen] == [g.id for g in sorted(seen, key=key, reverse=True)]
+
+
+async def test_list_groups_rejects_cursor_from_other_sort(async_session: AsyncSession):
+    proj = await _seed_project(async_session)
+    g = _make_group(proj)
+    async_session.add(g)
+    await async_session.commit()
+
+    cursor = log_query_service.group_cursor(g, "last_seen")
+    with pytest.raises(log_query_service.InvalidCursorError):
+        await log_query_service.list_groups(
+            async_session, project_id=proj.id, sort="event_count", cursor=cursor,
+        )
+    with pytest.raises(log_query_service.InvalidCursorError):
+        await log_query_service.list_groups(
+            async_session, project_id=proj.id, cursor="not-a-cursor",
+        )
+
+
+async def test_list_groups_estimate_total_is_exact_when_small(async_session: AsyncSession):
+    proj = await _seed_project(async_session)
+    for i in range(3):
+        async_session.add(_make_group(proj, fingerprint=f"fp-{i}"))
+    await async_session.commit()
+
+    _, total = await log_query_service.list_groups(
+        async_session, project_id=proj.id, limit=1, total_mode="estimate",
+    )
+    assert total == 3
+    assert not log_query_service.is_estimated_total("estimate", total)
+
+
+async def test_list_groups_estimate_total_uses_planner_above_limit(
+    async_session: AsyncSession, monkeypatch,
+):
+    """bounded count 상한 초과 → EXPLAIN 추정치 (상한 이상) 반환."""
+    monkeypatch.setattr(log_query_service, "COUNT_EXACT_LIMIT", 2)
+    proj = await _seed_project(async_session)
+    for i in range(5):
+        async_session.add(_make_group(proj, fingerprint=f"fp-{i}"))
+    await async_session.commit()
+
+    _, total = await log_query_service.list_groups(
+        async_session, project_id=proj.id, limit=1, total_mode="estimate",
+    )
+    assert total >= 3
+    assert log_query_service.is_estimated_total("estimate", total)
+
+
 # ---- get_group_detail ----
 
 
@@ -130,12 +212,58 @@ def _make_log_event(
     )
 
 
+async def test_group_sparklines_fills_buckets_in_one_query(async_session: AsyncSession):
+    """페이지 fingerprint 들의 시간 bucket 별 count — 빈 bucket 0, 다른 fingerprint / 범위 밖 제외."""
+    proj = await _seed_project(async_session)
+    now = datetime.utcnow().replace(hour=20, minute=30, second=0, microsecond=0)
+    today = now.replace(hour=0, minute=0)
+    async_session.add_all([
+        _make_log_event(proj, fingerprint="fp-a", received_at=today + timedelta(hours=19, minutes=5)),
+        _make_log_event(proj, fingerprint="fp-a", received_at=today + timedelta(hours=19, minutes=50)),
+        _make_log_event(proj, fingerprint="fp-a", received_at=today + timedelta(hours=20, minutes=1)),
+        _make_log_event(proj, fingerprint="fp-b", received_at=today + timedelta(hours=1)),
+        _make_log_event(proj, fingerprint="fp-other", received_at=today + timedelta(hours=20)),
+    ])
+    await async_session.commit()
+
+    start, step, counts = await log_query_service.group_sparklines(
+        async_session, project_id=proj.id, fingerprints=["fp-a", "fp-b", "fp-none"], now=now,
+    )
+
+    assert step == timedelta(hours=1)
+    assert start == today - timedelta(hours=3)  # 마지막 bucket = [20:00, 21:00)
+    assert set(counts) == {"fp-a", "fp-b", "fp-none"}
+    assert all(len(c) == 24 for c in counts.values())
+    assert counts["fp-a"][-2:] == [2, 1] and sum(counts["fp-a"]) == 3
+    assert counts["fp-b"][4] == 1 and sum(counts["fp-b"]) == 1
+    assert counts["fp-none"] == [0] * 24
+
+
+def test_select_fields_validates_and_adds_required():
+    assert log_query_service.split_fields(" level, ,message ") == ["level", "message"]
+    assert log_query_service.select_fields(
+        ["message", "level"], allowed=log_query_service.LOG_FIELDS,
+        default=log_query_service.LOG_LIST_FIELDS, required=("id", "received_at"),
+    ) == ("id", "level", "message", "received_at")
+    assert log_query_service.select_fields(
+        None, allowed=log_query_service.LOG_FIELDS, default=log_query_service.LOG_LIST_FIELDS,
+    ) == log_query_service.LOG_LIST_FIELDS
+    with pytest.raises(log_query_service.InvalidFieldsError):
+        log_query_service.select_fields(["search_tsv"], allowed=log_query_service.LOG_FIELDS, default=())
+
+
+def test_sparkline_window_aligns_to_bucket_boundaries():
+    start, step, buckets = log_query_service.sparkline_window("7d", datetime(2026, 5, 10, 13, 45))
+    assert (step, buckets) == (timedelta(hours=6), 28)
+    assert start + buckets * step == datetime(2026, 5, 10, 18, 0)
+
+
 async def test_get_group_detail_normal_path_with_git_context(async_session: AsyncSession):
     """정상 path — group + recent events + git context (handoff/task/push_event) 채워짐."""
     proj = await _seed_project(async_session)
     sha = "a" * 40
     group = _make_group(proj, fingerprint="fp-1")
-    event = _make_log_event(proj, fingerprint="fp-1", version_sha=sha)
+    event = _make_log_event(proj, fingerprint="fp-1", version_sha=sha, received_at=group.last_seen_at)
     handoff = Handoff(
         project_id=proj.id, branch="main",
         author_git_login="alice", commit_sha=sha,
@@ -225,6 +353,80 @@ async def test_get_group_detail_previous_good_sha_algorithm(async_session: Async
     assert detail["git_context"]["previous_good_sha"] == good_sha
 
 
+async def test_get_group_detail_runs_sequentially_when_sibling_sessions_exhausted(
+    async_session: AsyncSession, monkeypatch,
+):
+    """추가 연결 상한이 차 있으면 같은 연결에서 순차 — 결과는 병렬 경로와 같음."""
+    monkeypatch.setattr(log_query_service, "_SIBLING_SESSIONS", asyncio.Semaphore(0))
+    proj = await _seed_project(async_session)
+    good_sha = "b" * 40
+    async_session.add_all([
+        _make_log_event(
+            proj, fingerprint="fp-other", version_sha=good_sha,
+            environment="production", received_at=datetime(2026, 5, 1, 9, 0),
+        ),
+        _make_log_event(
+            proj, fingerprint="fp-target", version_sha="c" * 40,
+            environment="production", received_at=datetime(2026, 5, 1, 10, 0),
+        ),
+    ])
+    group = _make_group(proj, fingerprint="fp-target")
+    group.first_seen_at = datetime(2026, 5, 1, 10, 0)
+    async_session.add(group)
+    await async_session.commit()
+    await async_session.refresh(group)
+
+    detail = await log_query_service.get_group_detail(
+        async_session, project_id=proj.id, group_id=group.id,
+    )
+    assert detail is not None
+    assert detail["git_context"]["previous_good_sha"] == good_sha
+    assert detail["git_context"]["first_seen"]["git_push_event"] is None
+
+
+async def test_get_group_detail_recent_events_bounded_and_light(async_session: AsyncSession):
+    """recent events — group 의 first_seen_at 이전 event 제외 + 무거운 컬럼 미로딩."""
+    from sqlalchemy import inspect
+
+    proj = await _seed_project(async_session)
+    # 오늘 파티션 안쪽 고정 시각 (now - Δ 는 자정 직후 어제 파티션으로 넘어갈 수 있음)
+    first_seen = datetime.utcnow().replace(hour=0, minute=5, second=0, microsecond=0)
+    group = _make_group(proj, fingerprint="fp-b", last_seen_at=first_seen + timedelta(minutes=1))
+    group.first_seen_at = first_seen
+    before = _make_log_event(proj, fingerprint="fp-b", received_at=first_seen - timedelta(minutes=1))
+    inside = _make_log_event(proj, fingerprint="fp-b", received_at=first_seen + timedelta(minutes=1))
+    inside.stack_trace = "Traceback ..." * 100
+    async_session.add_all([group, before, inside])
+    await async_session.commit()
+    async_session.expunge_all()
+
+    detail = await log_query_service.get_group_detail(
+        async_session, project_id=proj.id, group_id=group.id,
+    )
+    assert [e.id for e in detail["recent_events"]] == [inside.id]
+    unloaded = inspect(detail["recent_events"][0]).unloaded
+    assert {"stack_trace", "stack_frames", "extra"} <= unloaded
+
+
+async def test_get_group_detail_includes_late_processed_out_of_order_event(async_session: AsyncSession):
+    """reaper 가 며칠 전 event 를 늦게 처리해도 상세 recent events 에서 빠지지 않음."""
+    proj = await _seed_project(async_session)
+    recent = _make_log_event(proj, fingerprint="fp-late", received_at=datetime(2026, 5, 4, 10, 0))
+    old = _make_log_event(proj, fingerprint="fp-late", received_at=datetime(2026, 5, 1, 9, 0))
+    async_session.add_all([recent, old])
+    await async_session.flush()
+    for event in (recent, old):  # 처리 순서 = 최신 먼저
+        result = await error_group_service.upsert(
+            async_session, project_id=proj.id, fingerprint="fp-late", event=event,
+        )
+    await async_session.commit()
+
+    detail = await log_query_service.get_group_detail(
+        async_session, project_id=proj.id, group_id=result.group.id,
+    )
+    assert [e.id for e in detail["recent_events"]] == [recent.id, old.id]
+
+
 async def test_get_group_detail_returns_none_for_other_project(async_session: AsyncSession):
     """다른 project 의 group_id → None."""
     proj_a = await _seed_project(async_session)
@@ -286,28 +488,26 @@ async def test_list_logs_filter_by_since(async_session: AsyncSession):
     assert rows[0].fingerprint == "fp-new"
 
 
-async def test_list_logs_q_full_text_filters_to_warning_and_above(
+async def test_list_logs_q_full_text_matches_all_levels(
     async_session: AsyncSession,
 ):
-    """q 풀텍스트 — level >= WARNING 자동 강제 + ILIKE."""
+    """q 풀텍스트 — search_tsv 기반, INFO 포함 모든 level. level 지정 시 AND."""
     proj = await _seed_project(async_session)
 
-    # WARNING + matching message
     e1 = _make_log_event(proj, fingerprint="fp-1")
     e1.level = LogLevel.WARNING
     e1.message = "this is a special_marker thing"
 
-    # ERROR + matching message
     e2 = _make_log_event(proj, fingerprint="fp-2")
     e2.level = LogLevel.ERROR
     e2.message = "another special_marker here"
 
-    # INFO + matching message — should be excluded (level < WARNING)
+    # INFO — 이전 (trgm partial) 경로에선 제외됐지만 이제 포함
     e3 = _make_log_event(proj, fingerprint="fp-3")
     e3.level = LogLevel.INFO
     e3.message = "info with special_marker"
 
-    # WARNING + non-matching — should be excluded (no q match)
+    # q 매칭 X — 제외
     e4 = _make_log_event(proj, fingerprint="fp-4")
     e4.level = LogLevel.WARNING
     e4.message = "completely different"
@@ -318,9 +518,138 @@ async def test_list_logs_q_full_text_filters_to_warning_and_above(
     rows, total = await log_query_service.list_logs(
         async_session, project_id=proj.id, q="special_marker",
     )
-    assert total == 2
-    msgs = {r.message for r in rows}
-    assert msgs == {
+    assert total == 3
+    assert {r.message for r in rows} == {
         "this is a special_marker thing",
         "another special_marker here",
+        "info with special_marker",
     }
+
+    rows, total = await log_query_service.list_logs(
+        async_session, project_id=proj.id, q="special_marker", level=LogLevel.INFO,
+    )
+    assert total == 1 and rows[0].message == "info with special_marker"
+
+
+async def _seed_search_events(db: AsyncSession) -> Project:
+    proj = await _seed_project(db)
+    specs = [
+        ("connection reset by peer", "app.db.pool", "web-1"),
+        ("reset connection pool", "app.db.pool", "web-2"),
+        ("timeout while connecting", "app.http", "web-1"),
+        ("payment declined for order", "app.billing", "worker-1"),
+        ("user 42 logged in", "app.auth", "web-1"),
+    ]
+    for i, (message, logger_name, host) in enumerate(specs):
+        event = _make_log_event(proj, fingerprint=f"fp-s{i}")
+        event.message = message
+        event.logger_name = logger_name
+        event.hostname = host
+        db.add(event)
+    await db.commit()
+    return proj
+
+
+async def _search(db: AsyncSession, proj: Project, q: str) -> set[str]:
+    rows, _ = await log_query_service.list_logs(db, project_id=proj.id, q=q)
+    return {r.message for r in rows}
+
+
+async def test_list_logs_search_phrase_prefix_or_not(async_session: AsyncSession):
+    proj = await _seed_search_events(async_session)
+
+    assert await _search(async_session, proj, '"connection reset"') == {"connection reset by peer"}
+    assert await _search(async_session, proj, "connect*") == {
+        "connection reset by peer", "reset connection pool", "timeout while connecting",
+    }
+    assert await _search(async_session, proj, "payment OR timeout") == {
+        "payment declined for order", "timeout while connecting",
+    }
+    assert await _search(async_session, proj, "reset -peer") == {"reset connection pool"}
+
+
+async def test_list_logs_search_field_filters_and_substring(async_session: AsyncSession):
+    proj = await _seed_search_events(async_session)
+
+    assert await _search(async_session, proj, "logger:app.db* reset host:web-2") == {
+        "reset connection pool",
+    }
+    assert await _search(async_session, proj, "-logger:app.db.pool connect*") == {
+        "timeout while connecting",
+    }
+    # tsvector 로는 단어 중간이 안 잡힘 — *substr* 는 trigram ILIKE
+    assert await _search(async_session, proj, "*ecline*") == {"payment declined for order"}
+
+
+async def test_list_logs_relevance_sort_and_cursor(async_session: AsyncSession):
+    """relevance — message(A) 매칭이 exception_message(B) 매칭보다 앞. cursor 로 끝까지 순회."""
+    proj = await _seed_project(async_session)
+    in_exception = _make_log_event(proj, fingerprint="fp-r0")
+    in_exception.message = "unrelated text"
+    in_exception.exception_message = "widget missing"
+    in_message = _make_log_event(proj, fingerprint="fp-r1")
+    in_message.message = "widget exploded"
+    in_message.logger_name = "app.core"
+    others = []
+    for i in range(3):
+        e = _make_log_event(proj, fingerprint=f"fp-r{i + 2}")
+        e.message = f"widget {i}"
+        others.append(e)
+    async_session.add_all([in_exception, in_message, *others])
+    await async_session.commit()
+
+    rows, _ = await log_query_service.list_logs(
+        async_session, project_id=proj.id, q="widget", limit=10,
+    )
+    assert len(rows) == 5
+    assert rows[-1].id == in_exception.id
+    assert rows[0].search_rank > rows[-1].search_rank
+
+    seen = []
+    cursor = None
+    while True:
+        page, _ = await log_query_service.list_logs(
+            async_session, project_id=proj.id, q="widget", limit=2, cursor=cursor,
+            total_mode="none",
+        )
+        seen.extend(r.id for r in page)
+        if len(page) < 2:
+            break
+        cursor = log_query_service.log_cursor(page[-1], "relevance")
+    assert seen == [r.id for r in rows]
+
+
+async def test_list_logs_unknown_level_in_query_raises(async_session: AsyncSession):
+    from app.services.log_search_service import InvalidSearchQueryError
+
+    proj = await _seed_project(async_session)
+    with pytest.raises(InvalidSearchQueryError):
+        await log_query_service.list_logs(async_session, project_id=proj.id, q="level:loud")
+
+
+async def test_list_logs_cursor_pagination(async_session: AsyncSession):
+    """(received_at, id) cursor — 같은 received_at 동률도 id 로 안정 순회."""
+    from datetime import timedelta
+
+    proj = await _seed_project(async_session)
+    base = datetime.utcnow() - timedelta(hours=1)
+    events = [
+        _make_log_event(proj, fingerprint=f"fp-{i}", received_at=base + timedelta(seconds=i // 2))
+        for i in range(9)
+    ]
+    async_session.add_all(events)
+    await async_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        rows, _ = await log_query_service.list_logs(
+            async_session, project_id=proj.id, cursor=cursor, limit=4, total_mode="none",
+        )
+        seen.extend(rows)
+        if len(rows) < 4:
+            break
+        cursor = log_query_service.log_cursor(rows[-1])
+    assert len({e.id for e in seen}) == 9
+    keys = [(e.received_at, e.id) for e in seen]
+    assert keys == sorted(keys, reverse=True)
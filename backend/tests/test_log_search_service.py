@@ -0,0 +1,76 @@
+"""log_search_service — q 문법 → SQL 조건 (DB 불필요, postgresql dialect 컴파일)."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.log_event import LogLevel
+from app.services.log_search_service import InvalidSearchQueryError, extra_condition, parse_query
+
+
+def _compile(q: str) -> tuple[str, list]:
+    """(SQL, bind 값 순서대로). REGCONFIG 는 literal 렌더 불가라 params 로 확인."""
+    compiled = parse_query(q).where_clause().compile(dialect=postgresql.dialect())
+    return str(compiled), list(compiled.params.values())
+
+
+def test_words_are_anded_tsquery_matches():
+    sql, params = _compile("timeout payment")
+    assert sql.count("log_events.search_tsv @@ plainto_tsquery(") == 2
+    assert ") AND (" in sql
+    assert params == ["simple", "timeout", "simple", "payment"]
+
+
+def test_phrase_and_prefix():
+    sql, params = _compile('"connection reset" conn*')
+    assert "phraseto_tsquery(" in sql
+    assert "to_tsquery(%(to_tsquery_1)s, quote_literal(%(quote_literal_1)s) || " in sql
+    assert "connection reset" in params and "conn" in params and ":*" in params
+
+
+def test_or_binds_looser_than_and_and_not_negates():
+    sql, params = _compile("a b OR c -d")
+    # (a AND b) OR (c AND NOT d) — SQL 에서 AND 가 OR 보다 강하게 결합
+    assert sql.count(" AND ") == 2 and sql.count(" OR ") == 1
+    assert sql.index(" OR ") < sql.index("NOT (log_events.search_tsv @@")
+    assert params[1::2] == ["a", "b", "c", "d"]
+
+
+def test_field_filters_and_substring():
+    sql, params = _compile("logger:app.db* host:web-1 level:error *ecline*")
+    assert "log_events.logger_name LIKE " in sql
+    assert "log_events.hostname = " in sql
+    assert "log_events.message ILIKE " in sql
+    assert params == ["app.db%", "web-1", LogLevel.ERROR, "%ecline%"]
+
+
+def test_rank_tsquery_only_from_positive_text_terms():
+    assert parse_query("logger:x -y *sub*").tsquery is None
+    assert parse_query("a -b").tsquery is not None
+
+
+def test_empty_query_has_no_conditions():
+    assert parse_query('   "" * ').conditions == []
+
+
+def test_unknown_level_raises():
+    with pytest.raises(InvalidSearchQueryError):
+        parse_query("level:loud")
+
+
+def test_extra_condition_builds_jsonpath_equality():
+    compiled = extra_condition("user.plan", "pro").compile(dialect=postgresql.dialect())
+    assert "log_events.extra @@ CAST(" in str(compiled) and "AS JSONPATH)" in str(compiled)
+    assert list(compiled.params.values()) == ['$."user"."plan" == "pro"']
+
+
+def test_extra_condition_matches_scalar_and_string_forms():
+    compiled = extra_condition("attempt", "3").compile(dialect=postgresql.dialect())
+    assert list(compiled.params.values()) == ['$."attempt" == "3" || $."attempt" == 3']
+    compiled = extra_condition("k", 'a"b').compile(dialect=postgresql.dialect())
+    assert list(compiled.params.values()) == ['$."k" == "a\\"b"']
+
+
+@pytest.mark.parametrize("path", ["", "a..b", ".a", "a b"])
+def test_extra_condition_rejects_bad_paths(path):
+    with pytest.raises(InvalidSearchQueryError):
+        extra_condition(path, "x")
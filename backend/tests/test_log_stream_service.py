@@ -0,0 +1,178 @@
+"""log_stream_service — NOTIFY payload 인코딩 / 서버 측 필터 / fan-out / bounded buffer.
+
+LISTEN 연결은 fake 로 대체 (DB 불필요).
+"""
+
+import asyncio
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from app.models.log_event import LogEvent, LogLevel
+from app.services import log_stream_service
+from app.services.log_stream_service import (
+    NOTIFY_PAYLOAD_LIMIT,
+    LogStreamHub,
+    StreamFilter,
+    encode_notifications,
+    sse_stream,
+)
+
+
+def _event(project_id, **overrides) -> LogEvent:
+    now = datetime(2026, 5, 1, 12, 0, 0)
+    fields = dict(
+        id=uuid.uuid4(), project_id=project_id, level=LogLevel.ERROR,
+        message="db timeout", logger_name="app.db", version_sha="a" * 40,
+        environment="production", hostname="web-1",
+        emitted_at=now, received_at=now,
+    )
+    fields.update(overrides)
+    return LogEvent(**fields)
+
+
+def _summary(**overrides) -> dict:
+    item = {
+        "id": str(uuid.uuid4()), "level": "error", "message": "db timeout",
+        "logger_name": "app.db", "exception_class": None, "exception_message": None,
+    }
+    item.update(overrides)
+    return item
+
+
+def _payload(project_id, *events) -> str:
+    return json.dumps({"p": str(project_id), "e": list(events)})
+
+
+class _FakeConn:
+    def __init__(self):
+        self.listeners = {}
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def is_closed(self):
+        return False
+
+
+def _hub(**kwargs) -> tuple[LogStreamHub, list[_FakeConn]]:
+    conns: list[_FakeConn] = []
+
+    @asynccontextmanager
+    async def connect():
+        conn = _FakeConn()
+        conns.append(conn)
+        yield conn
+
+    return LogStreamHub(connect=connect, **kwargs), conns
+
+
+def test_encode_notifications_splits_under_payload_limit():
+    project_id = uuid.uuid4()
+    events = [_event(project_id, message="x" * 2000) for _ in range(20)]
+
+    payloads = encode_notifications(project_id, events)
+
+    assert len(payloads) > 1
+    assert all(len(p.encode()) <= NOTIFY_PAYLOAD_LIMIT for p in payloads)
+    decoded = [e for p in payloads for e in json.loads(p)["e"]]
+    assert [e["id"] for e in decoded] == [str(e.id) for e in events]
+    # 미리보기로 잘림
+    assert len(decoded[0]["message"]) == log_stream_service.MESSAGE_PREVIEW_CHARS + 1
+    assert decoded[0]["level"] == "error"
+
+
+def test_stream_filter_level_logger_prefix_and_terms():
+    f = StreamFilter(level=LogLevel.ERROR, logger="app.db", q="DB  timeout")
+    assert f.matches(_summary())
+    assert f.matches(_summary(logger_name="app.db.pool"))
+    assert not f.matches(_summary(logger_name="app.dbx"))
+    assert not f.matches(_summary(level="warning"))
+    assert not f.matches(_summary(message="db ok"))
+    assert f.matches(_summary(message="failed", exception_message="DB Timeout after 5s"))
+    assert StreamFilter().matches(_summary(level="debug", logger_name="other"))
+
+
+async def test_dispatch_fans_out_to_matching_project_subscribers():
+    hub, conns = _hub()
+    project_id, other_project = uuid.uuid4(), uuid.uuid4()
+
+    async with hub.subscribe(project_id, StreamFilter()) as all_levels, \
+            hub.subscribe(project_id, StreamFilter(level=LogLevel.CRITICAL)) as critical_only, \
+            hub.subscribe(other_project, StreamFilter()) as other:
+        await asyncio.sleep(0)
+        assert len(conns) == 1  # 구독자 수와 무관하게 LISTEN 연결 1개
+
+        notify = conns[0].listeners[log_stream_service.CHANNEL]
+        notify(None, 1, log_stream_service.CHANNEL, _payload(
+            project_id, _summary(), _summary(level="critical"),
+        ))
+
+        assert all_levels.queue.qsize() == 2
+        assert critical_only.queue.qsize() == 1
+        assert other.queue.qsize() == 0
+        assert hub.delivered == 3
+
+    assert hub.subscriber_count == 0
+    assert hub._listen_task is None
+
+
+async def test_slow_subscriber_drops_newest_and_reports_count():
+    hub, _ = _hub(buffer_size=2)
+    project_id = uuid.uuid4()
+
+    async with hub.subscribe(project_id, StreamFilter()) as sub:
+        hub.dispatch(_payload(project_id, *[_summary(message=f"m{i}") for i in range(5)]))
+
+        assert sub.queue.qsize() == 2
+        assert sub.dropped == 3
+        assert hub.dropped == 3
+        assert sub.take_dropped() == 3
+        assert sub.take_dropped() == 0
+        assert [sub.queue.get_nowait()["message"] for _ in range(2)] == ["m0", "m1"]
+
+
+async def test_subscribe_rejects_over_capacity():
+    hub, _ = _hub(max_subscribers=1)
+    project_id = uuid.uuid4()
+
+    async with hub.subscribe(project_id, StreamFilter()):
+        assert hub.has_capacity() is False
+        try:
+            async with hub.subscribe(project_id, StreamFilter()):
+                raise AssertionError("second subscriber must be rejected")
+        except log_stream_service.StreamUnavailableError:
+            pass
+
+
+async def test_malformed_notification_is_ignored():
+    hub, _ = _hub()
+    project_id = uuid.uuid4()
+    async with hub.subscribe(project_id, StreamFilter()) as sub:
+        hub.dispatch("not json")
+        hub.dispatch(json.dumps({"e": []}))
+        assert sub.queue.qsize() == 0
+
+
+async def test_sse_stream_emits_log_dropped_and_heartbeat():
+    hub, _ = _hub(buffer_size=1)
+    project_id = uuid.uuid4()
+    stream = sse_stream(hub, project_id, StreamFilter(), heartbeat_seconds=0.01)
+
+    assert await stream.__anext__() == f"retry: {log_stream_service.RETRY_MS}\n\n"
+    assert await stream.__anext__() == ": ping\n\n"
+
+    first, second = _summary(message="kept"), _summary(message="lost")
+    hub.dispatch(_payload(project_id, first, second))
+
+    dropped = await stream.__anext__()
+    assert dropped.startswith("event: dropped\n")
+    assert json.loads(dropped.split("data: ", 1)[1]) == {"count": 1, "total": 1}
+
+    log = await stream.__anext__()
+    assert log.startswith(f"id: {first['id']}\nevent: log\n")
+    assert json.loads(log.split("data: ", 1)[1])["message"] == "kept"
+
+    await stream.aclose()
+    assert hub.subscriber_count == 0
@@ -0,0 +1,136 @@
+"""metrics registry — Prometheus text format / label 검증 / 파일 기반 멀티프로세스 합산 / /metrics endpoint."""
+
+import uuid
+
+import httpx
+import pytest
+
+from app.core.metrics import Counter, Gauge, Histogram, MultiprocessStore, Registry, render
+from app.services import log_ingest_service, sync_service
+
+
+def test_render_counter_gauge_histogram():
+    registry = Registry()
+    requests = Counter("t_requests_total", "Requests", ["outcome"], registry=registry)
+    backlog = Gauge("t_backlog", "Backlog", registry=registry)
+    latency = Histogram("t_seconds", "Latency", buckets=(0.1, 1), registry=registry)
+
+    requests.labels(outcome="ok").inc()
+    requests.labels(outcome="ok").inc(2)
+    requests.labels(outcome='bad "x"').inc()
+    backlog.set(7)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(3)
+
+    assert render(registry.collect()) == (
+        "# HELP t_requests_total Requests\n"
+        "# TYPE t_requests_total counter\n"
+        't_requests_total{outcome="ok"} 3\n'
+        't_requests_total{outcome="bad \\"x\\""} 1\n'
+        "# HELP t_backlog Backlog\n"
+        "# TYPE t_backlog gauge\n"
+        "t_backlog 7\n"
+        "# HELP t_seconds Latency\n"
+        "# TYPE t_seconds histogram\n"
+        't_seconds_bucket{le="0.1"} 1\n'
+        't_seconds_bucket{le="1"} 2\n'
+        't_seconds_bucket{le="+Inf"} 3\n'
+        "t_seconds_sum 3.55\n"
+        "t_seconds_count 3\n"
+    )
+
+
+def test_labels_are_validated():
+    registry = Registry()
+    counter = Counter("t_total", "x", ["kind"], registry=registry)
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        counter.labels(other="a")
+    with pytest.raises(ValueError):
+        counter.labels(kind="a").inc(-1)
+    with pytest.raises(ValueError):
+        Counter("t_total", "dup", registry=registry)
+
+
+def _worker_registry(events: int, backlog: int, in_use: int) -> Registry:
+    registry = Registry()
+    Counter("t_events_total", "Events", registry=registry).inc(events)
+    Gauge("t_backlog", "Backlog", multiprocess_mode="max", registry=registry).set(backlog)
+    Gauge("t_in_use", "In use", registry=registry).set(in_use)
+    Histogram("t_seconds", "Latency", buckets=(1,), registry=registry).observe(0.5)
+    return registry
+
+
+def test_multiprocess_merge_sums_counters_and_aggregates_live_gauges(tmp_path):
+    MultiprocessStore(tmp_path, pid=101).write(_worker_registry(events=3, backlog=10, in_use=2))
+    MultiprocessStore(tmp_path, pid=102).write(_worker_registry(events=4, backlog=12, in_use=1))
+    MultiprocessStore(tmp_path, pid=103).write(_worker_registry(events=5, backlog=99, in_use=9))
+
+    # pid 103 은 종료 — counter / histogram 은 유지, gauge 는 제외
+    store = MultiprocessStore(tmp_path, pid=101)
+    families = {f.name: f for f in store.merge(is_alive=lambda pid: pid != 103)}
+
+    def value(name, suffix="", **labels):
+        return next(
+            s.value for s in families[name].samples if s.suffix == suffix and s.labels == labels
+        )
+
+    assert value("t_events_total") == 12
+    assert value("t_backlog") == 12  # max
+    assert value("t_in_use") == 3  # sum
+    assert value("t_seconds", "_count") == 3
+    assert value("t_seconds", "_bucket", le="1") == 3
+
+
+async def test_counted_fetch_records_result_kinds():
+    async def fetch_file(repo, pat, sha, path):
+        return None if path == "missing" else "content"
+
+    async def broken(*args):
+        raise RuntimeError("boom")
+
+    counted = sync_service._counted_fetch(fetch_file, "file")
+    not_found = sync_service.SYNC_FETCHES.labels(kind="file", result="not_found")
+    ok = sync_service.SYNC_FETCHES.labels(kind="file", result="ok")
+    error = sync_service.SYNC_FETCHES.labels(kind="compare", result="error")
+    before = (not_found.value, ok.value, error.value)
+
+    assert await counted("r", None, "sha", "PLAN.md") == "content"
+    assert await counted("r", None, "sha", "missing") is None
+    with pytest.raises(RuntimeError):
+        await sync_service._counted_fetch(broken, "compare")("r", None, "a", "b")
+
+    assert (not_found.value, ok.value, error.value) == (before[0] + 1, before[1] + 1, before[2] + 1)
+
+
+async def test_metrics_endpoint_exposes_ingest_rejections_and_checks_access(monkeypatch):
+    from app.main import app
+
+    rejected = log_ingest_service.INGEST_REJECTED.labels(reason="version_sha")
+    before = rejected.value
+    log_ingest_service.validate_event(
+        {"level": "error", "message": "x", "logger_name": "a", "version_sha": "nope",
+         "environment": "production", "hostname": "h", "emitted_at": "2026-05-01T00:00:00Z"},
+        0, uuid.uuid4(),
+    )
+    assert rejected.value == before + 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        monkeypatch.setattr("app.main.settings.metrics_token", None)
+        monkeypatch.setattr("app.main.settings.metrics_public", False)
+        assert (await client.get("/metrics")).status_code == 404  # 기본 꺼짐 (fail closed)
+
+        monkeypatch.setattr("app.main.settings.metrics_public", True)
+        res = await client.get("/metrics")
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert f'forps_ingest_rejected_events_total{{reason="version_sha"}} {before + 1:g}' in res.text
+        assert "# TYPE forps_db_pool_checkout_wait_seconds histogram" in res.text
+
+        monkeypatch.setattr("app.main.settings.metrics_token", "s3cret")
+        assert (await client.get("/metrics")).status_code == 401
+        authed = await client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+        assert authed.status_code == 200
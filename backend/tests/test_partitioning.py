@@ -52,3 +52,57 @@ def test_pg_trgm_extension_enabled(upgraded_db):
         assert row is not None, "pg_trgm extension 미활성"
     finally:
         conn.close()
+
+
+async def test_ensure_partitions_creates_missing_future_days(async_session):
+    """31일 pre-create 범위 밖 (60일 후) 도 days_ahead 까지 채우고, 재실행은 no-op."""
+    from datetime import date, timedelta
+
+    from app.services.log_partition_service import ensure_partitions, partition_name
+
+    start = date.today() + timedelta(days=60)
+    created = await ensure_partitions(async_session, days_ahead=2, today=start)
+    assert created == 3
+    assert await ensure_partitions(async_session, days_ahead=2, today=start) == 0
+
+    from sqlalchemy import text
+    exists = (await async_session.execute(
+        text("SELECT to_regclass(:n) IS NOT NULL"),
+        {"n": partition_name(start + timedelta(days=2))},
+    )).scalar_one()
+    assert exists
+
+
+async def test_maintain_extra_indexes_keeps_gin_on_recent_partitions_only(async_session):
+    """최근 keep_days 이후 파티션엔 extra GIN 생성, 그 이전 파티션에선 삭제. 재실행 no-op."""
+    from datetime import date, timedelta
+
+    from sqlalchemy import text
+
+    from app.services.log_partition_service import (
+        ensure_partitions,
+        extra_index_name,
+        maintain_extra_indexes,
+    )
+
+    old_day = date.today() - timedelta(days=30)
+    await ensure_partitions(async_session, days_ahead=0, today=old_day)
+    await async_session.execute(text(
+        f"CREATE INDEX {extra_index_name(old_day)} "
+        f"ON log_events_{old_day:%Y%m%d} USING gin (extra jsonb_path_ops)"
+    ))
+    await async_session.commit()
+    future_day = date.today() + timedelta(days=60)
+    await ensure_partitions(async_session, days_ahead=0, today=future_day)
+
+    assert await maintain_extra_indexes(async_session, keep_days=7) >= 2
+    assert await maintain_extra_indexes(async_session, keep_days=7) == 0
+
+    async def indexed(day: date) -> bool:
+        return (await async_session.execute(
+            text("SELECT to_regclass(:n) IS NOT NULL"), {"n": extra_index_name(day)},
+        )).scalar_one()
+
+    assert await indexed(future_day)
+    assert await indexed(date.today())
+    assert not await indexed(old_day)
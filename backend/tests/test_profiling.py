@@ -0,0 +1,145 @@
+"""on-demand profiling — 서명 헤더 검증 / mode 별 결과 저장 / OWNER flag / 꺼져 있을 때 무영향."""
+
+import pstats
+import time
+import tracemalloc
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+
+from app.core import profiling
+from app.core.profiling import ProfilingMiddleware, sign, verify
+
+SECRET = "profile-secret"
+
+
+def test_sign_and_verify():
+    now = 1_800_000_000.0
+    header = sign(SECRET, "cprofile", ttl_seconds=60, now=now)
+
+    assert verify(SECRET, header, now=now + 59) == "cprofile"
+    assert verify(SECRET, header, now=now + 61) is None  # 만료
+    assert verify("other-secret", header, now=now) is None
+    assert verify(SECRET, header.replace("cprofile", "memory", 1), now=now) is None  # mode 변조
+    assert verify(SECRET, "cprofile:abc:def", now=now) is None
+    assert verify(SECRET, "nonsense", now=now) is None
+
+
+def _app(tmp_path, *, owner: bool = False) -> FastAPI:
+    app = FastAPI()
+
+    async def owner_check(scope):
+        return owner
+
+    app.add_middleware(ProfilingMiddleware, secret=SECRET, directory=tmp_path, owner_check=owner_check)
+
+    @app.get("/api/v1/projects/{project_id}/errors/{error_id}")
+    async def slow(project_id: str, error_id: str):
+        deadline = time.perf_counter() + 0.03
+        chunks = []
+        while time.perf_counter() < deadline:
+            chunks.append("x" * 1024)
+        return {"chunks": len(chunks)}
+
+    @app.get("/api/v1/projects/{project_id}/export")
+    async def export(project_id: str, size: int = 1024):
+        async def body():
+            for _ in range(4):
+                yield b"x" * size
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    @app.get("/api/v1/projects/{project_id}/blob")
+    async def blob(project_id: str):
+        return Response(b"x" * (profiling.MAX_BUFFER_BYTES + 1), media_type="application/octet-stream")
+
+    return app
+
+
+async def _get(app: FastAPI, url: str, headers: dict | None = None) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(url, headers=headers)
+
+
+URL = "/api/v1/projects/00000000-0000-0000-0000-000000000001/errors/e1"
+
+
+async def test_unflagged_request_is_not_profiled(tmp_path):
+    res = await _get(_app(tmp_path), URL)
+    assert res.status_code == 200
+    assert profiling.PROFILE_ID_HEADER not in res.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_invalid_signature_is_ignored(tmp_path):
+    res = await _get(_app(tmp_path), URL, {profiling.PROFILE_HEADER: "cprofile:1:bad"})
+    assert res.status_code == 200
+    assert profiling.PROFILE_ID_HEADER not in res.headers
+
+
+async def test_cprofile_mode_attaches_summary_and_stores_stats(tmp_path):
+    res = await _get(_app(tmp_path), URL, {profiling.PROFILE_HEADER: sign(SECRET, "cprofile")})
+
+    assert res.status_code == 200
+    assert res.json()["chunks"] > 0
+    assert res.headers[profiling.PROFILE_SUMMARY_HEADER].startswith("wall_ms=")
+    assert "slow(" in res.headers[profiling.PROFILE_SUMMARY_HEADER]
+    path = profiling.profile_path(tmp_path, res.headers[profiling.PROFILE_ID_HEADER])
+    assert path is not None and path.suffix == ".prof"
+    assert any(name == "slow" for _file, _line, name in pstats.Stats(str(path)).stats)
+
+
+async def test_sample_mode_writes_collapsed_stacks(tmp_path):
+    res = await _get(_app(tmp_path), URL, {profiling.PROFILE_HEADER: sign(SECRET, "sample")})
+
+    path = profiling.profile_path(tmp_path, res.headers[profiling.PROFILE_ID_HEADER])
+    assert path.suffix == ".collapsed"
+    lines = path.read_text().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("slow (" in line for line in lines)
+
+
+async def test_memory_mode_stores_tracemalloc_snapshot(tmp_path):
+    res = await _get(_app(tmp_path), URL, {profiling.PROFILE_HEADER: sign(SECRET, "memory")})
+
+    assert res.headers[profiling.PROFILE_SUMMARY_HEADER].startswith("peak_kib=")
+    path = profiling.profile_path(tmp_path, res.headers[profiling.PROFILE_ID_HEADER])
+    assert tracemalloc.Snapshot.load(str(path)).traces
+    assert not tracemalloc.is_tracing()  # 시작한 쪽이 정리
+
+
+async def test_owner_query_flag(tmp_path):
+    denied = await _get(_app(tmp_path, owner=False), URL + "?profile=cprofile")
+    assert profiling.PROFILE_ID_HEADER not in denied.headers
+
+    allowed = await _get(_app(tmp_path, owner=True), URL + "?profile=cprofile")
+    assert allowed.status_code == 200
+    assert profiling.PROFILE_ID_HEADER in allowed.headers
+
+
+def test_profile_path_rejects_traversal_and_prunes(tmp_path):
+    assert profiling.profile_path(tmp_path, "../../etc/passwd") is None
+    for i in range(4):
+        (tmp_path / f"20260101T00000{i}-0000000{i}.prof").write_bytes(b"")
+    profiling._prune(tmp_path, keep=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "20260101T000002-00000002.prof", "20260101T000003-00000003.prof",
+    ]
+
+
+async def test_streaming_and_oversized_responses_pass_through(tmp_path):
+    """streaming 응답 / buffer 상한 초과 응답은 통과 — 요약 헤더 대신 'streamed', profile 은 저장."""
+    project = "/api/v1/projects/00000000-0000-0000-0000-000000000001"
+    app = _app(tmp_path, owner=True)
+
+    streamed = await _get(app, project + "/export?profile=cprofile")
+    assert streamed.status_code == 200 and len(streamed.content) == 4 * 1024
+    assert streamed.headers[profiling.PROFILE_SUMMARY_HEADER] == "streamed"
+    assert profiling.PROFILE_ID_HEADER not in streamed.headers
+
+    big = await _get(app, project + "/blob?profile=cprofile")
+    assert len(big.content) == profiling.MAX_BUFFER_BYTES + 1
+    assert big.headers[profiling.PROFILE_SUMMARY_HEADER] == "streamed"
+    assert len(list(tmp_path.iterdir())) == 2
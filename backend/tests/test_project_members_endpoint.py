@@ -0,0 +1,182 @@
+"""프로젝트 멤버 endpoint + 인증 context — user / role 1쿼리 조회, role cache 무효화."""
+
+import uuid
+
+import pytest
+from cryptography.fernet import Fernet
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectMember
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceRole
+from app.services.permission_service import RoleCache
+
+
+@pytest.fixture
+async def client_with_db(async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FORPS_FERNET_KEY", Fernet.generate_key().decode())
+    import importlib
+    import app.config
+    importlib.reload(app.config)
+    import app.core.crypto
+    importlib.reload(app.core.crypto)
+
+    from app.main import app
+    from app.database import get_db
+
+    async def override_get_db():
+        yield async_session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+    app.dependency_overrides.clear()
+
+
+async def _seed_user(db: AsyncSession) -> User:
+    user = User(
+        email=f"u-{uuid.uuid4().hex[:8]}@example.com",
+        name="alice", password_hash="x",
+    )
+    db.add(user)
+    await db.flush()
+    return user
+
+
+async def _seed_user_project(
+    db: AsyncSession, role: WorkspaceRole = WorkspaceRole.OWNER,
+) -> tuple[User, Project]:
+    user = await _seed_user(db)
+    ws = Workspace(name="ws", slug=f"ws-{uuid.uuid4().hex[:8]}")
+    db.add(ws)
+    await db.flush()
+    proj = Project(workspace_id=ws.id, name="p")
+    db.add(proj)
+    await db.flush()
+    db.add(ProjectMember(project_id=proj.id, user_id=user.id, role=role))
+    await db.commit()
+    await db.refresh(user)
+    await db.refresh(proj)
+    return user, proj
+
+
+def _auth(user: User) -> dict[str, str]:
+    from app.services.auth_service import create_access_token
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+def test_role_cache_ttl_and_invalidation():
+    now = [0.0]
+    cache = RoleCache(30, clock=lambda: now[0])
+    u1, u2, p1, p2 = (uuid.uuid4() for _ in range(4))
+
+    cache.set(u1, p1, WorkspaceRole.OWNER, epoch=cache.epoch)
+    cache.set(u2, p1, WorkspaceRole.EDITOR, epoch=cache.epoch)
+    cache.set(u1, p2, WorkspaceRole.VIEWER, epoch=cache.epoch)
+    assert cache.get(u1, p1) == WorkspaceRole.OWNER
+
+    cache.invalidate(u1, p1)
+    assert cache.get(u1, p1) is None
+    cache.invalidate_project(p1)
+    assert cache.get(u2, p1) is None
+    assert cache.get(u1, p2) == WorkspaceRole.VIEWER
+
+    now[0] = 30.0
+    assert cache.get(u1, p2) is None  # 만료
+
+    disabled = RoleCache(0)
+    disabled.set(u1, p1, WorkspaceRole.OWNER, epoch=disabled.epoch)
+    assert disabled.get(u1, p1) is None
+
+
+def test_role_cache_drops_role_read_before_invalidation():
+    cache = RoleCache(30)
+    u1, p1 = uuid.uuid4(), uuid.uuid4()
+
+    epoch = cache.epoch  # 요청 A: 이전 role SELECT 시작
+    cache.invalidate(u1, p1)  # 요청 B: role 변경 commit 후 무효화
+    cache.set(u1, p1, WorkspaceRole.OWNER, epoch=epoch)  # A 가 이전 role 을 뒤늦게 set
+    assert cache.get(u1, p1) is None
+
+    cache.set(u1, p1, WorkspaceRole.VIEWER, epoch=cache.epoch)
+    assert cache.get(u1, p1) == WorkspaceRole.VIEWER
+
+
+async def test_members_list_loads_user_and_role_in_one_query(
+    client_with_db, async_session: AsyncSession, query_budget,
+):
+    owner, proj = await _seed_user_project(async_session)
+
+    # auth (user + role LEFT JOIN) 1 + members 1 + member.user selectin 1
+    with query_budget(3) as first:
+        res = await client_with_db.get(f"/api/v1/projects/{proj.id}/members", headers=_auth(owner))
+    assert res.status_code == 200
+    assert sum(1 for shape in first.shapes if "LEFT OUTER JOIN project_members" in shape) == 1
+
+    # 두 번째 — role 은 cache, user 만 조회
+    with query_budget(3) as second:
+        res = await client_with_db.get(f"/api/v1/projects/{proj.id}/members", headers=_auth(owner))
+    assert res.status_code == 200
+    assert not any("LEFT OUTER JOIN project_members" in shape for shape in second.shapes)
+
+
+async def test_role_change_and_removal_invalidate_cached_role(
+    client_with_db, async_session: AsyncSession,
+):
+    owner, proj = await _seed_user_project(async_session)
+    member = await _seed_user(async_session)
+    await async_session.commit()
+
+    res = await client_with_db.post(
+        f"/api/v1/projects/{proj.id}/members",
+        json={"email": member.email, "role": "editor"}, headers=_auth(owner),
+    )
+    assert res.status_code == 201
+
+    res = await client_with_db.get(f"/api/v1/projects/{proj.id}", headers=_auth(member))
+    assert res.json()["my_role"] == "editor"  # cache 에 editor
+
+    res = await client_with_db.patch(
+        f"/api/v1/projects/{proj.id}/members/{member.id}",
+        json={"role": "viewer"}, headers=_auth(owner),
+    )
+    assert res.status_code == 200
+    res = await client_with_db.get(f"/api/v1/projects/{proj.id}", headers=_auth(member))
+    assert res.json()["my_role"] == "viewer"
+
+    res = await client_with_db.delete(
+        f"/api/v1/projects/{proj.id}/members/{member.id}", headers=_auth(owner),
+    )
+    assert res.status_code == 204
+    res = await client_with_db.get(f"/api/v1/projects/{proj.id}/members", headers=_auth(member))
+    assert res.status_code == 403
+
+
+async def test_privileged_checks_ignore_cached_role(client_with_db, async_session: AsyncSession):
+    owner, proj = await _seed_user_project(async_session)
+    other = await _seed_user(async_session)
+    async_session.add(ProjectMember(project_id=proj.id, user_id=other.id, role=WorkspaceRole.VIEWER))
+    await async_session.commit()
+
+    res = await client_with_db.get(f"/api/v1/projects/{proj.id}/members", headers=_auth(owner))
+    assert res.status_code == 200  # cache 에 OWNER
+
+    # 다른 워커에서 강등 — 이 워커 cache 는 무효화되지 않음
+    await async_session.execute(
+        update(ProjectMember)
+        .where(ProjectMember.project_id == proj.id, ProjectMember.user_id == owner.id)
+        .values(role=WorkspaceRole.VIEWER)
+    )
+    await async_session.commit()
+
+    res = await client_with_db.get(f"/api/v1/projects/{proj.id}/members", headers=_auth(owner))
+    assert res.status_code == 200  # 읽기 VIEWER 확인은 TTL 동안 cache
+    res = await client_with_db.delete(
+        f"/api/v1/projects/{proj.id}/members/{other.id}", headers=_auth(owner),
+    )
+    assert res.status_code == 403
@@ -1,4 +1,4 @@
-"""project_service 회귀 — Phase 6 의 URL 변경 시 자동 reset.
+"""project_service 회귀 — Phase 6 의 URL 변경 시 자동 reset, 프로젝트 목록 쿼리 수.
 
 설계서: 2026-05-01-phase-6-discord-notifications-design.md §3.7
 """
@@ -9,10 +9,12 @@ from datetime import datetime
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.project import Project
-from app.models.workspace import Workspace
+from app.models.project import Project, ProjectMember
+from app.models.task import Task
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceRole
 from app.schemas.project import ProjectUpdate
-from app.services import project_service
+from app.services import project_service, task_stats_service
 
 
 async def test_update_project_resets_discord_counter_when_url_changes(
@@ -40,3 +42,62 @@ async def test_update_project_resets_discord_counter_when_url_changes(
     assert updated.discord_webhook_url == "https://discord.com/api/webhooks/1/new"
     assert updated.discord_consecutive_failures == 0
     assert updated.discord_disabled_at is None
+
+
+async def _seed_memberships(db: AsyncSession, n_projects: int) -> tuple[User, Workspace, list[Project]]:
+    """user 가 n_projects 개 프로젝트 멤버 (i 번째 프로젝트에 task i 개) + 남의 프로젝트 1개."""
+    user = User(email=f"u-{uuid.uuid4().hex[:8]}@example.com", name="u", password_hash="x")
+    ws = Workspace(name="ws", slug=f"ws-{uuid.uuid4().hex[:8]}")
+    db.add_all([user, ws])
+    await db.flush()
+    roles = [WorkspaceRole.OWNER, WorkspaceRole.EDITOR, WorkspaceRole.VIEWER]
+    projects = []
+    for i in range(n_projects):
+        proj = Project(workspace_id=ws.id, name=f"p{i}", discord_webhook_url="https://discord.com/api/webhooks/1/x")
+        db.add(proj)
+        await db.flush()
+        db.add(ProjectMember(project_id=proj.id, user_id=user.id, role=roles[i % 3]))
+        db.add_all(Task(project_id=proj.id, title=f"t{j}") for j in range(i))
+        projects.append(proj)
+    other = Project(workspace_id=ws.id, name="not-mine")
+    db.add(other)
+    await db.flush()
+    db.add(Task(project_id=other.id, title="t"))
+    await db.commit()
+    # task 를 직접 INSERT 했으므로 카운터는 재집계로 채움
+    await task_stats_service.reconcile(db)
+    return user, ws, projects
+
+
+@pytest.mark.parametrize("n_projects", [1, 12])
+async def test_user_projects_is_one_query_regardless_of_project_count(
+    async_session: AsyncSession, query_budget, n_projects: int,
+):
+    user, _, projects = await _seed_memberships(async_session, n_projects)
+
+    with query_budget(1):
+        listed = await project_service.get_user_projects(async_session, user.id)
+
+    by_id = {p["id"]: p for p in listed}
+    assert set(by_id) == {p.id for p in projects}
+    for i, proj in enumerate(projects):
+        assert by_id[proj.id]["task_count"] == i
+        assert by_id[proj.id]["my_role"] == [WorkspaceRole.OWNER, WorkspaceRole.EDITOR, WorkspaceRole.VIEWER][i % 3]
+        # webhook URL 은 OWNER 에게만
+        expected_url = proj.discord_webhook_url if i % 3 == 0 else None
+        assert by_id[proj.id]["discord_webhook_url"] == expected_url
+
+
+async def test_workspace_projects_is_one_query_and_skips_non_member_projects(
+    async_session: AsyncSession, query_budget,
+):
+    user, ws, projects = await _seed_memberships(async_session, 5)
+
+    with query_budget(1):
+        listed = await project_service.get_workspace_projects(async_session, ws.id, user.id)
+
+    assert sorted(p["name"] for p in listed) == [p.name for p in projects]
+    assert {p["id"]: p["task_count"] for p in listed} == {p.id: i for i, p in enumerate(projects)}
+
+    with query_budget(1):
+        assert await project_service.get_workspace_projects(async_session, uuid.uuid4(), user.id) == []
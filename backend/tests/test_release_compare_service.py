@@ -0,0 +1,122 @@
+"""release_compare_service — version_observations 집합 + version_fingerprint_counts 로 base / head 비교."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.error_group import ErrorGroup, ErrorGroupStatus
+from app.models.log_event import LogEvent, LogLevel
+from app.models.project import Project
+from app.models.version_observation import VersionObservation
+from app.models.workspace import Workspace
+from app.services import release_compare_service, version_observation_service
+
+SHA_BASE, SHA_HEAD = "a" * 40, "b" * 40
+
+
+def _today_at(hour: int) -> datetime:
+    return datetime.utcnow().replace(hour=hour, minute=0, second=0, microsecond=0)
+
+
+async def _seed_project(db: AsyncSession) -> Project:
+    ws = Workspace(name="ws", slug=f"ws-{uuid.uuid4().hex[:8]}")
+    db.add(ws)
+    await db.flush()
+    proj = Project(workspace_id=ws.id, name="p")
+    db.add(proj)
+    await db.commit()
+    return proj
+
+
+def _events(proj: Project, sha: str, fingerprint: str, count: int, start: datetime) -> list[LogEvent]:
+    return [
+        LogEvent(
+            project_id=proj.id, level=LogLevel.ERROR, message="boom", logger_name="app.x",
+            version_sha=sha, environment="production", hostname="h",
+            emitted_at=start + timedelta(minutes=i), received_at=start + timedelta(minutes=i),
+            exception_class="KeyError", exception_message="x",
+            fingerprint=fingerprint, fingerprinted_at=start,
+        )
+        for i in range(count)
+    ]
+
+
+async def _seed_releases(db: AsyncSession) -> Project:
+    """base: 01~03시 (2h), head: 03~05시 (2h).
+
+    fp-gone  base 에만 / fp-new head 에만 / fp-up 1 → 6 건 / fp-flat 3 → 3 건
+    """
+    proj = await _seed_project(db)
+    base_start, head_start = _today_at(1), _today_at(3)
+    db.add_all([
+        VersionObservation(
+            project_id=proj.id, environment="production", version_sha=SHA_BASE,
+            first_seen_at=base_start, last_seen_at=base_start + timedelta(hours=2),
+            fingerprints=["fp-gone", "fp-up", "fp-flat"],
+        ),
+        VersionObservation(
+            project_id=proj.id, environment="production", version_sha=SHA_HEAD,
+            first_seen_at=head_start, last_seen_at=head_start + timedelta(hours=2),
+            fingerprints=["fp-new", "fp-up", "fp-flat"],
+        ),
+        ErrorGroup(
+            project_id=proj.id, fingerprint="fp-new",
+            exception_class="ValueError", exception_message_sample="bad",
+            first_seen_at=head_start, first_seen_version_sha=SHA_HEAD,
+            last_seen_at=head_start, last_seen_version_sha=SHA_HEAD,
+            event_count=2, status=ErrorGroupStatus.OPEN,
+        ),
+    ])
+    for sha, fp, count, start in [
+        (SHA_BASE, "fp-gone", 4, base_start),
+        (SHA_BASE, "fp-up", 1, base_start),
+        (SHA_BASE, "fp-flat", 3, base_start),
+        (SHA_HEAD, "fp-new", 2, head_start),
+        (SHA_HEAD, "fp-up", 6, head_start),
+        (SHA_HEAD, "fp-flat", 3, head_start),
+    ]:
+        db.add_all(_events(proj, sha, fp, count, start))
+    await db.commit()
+    # 배포 전 데이터 → 발생 수 요약
+    await version_observation_service.backfill(db)
+    return proj
+
+
+async def test_compare_versions_new_disappeared_increased(async_session: AsyncSession):
+    proj = await _seed_releases(async_session)
+
+    result = await release_compare_service.compare_versions(
+        async_session, project_id=proj.id, environment="production",
+        base_sha=SHA_BASE, head_sha=SHA_HEAD[:8],
+    )
+
+    assert result is not None
+    assert result.head.version_sha == SHA_HEAD
+    assert [(d.fingerprint, d.head_count) for d in result.new] == [("fp-new", 2)]
+    assert result.new[0].group is not None and result.new[0].group.exception_class == "ValueError"
+    assert [(d.fingerprint, d.base_count, d.head_count) for d in result.disappeared] == [("fp-gone", 4, 0)]
+    assert result.disappeared[0].group is None
+    assert [d.fingerprint for d in result.increased] == ["fp-up"]
+    assert result.increased[0].head_rate == pytest.approx(3.0)  # 6건 / 2h
+
+
+async def test_compare_versions_unknown_or_ambiguous_version(async_session: AsyncSession):
+    proj = await _seed_releases(async_session)
+    other_sha = "a" * 8 + "f" * 32
+    async_session.add(VersionObservation(
+        project_id=proj.id, environment="production", version_sha=other_sha,
+        first_seen_at=_today_at(0), last_seen_at=_today_at(0), fingerprints=[],
+    ))
+    await async_session.commit()
+
+    assert await release_compare_service.compare_versions(
+        async_session, project_id=proj.id, environment="staging",
+        base_sha=SHA_BASE, head_sha=SHA_HEAD,
+    ) is None
+    with pytest.raises(release_compare_service.AmbiguousVersionError):
+        await release_compare_service.compare_versions(
+            async_session, project_id=proj.id, environment="production",
+            base_sha="aaaaaaaa", head_sha=SHA_HEAD,
+        )
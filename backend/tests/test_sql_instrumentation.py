@@ -0,0 +1,110 @@
+"""sql_instrumentation — 쿼리 수 / DB 시간 / 반복 statement 감지 / Server-Timing 헤더.
+
+in-memory SQLite (동기 engine) 로 cursor event 를 발생시킴 (PG 불필요).
+"""
+
+import logging
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+
+from app.core.sql_instrumentation import (
+    QueryStatsMiddleware,
+    expected_repeats,
+    statement_shape,
+    track_queries,
+)
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        conn.execute(text("INSERT INTO t (v) VALUES ('a'), ('b'), ('c')"))
+    return engine
+
+
+def test_track_queries_counts_and_flags_repeated_shapes():
+    engine = _engine()
+    with track_queries() as outer:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT count(*) FROM t"))
+            with track_queries() as inner:
+                for i in range(1, 7):  # row 마다 같은 쿼리 — N+1 패턴
+                    conn.execute(text("SELECT v FROM t WHERE id = :id"), {"id": i})
+
+    assert inner.count == 6
+    assert outer.count == 7  # 중첩 stats 는 바깥에도 합산
+    assert outer.total_ms >= inner.total_ms > 0
+    assert outer.repeated(5) == [("SELECT v FROM t WHERE id = ?", 6)]
+    assert outer.repeated(7) == []
+    assert outer.slowest_statement is not None
+
+
+def test_expected_repeats_are_counted_but_not_flagged():
+    engine = _engine()
+    with track_queries() as stats:
+        with engine.connect() as conn:
+            with expected_repeats():  # 파티션 / batch 단위 루프
+                for i in range(1, 7):
+                    conn.execute(text("SELECT v FROM t WHERE id = :id"), {"id": i})
+            assert stats.repeated(5) == []
+            for i in range(1, 6):  # 표시 밖 반복은 그대로 N+1 후보
+                conn.execute(text("SELECT v FROM t WHERE id = :id"), {"id": i})
+
+    assert stats.count == 11
+    assert stats.repeated(5) == [("SELECT v FROM t WHERE id = ?", 5)]
+
+
+def test_queries_outside_tracking_are_not_recorded():
+    engine = _engine()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    with track_queries() as stats:
+        pass
+    assert stats.count == 0
+
+
+def test_statement_shape_normalizes_whitespace_and_in_lists():
+    assert statement_shape("SELECT *\n  FROM t WHERE id IN ($1, $2, $3)") == (
+        "SELECT * FROM t WHERE id IN (...)"
+    )
+    assert statement_shape("SELECT * FROM t WHERE id IN ($1)") == "SELECT * FROM t WHERE id IN (...)"
+
+
+async def test_middleware_sets_server_timing_and_warns_on_repeats(caplog):
+    engine = _engine()
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, slow_ms=10_000, repeat_threshold=3)
+
+    @app.get("/ok")
+    async def ok():
+        with engine.connect() as conn:
+            return {"n": conn.execute(text("SELECT count(*) FROM t")).scalar_one()}
+
+    @app.get("/n-plus-one")
+    async def n_plus_one():
+        with engine.connect() as conn:
+            return [conn.execute(text("SELECT v FROM t WHERE id = :id"), {"id": i}).scalar() for i in (1, 2, 3)]
+
+    @app.get("/none")
+    async def none():
+        return {}
+
+    transport = httpx.ASGITransport(app=app)
+    with caplog.at_level(logging.DEBUG, logger="app.core.sql_instrumentation"):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            ok_res = await client.get("/ok")
+            repeat_res = await client.get("/n-plus-one")
+            none_res = await client.get("/none")
+
+    assert ok_res.headers["Server-Timing"].endswith('desc="1 queries"')
+    assert repeat_res.headers["Server-Timing"].startswith("db;dur=")
+    assert "Server-Timing" not in none_res.headers
+
+    warnings = {r for r in caplog.records if r.levelno == logging.WARNING}
+    assert len(warnings) == 1
+    record = warnings.pop()
+    assert "GET /n-plus-one" in record.getMessage()
+    assert record.sql["repeated"] == [{"statement": "SELECT v FROM t WHERE id = ?", "count": 3}]
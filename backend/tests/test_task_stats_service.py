@@ -0,0 +1,200 @@
+"""project_task_stats — task_service / PLAN sync 가 같은 트랜잭션에서 유지, reconcile 의 drift 복구."""
+
+import uuid
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.git_push_event import GitPushEvent
+from app.models.project import Project
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task, TaskStatus
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.services import task_service, task_stats_service
+from app.services.discord_service import build_project_summary
+from app.services.sync_service import process_event
+
+TODAY = datetime.utcnow().date()
+
+
+async def _seed_project(db: AsyncSession) -> tuple[User, Project]:
+    user = User(email=f"u-{uuid.uuid4().hex[:8]}@example.com", name="u", password_hash="x")
+    ws = Workspace(name="ws", slug=f"ws-{uuid.uuid4().hex[:8]}")
+    db.add_all([user, ws])
+    await db.flush()
+    proj = Project(workspace_id=ws.id, name="p", git_repo_url="https://github.com/ardenspace/app-chak")
+    db.add(proj)
+    await db.commit()
+    await db.refresh(user)
+    await db.refresh(proj)
+    return user, proj
+
+
+async def _counters(db: AsyncSession, project_id: uuid.UUID) -> dict[str, int]:
+    stats = await db.get(ProjectTaskStats, project_id, populate_existing=True)
+    return {col: getattr(stats, col) for col in task_stats_service.COUNTER_COLUMNS}
+
+
+def test_task_state_buckets():
+    yesterday = TODAY - timedelta(days=1)
+    state = task_stats_service.task_state
+    assert state(Task(status=TaskStatus.DOING, due_date=yesterday), TODAY) == (
+        task_stats_service.TaskState("doing", True)
+    )
+    assert state(Task(status=TaskStatus.DONE, due_date=yesterday), TODAY).overdue is False
+    assert state(Task(status=TaskStatus.TODO, due_date=TODAY), TODAY).overdue is False
+    archived = state(Task(status=TaskStatus.TODO, due_date=yesterday, archived_at=datetime.utcnow()), TODAY)
+    assert archived == task_stats_service.TaskState("archived", False)
+
+
+async def test_task_service_keeps_counters_in_sync(async_session: AsyncSession):
+    user, proj = await _seed_project(async_session)
+    overdue = await task_service.create_task(
+        async_session, proj.id, user.id,
+        TaskCreate(title="late", due_date=TODAY - timedelta(days=2)),
+    )
+    done = await task_service.create_task(async_session, proj.id, user.id, TaskCreate(title="a"))
+    assert await _counters(async_session, proj.id) == {
+        "todo_count": 2, "doing_count": 0, "done_count": 0, "blocked_count": 0,
+        "archived_count": 0, "overdue_count": 1,
+    }
+
+    await task_service.update_task(async_session, done.id, user.id, TaskUpdate(status=TaskStatus.DONE))
+    await task_service.update_task(async_session, overdue.id, user.id, TaskUpdate(status=TaskStatus.DOING))
+    await task_service.update_task(async_session, overdue.id, user.id, TaskUpdate(title="renamed"))
+    counters = await _counters(async_session, proj.id)
+    assert (counters["todo_count"], counters["doing_count"], counters["done_count"]) == (0, 1, 1)
+    assert counters["overdue_count"] == 1
+
+    await task_service.delete_task(async_session, overdue.id, user.id)
+    counters = await _counters(async_session, proj.id)
+    assert (counters["doing_count"], counters["done_count"], counters["overdue_count"]) == (0, 1, 0)
+
+    assert await task_stats_service.reconcile(async_session) == 0  # 재집계와 일치
+
+
+async def test_plan_sync_updates_counters(async_session: AsyncSession):
+    _, proj = await _seed_project(async_session)
+    plans = [
+        "## 태스크\n\n- [ ] [task-001] a\n- [x] [task-002] b\n- [ ] [task-003] c\n",
+        # 001 체크, 002 해제, 003 PLAN 에서 빠짐 → archived
+        "## 태스크\n\n- [x] [task-001] a\n- [ ] [task-002] b\n",
+    ]
+    for i, plan_text in enumerate(plans):
+        async def fetch_file(repo_url, pat, sha, path, plan_text=plan_text):
+            return plan_text if path == "PLAN.md" else None
+
+        async def fetch_compare(repo_url, pat, base, head):
+            return []
+
+        event = GitPushEvent(
+            project_id=proj.id, branch="main", head_commit_sha=str(i) * 40,
+            commits=[{"modified": ["PLAN.md"]}], commits_truncated=False, pusher="alice",
+        )
+        async_session.add(event)
+        await async_session.commit()
+        await process_event(async_session, event, fetch_file=fetch_file, fetch_compare=fetch_compare)
+
+    assert await _counters(async_session, proj.id) == {
+        "todo_count": 1, "doing_count": 0, "done_count": 1, "blocked_count": 0,
+        "archived_count": 1, "overdue_count": 0,
+    }
+    assert await task_stats_service.reconcile(async_session) == 0
+
+
+async def test_reconcile_repairs_drift_and_overdue_rollover(async_session: AsyncSession):
+    user, proj = await _seed_project(async_session)
+    await task_service.create_task(
+        async_session, proj.id, user.id, TaskCreate(title="due-today", due_date=TODAY),
+    )
+    # 경로 밖 변경 — ORM bulk UPDATE 는 카운터를 안 건드림
+    async_session.add(Task(project_id=proj.id, title="raw", status=TaskStatus.BLOCKED))
+    await async_session.execute(
+        update(ProjectTaskStats).where(ProjectTaskStats.project_id == proj.id).values(done_count=7)
+    )
+    await async_session.commit()
+
+    assert await task_stats_service.reconcile(async_session, today=TODAY) == 1
+    counters = await _counters(async_session, proj.id)
+    assert (counters["todo_count"], counters["done_count"], counters["blocked_count"]) == (1, 0, 1)
+    assert counters["overdue_count"] == 0
+    assert await task_stats_service.reconcile(async_session, today=TODAY) == 0
+
+    # 다음 날 — due-today 가 마감 초과로
+    tomorrow: date = TODAY + timedelta(days=1)
+    assert await task_stats_service.reconcile(async_session, today=tomorrow) == 1
+    stats = await async_session.get(ProjectTaskStats, proj.id, populate_existing=True)
+    assert stats.overdue_count == 1 and stats.overdue_as_of == tomorrow
+
+
+async def test_task_change_after_date_rollover_recounts_overdue(async_session: AsyncSession):
+    """카운터가 어제 기준일 때 task 변경 — 오늘 기준 overdue 증감을 어제 값에 더하지 않고 재집계."""
+    user, proj = await _seed_project(async_session)
+    yesterday = TODAY - timedelta(days=1)
+    first = await task_service.create_task(
+        async_session, proj.id, user.id, TaskCreate(title="a", due_date=yesterday),
+    )
+    await task_service.create_task(
+        async_session, proj.id, user.id, TaskCreate(title="b", due_date=yesterday),
+    )
+    # 어제 센 카운터 — 어제 마감 task 는 그때는 마감 초과 아님
+    await async_session.execute(
+        update(ProjectTaskStats).where(ProjectTaskStats.project_id == proj.id)
+        .values(overdue_count=0, overdue_as_of=yesterday)
+    )
+    await async_session.commit()
+
+    await task_service.delete_task(async_session, first.id, user.id)
+
+    stats = await async_session.get(ProjectTaskStats, proj.id, populate_existing=True)
+    assert (stats.overdue_count, stats.overdue_as_of) == (1, TODAY)
+    assert stats.todo_count == 1
+    assert await task_stats_service.reconcile(async_session, today=TODAY) == 0
+
+
+async def test_weekly_report_reads_counters_and_only_reported_tasks(
+    async_session: AsyncSession, query_budget,
+):
+    user, proj = await _seed_project(async_session)
+    for i in range(5):
+        await task_service.create_task(async_session, proj.id, user.id, TaskCreate(title=f"t{i}"))
+    late = await task_service.create_task(
+        async_session, proj.id, user.id, TaskCreate(title="late", due_date=TODAY - timedelta(days=3)),
+    )
+    # 오래된 task 는 리포트 대상 아님 — 조회도 안 됨
+    await async_session.execute(
+        update(Task).where(Task.project_id == proj.id, Task.id != late.id)
+        .values(updated_at=datetime.utcnow() - timedelta(days=30))
+    )
+    await async_session.commit()
+
+    # project + task (필터) + assignee selectin + 카운터
+    with query_budget(4):
+        summary = await build_project_summary(proj.id, async_session)
+
+    assert "현황: ✅ 0 · 🔨 0 · 📋 6 · 🚫 0 (마감 초과 1, 보관 0)" in summary
+    assert "📋 To Do (1)" in summary
+    assert "⚠️ **마감 초과 태스크**" in summary and "**late**" in summary
+
+
+async def test_weekly_report_overdue_matches_list_before_rollover_reconcile(async_session: AsyncSession):
+    """자정 직후 (reconcile 전) — 카운터는 어제 기준이어도 마감 초과 수는 오늘 기준 목록과 같음."""
+    user, proj = await _seed_project(async_session)
+    await task_service.create_task(
+        async_session, proj.id, user.id,
+        TaskCreate(title="due-yesterday", due_date=TODAY - timedelta(days=1)),
+    )
+    # 어제 센 카운터 — 어제 마감 task 는 그때는 마감 초과 아님
+    await async_session.execute(
+        update(ProjectTaskStats).where(ProjectTaskStats.project_id == proj.id)
+        .values(overdue_count=0, overdue_as_of=TODAY - timedelta(days=1))
+    )
+    await async_session.commit()
+
+    summary = await build_project_summary(proj.id, async_session)
+
+    assert "(마감 초과 1, 보관 0)" in summary
+    assert "**due-yesterday**" in summary
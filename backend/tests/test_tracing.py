@@ -0,0 +1,158 @@
+"""tracing — span 계층 / 큐 작업 context 전파 / DB span / OTLP JSON export / ingest→alert 지연 metric."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core import tracing
+from app.services import log_alert_service, log_ingest_service
+
+
+class _ListExporter:
+    def __init__(self) -> None:
+        self.spans: list[tracing.Span] = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter():
+    exporter = _ListExporter()
+    tracing.configure(exporter)
+    yield exporter
+    tracing.configure(None)
+
+
+async def test_disabled_tracing_is_pass_through():
+    async def work():
+        return 42
+
+    assert tracing.get_tracer() is None
+    assert tracing.bind(work) is work
+    assert await tracing.traced("x")(work)() == 42
+    with tracing.start_span("noop") as span:
+        span.set_attribute("k", "v")
+        assert tracing.current_context() is None
+    assert tracing.flush() == 0
+
+
+async def test_nested_spans_share_trace_and_record_errors(exporter):
+    @tracing.traced("inner")
+    async def inner():
+        raise ValueError("boom")
+
+    with tracing.start_span("root", kind="server") as root:
+        with pytest.raises(ValueError):
+            await inner()
+    tracing.flush()
+
+    inner_span, root_span = exporter.spans
+    assert root_span is root and root_span.parent_span_id is None
+    assert inner_span.context.trace_id == root.context.trace_id
+    assert inner_span.parent_span_id == root.context.span_id
+    assert inner_span.status == "error" and inner_span.status_message == "ValueError: boom"
+    assert root_span.status == "unset"
+    assert tracing.current_span() is None
+
+
+async def test_bind_propagates_context_into_queued_work(exporter):
+    seen = {}
+
+    async def background(event_id):
+        seen["event_id"] = event_id
+        seen["elapsed"] = tracing.elapsed_since_root("ingest")
+        seen["other_root"] = tracing.elapsed_since_root("sync")
+
+    with tracing.start_span("ingest", kind="server") as request_span:
+        task = tracing.bind(background)
+    # 요청 span 이 끝난 뒤 (BackgroundTask 처럼) 실행
+    await task("e1")
+    tracing.flush()
+
+    consumer = exporter.spans[-1]
+    assert consumer.name == "queue background" and consumer.kind == "consumer"
+    assert consumer.context.trace_id == request_span.context.trace_id
+    assert consumer.parent_span_id == request_span.context.span_id
+    assert consumer.attributes["queue.wait_ms"] >= 0
+    assert seen["event_id"] == "e1"
+    assert seen["elapsed"] > 0 and seen["other_root"] is None
+
+
+async def test_db_statements_become_child_spans(exporter):
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))  # span 밖 — 기록 안 됨
+        with tracing.start_span("job") as job:
+            conn.execute(text("SELECT 2"))
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing"))
+    tracing.flush()
+
+    db_spans = [s for s in exporter.spans if s.name == "db.query"]
+    assert [s.attributes["db.statement"] for s in db_spans] == ["SELECT 2", "SELECT * FROM missing"]
+    assert all(s.parent_span_id == job.context.span_id for s in db_spans)
+    assert db_spans[1].status == "error"
+
+
+def test_otlp_json_file_export(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = tracing.configure(tracing.OTLPJSONFileExporter(path))
+    try:
+        with tracing.start_span("root", kind="server", attributes={"n": 3, "ok": True}):
+            with tracing.start_span("child"):
+                pass
+        tracer.flush()
+    finally:
+        tracing.configure(None)
+
+    payload = json.loads(path.read_text().splitlines()[0])
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child, root = spans
+    assert root["kind"] == 2 and "parentSpanId" not in root
+    assert child["parentSpanId"] == root["spanId"] and child["traceId"] == root["traceId"]
+    assert {"key": "n", "value": {"intValue": "3"}} in root["attributes"]
+    assert {"key": "ok", "value": {"boolValue": True}} in root["attributes"]
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+
+
+class _FakeSession:
+    def __init__(self, project) -> None:
+        self.project = project
+
+    async def get(self, model, key):
+        return self.project
+
+    async def commit(self):
+        pass
+
+
+async def test_new_error_alert_observes_ingest_to_alert_latency(exporter, monkeypatch):
+    async def fake_dispatch(db, project, content):
+        return True
+
+    monkeypatch.setattr(log_alert_service.notification_dispatcher, "dispatch_discord_alert", fake_dispatch)
+    histogram = log_alert_service.INGEST_TO_ALERT_SECONDS._unlabelled()
+    before = sum(histogram.counts)
+
+    group = SimpleNamespace(
+        id="g1", last_alerted_new_at=None, exception_class="KeyError", exception_message_sample="x",
+    )
+    event = SimpleNamespace(version_sha="a" * 40, environment="production")
+
+    async def notify():
+        await log_alert_service.notify_new_error(
+            _FakeSession(SimpleNamespace(id="p1")), project_id="p1", group=group, event=event,
+        )
+
+    with tracing.start_span(log_ingest_service.INGEST_REQUEST_SPAN, kind="server"):
+        queued = tracing.bind(notify)
+    await queued()
+    # trace 밖 (reaper 회수 경로) 은 관측 안 함
+    group.last_alerted_new_at = None
+    await notify()
+
+    assert sum(histogram.counts) == before + 1
+    assert group.last_alerted_new_at is not None
@@ -0,0 +1,203 @@
+"""version_observation_service — 버전 관측 유지 / 직전 정상 SHA lookup / backfill."""
+
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.error_group import ErrorGroup
+from app.models.log_event import LogEvent, LogLevel
+from app.models.project import Project
+from app.models.version_observation import VersionCoverage, VersionObservation
+from app.models.workspace import Workspace
+from app.services import log_query_service, version_observation_service
+
+SHA_A, SHA_B, SHA_C = "a" * 40, "b" * 40, "c" * 40
+
+
+def _today_at(hour: int) -> datetime:
+    """migration 이 만든 오늘 파티션 안의 시각 (now - Δ 는 자정 직후 어제 파티션으로 넘어갈 수 있음)."""
+    return datetime.utcnow().replace(hour=hour, minute=0, second=0, microsecond=0)
+
+
+async def _seed_project(db: AsyncSession) -> Project:
+    ws = Workspace(name="ws", slug=f"ws-{uuid.uuid4().hex[:8]}")
+    db.add(ws)
+    await db.flush()
+    proj = Project(workspace_id=ws.id, name="p")
+    db.add(proj)
+    await db.commit()
+    return proj
+
+
+def _event(
+    proj: Project, sha: str, received_at: datetime, *,
+    fingerprint: str | None = None, environment: str = "production",
+) -> LogEvent:
+    return LogEvent(
+        project_id=proj.id, level=LogLevel.ERROR, message="boom", logger_name="app.x",
+        version_sha=sha, environment=environment, hostname="h",
+        emitted_at=received_at, received_at=received_at,
+        exception_class="KeyError", exception_message="x",
+        fingerprint=fingerprint, fingerprinted_at=received_at if fingerprint else None,
+    )
+
+
+async def _observation(db: AsyncSession, proj: Project, sha: str) -> VersionObservation:
+    return (await db.execute(
+        select(VersionObservation).where(
+            VersionObservation.project_id == proj.id, VersionObservation.version_sha == sha,
+        ).execution_options(populate_existing=True)
+    )).scalar_one()
+
+
+async def test_record_events_and_fingerprints_drive_previous_good_lookup(async_session):
+    proj = await _seed_project(async_session)
+    t0 = _today_at(hour=1)
+    events = [
+        _event(proj, SHA_A, t0),
+        _event(proj, SHA_A, t0 + timedelta(minutes=30)),
+        _event(proj, SHA_B, t0 + timedelta(hours=1)),
+        _event(proj, SHA_C, t0 + timedelta(hours=2)),
+        _event(proj, "unknown", t0),
+    ]
+    async_session.add_all(events)
+    await async_session.flush()
+    await version_observation_service.record_events(async_session, events)
+    await version_observation_service.record_fingerprint(async_session, events[2], "fp-bug")
+    await version_observation_service.record_fingerprint(async_session, events[2], "fp-bug")  # no-op
+    await version_observation_service.record_fingerprint(async_session, events[3], "fp-bug")
+    await async_session.commit()
+
+    obs_a = await _observation(async_session, proj, SHA_A)
+    assert obs_a.first_seen_at == t0 and obs_a.last_seen_at == t0 + timedelta(minutes=30)
+    assert (await _observation(async_session, proj, SHA_B)).fingerprints == ["fp-bug"]
+    rows = (await async_session.execute(
+        select(VersionObservation.version_sha).where(VersionObservation.project_id == proj.id)
+    )).scalars().all()
+    assert "unknown" not in rows
+
+    find = version_observation_service.find_previous_good_sha
+    # fp-bug 첫 발생 = SHA_B 시점 → 그 이전 버전 중 fp-bug 없는 최근 = SHA_A
+    assert await find(
+        async_session, project_id=proj.id, environment="production",
+        fingerprint="fp-bug", before=t0 + timedelta(hours=1),
+    ) == SHA_A
+    # SHA_C 이후 기준이어도 SHA_C / SHA_B 는 fp-bug 보유 → SHA_A
+    assert await find(
+        async_session, project_id=proj.id, environment="production",
+        fingerprint="fp-bug", before=t0 + timedelta(hours=5),
+    ) == SHA_A
+    assert await find(
+        async_session, project_id=proj.id, environment="staging",
+        fingerprint="fp-bug", before=t0 + timedelta(hours=5),
+    ) is None
+
+
+async def test_backfill_aggregates_partitions_and_is_idempotent(async_session):
+    proj = await _seed_project(async_session)
+    t0 = _today_at(hour=1)
+    async_session.add_all([
+        _event(proj, SHA_A, t0),
+        _event(proj, SHA_A, t0 + timedelta(minutes=5), fingerprint="fp-1"),
+        _event(proj, SHA_B, t0 + timedelta(minutes=10), fingerprint="fp-2"),
+        _event(proj, SHA_B, t0 + timedelta(minutes=11), fingerprint="fp-2"),
+    ])
+    await async_session.commit()
+
+    assert await version_observation_service.backfill(async_session) > 0
+    obs_a = await _observation(async_session, proj, SHA_A)
+    assert obs_a.first_seen_at == t0 and obs_a.fingerprints == ["fp-1"]
+    assert (await _observation(async_session, proj, SHA_B)).fingerprints == ["fp-2"]
+
+    await version_observation_service.backfill(async_session)
+    obs_b = await _observation(async_session, proj, SHA_B)
+    assert obs_b.fingerprints == ["fp-2"]
+    assert obs_b.last_seen_at == t0 + timedelta(minutes=11)
+
+
+async def test_fingerprint_counts_split_between_live_and_backfill(async_session: AsyncSession):
+    proj = await _seed_project(async_session)
+    t0 = _today_at(hour=0)
+    # 발생 수 live 집계 전에 처리된 event 2건 → backfill 몫
+    async_session.add_all([
+        _event(proj, SHA_A, t0, fingerprint="fp-1"),
+        _event(proj, SHA_A, t0 + timedelta(seconds=1), fingerprint="fp-1"),
+    ])
+    live = _event(proj, SHA_A, t0 + timedelta(seconds=2))
+    async_session.add(live)
+    await async_session.flush()
+    await version_observation_service.record_fingerprint(async_session, live, "fp-1")
+    live.fingerprint, live.fingerprinted_at = "fp-1", datetime.utcnow()
+    await async_session.commit()
+
+    counts = version_observation_service.fingerprint_counts
+    key = {"project_id": proj.id, "environment": "production", "version_sha": SHA_A}
+    assert await counts(async_session, **key) == {"fp-1": 1}
+
+    await version_observation_service.backfill(async_session)
+    assert await counts(async_session, **key) == {"fp-1": 3}  # live 로 센 1건은 다시 안 셈
+    await version_observation_service.backfill(async_session)
+    assert await counts(async_session, **key) == {"fp-1": 3}
+
+
+async def test_group_detail_uses_observations_once_history_complete(async_session: AsyncSession):
+    """backfill 완료 표시가 있으면 log_events anti-join 대신 version_observations 로 판정."""
+    proj = await _seed_project(async_session)
+    first_seen = _today_at(hour=1)
+    target = _event(proj, SHA_C, first_seen, fingerprint="fp-t")
+    group = ErrorGroup(
+        project_id=proj.id, fingerprint="fp-t", exception_class="KeyError",
+        exception_message_sample="x", first_seen_at=first_seen, first_seen_version_sha=SHA_C,
+        last_seen_at=first_seen, last_seen_version_sha=SHA_C, event_count=1,
+    )
+    # SHA_B 는 log_events 에 없고 관측 테이블에만 — 결과가 SHA_B 면 관측 경로 사용
+    async_session.add_all([target, group, VersionObservation(
+        project_id=proj.id, environment="production", version_sha=SHA_B,
+        first_seen_at=first_seen - timedelta(days=1), last_seen_at=first_seen, fingerprints=[],
+    ), VersionCoverage(
+        project_id=proj.id, environment="production", live_since=first_seen, history_complete=True,
+    )])
+    await async_session.commit()
+
+    detail = await log_query_service.get_group_detail(
+        async_session, project_id=proj.id, group_id=group.id,
+    )
+    assert detail["git_context"]["previous_good_sha"] == SHA_B
+
+
+async def test_group_detail_scans_until_backfill_completes(async_session: AsyncSession):
+    """배포 직후 — live ingest 관측은 있지만 배포 전 기록이 아직 없음 → log_events scan 으로 판정."""
+    proj = await _seed_project(async_session)
+    t0 = _today_at(hour=0)
+    # 배포 전 기록 (관측 없음): SHA_A 정상
+    async_session.add(_event(proj, SHA_A, t0))
+    # 배포 후 live 경로: SHA_C 에서 fp-t 첫 발생
+    target = _event(proj, SHA_C, t0 + timedelta(seconds=1))
+    async_session.add(target)
+    await async_session.flush()
+    await version_observation_service.record_events(async_session, [target])
+    await version_observation_service.record_fingerprint(async_session, target, "fp-t")
+    target.fingerprint, target.fingerprinted_at = "fp-t", datetime.utcnow()
+    group = ErrorGroup(
+        project_id=proj.id, fingerprint="fp-t", exception_class="KeyError",
+        exception_message_sample="x", first_seen_at=target.received_at, first_seen_version_sha=SHA_C,
+        last_seen_at=target.received_at, last_seen_version_sha=SHA_C, event_count=1,
+    )
+    async_session.add(group)
+    await async_session.commit()
+
+    key = {"project_id": proj.id, "environment": "production"}
+    assert not await version_observation_service.history_complete(async_session, **key)
+    detail = await log_query_service.get_group_detail(
+        async_session, project_id=proj.id, group_id=group.id,
+    )
+    assert detail["git_context"]["previous_good_sha"] == SHA_A
+
+    await version_observation_service.backfill(async_session)
+    assert await version_observation_service.history_complete(async_session, **key)
+    detail = await log_query_service.get_group_detail(
+        async_session, project_id=proj.id, group_id=group.id,
+    )
+    assert detail["git_context"]["previous_good_sha"] == SHA_A
@@ -104,7 +104,9 @@ export function ErrorsList({ projectId, onSelectGroup }: ErrorsListProps) {
       {data && data.items.length > 0 && (
         <>
           <p className="text-[11px] text-muted-foreground">
-            {data.items.length} / 총 {data.total} 건
+            {data.total === null
+              ? `${data.items.length} 건`
+              : `${data.items.length} / 총 ${data.total_is_estimate ? '약 ' : ''}${data.total} 건`}
           </p>
           <ul className="space-y-2">
             {data.items.map((group) => (
@@ -39,18 +39,31 @@ const apiClient = axios.create({
   },
 });
 
+// read-your-writes — 쓰기 응답의 primary pin 시각을 다음 요청들에 되돌려 보냄 (읽기 replica 사용 시)
+const PRIMARY_UNTIL_HEADER = 'x-forps-primary-until';
+let primaryUntil = 0;
+
 // Request interceptor - 토큰 자동 첨부
 apiClient.interceptors.request.use((config) => {
   const token = localStorage.getItem('access_token');
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
+  if (primaryUntil > Date.now() / 1000) {
+    config.headers[PRIMARY_UNTIL_HEADER] = primaryUntil.toFixed(3);
+  }
   return config;
 });
 
-// Response interceptor - 401 에러 처리
+// Response interceptor - primary pin 기록 + 401 에러 처리
 apiClient.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    const until = Number(response.headers[PRIMARY_UNTIL_HEADER]);
+    if (until > primaryUntil) {
+      primaryUntil = until;
+    }
+    return response;
+  },
   (error) => {
     if (error.response?.status === 401) {
       localStorage.removeItem('access_token');
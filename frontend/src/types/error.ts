@@ -19,11 +19,25 @@ export interface ErrorGroupSummary {
   resolved_at: string | null;
   resolved_by_user_id: string | null;
   resolved_in_version_sha: string | null;
+  // ?sparkline= 지정 시에만 — bucket 별 발생 수 (오래된 → 최근)
+  sparkline?: number[] | null;
+}
+
+export type SparklineRange = '24h' | '7d';
+
+export interface SparklineWindow {
+  start: string;
+  bucket_seconds: number;
+  buckets: number;
 }
 
 export interface ErrorGroupListResponse {
   items: ErrorGroupSummary[];
-  total: number;
+  // 기본 ?total=estimate — 1000 건 초과 시 planner 추정치 (total_is_estimate), ?total=none 이면 null
+  total: number | null;
+  total_is_estimate: boolean;
+  next_cursor: string | null;
+  sparkline_window?: SparklineWindow | null;
 }
 
 // GET /errors/{id} response — git context nested
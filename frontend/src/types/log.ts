@@ -18,5 +18,30 @@ export interface LogEventSummary {
 
 export interface LogEventListResponse {
   items: LogEventSummary[];
-  total: number;
+  // 기본 ?total=estimate — 1000 건 초과 시 planner 추정치 (total_is_estimate), ?total=none 이면 null
+  total: number | null;
+  total_is_estimate: boolean;
+  next_cursor: string | null;
+}
+
+// GET /projects/{id}/requests/{request_id} — offset_ms 는 첫 이벤트 emitted_at 기준
+export interface RequestTraceEvent extends LogEventSummary {
+  user_id_external: string | null;
+  extra: Record<string, unknown> | null;
+  offset_ms: number;
+}
+
+export interface RequestTraceResponse {
+  request_id: string;
+  started_at: string;
+  duration_ms: number;
+  events: RequestTraceEvent[];
+  truncated: boolean;
+}
+
+// GET /projects/{id}/logs/stream (SSE) — event: log (LogEventSummary, message 는 미리보기)
+// | dropped (느린 소비자 — 버린 건수) | resync (서버 재연결 — /logs 로 구간 재조회)
+export interface LogStreamDropped {
+  count: number;
+  total: number; // 이 구독에서 버린 누적 수 — 목록 total 과 달리 항상 숫자
 }
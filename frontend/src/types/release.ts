@@ -0,0 +1,28 @@
+import type { ErrorGroupSummary } from './error';
+
+// GET /projects/{id}/releases/compare?base=&head= — base / head 는 전체 SHA 또는 7자 이상 prefix
+export interface ReleaseVersion {
+  version_sha: string;
+  first_seen_at: string;
+  last_seen_at: string;
+  observed_hours: number; // 발생률 분모 (최소 1시간)
+  error_events: number;
+}
+
+export interface ReleaseGroupDelta {
+  fingerprint: string;
+  group: ErrorGroupSummary | null;
+  base_count: number;
+  head_count: number;
+  base_rate_per_hour: number;
+  head_rate_per_hour: number;
+}
+
+export interface ReleaseCompareResponse {
+  environment: string;
+  base: ReleaseVersion;
+  head: ReleaseVersion;
+  new: ReleaseGroupDelta[];
+  disappeared: ReleaseGroupDelta[];
+  increased: ReleaseGroupDelta[];
+}